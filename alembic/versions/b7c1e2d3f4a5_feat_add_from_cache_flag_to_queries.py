@@ -0,0 +1,38 @@
+"""feat: add from_cache flag to queries
+
+Revision ID: b7c1e2d3f4a5
+Revises: 962f773da434
+Create Date: 2026-10-17 09:12:44.310528
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7c1e2d3f4a5"
+down_revision: Union[str, Sequence[str], None] = "962f773da434"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "queries",
+        sa.Column(
+            "from_cache",
+            sa.Boolean(),
+            nullable=False,
+            server_default=sa.false(),
+            comment="Indica si la traducción se obtuvo de la caché",
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("queries", "from_cache")
@@ -0,0 +1,37 @@
+"""feat: add cypher_parameters to queries
+
+Revision ID: c4d5e6f7a8b9
+Revises: b7c1e2d3f4a5
+Create Date: 2026-10-17 11:03:27.518204
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4d5e6f7a8b9"
+down_revision: Union[str, Sequence[str], None] = "b7c1e2d3f4a5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "queries",
+        sa.Column(
+            "cypher_parameters",
+            sa.JSON(),
+            nullable=True,
+            comment="Parámetros de la consulta Cypher parametrizada",
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("queries", "cypher_parameters")
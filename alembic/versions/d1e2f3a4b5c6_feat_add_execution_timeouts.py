@@ -0,0 +1,46 @@
+"""feat: add execution timeouts and cancelled statuses
+
+Revision ID: d1e2f3a4b5c6
+Revises: c4d5e6f7a8b9
+Create Date: 2026-10-17 15:42:08.913027
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d1e2f3a4b5c6"
+down_revision: Union[str, Sequence[str], None] = "c4d5e6f7a8b9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "connections",
+        sa.Column(
+            "query_timeout_seconds",
+            sa.Float(),
+            nullable=True,
+            comment="Tiempo límite de ejecución en segundos (NULL usa el global)",
+        ),
+    )
+    # ALTER TYPE ... ADD VALUE no puede ejecutarse dentro de una transacción
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE querystatus ADD VALUE IF NOT EXISTS 'CANCELADO'")
+        op.execute("ALTER TYPE querystatus ADD VALUE IF NOT EXISTS 'TIEMPO_AGOTADO'")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Postgres no permite quitar valores de un enum: se reasignan a FALLIDO
+    op.execute(
+        "UPDATE queries SET status = 'FALLIDO' "
+        "WHERE status IN ('CANCELADO', 'TIEMPO_AGOTADO')"
+    )
+    op.drop_column("connections", "query_timeout_seconds")
@@ -1,25 +1,54 @@
 """Endpoints para gestión de conexiones a bases de datos."""
 
-from typing import List
+from typing import AsyncIterator, List
 
 from fastapi import APIRouter, Depends, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from app.core.security import get_current_user
+from app.core.security import get_current_user, require_admin
 from app.db.session import get_db
 from app.models.user import User
 from app.schemas.connection import (
+    ConnectionBulkTestRequest,
+    ConnectionBulkTestResult,
     ConnectionCreate,
+    ConnectionHealth,
     ConnectionResponse,
     ConnectionTestRequest,
     ConnectionTestResponse,
     ConnectionUpdate,
+    CredentialCacheStatsResponse,
+    SchemaCatalogResponse,
+    SchemaColumnResponse,
+    SchemaForeignKeyResponse,
+    SchemaTableResponse,
 )
 from app.services.connection_service import ConnectionService
+from app.services.health_monitor import STATUS_UP, health_monitor
+from app.services.schema_service import SchemaService
 
 router = APIRouter()
 
 
+def _with_health(connection) -> ConnectionResponse:
+    """Construye la respuesta de una conexión con su último estado conocido.
+
+    El estado sale de la caché del monitor en segundo plano, sin llamadas de red.
+    """
+    response = ConnectionResponse.model_validate(connection)
+    health = health_monitor.snapshot(connection.connection_id)
+    if health is None:
+        return response
+    return response.model_copy(
+        update={
+            "health": ConnectionHealth(**health),
+            "is_active": health["status"] == STATUS_UP,
+        }
+    )
+
+
 @router.post(
     "/test",
     response_model=ConnectionTestResponse,
@@ -49,6 +78,61 @@ def test_connection(
     return ConnectionService.test_connection(connection_data)
 
 
+@router.post(
+    "/test/bulk",
+    status_code=status.HTTP_200_OK,
+    summary="Probar varias conexiones guardadas a la vez",
+    description=(
+        "Prueba todas las conexiones guardadas del usuario (o las indicadas en "
+        "connection_ids) en paralelo, con un número acotado de pruebas "
+        "simultáneas y un tiempo límite por conexión. Los resultados se "
+        "devuelven en NDJSON (una línea por conexión) a medida que terminan, "
+        "así el tiempo total se acerca al de la conexión más lenta."
+    ),
+    responses={
+        200: {
+            "description": "Un ConnectionBulkTestResult por línea",
+            "content": {"application/x-ndjson": {}},
+        },
+        403: {"description": "Alguna conexión pertenece a otro usuario"},
+        404: {"description": "Alguna conexión no existe"},
+    },
+)
+async def test_connections_bulk(
+    request: ConnectionBulkTestRequest,
+    db: Session = Depends(get_db),  # noqa: B008
+    current_user: User = Depends(get_current_user),  # noqa: B008
+) -> StreamingResponse:
+    """Prueba a la vez varias conexiones guardadas.
+
+    - **connection_ids**: Conexiones a probar (por defecto todas)
+    - **concurrency**: Pruebas simultáneas
+    - **timeout**: Espera máxima por conexión en segundos
+
+    Returns:
+        Resultados en NDJSON, en el orden en que terminan las pruebas
+    """
+    if request.connection_ids is None:
+        connections = await run_in_threadpool(
+            ConnectionService.get_user_connections, db, current_user.user_id
+        )
+    else:
+        connections = await run_in_threadpool(
+            ConnectionService.get_connections_by_ids,
+            db,
+            request.connection_ids,
+            current_user.user_id,
+        )
+
+    async def lines() -> AsyncIterator[bytes]:
+        async for result in ConnectionService.check_connections(
+            connections, request.concurrency, request.timeout
+        ):
+            yield (ConnectionBulkTestResult(**result).model_dump_json() + "\n").encode()
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
 @router.post(
     "",
     response_model=ConnectionResponse,
@@ -100,12 +184,42 @@ def list_connections(
     """Lista todas las conexiones del usuario autenticado.
 
     Returns:
-        Lista de conexiones (sin contraseñas)
+        Lista de conexiones (sin contraseñas) con su último estado conocido
     """
     connections = ConnectionService.get_user_connections(db, current_user.user_id)
 
     # Convertir a schema de respuesta
-    return [ConnectionResponse.model_validate(conn) for conn in connections]
+    return [_with_health(conn) for conn in connections]
+
+
+@router.get(
+    "/credentials/cache/stats",
+    response_model=CredentialCacheStatsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Métricas de la caché de credenciales",
+    description="""
+    Devuelve el tamaño, los límites, los contadores de aciertos y fallos y el
+    tiempo de desencriptado ahorrado por la caché de contraseñas de las
+    conexiones guardadas.
+
+    **Requiere rol ADMIN.**
+    """,
+    responses={
+        401: {"description": "No autenticado"},
+        403: {"description": "Se requiere rol de administrador"},
+    },
+)
+def get_credential_cache_stats(
+    current_user: User = Depends(require_admin),  # noqa: B008
+) -> CredentialCacheStatsResponse:
+    """Obtiene las métricas de la caché de credenciales desencriptadas.
+
+    Returns:
+        Métricas de la caché (sin contraseñas)
+    """
+    return CredentialCacheStatsResponse(
+        **ConnectionService.get_credential_cache_stats()
+    )
 
 
 @router.get(
@@ -135,7 +249,76 @@ def get_connection(
     connection = ConnectionService.get_connection(
         db, connection_id, current_user.user_id
     )
-    return ConnectionResponse.model_validate(connection)
+    return _with_health(connection)
+
+
+@router.get(
+    "/{connection_id}/schema",
+    response_model=SchemaCatalogResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Esquema de una conexión SQL Server",
+    description="""
+    Devuelve las tablas, columnas, claves primarias y claves foráneas de una
+    conexión SQL Server, con el label de Neo4j de cada tabla.
+
+    El esquema se lee de INFORMATION_SCHEMA una vez y se guarda en caché
+    (memoria y disco) hasta que caduca o cambia la conexión. Con
+    `refresh=true` se vuelve a leer. Es el mismo catálogo que usa la
+    traducción cuando se indica `source_connection_id`.
+    """,
+    responses={
+        400: {"description": "La conexión no es de SQL Server"},
+        403: {"description": "No tienes permiso para acceder a esta conexión"},
+        404: {"description": "Conexión no encontrada"},
+        503: {"description": "No se pudo leer el esquema"},
+    },
+)
+def get_connection_schema(
+    connection_id: int,
+    refresh: bool = False,
+    db: Session = Depends(get_db),  # noqa: B008
+    current_user: User = Depends(get_current_user),  # noqa: B008
+) -> SchemaCatalogResponse:
+    """Obtiene el esquema de una conexión SQL Server.
+
+    Args:
+        connection_id: ID de la conexión
+        refresh: Si True, se ignora la caché y se lee de nuevo
+
+    Returns:
+        Catálogo del esquema y el momento en que se leyó
+    """
+    connection = ConnectionService.get_connection(
+        db, connection_id, current_user.user_id
+    )
+    catalog, introspected_at = SchemaService.get_catalog_info(connection, refresh)
+    return SchemaCatalogResponse(
+        connection_id=connection_id,
+        version=catalog.version,
+        introspected_at=introspected_at,
+        tables=[
+            SchemaTableResponse(
+                schema_name=table.schema,
+                name=table.name,
+                label=table.label,
+                columns=[
+                    SchemaColumnResponse(**column._asdict()) for column in table.columns
+                ],
+                primary_key=list(table.primary_key),
+                foreign_keys=[
+                    SchemaForeignKeyResponse(
+                        **{
+                            **foreign_key._asdict(),
+                            "columns": list(foreign_key.columns),
+                            "referenced_columns": list(foreign_key.referenced_columns),
+                        }
+                    )
+                    for foreign_key in table.foreign_keys
+                ],
+            )
+            for table in catalog.tables
+        ],
+    )
 
 
 @router.put(
@@ -3,25 +3,64 @@ Endpoints para traducción de SQL a Cypher.
 
 Proporciona endpoints para:
 - Traducir consultas SQL a Cypher (QTE-01)
+- Traducir lotes de consultas en una sola petición
+- Ejecutar consultas traducidas en Neo4j con respuesta en streaming (JSON,
+  Arrow IPC o Parquet)
+- Ejecutar un lote de consultas traducidas en una sola transacción
+- Paginar los resultados de una consulta con cursores
+- Obtener el plan de ejecución (EXPLAIN/PROFILE) y su coste estimado
+- Invalidar y consultar la caché de resultados de ejecución
 - Obtener ejemplos de traducción
 - Consultar historial de traducciones
+- Consultar métricas de la caché de traducciones
 """
 
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from app.core.security import get_current_user
+from app.core.parser.schema import SchemaCatalog
+from app.core.security import get_current_user, require_admin
 from app.db.session import get_db
+from app.models.connection import Connection
+from app.models.query import Query as QueryModel
 from app.models.user import User
 from app.schemas.query import (
+    CacheInvalidationResponse,
+    ExecuteBatchItem,
+    ExecuteBatchRequest,
+    ExecuteBatchResponse,
+    ExecutePageRequest,
+    ExecutePageResponse,
+    ExecuteRequest,
+    ExecutionCacheStatsResponse,
+    ExplainRequest,
+    ExplainResponse,
     QueryHistoryResponse,
+    TranslateBatchItem,
+    TranslateBatchRequest,
+    TranslateBatchResponse,
     TranslateRequest,
     TranslateResponse,
+    TranslationCacheStatsResponse,
     TranslationExample,
     TranslationExamplesResponse,
 )
+from app.services.connection_service import ConnectionService
+from app.services.execution_service import ExecutionService
+from app.services.export_service import COLUMNAR_EXTENSIONS, COLUMNAR_MEDIA_TYPES
+from app.services.schema_service import SchemaService
 from app.services.translation_service import TranslationService
 
 router = APIRouter()
@@ -41,10 +80,19 @@ router = APIRouter()
     - WHERE con operadores: =, !=, <, >, <=, >=
     - Operadores lógicos: AND, OR
     - Valores: strings, números, booleanos, null
+    - ORDER BY col [ASC|DESC], LIMIT n, OFFSET n y TOP n (SQL Server), que se
+      traducen a ORDER BY, SKIP y LIMIT de Cypher
+    - Modo parametrizado (`parameterize`): los literales se devuelven en
+      `parameters` y la consulta usa `$p0, $p1...`
+    - Esquema de origen (`source_connection_id`): el label y las propiedades
+      se toman del esquema de esa conexión SQL Server (leído de
+      INFORMATION_SCHEMA y cacheado) y las tablas o columnas que no existen
+      se informan como error
     
     **Limitaciones:**
     - Solo consultas SELECT
-    - No soporta JOIN, GROUP BY, ORDER BY, LIMIT
+    - No soporta JOIN ni GROUP BY
+    - TOP y LIMIT no pueden combinarse
     - Una sola tabla por consulta
     
     **Seguridad:**
@@ -110,6 +158,8 @@ def translate_sql_to_cypher(
         db=db,
         user_id=current_user.user_id,
         neo4j_connection_id=request.neo4j_connection_id,
+        parameterize=request.parameterize,
+        schema=_source_schema(db, request.source_connection_id, current_user.user_id),
     )
 
     # Si la traducción falló por validación, retornar error 400
@@ -142,10 +192,612 @@ def translate_sql_to_cypher(
         success=result["success"],
         sql_query=result["sql_query"],
         cypher=result["cypher"],
+        parameters=result.get("parameters"),
         errors=result["errors"],
         query_id=result.get("query_id"),
         translation_time=result.get("translation_time"),
+        from_cache=result.get("from_cache", False),
+    )
+
+
+@router.post(
+    "/translate/batch",
+    response_model=TranslateBatchResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Traducir un lote de consultas SQL a Cypher",
+    description="""
+    Traduce hasta 500 consultas SQL SELECT en una sola petición.
+
+    - Las consultas idénticas se traducen una sola vez y sus repeticiones
+      se devuelven con `from_cache = true`
+    - Todas las consultas se guardan en el historial con un único commit
+    - Los resultados se devuelven en el mismo orden que la solicitud; una
+      consulta inválida no hace fallar el lote, su error se informa en su
+      propio elemento
+
+    **Requiere autenticación.**
+    """,
+    responses={
+        401: {"description": "No autenticado"},
+        422: {"description": "Datos de entrada inválidos"},
+    },
+)
+def translate_batch_sql_to_cypher(
+    request: TranslateBatchRequest,
+    current_user: User = Depends(get_current_user),  # noqa: B008
+    db: Session = Depends(get_db),  # noqa: B008
+):
+    """
+    Traduce un lote de consultas SQL a Cypher Neo4j.
+
+    Args:
+        request: Solicitud con las consultas SQL
+        current_user: Usuario autenticado
+        db: Sesión de base de datos
+
+    Returns:
+        TranslateBatchResponse: Resultado de cada consulta en orden
+    """
+    results = TranslationService.translate_batch(
+        sql_queries=request.sql_queries,
+        db=db,
+        user_id=current_user.user_id,
+        neo4j_connection_id=request.neo4j_connection_id,
+        parameterize=request.parameterize,
+        schema=_source_schema(db, request.source_connection_id, current_user.user_id),
+    )
+
+    successful = sum(1 for result in results if result["success"])
+    return TranslateBatchResponse(
+        results=[
+            TranslateBatchItem(index=index, **result)
+            for index, result in enumerate(results)
+        ],
+        total=len(results),
+        successful=successful,
+        failed=len(results) - successful,
+        unique=len({result["sql_query"] for result in results}),
+    )
+
+
+@router.post(
+    "/execute",
+    status_code=status.HTTP_200_OK,
+    summary="Ejecutar una consulta traducida en Neo4j",
+    description="""
+    Ejecuta en Neo4j el Cypher de una consulta del historial y devuelve los
+    registros en streaming, a medida que Neo4j los entrega.
+
+    - `format = "ndjson"` (por defecto): un objeto JSON por línea
+      (`application/x-ndjson`)
+    - `format = "json"`: un único array JSON (`application/json`)
+    - `format = "arrow"`: flujo Arrow IPC
+      (`application/vnd.apache.arrow.stream`), para leer con
+      `pyarrow.ipc.open_stream()` o `pandas` sin convertir JSON
+    - `format = "parquet"`: fichero Parquet (`application/vnd.apache.parquet`)
+      con un row group por lote
+
+    En los formatos columnares los lotes se construyen directamente desde el
+    cursor de Neo4j con un esquema tipado: las columnas son las del `RETURN`
+    del Cypher y sus tipos se deducen del primer lote; los nodos y demás
+    valores compuestos se guardan como texto JSON. Si la ejecución falla a
+    mitad, el fichero queda sin su final. Estos formatos no usan la caché de
+    resultados.
+    - `fetch_size`: registros por lote pedido a Neo4j; el servidor nunca
+      mantiene más de un lote en memoria
+
+    La ejecución es asíncrona: mientras Neo4j responde la petición no ocupa
+    ningún hilo del servidor, así que pueden esperar miles a la vez.
+
+    Los errores de conexión o de Cypher se devuelven como error HTTP antes de
+    empezar la respuesta. Si Neo4j falla a mitad del resultado, en NDJSON se
+    emite una última línea `{"error": ...}` y el array JSON queda sin cerrar.
+    Al terminar se guardan en el historial el estado, el tiempo de ejecución
+    y el número de registros devueltos.
+
+    Si la caché de resultados está activa, una ejecución idéntica (mismo
+    usuario, conexión, Cypher y parámetros) dentro de `cache_ttl` segundos se
+    sirve desde memoria sin consultar Neo4j. La cabecera `X-Cache` indica
+    `HIT`, `MISS` o `BYPASS` y, en los aciertos, `Age` da la antigüedad del
+    resultado en segundos.
+
+    Cada ejecución tiene un tiempo límite: el de la conexión o, si no tiene,
+    `NEO4J_QUERY_TIMEOUT_SECONDS`; `timeout` permite acortarlo para esta
+    petición. Neo4j aborta la transacción al vencer y la consulta queda como
+    `tiempo_agotado` (504 si aún no se había enviado nada). Si el cliente se
+    desconecta a mitad del resultado, la transacción se cancela en Neo4j y la
+    consulta queda como `cancelado`.
+
+    Si la consulta no tiene `LIMIT` ni `TOP` y `EXECUTION_DEFAULT_ROW_LIMIT`
+    es mayor que 0, se ejecuta con ese `LIMIT` añadido al Cypher (lo aplica
+    Neo4j) y la cabecera `X-Row-Limit` indica el límite aplicado.
+
+    Si `EXECUTION_MAX_ESTIMATED_COST` es mayor que 0, antes de ejecutar se
+    pide el plan `EXPLAIN` y la consulta se rechaza (400) cuando su coste
+    estimado supera el umbral; el resumen del plan queda en el historial.
+
+    **Requiere autenticación.**
+    """,
+    responses={
+        200: {"description": "Registros del resultado en streaming"},
+        400: {
+            "description": (
+                "Consulta sin traducción, Cypher inválido o rechazada por su "
+                "coste estimado"
+            )
+        },
+        401: {"description": "No autenticado"},
+        403: {"description": "La consulta o la conexión pertenecen a otro usuario"},
+        404: {"description": "Consulta o conexión no encontrada"},
+        503: {"description": "No se puede conectar con Neo4j"},
+        504: {"description": "La consulta excedió el tiempo límite"},
+    },
+)
+async def execute_query(
+    request: ExecuteRequest,
+    http_request: Request,
+    current_user: User = Depends(get_current_user),  # noqa: B008
+    db: Session = Depends(get_db),  # noqa: B008
+):
+    """
+    Ejecuta una consulta traducida y devuelve sus registros en streaming.
+
+    Args:
+        request: Solicitud con la consulta y el formato de salida
+        http_request: Petición HTTP, para detectar la desconexión del cliente
+        current_user: Usuario autenticado
+        db: Sesión de base de datos
+
+    Returns:
+        StreamingResponse: Registros en NDJSON o como array JSON
+    """
+    # La sesión de SQLAlchemy es síncrona: las lecturas van al threadpool
+    query, connection = await run_in_threadpool(
+        _load_execution_target, db, request, current_user.user_id
+    )
+
+    columnar = request.format in COLUMNAR_MEDIA_TYPES
+    if columnar:
+        media_type = COLUMNAR_MEDIA_TYPES[request.format]
+    elif request.format == "ndjson":
+        media_type = "application/x-ndjson"
+    else:
+        media_type = "application/json"
+    cypher, row_limit = ExecutionService.apply_row_limit(query.cypher_query)
+    cache_key = ExecutionService.result_cache_key(
+        current_user.user_id,
+        connection.connection_id,
+        cypher,
+        query.cypher_parameters,
+        0 if columnar else request.cache_ttl,
+    )
+    cached = ExecutionService.get_cached_result(cache_key)
+    if cached is not None:
+        rows, age = cached
+        headers = _cache_headers(True, age)
+        if row_limit is not None:
+            headers["X-Row-Limit"] = str(row_limit)
+        return StreamingResponse(
+            ExecutionService.cached_chunks(rows, request.format),
+            media_type=media_type,
+            headers=headers,
+        )
+
+    stream = await ExecutionService.open_stream(
+        db,
+        query,
+        connection,
+        request.fetch_size,
+        cypher,
+        query.cypher_parameters,
+        timeout=ExecutionService.effective_timeout(connection, request.timeout),
+    )
+    headers = _cache_headers(cache_key is not None, None)
+    if row_limit is not None:
+        headers["X-Row-Limit"] = str(row_limit)
+    if columnar:
+        extension = COLUMNAR_EXTENSIONS[request.format]
+        headers["Content-Disposition"] = (
+            f'attachment; filename="query_{query.query_id}.{extension}"'
+        )
+    return StreamingResponse(
+        ExecutionService.stream_results(
+            db,
+            query.query_id,
+            stream,
+            request.format,
+            cache_key=cache_key,
+            cache_ttl=request.cache_ttl,
+            receive=http_request.receive,
+        ),
+        media_type=media_type,
+        headers=headers,
+    )
+
+
+@router.post(
+    "/execute/batch",
+    response_model=ExecuteBatchResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Ejecutar un lote de consultas traducidas en Neo4j",
+    description="""
+    Ejecuta en Neo4j hasta 500 consultas del historial con una sola sesión y
+    una sola transacción de lectura, en lugar de una petición, sesión y
+    transacción por consulta.
+
+    - Las consultas con el mismo Cypher y parámetros se ejecutan una vez
+    - Con `unwind = true` (por defecto), las consultas que comparten el
+      mismo Cypher parametrizado se reescriben en una única sentencia
+      `UNWIND $rows AS _row CALL { WITH _row ... }`; `ORDER BY`, `SKIP` y `LIMIT`
+      siguen aplicándose a cada consulta por separado
+    - El resto de sentencias se envían una tras otra en la misma transacción
+
+    Todas las consultas deben usar la misma conexión: `neo4j_connection_id`
+    o, si no se indica, la asociada a todas ellas. Los registros se devuelven
+    por consulta en el orden de la solicitud y `statements` indica cuántas
+    sentencias se enviaron a Neo4j.
+
+    Un error de Neo4j aborta la transacción: las consultas de la sentencia
+    que falló reciben el error y las siguientes se informan como no
+    ejecutadas. El tiempo límite (`timeout`) se aplica al lote completo. Los
+    lotes no usan la caché de resultados.
+
+    **Requiere autenticación.**
+    """,
+    responses={
+        400: {
+            "description": (
+                "Consulta sin traducción o consultas con conexiones distintas"
+            )
+        },
+        401: {"description": "No autenticado"},
+        403: {"description": "Una consulta o la conexión pertenecen a otro usuario"},
+        404: {"description": "Consulta o conexión no encontrada"},
+        422: {"description": "Datos de entrada inválidos"},
+        503: {"description": "No se puede conectar con Neo4j"},
+        504: {"description": "La transacción no pudo abrirse a tiempo"},
+    },
+)
+async def execute_query_batch(
+    request: ExecuteBatchRequest,
+    current_user: User = Depends(get_current_user),  # noqa: B008
+    db: Session = Depends(get_db),  # noqa: B008
+):
+    """
+    Ejecuta un lote de consultas traducidas en una sola transacción.
+
+    Args:
+        request: Solicitud con las consultas y la conexión
+        current_user: Usuario autenticado
+        db: Sesión de base de datos
+
+    Returns:
+        ExecuteBatchResponse: Registros de cada consulta en orden
+    """
+    queries, connection = await run_in_threadpool(
+        _load_batch_targets, db, request, current_user.user_id
+    )
+    batch = await ExecutionService.execute_batch(
+        db,
+        queries,
+        connection,
+        timeout=ExecutionService.effective_timeout(connection, request.timeout),
+        unwind=request.unwind,
+    )
+
+    successful = sum(1 for item in batch["results"] if item["success"])
+    return ExecuteBatchResponse(
+        results=[ExecuteBatchItem(**item) for item in batch["results"]],
+        total=len(batch["results"]),
+        successful=successful,
+        failed=len(batch["results"]) - successful,
+        statements=batch["statements"],
+        execution_time=batch["execution_time"],
+    )
+
+
+@router.post(
+    "/execute/page",
+    response_model=ExecutePageResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Obtener una página de resultados de una consulta",
+    description="""
+    Ejecuta una consulta traducida y devuelve una sola página de resultados.
+
+    El Cypher se reescribe con `WHERE clave > $cursor ORDER BY clave LIMIT $n`,
+    de modo que cada página empieza donde terminó la anterior y cuesta lo
+    mismo que la primera. Para la página siguiente se envía el `next_cursor`
+    recibido con la misma `order_key`.
+
+    - `order_key = "elementId"` (por defecto): orden por el identificador
+      interno del nodo
+    - `order_key = "<propiedad>"`: orden por esa propiedad (desempatando por
+      elementId); con un índice en la propiedad la lectura es un range seek
+
+    Las páginas pueden servirse desde la caché de resultados igual que en
+    `/execute` (cabeceras `X-Cache` y `Age`), y tienen el mismo tiempo límite
+    (`timeout`).
+
+    **Requiere autenticación.**
+    """,
+    responses={
+        400: {"description": "Cursor o clave inválidos, o Cypher inválido"},
+        401: {"description": "No autenticado"},
+        403: {"description": "La consulta o la conexión pertenecen a otro usuario"},
+        404: {"description": "Consulta o conexión no encontrada"},
+        503: {"description": "No se puede conectar con Neo4j"},
+        504: {"description": "La consulta excedió el tiempo límite"},
+    },
+)
+async def execute_query_page(
+    request: ExecutePageRequest,
+    response: Response,
+    current_user: User = Depends(get_current_user),  # noqa: B008
+    db: Session = Depends(get_db),  # noqa: B008
+):
+    """
+    Ejecuta una página de una consulta traducida.
+
+    Args:
+        request: Solicitud con la consulta, el tamaño de página y el cursor
+        response: Respuesta, para añadir las cabeceras de caché
+        current_user: Usuario autenticado
+        db: Sesión de base de datos
+
+    Returns:
+        ExecutePageResponse: Filas de la página y cursor de la siguiente
+    """
+    query, connection = await run_in_threadpool(
+        _load_execution_target, db, request, current_user.user_id
+    )
+    page, age = await ExecutionService.execute_page(
+        db,
+        query,
+        connection,
+        page_size=request.page_size,
+        cursor=request.cursor,
+        order_key=request.order_key,
+        user_id=current_user.user_id,
+        cache_ttl=request.cache_ttl,
+        timeout=ExecutionService.effective_timeout(connection, request.timeout),
+    )
+    response.headers.update(
+        _cache_headers(ExecutionService.uses_result_cache(request.cache_ttl), age)
+    )
+    return ExecutePageResponse(**page)
+
+
+@router.post(
+    "/explain",
+    response_model=ExplainResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Obtener el plan de ejecución de una consulta",
+    description="""
+    Devuelve el plan de ejecución de Neo4j para el Cypher de una consulta del
+    historial, para conocer su coste antes de ejecutarla.
+
+    - `profile = false` (por defecto): `EXPLAIN`, la consulta no se ejecuta y
+      solo hay estimaciones
+    - `profile = true`: `PROFILE`, la consulta se ejecuta (sus filas se
+      descartan y la transacción se deshace) y el plan incluye db hits y
+      filas reales
+
+    La respuesta incluye el árbol de operadores, las filas estimadas, el
+    coste estimado (suma de filas estimadas de todos los operadores), avisos
+    de recorridos por etiqueta sin índice y si la política de admisión
+    (`EXECUTION_MAX_ESTIMATED_COST`) permitiría ejecutarla. El resumen del
+    plan se guarda en el historial de la consulta.
+
+    **Requiere autenticación.**
+    """,
+    responses={
+        400: {"description": "Consulta sin traducción o Cypher inválido"},
+        401: {"description": "No autenticado"},
+        403: {"description": "La consulta o la conexión pertenecen a otro usuario"},
+        404: {"description": "Consulta o conexión no encontrada"},
+        503: {"description": "No se puede conectar con Neo4j"},
+        504: {"description": "El plan no se obtuvo dentro del tiempo límite"},
+    },
+)
+async def explain_query(
+    request: ExplainRequest,
+    current_user: User = Depends(get_current_user),  # noqa: B008
+    db: Session = Depends(get_db),  # noqa: B008
+):
+    """
+    Obtiene el plan de ejecución de una consulta traducida.
+
+    Args:
+        request: Solicitud con la consulta y el modo (EXPLAIN o PROFILE)
+        current_user: Usuario autenticado
+        db: Sesión de base de datos
+
+    Returns:
+        ExplainResponse: Árbol del plan, coste estimado y avisos
+    """
+    query, connection = await run_in_threadpool(
+        _load_execution_target, db, request, current_user.user_id
+    )
+    plan = await ExecutionService.explain_query(
+        db,
+        query,
+        connection,
+        profile=request.profile,
+        timeout=ExecutionService.effective_timeout(connection, request.timeout),
     )
+    return ExplainResponse(**plan)
+
+
+@router.delete(
+    "/execute/cache",
+    response_model=CacheInvalidationResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Invalidar resultados cacheados",
+    description="""
+    Elimina de la caché de resultados las ejecuciones del usuario autenticado,
+    todas o solo las de la conexión indicada en `neo4j_connection_id`.
+
+    Los resultados de una conexión también se invalidan automáticamente al
+    modificarla o eliminarla.
+
+    **Requiere autenticación.**
+    """,
+    responses={
+        401: {"description": "No autenticado"},
+        403: {"description": "La conexión pertenece a otro usuario"},
+        404: {"description": "Conexión no encontrada"},
+    },
+)
+def invalidate_execution_cache(
+    neo4j_connection_id: Optional[int] = Query(
+        default=None, description="Limitar a los resultados de esta conexión"
+    ),
+    current_user: User = Depends(get_current_user),  # noqa: B008
+    db: Session = Depends(get_db),  # noqa: B008
+):
+    """
+    Invalida los resultados cacheados del usuario.
+
+    Args:
+        neo4j_connection_id: Conexión cuyos resultados se invalidan (opcional)
+        current_user: Usuario autenticado
+        db: Sesión de base de datos
+
+    Returns:
+        CacheInvalidationResponse: Número de entradas eliminadas
+    """
+    if neo4j_connection_id is not None:
+        # Valida que la conexión existe y pertenece al usuario
+        ConnectionService.get_connection(db, neo4j_connection_id, current_user.user_id)
+    invalidated = ExecutionService.invalidate_results(
+        user_id=current_user.user_id, connection_id=neo4j_connection_id
+    )
+    return CacheInvalidationResponse(invalidated=invalidated)
+
+
+@router.get(
+    "/execute/cache/stats",
+    response_model=ExecutionCacheStatsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Métricas de la caché de resultados",
+    description="""
+    Devuelve el tamaño, los límites y los contadores de aciertos, fallos,
+    desalojos y caducidades de la caché de resultados de ejecución.
+
+    **Requiere rol ADMIN.**
+    """,
+    responses={
+        401: {"description": "No autenticado"},
+        403: {"description": "Se requiere rol de administrador"},
+    },
+)
+def get_execution_cache_stats(
+    current_user: User = Depends(require_admin),  # noqa: B008
+):
+    """
+    Obtiene las métricas de la caché de resultados de ejecución.
+
+    Args:
+        current_user: Usuario autenticado con rol ADMIN
+
+    Returns:
+        ExecutionCacheStatsResponse: Métricas de la caché
+    """
+    return ExecutionCacheStatsResponse(**ExecutionService.get_cache_stats())
+
+
+def _cache_headers(cached: bool, age: Optional[float]) -> dict:
+    """
+    Cabeceras que indican si un resultado se sirvió desde la caché.
+
+    Args:
+        cached: Si la ejecución podía usar la caché
+        age: Antigüedad del resultado cacheado en segundos (None si se ejecutó)
+
+    Returns:
+        dict: X-Cache (HIT, MISS o BYPASS) y Age en los aciertos
+    """
+    if not cached:
+        return {"X-Cache": "BYPASS"}
+    if age is None:
+        return {"X-Cache": "MISS"}
+    return {"X-Cache": "HIT", "Age": str(int(age))}
+
+
+def _load_execution_target(
+    db: Session,
+    request: ExecuteRequest | ExecutePageRequest | ExplainRequest,
+    user_id: int,
+) -> tuple[QueryModel, Connection]:
+    """
+    Obtiene la consulta a ejecutar y la conexión Neo4j en la que ejecutarla.
+
+    Args:
+        db: Sesión de base de datos
+        request: Solicitud de ejecución
+        user_id: ID del usuario autenticado
+
+    Returns:
+        tuple: Consulta del historial y conexión validadas
+
+    Raises:
+        HTTPException: Si la consulta no tiene conexión asociada
+    """
+    query = ExecutionService.get_executable_query(db, request.query_id, user_id)
+    connection_id = request.neo4j_connection_id or query.neo4j_connection_id
+    if connection_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="La consulta no tiene una conexión Neo4j asociada",
+        )
+    connection = ConnectionService.get_connection(db, connection_id, user_id)
+    return query, connection
+
+
+def _load_batch_targets(
+    db: Session, request: ExecuteBatchRequest, user_id: int
+) -> tuple[List[QueryModel], Connection]:
+    """
+    Obtiene las consultas de un lote y la conexión Neo4j en la que ejecutarlas.
+
+    Args:
+        db: Sesión de base de datos
+        request: Solicitud de ejecución por lotes
+        user_id: ID del usuario autenticado
+
+    Returns:
+        tuple: Consultas en el orden de la solicitud y conexión validadas
+    """
+    queries = ExecutionService.get_executable_queries(db, request.query_ids, user_id)
+    connection_id = ExecutionService.resolve_batch_connection_id(
+        queries, request.neo4j_connection_id
+    )
+    connection = ConnectionService.get_connection(db, connection_id, user_id)
+    return queries, connection
+
+
+def _source_schema(
+    db: Session, connection_id: Optional[int], user_id: int
+) -> Optional[SchemaCatalog]:
+    """
+    Obtiene el catálogo del esquema de la conexión SQL Server de origen.
+
+    Args:
+        db: Sesión de base de datos
+        connection_id: ID de la conexión de origen (None si no se indicó)
+        user_id: ID del usuario autenticado
+
+    Returns:
+        SchemaCatalog o None si no se indicó conexión de origen
+
+    Raises:
+        ValidationError: Si la conexión no es de SQL Server
+        DatabaseConnectionError: Si no se puede leer el esquema
+    """
+    if connection_id is None:
+        return None
+    connection = ConnectionService.get_connection(db, connection_id, user_id)
+    return SchemaService.get_catalog(connection)
 
 
 @router.get(
@@ -232,6 +884,7 @@ def get_query_history(
             query_id=q.query_id,
             sql_query=q.sql_query,
             cypher_query=q.cypher_query,
+            cypher_parameters=q.cypher_parameters,
             status=q.status.value,
             error_message=q.error_message,
             translation_time=q.translation_time,
@@ -239,6 +892,38 @@ def get_query_history(
             nodes_affected=q.nodes_affected,
             created_at=q.created_at,
             neo4j_connection_id=q.neo4j_connection_id,
+            from_cache=q.from_cache,
         )
         for q in queries
     ]
+
+
+@router.get(
+    "/cache/stats",
+    response_model=TranslationCacheStatsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Métricas de la caché de traducciones",
+    description="""
+    Devuelve el tamaño, los límites y los contadores de aciertos y fallos
+    de la caché en memoria de traducciones.
+
+    **Requiere rol ADMIN.**
+    """,
+    responses={
+        401: {"description": "No autenticado"},
+        403: {"description": "Se requiere rol de administrador"},
+    },
+)
+def get_translation_cache_stats(
+    current_user: User = Depends(require_admin),  # noqa: B008
+):
+    """
+    Obtiene las métricas de la caché de traducciones.
+
+    Args:
+        current_user: Usuario autenticado con rol ADMIN
+
+    Returns:
+        TranslationCacheStatsResponse: Métricas de la caché
+    """
+    return TranslationCacheStatsResponse(**TranslationService.get_cache_stats())
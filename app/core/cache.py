@@ -0,0 +1,210 @@
+"""
+Cachés en memoria compartidas por los servicios.
+
+Proporciona una caché LRU thread-safe acotada por número de entradas y por
+tamaño total en bytes, con caducidad opcional por entrada, contadores de
+aciertos, fallos, desalojos y caducidades y aviso opcional al descartar cada
+valor.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+class LRUCache:
+    """
+    Caché LRU acotada por entradas y bytes.
+
+    El tamaño de cada valor lo indica quien lo inserta, ya que solo el
+    llamador sabe qué representa ese valor en memoria.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_bytes: int,
+        on_discard: Optional[Callable[[Any], None]] = None,
+    ):
+        """
+        Inicializa la caché vacía.
+
+        Args:
+            max_entries: Número máximo de entradas (0 desactiva la caché)
+            max_bytes: Tamaño máximo total en bytes (0 desactiva la caché)
+            on_discard: Función que recibe cada valor que sale de la caché
+                (desalojado, caducado, reemplazado, invalidado o limpiado);
+                se llama con el lock tomado, así que debe ser rápida
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.on_discard = on_discard
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _discard(self, entry: tuple) -> None:
+        """Avisa de que el valor de una entrada sale de la caché."""
+        if self.on_discard is not None:
+            self.on_discard(entry[0])
+
+    @property
+    def enabled(self) -> bool:
+        """Indica si la caché puede almacenar entradas."""
+        return self.max_entries > 0 and self.max_bytes > 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Obtiene un valor y lo marca como usado recientemente.
+
+        Args:
+            key: Clave de la entrada
+
+        Returns:
+            Valor almacenado o None si no existe o ha caducado
+        """
+        entry = self.get_with_age(key)
+        return None if entry is None else entry[0]
+
+    def get_with_age(self, key: Hashable) -> Optional[tuple[Any, float]]:
+        """
+        Obtiene un valor junto con los segundos transcurridos desde que se guardó.
+
+        Args:
+            key: Clave de la entrada
+
+        Returns:
+            tuple: (valor, antigüedad en segundos) o None si no existe o ha
+                caducado
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[3] is not None and entry[3] <= now:
+                del self._entries[key]
+                self._bytes -= entry[1]
+                self.expirations += 1
+                self._discard(entry)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0], now - entry[2]
+
+    def set(
+        self, key: Hashable, value: Any, size: int, ttl: Optional[float] = None
+    ) -> bool:
+        """
+        Inserta o reemplaza un valor, desalojando los menos usados si hace falta.
+
+        Args:
+            key: Clave de la entrada
+            value: Valor a almacenar
+            size: Tamaño aproximado del valor en bytes
+            ttl: Segundos de validez de la entrada (None = sin caducidad)
+
+        Returns:
+            bool: False si la caché está desactivada o el valor no cabe
+        """
+        if not self.enabled or size > self.max_bytes:
+            return False
+
+        now = time.monotonic()
+        expires_at = now + ttl if ttl is not None else None
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+                self._discard(previous)
+
+            self._entries[key] = (value, size, now, expires_at)
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted[1]
+                self.evictions += 1
+                self._discard(evicted)
+
+        return True
+
+    def invalidate(self, key: Hashable) -> bool:
+        """
+        Elimina una entrada de la caché.
+
+        Args:
+            key: Clave de la entrada
+
+        Returns:
+            bool: True si la entrada existía
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return False
+            self._bytes -= entry[1]
+            self._discard(entry)
+            return True
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """
+        Elimina las entradas cuya clave cumple una condición.
+
+        Args:
+            predicate: Función que recibe la clave y devuelve True para borrarla
+
+        Returns:
+            int: Número de entradas eliminadas
+        """
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                entry = self._entries.pop(key)
+                self._bytes -= entry[1]
+                self._discard(entry)
+            return len(keys)
+
+    def clear(self) -> None:
+        """Elimina todas las entradas y reinicia los contadores."""
+        with self._lock:
+            for entry in self._entries.values():
+                self._discard(entry)
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.expirations = 0
+
+    def stats(self) -> dict:
+        """
+        Devuelve el estado actual de la caché.
+
+        Returns:
+            dict: Entradas, bytes, límites y contadores de uso
+        """
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
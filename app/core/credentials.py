@@ -0,0 +1,154 @@
+"""
+Caché en memoria de credenciales desencriptadas.
+
+Cada conexión saliente necesita la contraseña guardada en claro, y
+desencriptarla con Fernet (HMAC + AES) en cada apertura tiene un coste fijo.
+Esta caché guarda el resultado durante un tiempo corto:
+- La clave es (connection_id, SHA-256 del texto encriptado), así que al
+  cambiar la contraseña la entrada anterior deja de usarse sin invalidarla
+- El texto en claro se guarda en un bytearray que se sobrescribe con ceros
+  al salir de la caché; las copias str que reciben los drivers no se pueden
+  borrar y quedan a cargo del recolector de basura
+- Mide el tiempo de cada desencriptado para estimar el coste ahorrado por
+  los aciertos
+"""
+
+import hashlib
+import threading
+import time
+from typing import Optional
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.core.security import decrypt_data
+
+# Las contraseñas admiten hasta 255 caracteres (1020 bytes en UTF-8), así que
+# el límite de bytes nunca es más estricto que el de entradas
+_MAX_SECRET_BYTES = 1020
+
+
+def _zero(secret: bytearray) -> None:
+    """Sobrescribe con ceros el texto en claro de una entrada."""
+    secret[:] = bytes(len(secret))
+
+
+class CredentialCache:
+    """Caché LRU con caducidad de contraseñas desencriptadas."""
+
+    def __init__(self, max_entries: int, ttl: Optional[float]):
+        """
+        Inicializa la caché vacía.
+
+        Args:
+            max_entries: Número máximo de contraseñas (0 desactiva la caché)
+            ttl: Segundos de validez de cada contraseña (None = sin caducidad)
+        """
+        self.ttl = ttl
+        self._cache = LRUCache(
+            max_entries=max_entries,
+            max_bytes=max_entries * _MAX_SECRET_BYTES,
+            on_discard=_zero,
+        )
+        # Protege la lectura de una entrada frente a que otro hilo la borre
+        # (y la sobrescriba con ceros) mientras se copia
+        self._lock = threading.Lock()
+        self.decrypts = 0
+        self.decrypt_seconds = 0.0
+
+    @staticmethod
+    def _key(connection_id: Optional[int], ciphertext: str) -> tuple:
+        digest = hashlib.sha256(ciphertext.encode("utf-8")).hexdigest()
+        return connection_id, digest
+
+    def decrypt(self, connection_id: Optional[int], ciphertext: str) -> str:
+        """
+        Devuelve la contraseña en claro, desencriptándola solo si no está en caché.
+
+        Args:
+            connection_id: ID de la conexión a la que pertenece la contraseña
+            ciphertext: Contraseña encriptada guardada en la conexión
+
+        Returns:
+            str: Contraseña desencriptada
+
+        Raises:
+            ValueError: Si no se puede desencriptar
+        """
+        key = self._key(connection_id, ciphertext)
+        with self._lock:
+            secret = self._cache.get(key)
+            if secret is not None:
+                return secret.decode("utf-8")
+
+        start = time.perf_counter()
+        plaintext = decrypt_data(ciphertext)
+        elapsed = time.perf_counter() - start
+
+        secret = bytearray(plaintext.encode("utf-8"))
+        with self._lock:
+            self.decrypts += 1
+            self.decrypt_seconds += elapsed
+            if not self._cache.set(key, secret, len(secret), ttl=self.ttl):
+                _zero(secret)
+        return plaintext
+
+    def invalidate(self, connection_id: int) -> int:
+        """
+        Descarta las contraseñas en caché de una conexión.
+
+        Args:
+            connection_id: ID de la conexión
+
+        Returns:
+            int: Número de entradas eliminadas
+        """
+        with self._lock:
+            return self._cache.invalidate_where(lambda key: key[0] == connection_id)
+
+    def clear(self) -> None:
+        """Descarta todas las contraseñas y reinicia los contadores."""
+        with self._lock:
+            self._cache.clear()
+            self.decrypts = 0
+            self.decrypt_seconds = 0.0
+
+    def stats(self) -> dict:
+        """
+        Devuelve el estado de la caché y el coste de desencriptado ahorrado.
+
+        El ahorro se estima como aciertos × duración media de un desencriptado.
+
+        Returns:
+            dict: Entradas, límites, contadores de uso, desencriptados hechos,
+                su duración total y media en ms y los ms ahorrados
+        """
+        with self._lock:
+            stats = self._cache.stats()
+            decrypts = self.decrypts
+            decrypt_ms = self.decrypt_seconds * 1000
+        average_ms = decrypt_ms / decrypts if decrypts else 0.0
+        return {
+            "enabled": stats["enabled"],
+            "entries": stats["entries"],
+            "max_entries": stats["max_entries"],
+            "ttl_seconds": self.ttl,
+            "hits": stats["hits"],
+            "misses": stats["misses"],
+            "evictions": stats["evictions"],
+            "expirations": stats["expirations"],
+            "decrypts": decrypts,
+            "decrypt_ms_total": round(decrypt_ms, 3),
+            "decrypt_ms_avg": round(average_ms, 3),
+            "saved_ms": round(stats["hits"] * average_ms, 3),
+        }
+
+
+# Caché de contraseñas compartida por toda la aplicación
+credential_cache = CredentialCache(
+    max_entries=(
+        settings.CREDENTIAL_CACHE_MAX_ENTRIES
+        if settings.CREDENTIAL_CACHE_ENABLED
+        else 0
+    ),
+    ttl=settings.CREDENTIAL_CACHE_TTL_SECONDS or None,
+)
@@ -38,6 +38,13 @@ class DatabaseConnectionError(HTTPException):
         super().__init__(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=detail)
 
 
+class QueryTimeoutError(HTTPException):
+    """Excepción para consultas que exceden su tiempo límite."""
+
+    def __init__(self, detail: str):
+        super().__init__(status_code=status.HTTP_504_GATEWAY_TIMEOUT, detail=detail)
+
+
 class ConflictError(HTTPException):
     """Excepción para conflictos de recursos."""
 
@@ -0,0 +1,215 @@
+"""
+Motor de parsing reutilizable para la gramática SQLSimple.
+
+Construir un lexer, un token stream y un parser de ANTLR en cada traducción
+es costoso frente a consultas cortas. Este módulo mantiene una instancia de
+cada componente por hilo y solo reinicia sus streams de entrada entre
+consultas. Las cachés DFA de ANTLR son atributos de clase del lexer y del
+parser generados, por lo que se comparten entre hilos y pueden precalentarse
+al iniciar la aplicación con un corpus representativo.
+
+El parsing se hace en dos etapas: primero con predicción SLL y una estrategia
+de error que aborta al primer fallo, y solo si esa etapa falla se reparsea con
+predicción LL completa y recuperación de errores. SLL es suficiente para casi
+todas las consultas válidas y evita el coste del LL completo en cadenas
+largas de AND/OR.
+
+La consulta se tokeniza una sola vez por petición: la validación de seguridad,
+la normalización para la caché y el parser trabajan sobre el mismo token
+stream, que el motor reutiliza mientras el texto de entrada no cambie.
+"""
+
+import threading
+
+from antlr4 import CommonTokenStream, InputStream
+from antlr4.atn.PredictionMode import PredictionMode
+from antlr4.error.ErrorListener import ErrorListener
+from antlr4.error.Errors import ParseCancellationException
+from antlr4.error.ErrorStrategy import BailErrorStrategy, DefaultErrorStrategy
+
+from app.core.parser.generated.SQLSimpleLexer import SQLSimpleLexer
+from app.core.parser.generated.SQLSimpleParser import SQLSimpleParser
+
+# Corpus usado para precalentar las cachés DFA del lexer y del parser.
+# Cubre todas las alternativas de la gramática y un error de sintaxis típico.
+WARMUP_QUERIES = (
+    "SELECT * FROM Users",
+    "SELECT name, email FROM Users",
+    "SELECT name FROM Users WHERE age > 18",
+    "SELECT * FROM Products WHERE price <= 100.50",
+    "SELECT * FROM Users WHERE status != 'inactive' AND role <> 'guest'",
+    "SELECT * FROM Users WHERE active = true OR verified = false",
+    "SELECT * FROM Users WHERE last_login = null",
+    "SELECT * FROM Users WHERE (age >= 18 AND age < 65) OR role = 'admin'",
+    "select id from orders where total > 10 -- comentario",
+    "SELECT /* bloque */ id FROM Orders WHERE (a = 1 OR b = 2) AND c = 'x'",
+    "SELECT TOP 10 name FROM Users WHERE age > 18 ORDER BY age DESC, name ASC",
+    "SELECT * FROM Users ORDER BY name LIMIT 10 OFFSET 20",
+    "SELECT FROM WHERE",
+)
+
+
+class SQLErrorListener(ErrorListener):
+    """Captura errores de lexing y parsing."""
+
+    def __init__(self):
+        super().__init__()
+        # (línea, columna, mensaje) de cada error, en orden de aparición
+        self.reported = []
+
+    @property
+    def errors(self) -> list[str]:
+        """Mensajes de los errores capturados."""
+        return [message for _, _, message in self.reported]
+
+    def reset(self):
+        """Descarta los errores de la consulta anterior."""
+        self.reported = []
+
+    def syntaxError(self, recognizer, offending_symbol, line, column, msg, e):
+        self.reported.append((line, column, f"Línea {line}:{column} - {msg}"))
+
+
+class ParserEngine:
+    """
+    Pipeline lexer -> token stream -> parser reutilizable.
+
+    Las instancias no son thread-safe; usar get_parser_engine() para obtener
+    el motor asociado al hilo actual.
+    """
+
+    def __init__(self):
+        """Crea los componentes de ANTLR una sola vez."""
+        self.lexer_listener = SQLErrorListener()
+        self.parser_listener = SQLErrorListener()
+
+        self.lexer = SQLSimpleLexer(InputStream(""))
+        self.lexer.removeErrorListeners()
+        self.lexer.addErrorListener(self.lexer_listener)
+
+        self.token_stream = CommonTokenStream(self.lexer)
+
+        self.parser = SQLSimpleParser(self.token_stream)
+        self.parser.removeErrorListeners()
+        self.parser.addErrorListener(self.parser_listener)
+
+        self._bail_strategy = BailErrorStrategy()
+        self._default_strategy = DefaultErrorStrategy()
+
+        # Texto cuyo token stream está cargado actualmente
+        self._tokenized_sql = None
+
+        # Consultas que no pudieron resolverse con SLL
+        self.ll_fallbacks = 0
+
+    @property
+    def lexer_errors(self) -> list[str]:
+        """Errores léxicos de la última consulta tokenizada."""
+        return list(self.lexer_listener.errors)
+
+    def tokenize(self, sql_query: str) -> list:
+        """
+        Tokeniza una consulta completa, reutilizando el resultado anterior
+        si el texto no ha cambiado.
+
+        Args:
+            sql_query: Consulta SQL a tokenizar
+
+        Returns:
+            list: Tokens del canal por defecto, terminando en EOF
+        """
+        if sql_query is not self._tokenized_sql and sql_query != self._tokenized_sql:
+            self._tokenized_sql = None
+            self.lexer_listener.reset()
+            self.lexer.inputStream = InputStream(sql_query)
+            self.token_stream.setTokenSource(self.lexer)
+            self.token_stream.fill()
+            self._tokenized_sql = sql_query
+        return self.token_stream.tokens
+
+    def parse(self, sql_query: str):
+        """
+        Parsea una consulta reutilizando el lexer y el parser.
+
+        Intenta primero con predicción SLL y, si falla, repite el parsing con
+        LL completo sobre los mismos tokens. Ambas etapas reportan los mismos
+        errores: los léxicos de la tokenización y los del parser LL, ordenados
+        por posición como cuando el lexer se ejecutaba durante el parsing.
+
+        Args:
+            sql_query: Consulta SQL a parsear
+
+        Returns:
+            tuple: (árbol de la regla query, lista de errores de sintaxis)
+        """
+        self.tokenize(sql_query)
+
+        # Etapa 1: SLL, abortando en el primer error
+        self._prepare(PredictionMode.SLL, self._bail_strategy)
+        try:
+            tree = self.parser.query()
+            return tree, self._errors()
+        except ParseCancellationException:
+            self.ll_fallbacks += 1
+
+        # Etapa 2: LL completo con recuperación y reporte de errores
+        self._prepare(PredictionMode.LL, self._default_strategy)
+        tree = self.parser.query()
+        return tree, self._errors()
+
+    def _errors(self) -> list[str]:
+        """Errores léxicos y sintácticos de la consulta ordenados por posición."""
+        reported = self.lexer_listener.reported + self.parser_listener.reported
+        # sorted() es estable: en la misma posición el error léxico va antes
+        return [message for _, _, message in sorted(reported, key=lambda e: e[:2])]
+
+    def _prepare(self, prediction_mode, error_strategy):
+        """
+        Rebobina el token stream y reinicia el parser con un modo de predicción.
+
+        Args:
+            prediction_mode: Modo de predicción de ANTLR (SLL o LL)
+            error_strategy: Estrategia de manejo de errores del parser
+        """
+        self.parser_listener.reset()
+
+        self.parser._interp.predictionMode = prediction_mode
+        self.parser._errHandler = error_strategy
+
+        self.token_stream.seek(0)
+        self.parser.setTokenStream(self.token_stream)
+
+
+_local = threading.local()
+
+
+def get_parser_engine() -> ParserEngine:
+    """
+    Obtiene el motor de parsing del hilo actual, creándolo si no existe.
+
+    Returns:
+        ParserEngine: Motor reutilizable del hilo
+    """
+    engine = getattr(_local, "engine", None)
+    if engine is None:
+        engine = ParserEngine()
+        _local.engine = engine
+    return engine
+
+
+def warm_up(queries=WARMUP_QUERIES) -> int:
+    """
+    Precalienta las cachés DFA compartidas parseando un corpus de consultas.
+
+    Args:
+        queries: Consultas a parsear (por defecto WARMUP_QUERIES)
+
+    Returns:
+        int: Número de consultas parseadas
+    """
+    engine = get_parser_engine()
+    count = 0
+    for sql_query in queries:
+        engine.parse(sql_query)
+        count += 1
+    return count
@@ -0,0 +1,349 @@
+"""
+Ejecutor de traducciones en un pool de procesos.
+
+El parsing con ANTLR y el visitor son Python puro y dependen de la CPU, así
+que dentro del threadpool de Starlette compiten por el GIL y una consulta
+grande retrasa al resto de peticiones. Este módulo permite delegar la
+traducción a un pool de procesos: cada worker carga la gramática y precalienta
+sus cachés DFA al arrancar, las tareas tienen un tiempo límite y los lotes se
+reparten en trozos para amortizar el coste de comunicación entre procesos.
+
+Un worker no puede interrumpirse a mitad de una tarea: si vence el tiempo
+límite de un trozo que ya se está ejecutando, el pool se descarta y sus
+procesos se terminan para que la consulta atascada no siga ocupando un
+worker; la siguiente tarea arranca un pool nuevo.
+"""
+
+import math
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional, Union
+
+from app.core.config import settings
+from app.core.parser.engine import warm_up
+from app.core.parser.schema import SchemaCatalog
+from app.core.parser.visitor import translate_sql_to_cypher
+
+
+class TranslationTimeoutError(Exception):
+    """La traducción no terminó dentro del tiempo límite."""
+
+    def __init__(self, timeout: float):
+        super().__init__(
+            f"La traducción excedió el tiempo límite de {timeout * 1000:.0f} ms"
+        )
+        self.timeout = timeout
+
+
+# Resultado de una consulta: (resultado del visitor o excepción, tiempo en ms)
+TranslationOutcome = tuple[Union[dict, Exception], float]
+
+
+def _init_worker(started=None) -> None:
+    """
+    Inicializa un worker: carga la gramática y precalienta las cachés DFA.
+
+    Args:
+        started: Cola en la que el worker anuncia su pid (opcional)
+    """
+    if started is not None:
+        started.put(os.getpid())
+    warm_up()
+
+
+def _ping() -> int:
+    """Tarea vacía usada para forzar el arranque de los workers."""
+    return os.getpid()
+
+
+def _translate_chunk(
+    sql_queries: list[str],
+    parameterize: bool,
+    schema: Optional[SchemaCatalog] = None,
+) -> list[tuple]:
+    """
+    Traduce un trozo de consultas dentro de un worker.
+
+    Args:
+        sql_queries: Consultas ya validadas
+        parameterize: Si True, los literales se devuelven como parámetros
+        schema: Catálogo del esquema de origen (opcional)
+
+    Returns:
+        list[tuple]: (resultado o excepción, tiempo en ms) por consulta
+    """
+    outcomes = []
+    for sql_query in sql_queries:
+        start_time = time.perf_counter()
+        try:
+            outcome = translate_sql_to_cypher(
+                sql_query, parameterize=parameterize, schema=schema
+            )
+        except Exception as e:
+            outcome = e
+        outcomes.append((outcome, (time.perf_counter() - start_time) * 1000))
+    return outcomes
+
+
+class TranslationExecutor:
+    """
+    Pool de procesos para traducir consultas SQL a Cypher.
+
+    Los workers se crean con el método "spawn" para no heredar hilos ni
+    conexiones abiertas del proceso del servidor.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, timeout: float = 5.0):
+        """
+        Configura el pool sin arrancar todavía los procesos.
+
+        Args:
+            max_workers: Número de procesos (None o 0 usa os.cpu_count())
+            timeout: Tiempo límite por consulta en segundos (0 sin límite)
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self._pool: Optional[ProcessPoolExecutor] = None
+        # Pool -> cola en la que sus workers anuncian su pid al arrancar
+        self._started: dict = {}
+        self._lock = threading.Lock()
+        self.timeouts = 0
+        self.recycles = 0
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Obtiene el pool, creándolo si no existe o si quedó roto."""
+        with self._lock:
+            if self._pool is None:
+                context = multiprocessing.get_context("spawn")
+                started = context.SimpleQueue()
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=context,
+                    initializer=_init_worker,
+                    initargs=(started,),
+                )
+                self._started[self._pool] = started
+            return self._pool
+
+    def _release(self, pool: ProcessPoolExecutor) -> set[int]:
+        """
+        Retira un pool del ejecutor y devuelve los pids de sus workers.
+
+        Returns:
+            set[int]: Pids que los workers anunciaron al arrancar
+        """
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+            started = self._started.pop(pool, None)
+        pids = set()
+        if started is not None:
+            while not started.empty():
+                pids.add(started.get())
+        return pids
+
+    def _discard_pool(self, pool: ProcessPoolExecutor) -> None:
+        """Descarta un pool roto para que la siguiente tarea cree otro."""
+        self._release(pool)
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def _recycle_pool(self, pool: ProcessPoolExecutor) -> None:
+        """
+        Descarta un pool con un worker atascado y termina sus procesos.
+
+        Las tareas de otras peticiones que seguían en ese pool reciben un
+        error en lugar de esperar detrás de la consulta atascada.
+        """
+        # ProcessPoolExecutor no expone sus procesos (terminate_workers()
+        # solo existe desde Python 3.14), así que se usan los pids que los
+        # workers anuncian en _init_worker(). Se cruzan con los hijos vivos
+        # para no enviar la señal a un pid ya reutilizado por otro proceso.
+        pids = self._release(pool)
+        pool.shutdown(wait=False, cancel_futures=True)
+        for process in multiprocessing.active_children():
+            if process.pid in pids:
+                process.terminate()
+        self.recycles += 1
+
+    def _submit(
+        self,
+        chunks: list[list[str]],
+        parameterize: bool,
+        schema: Optional[SchemaCatalog],
+    ) -> tuple[ProcessPoolExecutor, list]:
+        """
+        Envía los trozos al pool; si está roto, lo reintenta una vez con otro.
+
+        Raises:
+            RuntimeError: Si tampoco el pool nuevo acepta las tareas
+        """
+        pool = self._get_pool()
+        try:
+            return pool, [
+                pool.submit(_translate_chunk, chunk, parameterize, schema)
+                for chunk in chunks
+            ]
+        except RuntimeError:
+            # BrokenProcessPool (murió un worker) o pool ya cerrado porque
+            # otra petición lo recicló; ambos son RuntimeError
+            self._discard_pool(pool)
+        pool = self._get_pool()
+        return pool, [
+            pool.submit(_translate_chunk, chunk, parameterize, schema)
+            for chunk in chunks
+        ]
+
+    def start(self) -> int:
+        """
+        Arranca y precalienta todos los workers.
+
+        Returns:
+            int: Número de procesos distintos que respondieron
+        """
+        pool = self._get_pool()
+        futures = [pool.submit(_ping) for _ in range(self.max_workers)]
+        return len({future.result() for future in futures})
+
+    def shutdown(self) -> None:
+        """Detiene los workers y libera el pool."""
+        with self._lock:
+            pool = self._pool
+        if pool is not None:
+            self._release(pool)
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def translate(
+        self,
+        sql_query: str,
+        parameterize: bool = False,
+        schema: Optional[SchemaCatalog] = None,
+    ) -> dict:
+        """
+        Traduce una consulta en un worker.
+
+        Args:
+            sql_query: Consulta ya validada
+            parameterize: Si True, los literales se devuelven como parámetros
+            schema: Catálogo del esquema de origen (opcional)
+
+        Returns:
+            dict: Resultado de translate_sql_to_cypher()
+
+        Raises:
+            TranslationTimeoutError: Si se supera el tiempo límite
+            Exception: Cualquier error producido por el traductor
+        """
+        outcome, _ = self.translate_many([sql_query], parameterize, schema)[0]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    def translate_many(
+        self,
+        sql_queries: list[str],
+        parameterize: bool = False,
+        schema: Optional[SchemaCatalog] = None,
+    ) -> list[TranslationOutcome]:
+        """
+        Traduce varias consultas repartiéndolas entre los workers.
+
+        Las consultas se agrupan en un trozo por worker. Los trozos corren en
+        paralelo, así que comparten un único plazo, calculado al enviarlos: el
+        tiempo límite de una consulta multiplicado por el tamaño del trozo
+        mayor. Si un trozo no termina a tiempo, todas sus consultas reciben un
+        TranslationTimeoutError y, si ya se estaba ejecutando, el pool se
+        recicla al recoger el resto de trozos. Si el pool está roto al enviar
+        las tareas se reintenta una vez con uno nuevo; si tampoco es posible,
+        cada consulta recibe el error. El catálogo del esquema, si lo hay, se
+        envía a cada worker junto con su trozo.
+
+        Args:
+            sql_queries: Consultas ya validadas
+            parameterize: Si True, los literales se devuelven como parámetros
+            schema: Catálogo del esquema de origen (opcional)
+
+        Returns:
+            list: (resultado o excepción, tiempo en ms) por consulta, en orden
+        """
+        if not sql_queries:
+            return []
+
+        chunk_size = math.ceil(len(sql_queries) / self.max_workers)
+        chunks = [
+            sql_queries[i : i + chunk_size]
+            for i in range(0, len(sql_queries), chunk_size)
+        ]
+
+        submitted = time.monotonic()
+        try:
+            pool, futures = self._submit(chunks, parameterize, schema)
+        except RuntimeError as e:
+            return [(e, 0.0) for _ in sql_queries]
+        deadline = submitted + self.timeout * chunk_size if self.timeout else None
+
+        outcomes = []
+        stuck = False
+        for chunk, future in zip(chunks, futures, strict=True):
+            timeout = None
+            if deadline is not None:
+                # Los trozos se esperan uno tras otro: cada espera consume lo
+                # que queda del plazo común en lugar de sumar uno propio
+                timeout = max(0.0, deadline - time.monotonic())
+            try:
+                outcomes.extend(future.result(timeout=timeout))
+            except FutureTimeoutError:
+                # cancel() solo detiene trozos que aún no han empezado
+                stuck = stuck or not future.cancel()
+                self.timeouts += len(chunk)
+                error = TranslationTimeoutError(self.timeout)
+                elapsed = (time.monotonic() - submitted) * 1000
+                outcomes.extend((error, elapsed) for _ in chunk)
+            except BrokenProcessPool as e:
+                self._discard_pool(pool)
+                outcomes.extend((e, 0.0) for _ in chunk)
+            except CancelledError:
+                # Otra petición recicló el pool antes de que empezara el trozo
+                error = BrokenProcessPool(
+                    "El pool de traducción se reinició antes de traducir la consulta"
+                )
+                outcomes.extend((error, 0.0) for _ in chunk)
+        if stuck:
+            self._recycle_pool(pool)
+        return outcomes
+
+
+_executor: Optional[TranslationExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_translation_executor() -> Optional[TranslationExecutor]:
+    """
+    Obtiene el ejecutor de traducciones configurado.
+
+    Returns:
+        TranslationExecutor o None si el pool de procesos está desactivado
+    """
+    global _executor
+    if not settings.TRANSLATION_PROCESS_POOL_ENABLED:
+        return None
+    with _executor_lock:
+        if _executor is None:
+            _executor = TranslationExecutor(
+                max_workers=settings.TRANSLATION_PROCESS_POOL_SIZE,
+                timeout=settings.ANTLR_TIMEOUT_MS / 1000,
+            )
+        return _executor
+
+
+def shutdown_translation_executor() -> None:
+    """Detiene el ejecutor de traducciones si está en marcha."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown()
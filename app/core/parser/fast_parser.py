@@ -0,0 +1,341 @@
+"""
+Lexer y parser descendente recursivo escritos a mano para SQLSimple.
+
+La gramática SQLSimple es pequeña (TOP opcional, lista de columnas, una tabla,
+un WHERE con comparaciones, AND/OR y paréntesis, y ORDER BY, LIMIT y OFFSET
+opcionales) y el runtime de ANTLR para Python es
+pesado para ella. Este módulo reconoce el mismo lenguaje con una expresión
+regular y un parser por precedencia que reproduce la asociatividad y la
+precedencia de la regla recursiva por la izquierda `condition` (AND liga más
+que OR y ambos asocian por la izquierda).
+
+Solo se contemplan consultas válidas: ante cualquier carácter o secuencia de
+tokens que no reconozca, parse_select() devuelve None y el llamador recurre a
+ANTLR, que es quien genera los mensajes de error. Así ambos motores producen
+exactamente los mismos resultados.
+"""
+
+import re
+from typing import NamedTuple, Optional, Union
+
+from app.core.parser.generated.SQLSimpleLexer import SQLSimpleLexer
+
+# Palabras clave de la gramática (las reglas del lexer definidas antes de
+# IDENTIFIER, que tienen prioridad ante coincidencias de igual longitud)
+_KEYWORDS = {
+    name: getattr(SQLSimpleLexer, name)
+    for name in (
+        "SELECT",
+        "FROM",
+        "WHERE",
+        "AND",
+        "OR",
+        "TRUE",
+        "FALSE",
+        "NULL",
+        "TOP",
+        "ORDER",
+        "BY",
+        "ASC",
+        "DESC",
+        "LIMIT",
+        "OFFSET",
+        "DROP",
+        "DELETE",
+        "UPDATE",
+        "INSERT",
+        "CREATE",
+        "ALTER",
+        "TRUNCATE",
+        "GRANT",
+        "REVOKE",
+        "EXEC",
+        "EXECUTE",
+    )
+}
+
+# Palabras clave no reservadas: la regla `identifier` de la gramática también
+# las acepta como nombres de tabla o columna
+_SOFT_KEYWORDS = frozenset(
+    {
+        SQLSimpleLexer.TOP,
+        SQLSimpleLexer.ORDER,
+        SQLSimpleLexer.BY,
+        SQLSimpleLexer.ASC,
+        SQLSimpleLexer.DESC,
+        SQLSimpleLexer.LIMIT,
+        SQLSimpleLexer.OFFSET,
+    }
+)
+
+_SYMBOLS = {
+    "*": SQLSimpleLexer.ASTERISK,
+    ",": SQLSimpleLexer.COMMA,
+    "(": SQLSimpleLexer.LPAREN,
+    ")": SQLSimpleLexer.RPAREN,
+    "=": SQLSimpleLexer.EQ,
+    "!=": SQLSimpleLexer.NEQ,
+    "<>": SQLSimpleLexer.NEQ,
+    "<": SQLSimpleLexer.LT,
+    ">": SQLSimpleLexer.GT,
+    "<=": SQLSimpleLexer.LTE,
+    ">=": SQLSimpleLexer.GTE,
+}
+
+# Reglas del lexer en el orden en que deben probarse. Los operadores de dos
+# caracteres van antes que los de uno para respetar la coincidencia más larga.
+_TOKEN_RE = re.compile(
+    r"""
+      (?P<skip>[ \t\r\n]+|--[^\r\n]*|/\*.*?\*/)
+    | (?P<word>[a-zA-Z_][a-zA-Z0-9_]*)
+    | (?P<string>'(?:[^']|'')*')
+    | (?P<number>[0-9]+(?:\.[0-9]+)?)
+    | (?P<symbol><=|>=|<>|!=|[=<>*,()])
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+_EOF = -1
+
+_LITERAL_TYPES = frozenset(
+    {
+        SQLSimpleLexer.STRING_LITERAL,
+        SQLSimpleLexer.NUMBER,
+        SQLSimpleLexer.TRUE,
+        SQLSimpleLexer.FALSE,
+        SQLSimpleLexer.NULL,
+    }
+)
+
+_COMPARISON_TYPES = frozenset(
+    {
+        SQLSimpleLexer.EQ,
+        SQLSimpleLexer.NEQ,
+        SQLSimpleLexer.LT,
+        SQLSimpleLexer.GT,
+        SQLSimpleLexer.LTE,
+        SQLSimpleLexer.GTE,
+    }
+)
+
+# Precedencia de los operadores lógicos, igual que en el parser generado
+# (precpred 2 para AND y 1 para OR)
+_LOGICAL_PRECEDENCE = {SQLSimpleLexer.AND: 2, SQLSimpleLexer.OR: 1}
+
+
+class Comparison(NamedTuple):
+    """Comparación `columna operador literal`."""
+
+    column: str
+    operator: str
+    value_type: int
+    value: str
+
+
+class LogicalCondition(NamedTuple):
+    """Condición AND/OR entre dos condiciones."""
+
+    operator: str
+    left: "Condition"
+    right: "Condition"
+
+
+class ParenCondition(NamedTuple):
+    """Condición entre paréntesis."""
+
+    condition: "Condition"
+
+
+Condition = Union[Comparison, LogicalCondition, ParenCondition]
+
+
+class SelectStatement(NamedTuple):
+    """Consulta SELECT reconocida por el parser rápido.
+
+    Los números de TOP, LIMIT y OFFSET se guardan como texto, igual que los
+    literales, y el visitor los valida al traducir.
+    """
+
+    table: str
+    columns: list[str]
+    condition: Optional[Condition]
+    order_by: tuple[tuple[str, str], ...] = ()
+    top: Optional[str] = None
+    limit: Optional[str] = None
+    offset: Optional[str] = None
+
+
+class _Unsupported(Exception):
+    """La entrada no es una consulta válida para el parser rápido."""
+
+
+def tokenize(sql_query: str) -> Optional[list[tuple[int, str]]]:
+    """
+    Tokeniza una consulta con las mismas reglas que el lexer de SQLSimple.
+
+    Args:
+        sql_query: Consulta SQL
+
+    Returns:
+        list: Pares (tipo de token de SQLSimpleLexer, texto) terminados en
+            EOF, o None si hay algún carácter no reconocido
+    """
+    tokens = []
+    pos = 0
+    length = len(sql_query)
+    while pos < length:
+        match = _TOKEN_RE.match(sql_query, pos)
+        if match is None:
+            return None
+        pos = match.end()
+        kind = match.lastgroup
+        text = match.group()
+        if kind == "skip":
+            continue
+        if kind == "word":
+            tokens.append(
+                (_KEYWORDS.get(text.upper(), SQLSimpleLexer.IDENTIFIER), text)
+            )
+        elif kind == "string":
+            tokens.append((SQLSimpleLexer.STRING_LITERAL, text))
+        elif kind == "number":
+            tokens.append((SQLSimpleLexer.NUMBER, text))
+        else:
+            tokens.append((_SYMBOLS[text], text))
+    tokens.append((_EOF, "<EOF>"))
+    return tokens
+
+
+class _Parser:
+    """Parser descendente recursivo sobre los tokens de tokenize()."""
+
+    def __init__(self, tokens: list[tuple[int, str]]):
+        self.tokens = tokens
+        self.pos = 0
+
+    def _peek(self) -> int:
+        return self.tokens[self.pos][0]
+
+    def _expect(self, token_type: int) -> str:
+        kind, text = self.tokens[self.pos]
+        if kind != token_type:
+            raise _Unsupported()
+        self.pos += 1
+        return text
+
+    def _identifier(self) -> str:
+        """identifier : IDENTIFIER o una palabra clave no reservada."""
+        kind, text = self.tokens[self.pos]
+        if kind != SQLSimpleLexer.IDENTIFIER and kind not in _SOFT_KEYWORDS:
+            raise _Unsupported()
+        self.pos += 1
+        return text
+
+    def query(self) -> SelectStatement:
+        """query : SELECT topClause? selectList FROM tableName whereClause?
+        orderByClause? limitClause? offsetClause? EOF"""
+        self._expect(SQLSimpleLexer.SELECT)
+        top = None
+        # Sin número detrás, TOP es el nombre de una columna
+        if (
+            self._peek() == SQLSimpleLexer.TOP
+            and self.tokens[self.pos + 1][0] == SQLSimpleLexer.NUMBER
+        ):
+            top = self._optional_count(SQLSimpleLexer.TOP)
+        columns = self._select_list()
+        self._expect(SQLSimpleLexer.FROM)
+        table = self._identifier()
+        condition = None
+        if self._peek() == SQLSimpleLexer.WHERE:
+            self.pos += 1
+            condition = self._condition(0)
+        order_by = self._order_by()
+        limit = self._optional_count(SQLSimpleLexer.LIMIT)
+        offset = self._optional_count(SQLSimpleLexer.OFFSET)
+        self._expect(_EOF)
+        return SelectStatement(table, columns, condition, order_by, top, limit, offset)
+
+    def _optional_count(self, keyword: int) -> Optional[str]:
+        """`keyword NUMBER` opcional (TOP, LIMIT u OFFSET)."""
+        if self._peek() != keyword:
+            return None
+        self.pos += 1
+        return self._expect(SQLSimpleLexer.NUMBER)
+
+    def _order_by(self) -> tuple[tuple[str, str], ...]:
+        if self._peek() != SQLSimpleLexer.ORDER:
+            return ()
+        self.pos += 1
+        self._expect(SQLSimpleLexer.BY)
+        items = [self._order_item()]
+        while self._peek() == SQLSimpleLexer.COMMA:
+            self.pos += 1
+            items.append(self._order_item())
+        return tuple(items)
+
+    def _order_item(self) -> tuple[str, str]:
+        column = self._identifier()
+        direction = "ASC"
+        if self._peek() in (SQLSimpleLexer.ASC, SQLSimpleLexer.DESC):
+            direction = self.tokens[self.pos][1].upper()
+            self.pos += 1
+        return column, direction
+
+    def _select_list(self) -> list[str]:
+        if self._peek() == SQLSimpleLexer.ASTERISK:
+            self.pos += 1
+            return ["*"]
+        columns = [self._identifier()]
+        while self._peek() == SQLSimpleLexer.COMMA:
+            self.pos += 1
+            columns.append(self._identifier())
+        return columns
+
+    def _condition(self, min_precedence: int) -> Condition:
+        """Condición con operadores lógicos de precedencia >= min_precedence."""
+        left = self._primary()
+        while True:
+            kind, text = self.tokens[self.pos]
+            precedence = _LOGICAL_PRECEDENCE.get(kind)
+            if precedence is None or precedence < min_precedence:
+                return left
+            self.pos += 1
+            right = self._condition(precedence + 1)
+            left = LogicalCondition(text.upper(), left, right)
+
+    def _primary(self) -> Condition:
+        if self._peek() == SQLSimpleLexer.LPAREN:
+            self.pos += 1
+            condition = self._condition(0)
+            self._expect(SQLSimpleLexer.RPAREN)
+            return ParenCondition(condition)
+
+        column = self._identifier()
+        operator_type, operator = self.tokens[self.pos]
+        if operator_type not in _COMPARISON_TYPES:
+            raise _Unsupported()
+        value_type, value = self.tokens[self.pos + 1]
+        if value_type not in _LITERAL_TYPES:
+            raise _Unsupported()
+        self.pos += 2
+        return Comparison(column, operator, value_type, value)
+
+
+def parse_select(sql_query: str) -> Optional[SelectStatement]:
+    """
+    Parsea una consulta con el parser rápido.
+
+    Args:
+        sql_query: Consulta SQL
+
+    Returns:
+        SelectStatement o None si la consulta no es válida o es demasiado
+        anidada; en ese caso debe parsearse con ANTLR
+    """
+    tokens = tokenize(sql_query)
+    if tokens is None:
+        return None
+    try:
+        return _Parser(tokens).query()
+    except _Unsupported, RecursionError:
+        return None
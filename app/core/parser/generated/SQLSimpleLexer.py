@@ -10,108 +10,159 @@ else:
 
 def serializedATN():
     return [
-        4,0,24,283,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,
+        4,0,42,428,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,
         2,6,7,6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,
         13,7,13,2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,
         19,2,20,7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,
         26,7,26,2,27,7,27,2,28,7,28,2,29,7,29,2,30,7,30,2,31,7,31,2,32,7,
         32,2,33,7,33,2,34,7,34,2,35,7,35,2,36,7,36,2,37,7,37,2,38,7,38,2,
         39,7,39,2,40,7,40,2,41,7,41,2,42,7,42,2,43,7,43,2,44,7,44,2,45,7,
-        45,2,46,7,46,2,47,7,47,2,48,7,48,2,49,7,49,1,0,1,0,1,0,1,0,1,0,1,
-        0,1,0,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,2,1,2,1,2,1,2,1,3,1,3,1,3,1,
-        3,1,4,1,4,1,4,1,5,1,5,1,5,1,5,1,5,1,6,1,6,1,6,1,6,1,6,1,6,1,7,1,
-        7,1,7,1,7,1,7,1,8,1,8,1,9,1,9,1,9,1,9,3,9,149,8,9,1,10,1,10,1,11,
-        1,11,1,12,1,12,1,12,1,13,1,13,1,13,1,14,1,14,1,15,1,15,1,16,1,16,
-        1,17,1,17,1,18,1,18,5,18,171,8,18,10,18,12,18,174,9,18,1,19,1,19,
-        1,19,1,19,5,19,180,8,19,10,19,12,19,183,9,19,1,19,1,19,1,20,4,20,
-        188,8,20,11,20,12,20,189,1,20,1,20,4,20,194,8,20,11,20,12,20,195,
-        3,20,198,8,20,1,21,4,21,201,8,21,11,21,12,21,202,1,21,1,21,1,22,
-        1,22,1,22,1,22,5,22,211,8,22,10,22,12,22,214,9,22,1,22,1,22,1,23,
-        1,23,1,23,1,23,5,23,222,8,23,10,23,12,23,225,9,23,1,23,1,23,1,23,
-        1,23,1,23,1,24,1,24,1,25,1,25,1,26,1,26,1,27,1,27,1,28,1,28,1,29,
-        1,29,1,30,1,30,1,31,1,31,1,32,1,32,1,33,1,33,1,34,1,34,1,35,1,35,
-        1,36,1,36,1,37,1,37,1,38,1,38,1,39,1,39,1,40,1,40,1,41,1,41,1,42,
-        1,42,1,43,1,43,1,44,1,44,1,45,1,45,1,46,1,46,1,47,1,47,1,48,1,48,
-        1,49,1,49,1,223,0,50,1,1,3,2,5,3,7,4,9,5,11,6,13,7,15,8,17,9,19,
-        10,21,11,23,12,25,13,27,14,29,15,31,16,33,17,35,18,37,19,39,20,41,
-        21,43,22,45,23,47,24,49,0,51,0,53,0,55,0,57,0,59,0,61,0,63,0,65,
-        0,67,0,69,0,71,0,73,0,75,0,77,0,79,0,81,0,83,0,85,0,87,0,89,0,91,
-        0,93,0,95,0,97,0,99,0,1,0,32,3,0,65,90,95,95,97,122,4,0,48,57,65,
-        90,95,95,97,122,1,0,39,39,1,0,48,57,3,0,9,10,13,13,32,32,2,0,10,
-        10,13,13,2,0,65,65,97,97,2,0,66,66,98,98,2,0,67,67,99,99,2,0,68,
-        68,100,100,2,0,69,69,101,101,2,0,70,70,102,102,2,0,71,71,103,103,
-        2,0,72,72,104,104,2,0,73,73,105,105,2,0,74,74,106,106,2,0,75,75,
-        107,107,2,0,76,76,108,108,2,0,77,77,109,109,2,0,78,78,110,110,2,
-        0,79,79,111,111,2,0,80,80,112,112,2,0,81,81,113,113,2,0,82,82,114,
-        114,2,0,83,83,115,115,2,0,84,84,116,116,2,0,85,85,117,117,2,0,86,
-        86,118,118,2,0,87,87,119,119,2,0,88,88,120,120,2,0,89,89,121,121,
-        2,0,90,90,122,122,266,0,1,1,0,0,0,0,3,1,0,0,0,0,5,1,0,0,0,0,7,1,
-        0,0,0,0,9,1,0,0,0,0,11,1,0,0,0,0,13,1,0,0,0,0,15,1,0,0,0,0,17,1,
-        0,0,0,0,19,1,0,0,0,0,21,1,0,0,0,0,23,1,0,0,0,0,25,1,0,0,0,0,27,1,
-        0,0,0,0,29,1,0,0,0,0,31,1,0,0,0,0,33,1,0,0,0,0,35,1,0,0,0,0,37,1,
-        0,0,0,0,39,1,0,0,0,0,41,1,0,0,0,0,43,1,0,0,0,0,45,1,0,0,0,0,47,1,
-        0,0,0,1,101,1,0,0,0,3,108,1,0,0,0,5,113,1,0,0,0,7,119,1,0,0,0,9,
-        123,1,0,0,0,11,126,1,0,0,0,13,131,1,0,0,0,15,137,1,0,0,0,17,142,
-        1,0,0,0,19,148,1,0,0,0,21,150,1,0,0,0,23,152,1,0,0,0,25,154,1,0,
-        0,0,27,157,1,0,0,0,29,160,1,0,0,0,31,162,1,0,0,0,33,164,1,0,0,0,
-        35,166,1,0,0,0,37,168,1,0,0,0,39,175,1,0,0,0,41,187,1,0,0,0,43,200,
-        1,0,0,0,45,206,1,0,0,0,47,217,1,0,0,0,49,231,1,0,0,0,51,233,1,0,
-        0,0,53,235,1,0,0,0,55,237,1,0,0,0,57,239,1,0,0,0,59,241,1,0,0,0,
-        61,243,1,0,0,0,63,245,1,0,0,0,65,247,1,0,0,0,67,249,1,0,0,0,69,251,
-        1,0,0,0,71,253,1,0,0,0,73,255,1,0,0,0,75,257,1,0,0,0,77,259,1,0,
-        0,0,79,261,1,0,0,0,81,263,1,0,0,0,83,265,1,0,0,0,85,267,1,0,0,0,
-        87,269,1,0,0,0,89,271,1,0,0,0,91,273,1,0,0,0,93,275,1,0,0,0,95,277,
-        1,0,0,0,97,279,1,0,0,0,99,281,1,0,0,0,101,102,3,85,42,0,102,103,
-        3,57,28,0,103,104,3,71,35,0,104,105,3,57,28,0,105,106,3,53,26,0,
-        106,107,3,87,43,0,107,2,1,0,0,0,108,109,3,59,29,0,109,110,3,83,41,
-        0,110,111,3,77,38,0,111,112,3,73,36,0,112,4,1,0,0,0,113,114,3,93,
-        46,0,114,115,3,63,31,0,115,116,3,57,28,0,116,117,3,83,41,0,117,118,
-        3,57,28,0,118,6,1,0,0,0,119,120,3,49,24,0,120,121,3,75,37,0,121,
-        122,3,55,27,0,122,8,1,0,0,0,123,124,3,77,38,0,124,125,3,83,41,0,
-        125,10,1,0,0,0,126,127,3,87,43,0,127,128,3,83,41,0,128,129,3,89,
-        44,0,129,130,3,57,28,0,130,12,1,0,0,0,131,132,3,59,29,0,132,133,
-        3,49,24,0,133,134,3,71,35,0,134,135,3,85,42,0,135,136,3,57,28,0,
-        136,14,1,0,0,0,137,138,3,75,37,0,138,139,3,89,44,0,139,140,3,71,
-        35,0,140,141,3,71,35,0,141,16,1,0,0,0,142,143,5,61,0,0,143,18,1,
-        0,0,0,144,145,5,33,0,0,145,149,5,61,0,0,146,147,5,60,0,0,147,149,
-        5,62,0,0,148,144,1,0,0,0,148,146,1,0,0,0,149,20,1,0,0,0,150,151,
-        5,60,0,0,151,22,1,0,0,0,152,153,5,62,0,0,153,24,1,0,0,0,154,155,
-        5,60,0,0,155,156,5,61,0,0,156,26,1,0,0,0,157,158,5,62,0,0,158,159,
-        5,61,0,0,159,28,1,0,0,0,160,161,5,42,0,0,161,30,1,0,0,0,162,163,
-        5,44,0,0,163,32,1,0,0,0,164,165,5,40,0,0,165,34,1,0,0,0,166,167,
-        5,41,0,0,167,36,1,0,0,0,168,172,7,0,0,0,169,171,7,1,0,0,170,169,
-        1,0,0,0,171,174,1,0,0,0,172,170,1,0,0,0,172,173,1,0,0,0,173,38,1,
-        0,0,0,174,172,1,0,0,0,175,181,5,39,0,0,176,180,8,2,0,0,177,178,5,
-        39,0,0,178,180,5,39,0,0,179,176,1,0,0,0,179,177,1,0,0,0,180,183,
-        1,0,0,0,181,179,1,0,0,0,181,182,1,0,0,0,182,184,1,0,0,0,183,181,
-        1,0,0,0,184,185,5,39,0,0,185,40,1,0,0,0,186,188,7,3,0,0,187,186,
-        1,0,0,0,188,189,1,0,0,0,189,187,1,0,0,0,189,190,1,0,0,0,190,197,
-        1,0,0,0,191,193,5,46,0,0,192,194,7,3,0,0,193,192,1,0,0,0,194,195,
-        1,0,0,0,195,193,1,0,0,0,195,196,1,0,0,0,196,198,1,0,0,0,197,191,
-        1,0,0,0,197,198,1,0,0,0,198,42,1,0,0,0,199,201,7,4,0,0,200,199,1,
-        0,0,0,201,202,1,0,0,0,202,200,1,0,0,0,202,203,1,0,0,0,203,204,1,
-        0,0,0,204,205,6,21,0,0,205,44,1,0,0,0,206,207,5,45,0,0,207,208,5,
-        45,0,0,208,212,1,0,0,0,209,211,8,5,0,0,210,209,1,0,0,0,211,214,1,
-        0,0,0,212,210,1,0,0,0,212,213,1,0,0,0,213,215,1,0,0,0,214,212,1,
-        0,0,0,215,216,6,22,0,0,216,46,1,0,0,0,217,218,5,47,0,0,218,219,5,
-        42,0,0,219,223,1,0,0,0,220,222,9,0,0,0,221,220,1,0,0,0,222,225,1,
-        0,0,0,223,224,1,0,0,0,223,221,1,0,0,0,224,226,1,0,0,0,225,223,1,
-        0,0,0,226,227,5,42,0,0,227,228,5,47,0,0,228,229,1,0,0,0,229,230,
-        6,23,0,0,230,48,1,0,0,0,231,232,7,6,0,0,232,50,1,0,0,0,233,234,7,
-        7,0,0,234,52,1,0,0,0,235,236,7,8,0,0,236,54,1,0,0,0,237,238,7,9,
-        0,0,238,56,1,0,0,0,239,240,7,10,0,0,240,58,1,0,0,0,241,242,7,11,
-        0,0,242,60,1,0,0,0,243,244,7,12,0,0,244,62,1,0,0,0,245,246,7,13,
-        0,0,246,64,1,0,0,0,247,248,7,14,0,0,248,66,1,0,0,0,249,250,7,15,
-        0,0,250,68,1,0,0,0,251,252,7,16,0,0,252,70,1,0,0,0,253,254,7,17,
-        0,0,254,72,1,0,0,0,255,256,7,18,0,0,256,74,1,0,0,0,257,258,7,19,
-        0,0,258,76,1,0,0,0,259,260,7,20,0,0,260,78,1,0,0,0,261,262,7,21,
-        0,0,262,80,1,0,0,0,263,264,7,22,0,0,264,82,1,0,0,0,265,266,7,23,
-        0,0,266,84,1,0,0,0,267,268,7,24,0,0,268,86,1,0,0,0,269,270,7,25,
-        0,0,270,88,1,0,0,0,271,272,7,26,0,0,272,90,1,0,0,0,273,274,7,27,
-        0,0,274,92,1,0,0,0,275,276,7,28,0,0,276,94,1,0,0,0,277,278,7,29,
-        0,0,278,96,1,0,0,0,279,280,7,30,0,0,280,98,1,0,0,0,281,282,7,31,
-        0,0,282,100,1,0,0,0,11,0,148,172,179,181,189,195,197,202,212,223,
-        1,6,0,0
+        45,2,46,7,46,2,47,7,47,2,48,7,48,2,49,7,49,2,50,7,50,2,51,7,51,2,
+        52,7,52,2,53,7,53,2,54,7,54,2,55,7,55,2,56,7,56,2,57,7,57,2,58,7,
+        58,2,59,7,59,2,60,7,60,2,61,7,61,2,62,7,62,2,63,7,63,2,64,7,64,2,
+        65,7,65,2,66,7,66,2,67,7,67,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,1,1,1,
+        1,1,1,1,1,1,1,2,1,2,1,2,1,2,1,2,1,2,1,3,1,3,1,3,1,3,1,4,1,4,1,4,
+        1,5,1,5,1,5,1,5,1,5,1,6,1,6,1,6,1,6,1,6,1,6,1,7,1,7,1,7,1,7,1,7,
+        1,8,1,8,1,8,1,8,1,9,1,9,1,9,1,9,1,9,1,9,1,10,1,10,1,10,1,11,1,11,
+        1,11,1,11,1,12,1,12,1,12,1,12,1,12,1,13,1,13,1,13,1,13,1,13,1,13,
+        1,14,1,14,1,14,1,14,1,14,1,14,1,14,1,15,1,15,1,15,1,15,1,15,1,16,
+        1,16,1,16,1,16,1,16,1,16,1,16,1,17,1,17,1,17,1,17,1,17,1,17,1,17,
+        1,18,1,18,1,18,1,18,1,18,1,18,1,18,1,19,1,19,1,19,1,19,1,19,1,19,
+        1,19,1,20,1,20,1,20,1,20,1,20,1,20,1,21,1,21,1,21,1,21,1,21,1,21,
+        1,21,1,21,1,21,1,22,1,22,1,22,1,22,1,22,1,22,1,23,1,23,1,23,1,23,
+        1,23,1,23,1,23,1,24,1,24,1,24,1,24,1,24,1,25,1,25,1,25,1,25,1,25,
+        1,25,1,25,1,25,1,26,1,26,1,27,1,27,1,27,1,27,3,27,294,8,27,1,28,
+        1,28,1,29,1,29,1,30,1,30,1,30,1,31,1,31,1,31,1,32,1,32,1,33,1,33,
+        1,34,1,34,1,35,1,35,1,36,1,36,5,36,316,8,36,10,36,12,36,319,9,36,
+        1,37,1,37,1,37,1,37,5,37,325,8,37,10,37,12,37,328,9,37,1,37,1,37,
+        1,38,4,38,333,8,38,11,38,12,38,334,1,38,1,38,4,38,339,8,38,11,38,
+        12,38,340,3,38,343,8,38,1,39,4,39,346,8,39,11,39,12,39,347,1,39,
+        1,39,1,40,1,40,1,40,1,40,5,40,356,8,40,10,40,12,40,359,9,40,1,40,
+        1,40,1,41,1,41,1,41,1,41,5,41,367,8,41,10,41,12,41,370,9,41,1,41,
+        1,41,1,41,1,41,1,41,1,42,1,42,1,43,1,43,1,44,1,44,1,45,1,45,1,46,
+        1,46,1,47,1,47,1,48,1,48,1,49,1,49,1,50,1,50,1,51,1,51,1,52,1,52,
+        1,53,1,53,1,54,1,54,1,55,1,55,1,56,1,56,1,57,1,57,1,58,1,58,1,59,
+        1,59,1,60,1,60,1,61,1,61,1,62,1,62,1,63,1,63,1,64,1,64,1,65,1,65,
+        1,66,1,66,1,67,1,67,1,368,0,68,1,1,3,2,5,3,7,4,9,5,11,6,13,7,15,
+        8,17,9,19,10,21,11,23,12,25,13,27,14,29,15,31,16,33,17,35,18,37,
+        19,39,20,41,21,43,22,45,23,47,24,49,25,51,26,53,27,55,28,57,29,59,
+        30,61,31,63,32,65,33,67,34,69,35,71,36,73,37,75,38,77,39,79,40,81,
+        41,83,42,85,0,87,0,89,0,91,0,93,0,95,0,97,0,99,0,101,0,103,0,105,
+        0,107,0,109,0,111,0,113,0,115,0,117,0,119,0,121,0,123,0,125,0,127,
+        0,129,0,131,0,133,0,135,0,1,0,32,3,0,65,90,95,95,97,122,4,0,48,57,
+        65,90,95,95,97,122,1,0,39,39,1,0,48,57,3,0,9,10,13,13,32,32,2,0,
+        10,10,13,13,2,0,65,65,97,97,2,0,66,66,98,98,2,0,67,67,99,99,2,0,
+        68,68,100,100,2,0,69,69,101,101,2,0,70,70,102,102,2,0,71,71,103,
+        103,2,0,72,72,104,104,2,0,73,73,105,105,2,0,74,74,106,106,2,0,75,
+        75,107,107,2,0,76,76,108,108,2,0,77,77,109,109,2,0,78,78,110,110,
+        2,0,79,79,111,111,2,0,80,80,112,112,2,0,81,81,113,113,2,0,82,82,
+        114,114,2,0,83,83,115,115,2,0,84,84,116,116,2,0,85,85,117,117,2,
+        0,86,86,118,118,2,0,87,87,119,119,2,0,88,88,120,120,2,0,89,89,121,
+        121,2,0,90,90,122,122,411,0,1,1,0,0,0,0,3,1,0,0,0,0,5,1,0,0,0,0,
+        7,1,0,0,0,0,9,1,0,0,0,0,11,1,0,0,0,0,13,1,0,0,0,0,15,1,0,0,0,0,17,
+        1,0,0,0,0,19,1,0,0,0,0,21,1,0,0,0,0,23,1,0,0,0,0,25,1,0,0,0,0,27,
+        1,0,0,0,0,29,1,0,0,0,0,31,1,0,0,0,0,33,1,0,0,0,0,35,1,0,0,0,0,37,
+        1,0,0,0,0,39,1,0,0,0,0,41,1,0,0,0,0,43,1,0,0,0,0,45,1,0,0,0,0,47,
+        1,0,0,0,0,49,1,0,0,0,0,51,1,0,0,0,0,53,1,0,0,0,0,55,1,0,0,0,0,57,
+        1,0,0,0,0,59,1,0,0,0,0,61,1,0,0,0,0,63,1,0,0,0,0,65,1,0,0,0,0,67,
+        1,0,0,0,0,69,1,0,0,0,0,71,1,0,0,0,0,73,1,0,0,0,0,75,1,0,0,0,0,77,
+        1,0,0,0,0,79,1,0,0,0,0,81,1,0,0,0,0,83,1,0,0,0,1,137,1,0,0,0,3,144,
+        1,0,0,0,5,149,1,0,0,0,7,155,1,0,0,0,9,159,1,0,0,0,11,162,1,0,0,0,
+        13,167,1,0,0,0,15,173,1,0,0,0,17,178,1,0,0,0,19,182,1,0,0,0,21,188,
+        1,0,0,0,23,191,1,0,0,0,25,195,1,0,0,0,27,200,1,0,0,0,29,206,1,0,
+        0,0,31,213,1,0,0,0,33,218,1,0,0,0,35,225,1,0,0,0,37,232,1,0,0,0,
+        39,239,1,0,0,0,41,246,1,0,0,0,43,252,1,0,0,0,45,261,1,0,0,0,47,267,
+        1,0,0,0,49,274,1,0,0,0,51,279,1,0,0,0,53,287,1,0,0,0,55,293,1,0,
+        0,0,57,295,1,0,0,0,59,297,1,0,0,0,61,299,1,0,0,0,63,302,1,0,0,0,
+        65,305,1,0,0,0,67,307,1,0,0,0,69,309,1,0,0,0,71,311,1,0,0,0,73,313,
+        1,0,0,0,75,320,1,0,0,0,77,332,1,0,0,0,79,345,1,0,0,0,81,351,1,0,
+        0,0,83,362,1,0,0,0,85,376,1,0,0,0,87,378,1,0,0,0,89,380,1,0,0,0,
+        91,382,1,0,0,0,93,384,1,0,0,0,95,386,1,0,0,0,97,388,1,0,0,0,99,390,
+        1,0,0,0,101,392,1,0,0,0,103,394,1,0,0,0,105,396,1,0,0,0,107,398,
+        1,0,0,0,109,400,1,0,0,0,111,402,1,0,0,0,113,404,1,0,0,0,115,406,
+        1,0,0,0,117,408,1,0,0,0,119,410,1,0,0,0,121,412,1,0,0,0,123,414,
+        1,0,0,0,125,416,1,0,0,0,127,418,1,0,0,0,129,420,1,0,0,0,131,422,
+        1,0,0,0,133,424,1,0,0,0,135,426,1,0,0,0,137,138,3,121,60,0,138,139,
+        3,93,46,0,139,140,3,107,53,0,140,141,3,93,46,0,141,142,3,89,44,0,
+        142,143,3,123,61,0,143,2,1,0,0,0,144,145,3,95,47,0,145,146,3,119,
+        59,0,146,147,3,113,56,0,147,148,3,109,54,0,148,4,1,0,0,0,149,150,
+        3,129,64,0,150,151,3,99,49,0,151,152,3,93,46,0,152,153,3,119,59,
+        0,153,154,3,93,46,0,154,6,1,0,0,0,155,156,3,85,42,0,156,157,3,111,
+        55,0,157,158,3,91,45,0,158,8,1,0,0,0,159,160,3,113,56,0,160,161,
+        3,119,59,0,161,10,1,0,0,0,162,163,3,123,61,0,163,164,3,119,59,0,
+        164,165,3,125,62,0,165,166,3,93,46,0,166,12,1,0,0,0,167,168,3,95,
+        47,0,168,169,3,85,42,0,169,170,3,107,53,0,170,171,3,121,60,0,171,
+        172,3,93,46,0,172,14,1,0,0,0,173,174,3,111,55,0,174,175,3,125,62,
+        0,175,176,3,107,53,0,176,177,3,107,53,0,177,16,1,0,0,0,178,179,3,
+        123,61,0,179,180,3,113,56,0,180,181,3,115,57,0,181,18,1,0,0,0,182,
+        183,3,113,56,0,183,184,3,119,59,0,184,185,3,91,45,0,185,186,3,93,
+        46,0,186,187,3,119,59,0,187,20,1,0,0,0,188,189,3,87,43,0,189,190,
+        3,133,66,0,190,22,1,0,0,0,191,192,3,85,42,0,192,193,3,121,60,0,193,
+        194,3,89,44,0,194,24,1,0,0,0,195,196,3,91,45,0,196,197,3,93,46,0,
+        197,198,3,121,60,0,198,199,3,89,44,0,199,26,1,0,0,0,200,201,3,107,
+        53,0,201,202,3,101,50,0,202,203,3,109,54,0,203,204,3,101,50,0,204,
+        205,3,123,61,0,205,28,1,0,0,0,206,207,3,113,56,0,207,208,3,95,47,
+        0,208,209,3,95,47,0,209,210,3,121,60,0,210,211,3,93,46,0,211,212,
+        3,123,61,0,212,30,1,0,0,0,213,214,3,91,45,0,214,215,3,119,59,0,215,
+        216,3,113,56,0,216,217,3,115,57,0,217,32,1,0,0,0,218,219,3,91,45,
+        0,219,220,3,93,46,0,220,221,3,107,53,0,221,222,3,93,46,0,222,223,
+        3,123,61,0,223,224,3,93,46,0,224,34,1,0,0,0,225,226,3,125,62,0,226,
+        227,3,115,57,0,227,228,3,91,45,0,228,229,3,85,42,0,229,230,3,123,
+        61,0,230,231,3,93,46,0,231,36,1,0,0,0,232,233,3,101,50,0,233,234,
+        3,111,55,0,234,235,3,121,60,0,235,236,3,93,46,0,236,237,3,119,59,
+        0,237,238,3,123,61,0,238,38,1,0,0,0,239,240,3,89,44,0,240,241,3,
+        119,59,0,241,242,3,93,46,0,242,243,3,85,42,0,243,244,3,123,61,0,
+        244,245,3,93,46,0,245,40,1,0,0,0,246,247,3,85,42,0,247,248,3,107,
+        53,0,248,249,3,123,61,0,249,250,3,93,46,0,250,251,3,119,59,0,251,
+        42,1,0,0,0,252,253,3,123,61,0,253,254,3,119,59,0,254,255,3,125,62,
+        0,255,256,3,111,55,0,256,257,3,89,44,0,257,258,3,85,42,0,258,259,
+        3,123,61,0,259,260,3,93,46,0,260,44,1,0,0,0,261,262,3,97,48,0,262,
+        263,3,119,59,0,263,264,3,85,42,0,264,265,3,111,55,0,265,266,3,123,
+        61,0,266,46,1,0,0,0,267,268,3,119,59,0,268,269,3,93,46,0,269,270,
+        3,127,63,0,270,271,3,113,56,0,271,272,3,105,52,0,272,273,3,93,46,
+        0,273,48,1,0,0,0,274,275,3,93,46,0,275,276,3,131,65,0,276,277,3,
+        93,46,0,277,278,3,89,44,0,278,50,1,0,0,0,279,280,3,93,46,0,280,281,
+        3,131,65,0,281,282,3,93,46,0,282,283,3,89,44,0,283,284,3,125,62,
+        0,284,285,3,123,61,0,285,286,3,93,46,0,286,52,1,0,0,0,287,288,5,
+        61,0,0,288,54,1,0,0,0,289,290,5,33,0,0,290,294,5,61,0,0,291,292,
+        5,60,0,0,292,294,5,62,0,0,293,289,1,0,0,0,293,291,1,0,0,0,294,56,
+        1,0,0,0,295,296,5,60,0,0,296,58,1,0,0,0,297,298,5,62,0,0,298,60,
+        1,0,0,0,299,300,5,60,0,0,300,301,5,61,0,0,301,62,1,0,0,0,302,303,
+        5,62,0,0,303,304,5,61,0,0,304,64,1,0,0,0,305,306,5,42,0,0,306,66,
+        1,0,0,0,307,308,5,44,0,0,308,68,1,0,0,0,309,310,5,40,0,0,310,70,
+        1,0,0,0,311,312,5,41,0,0,312,72,1,0,0,0,313,317,7,0,0,0,314,316,
+        7,1,0,0,315,314,1,0,0,0,316,319,1,0,0,0,317,315,1,0,0,0,317,318,
+        1,0,0,0,318,74,1,0,0,0,319,317,1,0,0,0,320,326,5,39,0,0,321,325,
+        8,2,0,0,322,323,5,39,0,0,323,325,5,39,0,0,324,321,1,0,0,0,324,322,
+        1,0,0,0,325,328,1,0,0,0,326,324,1,0,0,0,326,327,1,0,0,0,327,329,
+        1,0,0,0,328,326,1,0,0,0,329,330,5,39,0,0,330,76,1,0,0,0,331,333,
+        7,3,0,0,332,331,1,0,0,0,333,334,1,0,0,0,334,332,1,0,0,0,334,335,
+        1,0,0,0,335,342,1,0,0,0,336,338,5,46,0,0,337,339,7,3,0,0,338,337,
+        1,0,0,0,339,340,1,0,0,0,340,338,1,0,0,0,340,341,1,0,0,0,341,343,
+        1,0,0,0,342,336,1,0,0,0,342,343,1,0,0,0,343,78,1,0,0,0,344,346,7,
+        4,0,0,345,344,1,0,0,0,346,347,1,0,0,0,347,345,1,0,0,0,347,348,1,
+        0,0,0,348,349,1,0,0,0,349,350,6,39,0,0,350,80,1,0,0,0,351,352,5,
+        45,0,0,352,353,5,45,0,0,353,357,1,0,0,0,354,356,8,5,0,0,355,354,
+        1,0,0,0,356,359,1,0,0,0,357,355,1,0,0,0,357,358,1,0,0,0,358,360,
+        1,0,0,0,359,357,1,0,0,0,360,361,6,40,0,0,361,82,1,0,0,0,362,363,
+        5,47,0,0,363,364,5,42,0,0,364,368,1,0,0,0,365,367,9,0,0,0,366,365,
+        1,0,0,0,367,370,1,0,0,0,368,369,1,0,0,0,368,366,1,0,0,0,369,371,
+        1,0,0,0,370,368,1,0,0,0,371,372,5,42,0,0,372,373,5,47,0,0,373,374,
+        1,0,0,0,374,375,6,41,0,0,375,84,1,0,0,0,376,377,7,6,0,0,377,86,1,
+        0,0,0,378,379,7,7,0,0,379,88,1,0,0,0,380,381,7,8,0,0,381,90,1,0,
+        0,0,382,383,7,9,0,0,383,92,1,0,0,0,384,385,7,10,0,0,385,94,1,0,0,
+        0,386,387,7,11,0,0,387,96,1,0,0,0,388,389,7,12,0,0,389,98,1,0,0,
+        0,390,391,7,13,0,0,391,100,1,0,0,0,392,393,7,14,0,0,393,102,1,0,
+        0,0,394,395,7,15,0,0,395,104,1,0,0,0,396,397,7,16,0,0,397,106,1,
+        0,0,0,398,399,7,17,0,0,399,108,1,0,0,0,400,401,7,18,0,0,401,110,
+        1,0,0,0,402,403,7,19,0,0,403,112,1,0,0,0,404,405,7,20,0,0,405,114,
+        1,0,0,0,406,407,7,21,0,0,407,116,1,0,0,0,408,409,7,22,0,0,409,118,
+        1,0,0,0,410,411,7,23,0,0,411,120,1,0,0,0,412,413,7,24,0,0,413,122,
+        1,0,0,0,414,415,7,25,0,0,415,124,1,0,0,0,416,417,7,26,0,0,417,126,
+        1,0,0,0,418,419,7,27,0,0,419,128,1,0,0,0,420,421,7,28,0,0,421,130,
+        1,0,0,0,422,423,7,29,0,0,423,132,1,0,0,0,424,425,7,30,0,0,425,134,
+        1,0,0,0,426,427,7,31,0,0,427,136,1,0,0,0,11,0,293,317,324,326,334,
+        340,342,347,357,368,1,6,0,0
     ]
 
 class SQLSimpleLexer(Lexer):
@@ -128,22 +179,40 @@ class SQLSimpleLexer(Lexer):
     TRUE = 6
     FALSE = 7
     NULL = 8
-    EQ = 9
-    NEQ = 10
-    LT = 11
-    GT = 12
-    LTE = 13
-    GTE = 14
-    ASTERISK = 15
-    COMMA = 16
-    LPAREN = 17
-    RPAREN = 18
-    IDENTIFIER = 19
-    STRING_LITERAL = 20
-    NUMBER = 21
-    WS = 22
-    LINE_COMMENT = 23
-    BLOCK_COMMENT = 24
+    TOP = 9
+    ORDER = 10
+    BY = 11
+    ASC = 12
+    DESC = 13
+    LIMIT = 14
+    OFFSET = 15
+    DROP = 16
+    DELETE = 17
+    UPDATE = 18
+    INSERT = 19
+    CREATE = 20
+    ALTER = 21
+    TRUNCATE = 22
+    GRANT = 23
+    REVOKE = 24
+    EXEC = 25
+    EXECUTE = 26
+    EQ = 27
+    NEQ = 28
+    LT = 29
+    GT = 30
+    LTE = 31
+    GTE = 32
+    ASTERISK = 33
+    COMMA = 34
+    LPAREN = 35
+    RPAREN = 36
+    IDENTIFIER = 37
+    STRING_LITERAL = 38
+    NUMBER = 39
+    WS = 40
+    LINE_COMMENT = 41
+    BLOCK_COMMENT = 42
 
     channelNames = [ u"DEFAULT_TOKEN_CHANNEL", u"HIDDEN" ]
 
@@ -154,17 +223,22 @@ class SQLSimpleLexer(Lexer):
 
     symbolicNames = [ "<INVALID>",
             "SELECT", "FROM", "WHERE", "AND", "OR", "TRUE", "FALSE", "NULL", 
-            "EQ", "NEQ", "LT", "GT", "LTE", "GTE", "ASTERISK", "COMMA", 
-            "LPAREN", "RPAREN", "IDENTIFIER", "STRING_LITERAL", "NUMBER", 
-            "WS", "LINE_COMMENT", "BLOCK_COMMENT" ]
+            "TOP", "ORDER", "BY", "ASC", "DESC", "LIMIT", "OFFSET", "DROP", 
+            "DELETE", "UPDATE", "INSERT", "CREATE", "ALTER", "TRUNCATE", 
+            "GRANT", "REVOKE", "EXEC", "EXECUTE", "EQ", "NEQ", "LT", "GT", 
+            "LTE", "GTE", "ASTERISK", "COMMA", "LPAREN", "RPAREN", "IDENTIFIER", 
+            "STRING_LITERAL", "NUMBER", "WS", "LINE_COMMENT", "BLOCK_COMMENT" ]
 
     ruleNames = [ "SELECT", "FROM", "WHERE", "AND", "OR", "TRUE", "FALSE", 
-                  "NULL", "EQ", "NEQ", "LT", "GT", "LTE", "GTE", "ASTERISK", 
-                  "COMMA", "LPAREN", "RPAREN", "IDENTIFIER", "STRING_LITERAL", 
-                  "NUMBER", "WS", "LINE_COMMENT", "BLOCK_COMMENT", "A", 
-                  "B", "C", "D", "E", "F", "G", "H", "I", "J", "K", "L", 
-                  "M", "N", "O", "P", "Q", "R", "S", "T", "U", "V", "W", 
-                  "X", "Y", "Z" ]
+                  "NULL", "TOP", "ORDER", "BY", "ASC", "DESC", "LIMIT", 
+                  "OFFSET", "DROP", "DELETE", "UPDATE", "INSERT", "CREATE", 
+                  "ALTER", "TRUNCATE", "GRANT", "REVOKE", "EXEC", "EXECUTE", 
+                  "EQ", "NEQ", "LT", "GT", "LTE", "GTE", "ASTERISK", "COMMA", 
+                  "LPAREN", "RPAREN", "IDENTIFIER", "STRING_LITERAL", "NUMBER", 
+                  "WS", "LINE_COMMENT", "BLOCK_COMMENT", "A", "B", "C", 
+                  "D", "E", "F", "G", "H", "I", "J", "K", "L", "M", "N", 
+                  "O", "P", "Q", "R", "S", "T", "U", "V", "W", "X", "Y", 
+                  "Z" ]
 
     grammarFileName = "SQLSimple.g4"
 
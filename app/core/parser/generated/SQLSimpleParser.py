@@ -10,33 +10,50 @@ else:
 
 def serializedATN():
     return [
-        4,1,24,84,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,7,
-        6,2,7,7,7,2,8,7,8,1,0,1,0,1,0,1,1,1,1,1,1,1,1,1,1,3,1,27,8,1,1,2,
-        1,2,1,2,1,2,5,2,33,8,2,10,2,12,2,36,9,2,3,2,38,8,2,1,3,1,3,1,3,1,
-        4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,3,4,52,8,4,1,4,1,4,1,4,1,4,1,4,
-        1,4,5,4,60,8,4,10,4,12,4,63,9,4,1,5,1,5,1,5,1,5,1,5,1,5,3,5,71,8,
-        5,1,6,1,6,1,7,1,7,1,8,1,8,1,8,1,8,1,8,3,8,82,8,8,1,8,0,1,8,9,0,2,
-        4,6,8,10,12,14,16,0,0,89,0,18,1,0,0,0,2,21,1,0,0,0,4,37,1,0,0,0,
-        6,39,1,0,0,0,8,51,1,0,0,0,10,70,1,0,0,0,12,72,1,0,0,0,14,74,1,0,
-        0,0,16,81,1,0,0,0,18,19,3,2,1,0,19,20,5,0,0,1,20,1,1,0,0,0,21,22,
-        5,1,0,0,22,23,3,4,2,0,23,24,5,2,0,0,24,26,3,12,6,0,25,27,3,6,3,0,
-        26,25,1,0,0,0,26,27,1,0,0,0,27,3,1,0,0,0,28,38,5,15,0,0,29,34,3,
-        14,7,0,30,31,5,16,0,0,31,33,3,14,7,0,32,30,1,0,0,0,33,36,1,0,0,0,
-        34,32,1,0,0,0,34,35,1,0,0,0,35,38,1,0,0,0,36,34,1,0,0,0,37,28,1,
-        0,0,0,37,29,1,0,0,0,38,5,1,0,0,0,39,40,5,3,0,0,40,41,3,8,4,0,41,
-        7,1,0,0,0,42,43,6,4,-1,0,43,44,3,14,7,0,44,45,3,10,5,0,45,46,3,16,
-        8,0,46,52,1,0,0,0,47,48,5,17,0,0,48,49,3,8,4,0,49,50,5,18,0,0,50,
-        52,1,0,0,0,51,42,1,0,0,0,51,47,1,0,0,0,52,61,1,0,0,0,53,54,10,4,
-        0,0,54,55,5,4,0,0,55,60,3,8,4,5,56,57,10,3,0,0,57,58,5,5,0,0,58,
-        60,3,8,4,4,59,53,1,0,0,0,59,56,1,0,0,0,60,63,1,0,0,0,61,59,1,0,0,
-        0,61,62,1,0,0,0,62,9,1,0,0,0,63,61,1,0,0,0,64,71,5,9,0,0,65,71,5,
-        10,0,0,66,71,5,11,0,0,67,71,5,12,0,0,68,71,5,13,0,0,69,71,5,14,0,
-        0,70,64,1,0,0,0,70,65,1,0,0,0,70,66,1,0,0,0,70,67,1,0,0,0,70,68,
-        1,0,0,0,70,69,1,0,0,0,71,11,1,0,0,0,72,73,5,19,0,0,73,13,1,0,0,0,
-        74,75,5,19,0,0,75,15,1,0,0,0,76,82,5,20,0,0,77,82,5,21,0,0,78,82,
-        5,6,0,0,79,82,5,7,0,0,80,82,5,8,0,0,81,76,1,0,0,0,81,77,1,0,0,0,
-        81,78,1,0,0,0,81,79,1,0,0,0,81,80,1,0,0,0,82,17,1,0,0,0,8,26,34,
-        37,51,59,61,70,81
+        4,1,42,133,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,7,
+        6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,13,7,13,
+        2,14,7,14,1,0,1,0,1,0,1,1,1,1,3,1,36,8,1,1,1,1,1,1,1,1,1,3,1,42,
+        8,1,1,1,3,1,45,8,1,1,1,3,1,48,8,1,1,1,3,1,51,8,1,1,2,1,2,1,2,1,3,
+        1,3,1,3,1,3,5,3,60,8,3,10,3,12,3,63,9,3,3,3,65,8,3,1,4,1,4,1,4,1,
+        5,1,5,1,5,1,5,1,5,5,5,75,8,5,10,5,12,5,78,9,5,1,6,1,6,3,6,82,8,6,
+        1,7,1,7,1,7,1,8,1,8,1,8,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,3,9,
+        99,8,9,1,9,1,9,1,9,1,9,1,9,1,9,5,9,107,8,9,10,9,12,9,110,9,9,1,10,
+        1,10,1,10,1,10,1,10,1,10,3,10,118,8,10,1,11,1,11,1,12,1,12,1,13,
+        1,13,1,14,1,14,1,14,1,14,1,14,3,14,131,8,14,1,14,0,1,18,15,0,2,4,
+        6,8,10,12,14,16,18,20,22,24,26,28,0,2,1,0,12,13,2,0,9,15,37,37,138,
+        0,30,1,0,0,0,2,33,1,0,0,0,4,52,1,0,0,0,6,64,1,0,0,0,8,66,1,0,0,0,
+        10,69,1,0,0,0,12,79,1,0,0,0,14,83,1,0,0,0,16,86,1,0,0,0,18,98,1,
+        0,0,0,20,117,1,0,0,0,22,119,1,0,0,0,24,121,1,0,0,0,26,123,1,0,0,
+        0,28,130,1,0,0,0,30,31,3,2,1,0,31,32,5,0,0,1,32,1,1,0,0,0,33,35,
+        5,1,0,0,34,36,3,4,2,0,35,34,1,0,0,0,35,36,1,0,0,0,36,37,1,0,0,0,
+        37,38,3,6,3,0,38,39,5,2,0,0,39,41,3,22,11,0,40,42,3,8,4,0,41,40,
+        1,0,0,0,41,42,1,0,0,0,42,44,1,0,0,0,43,45,3,10,5,0,44,43,1,0,0,0,
+        44,45,1,0,0,0,45,47,1,0,0,0,46,48,3,14,7,0,47,46,1,0,0,0,47,48,1,
+        0,0,0,48,50,1,0,0,0,49,51,3,16,8,0,50,49,1,0,0,0,50,51,1,0,0,0,51,
+        3,1,0,0,0,52,53,5,9,0,0,53,54,5,39,0,0,54,5,1,0,0,0,55,65,5,33,0,
+        0,56,61,3,24,12,0,57,58,5,34,0,0,58,60,3,24,12,0,59,57,1,0,0,0,60,
+        63,1,0,0,0,61,59,1,0,0,0,61,62,1,0,0,0,62,65,1,0,0,0,63,61,1,0,0,
+        0,64,55,1,0,0,0,64,56,1,0,0,0,65,7,1,0,0,0,66,67,5,3,0,0,67,68,3,
+        18,9,0,68,9,1,0,0,0,69,70,5,10,0,0,70,71,5,11,0,0,71,76,3,12,6,0,
+        72,73,5,34,0,0,73,75,3,12,6,0,74,72,1,0,0,0,75,78,1,0,0,0,76,74,
+        1,0,0,0,76,77,1,0,0,0,77,11,1,0,0,0,78,76,1,0,0,0,79,81,3,24,12,
+        0,80,82,7,0,0,0,81,80,1,0,0,0,81,82,1,0,0,0,82,13,1,0,0,0,83,84,
+        5,14,0,0,84,85,5,39,0,0,85,15,1,0,0,0,86,87,5,15,0,0,87,88,5,39,
+        0,0,88,17,1,0,0,0,89,90,6,9,-1,0,90,91,3,24,12,0,91,92,3,20,10,0,
+        92,93,3,28,14,0,93,99,1,0,0,0,94,95,5,35,0,0,95,96,3,18,9,0,96,97,
+        5,36,0,0,97,99,1,0,0,0,98,89,1,0,0,0,98,94,1,0,0,0,99,108,1,0,0,
+        0,100,101,10,4,0,0,101,102,5,4,0,0,102,107,3,18,9,5,103,104,10,3,
+        0,0,104,105,5,5,0,0,105,107,3,18,9,4,106,100,1,0,0,0,106,103,1,0,
+        0,0,107,110,1,0,0,0,108,106,1,0,0,0,108,109,1,0,0,0,109,19,1,0,0,
+        0,110,108,1,0,0,0,111,118,5,27,0,0,112,118,5,28,0,0,113,118,5,29,
+        0,0,114,118,5,30,0,0,115,118,5,31,0,0,116,118,5,32,0,0,117,111,1,
+        0,0,0,117,112,1,0,0,0,117,113,1,0,0,0,117,114,1,0,0,0,117,115,1,
+        0,0,0,117,116,1,0,0,0,118,21,1,0,0,0,119,120,3,26,13,0,120,23,1,
+        0,0,0,121,122,3,26,13,0,122,25,1,0,0,0,123,124,7,1,0,0,124,27,1,
+        0,0,0,125,131,5,38,0,0,126,131,5,39,0,0,127,131,5,6,0,0,128,131,
+        5,7,0,0,129,131,5,8,0,0,130,125,1,0,0,0,130,126,1,0,0,0,130,127,
+        1,0,0,0,130,128,1,0,0,0,130,129,1,0,0,0,131,29,1,0,0,0,14,35,41,
+        44,47,50,61,64,76,81,98,106,108,117,130
     ]
 
 class SQLSimpleParser ( Parser ):
@@ -51,28 +68,43 @@ class SQLSimpleParser ( Parser ):
 
     literalNames = [ "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
-                     "<INVALID>", "'='", "<INVALID>", "'<'", "'>'", "'<='", 
-                     "'>='", "'*'", "','", "'('", "')'" ]
+                     "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                     "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                     "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                     "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                     "<INVALID>", "<INVALID>", "<INVALID>", "'='", "<INVALID>", 
+                     "'<'", "'>'", "'<='", "'>='", "'*'", "','", "'('", 
+                     "')'" ]
 
     symbolicNames = [ "<INVALID>", "SELECT", "FROM", "WHERE", "AND", "OR", 
-                      "TRUE", "FALSE", "NULL", "EQ", "NEQ", "LT", "GT", 
+                      "TRUE", "FALSE", "NULL", "TOP", "ORDER", "BY", "ASC", 
+                      "DESC", "LIMIT", "OFFSET", "DROP", "DELETE", "UPDATE", 
+                      "INSERT", "CREATE", "ALTER", "TRUNCATE", "GRANT", 
+                      "REVOKE", "EXEC", "EXECUTE", "EQ", "NEQ", "LT", "GT", 
                       "LTE", "GTE", "ASTERISK", "COMMA", "LPAREN", "RPAREN", 
                       "IDENTIFIER", "STRING_LITERAL", "NUMBER", "WS", "LINE_COMMENT", 
                       "BLOCK_COMMENT" ]
 
     RULE_query = 0
     RULE_selectStatement = 1
-    RULE_selectList = 2
-    RULE_whereClause = 3
-    RULE_condition = 4
-    RULE_comparisonOp = 5
-    RULE_tableName = 6
-    RULE_columnName = 7
-    RULE_value = 8
-
-    ruleNames =  [ "query", "selectStatement", "selectList", "whereClause", 
-                   "condition", "comparisonOp", "tableName", "columnName", 
-                   "value" ]
+    RULE_topClause = 2
+    RULE_selectList = 3
+    RULE_whereClause = 4
+    RULE_orderByClause = 5
+    RULE_orderItem = 6
+    RULE_limitClause = 7
+    RULE_offsetClause = 8
+    RULE_condition = 9
+    RULE_comparisonOp = 10
+    RULE_tableName = 11
+    RULE_columnName = 12
+    RULE_identifier = 13
+    RULE_value = 14
+
+    ruleNames =  [ "query", "selectStatement", "topClause", "selectList", 
+                   "whereClause", "orderByClause", "orderItem", "limitClause", 
+                   "offsetClause", "condition", "comparisonOp", "tableName", 
+                   "columnName", "identifier", "value" ]
 
     EOF = Token.EOF
     SELECT=1
@@ -83,22 +115,40 @@ class SQLSimpleParser ( Parser ):
     TRUE=6
     FALSE=7
     NULL=8
-    EQ=9
-    NEQ=10
-    LT=11
-    GT=12
-    LTE=13
-    GTE=14
-    ASTERISK=15
-    COMMA=16
-    LPAREN=17
-    RPAREN=18
-    IDENTIFIER=19
-    STRING_LITERAL=20
-    NUMBER=21
-    WS=22
-    LINE_COMMENT=23
-    BLOCK_COMMENT=24
+    TOP=9
+    ORDER=10
+    BY=11
+    ASC=12
+    DESC=13
+    LIMIT=14
+    OFFSET=15
+    DROP=16
+    DELETE=17
+    UPDATE=18
+    INSERT=19
+    CREATE=20
+    ALTER=21
+    TRUNCATE=22
+    GRANT=23
+    REVOKE=24
+    EXEC=25
+    EXECUTE=26
+    EQ=27
+    NEQ=28
+    LT=29
+    GT=30
+    LTE=31
+    GTE=32
+    ASTERISK=33
+    COMMA=34
+    LPAREN=35
+    RPAREN=36
+    IDENTIFIER=37
+    STRING_LITERAL=38
+    NUMBER=39
+    WS=40
+    LINE_COMMENT=41
+    BLOCK_COMMENT=42
 
     def __init__(self, input:TokenStream, output:TextIO = sys.stdout):
         super().__init__(input, output)
@@ -141,9 +191,9 @@ class SQLSimpleParser ( Parser ):
         self.enterRule(localctx, 0, self.RULE_query)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 18
+            self.state = 30
             self.selectStatement()
-            self.state = 19
+            self.state = 31
             self.match(SQLSimpleParser.EOF)
         except RecognitionException as re:
             localctx.exception = re
@@ -175,10 +225,26 @@ class SQLSimpleParser ( Parser ):
             return self.getTypedRuleContext(SQLSimpleParser.TableNameContext,0)
 
 
+        def topClause(self):
+            return self.getTypedRuleContext(SQLSimpleParser.TopClauseContext,0)
+
+
         def whereClause(self):
             return self.getTypedRuleContext(SQLSimpleParser.WhereClauseContext,0)
 
 
+        def orderByClause(self):
+            return self.getTypedRuleContext(SQLSimpleParser.OrderByClauseContext,0)
+
+
+        def limitClause(self):
+            return self.getTypedRuleContext(SQLSimpleParser.LimitClauseContext,0)
+
+
+        def offsetClause(self):
+            return self.getTypedRuleContext(SQLSimpleParser.OffsetClauseContext,0)
+
+
         def getRuleIndex(self):
             return SQLSimpleParser.RULE_selectStatement
 
@@ -198,22 +264,98 @@ class SQLSimpleParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 21
+            self.state = 33
             self.match(SQLSimpleParser.SELECT)
-            self.state = 22
+            self.state = 35
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,0,self._ctx)
+            if la_ == 1:
+                self.state = 34
+                self.topClause()
+
+
+            self.state = 37
             self.selectList()
-            self.state = 23
+            self.state = 38
             self.match(SQLSimpleParser.FROM)
-            self.state = 24
+            self.state = 39
             self.tableName()
-            self.state = 26
+            self.state = 41
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==3:
-                self.state = 25
+                self.state = 40
                 self.whereClause()
 
 
+            self.state = 44
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==10:
+                self.state = 43
+                self.orderByClause()
+
+
+            self.state = 47
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==14:
+                self.state = 46
+                self.limitClause()
+
+
+            self.state = 50
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==15:
+                self.state = 49
+                self.offsetClause()
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class TopClauseContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def TOP(self):
+            return self.getToken(SQLSimpleParser.TOP, 0)
+
+        def NUMBER(self):
+            return self.getToken(SQLSimpleParser.NUMBER, 0)
+
+        def getRuleIndex(self):
+            return SQLSimpleParser.RULE_topClause
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitTopClause" ):
+                return visitor.visitTopClause(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def topClause(self):
+
+        localctx = SQLSimpleParser.TopClauseContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 4, self.RULE_topClause)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 52
+            self.match(SQLSimpleParser.TOP)
+            self.state = 53
+            self.match(SQLSimpleParser.NUMBER)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -285,32 +427,32 @@ class SQLSimpleParser ( Parser ):
     def selectList(self):
 
         localctx = SQLSimpleParser.SelectListContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 4, self.RULE_selectList)
+        self.enterRule(localctx, 6, self.RULE_selectList)
         self._la = 0 # Token type
         try:
-            self.state = 37
+            self.state = 64
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [15]:
+            if token in [33]:
                 localctx = SQLSimpleParser.SelectAllContext(self, localctx)
                 self.enterOuterAlt(localctx, 1)
-                self.state = 28
+                self.state = 55
                 self.match(SQLSimpleParser.ASTERISK)
                 pass
-            elif token in [19]:
+            elif token in [9, 10, 11, 12, 13, 14, 15, 37]:
                 localctx = SQLSimpleParser.SelectColumnsContext(self, localctx)
                 self.enterOuterAlt(localctx, 2)
-                self.state = 29
+                self.state = 56
                 self.columnName()
-                self.state = 34
+                self.state = 61
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                while _la==16:
-                    self.state = 30
+                while _la==34:
+                    self.state = 57
                     self.match(SQLSimpleParser.COMMA)
-                    self.state = 31
+                    self.state = 58
                     self.columnName()
-                    self.state = 36
+                    self.state = 63
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
@@ -356,12 +498,12 @@ class SQLSimpleParser ( Parser ):
     def whereClause(self):
 
         localctx = SQLSimpleParser.WhereClauseContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 6, self.RULE_whereClause)
+        self.enterRule(localctx, 8, self.RULE_whereClause)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 39
+            self.state = 66
             self.match(SQLSimpleParser.WHERE)
-            self.state = 40
+            self.state = 67
             self.condition(0)
         except RecognitionException as re:
             localctx.exception = re
@@ -372,6 +514,226 @@ class SQLSimpleParser ( Parser ):
         return localctx
 
 
+    class OrderByClauseContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ORDER(self):
+            return self.getToken(SQLSimpleParser.ORDER, 0)
+
+        def BY(self):
+            return self.getToken(SQLSimpleParser.BY, 0)
+
+        def orderItem(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(SQLSimpleParser.OrderItemContext)
+            else:
+                return self.getTypedRuleContext(SQLSimpleParser.OrderItemContext,i)
+
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(SQLSimpleParser.COMMA)
+            else:
+                return self.getToken(SQLSimpleParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return SQLSimpleParser.RULE_orderByClause
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitOrderByClause" ):
+                return visitor.visitOrderByClause(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def orderByClause(self):
+
+        localctx = SQLSimpleParser.OrderByClauseContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 10, self.RULE_orderByClause)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 69
+            self.match(SQLSimpleParser.ORDER)
+            self.state = 70
+            self.match(SQLSimpleParser.BY)
+            self.state = 71
+            self.orderItem()
+            self.state = 76
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==34:
+                self.state = 72
+                self.match(SQLSimpleParser.COMMA)
+                self.state = 73
+                self.orderItem()
+                self.state = 78
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class OrderItemContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def columnName(self):
+            return self.getTypedRuleContext(SQLSimpleParser.ColumnNameContext,0)
+
+
+        def ASC(self):
+            return self.getToken(SQLSimpleParser.ASC, 0)
+
+        def DESC(self):
+            return self.getToken(SQLSimpleParser.DESC, 0)
+
+        def getRuleIndex(self):
+            return SQLSimpleParser.RULE_orderItem
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitOrderItem" ):
+                return visitor.visitOrderItem(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def orderItem(self):
+
+        localctx = SQLSimpleParser.OrderItemContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 12, self.RULE_orderItem)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 79
+            self.columnName()
+            self.state = 81
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==12 or _la==13:
+                self.state = 80
+                _la = self._input.LA(1)
+                if not(_la==12 or _la==13):
+                    self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class LimitClauseContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def LIMIT(self):
+            return self.getToken(SQLSimpleParser.LIMIT, 0)
+
+        def NUMBER(self):
+            return self.getToken(SQLSimpleParser.NUMBER, 0)
+
+        def getRuleIndex(self):
+            return SQLSimpleParser.RULE_limitClause
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLimitClause" ):
+                return visitor.visitLimitClause(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def limitClause(self):
+
+        localctx = SQLSimpleParser.LimitClauseContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 14, self.RULE_limitClause)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 83
+            self.match(SQLSimpleParser.LIMIT)
+            self.state = 84
+            self.match(SQLSimpleParser.NUMBER)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class OffsetClauseContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def OFFSET(self):
+            return self.getToken(SQLSimpleParser.OFFSET, 0)
+
+        def NUMBER(self):
+            return self.getToken(SQLSimpleParser.NUMBER, 0)
+
+        def getRuleIndex(self):
+            return SQLSimpleParser.RULE_offsetClause
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitOffsetClause" ):
+                return visitor.visitOffsetClause(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def offsetClause(self):
+
+        localctx = SQLSimpleParser.OffsetClauseContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 16, self.RULE_offsetClause)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 86
+            self.match(SQLSimpleParser.OFFSET)
+            self.state = 87
+            self.match(SQLSimpleParser.NUMBER)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
     class ConditionContext(ParserRuleContext):
         __slots__ = 'parser'
 
@@ -482,81 +844,81 @@ class SQLSimpleParser ( Parser ):
         _parentState = self.state
         localctx = SQLSimpleParser.ConditionContext(self, self._ctx, _parentState)
         _prevctx = localctx
-        _startState = 8
-        self.enterRecursionRule(localctx, 8, self.RULE_condition, _p)
+        _startState = 18
+        self.enterRecursionRule(localctx, 18, self.RULE_condition, _p)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 51
+            self.state = 98
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [19]:
+            if token in [9, 10, 11, 12, 13, 14, 15, 37]:
                 localctx = SQLSimpleParser.ComparisonConditionContext(self, localctx)
                 self._ctx = localctx
                 _prevctx = localctx
 
-                self.state = 43
+                self.state = 90
                 self.columnName()
-                self.state = 44
+                self.state = 91
                 self.comparisonOp()
-                self.state = 45
+                self.state = 92
                 self.value()
                 pass
-            elif token in [17]:
+            elif token in [35]:
                 localctx = SQLSimpleParser.ParenConditionContext(self, localctx)
                 self._ctx = localctx
                 _prevctx = localctx
-                self.state = 47
+                self.state = 94
                 self.match(SQLSimpleParser.LPAREN)
-                self.state = 48
+                self.state = 95
                 self.condition(0)
-                self.state = 49
+                self.state = 96
                 self.match(SQLSimpleParser.RPAREN)
                 pass
             else:
                 raise NoViableAltException(self)
 
             self._ctx.stop = self._input.LT(-1)
-            self.state = 61
+            self.state = 108
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,5,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,11,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
                     if self._parseListeners is not None:
                         self.triggerExitRuleEvent()
                     _prevctx = localctx
-                    self.state = 59
+                    self.state = 106
                     self._errHandler.sync(self)
-                    la_ = self._interp.adaptivePredict(self._input,4,self._ctx)
+                    la_ = self._interp.adaptivePredict(self._input,10,self._ctx)
                     if la_ == 1:
                         localctx = SQLSimpleParser.AndConditionContext(self, SQLSimpleParser.ConditionContext(self, _parentctx, _parentState))
                         self.pushNewRecursionContext(localctx, _startState, self.RULE_condition)
-                        self.state = 53
+                        self.state = 100
                         if not self.precpred(self._ctx, 4):
                             from antlr4.error.Errors import FailedPredicateException
                             raise FailedPredicateException(self, "self.precpred(self._ctx, 4)")
-                        self.state = 54
+                        self.state = 101
                         self.match(SQLSimpleParser.AND)
-                        self.state = 55
+                        self.state = 102
                         self.condition(5)
                         pass
 
                     elif la_ == 2:
                         localctx = SQLSimpleParser.OrConditionContext(self, SQLSimpleParser.ConditionContext(self, _parentctx, _parentState))
                         self.pushNewRecursionContext(localctx, _startState, self.RULE_condition)
-                        self.state = 56
+                        self.state = 103
                         if not self.precpred(self._ctx, 3):
                             from antlr4.error.Errors import FailedPredicateException
                             raise FailedPredicateException(self, "self.precpred(self._ctx, 3)")
-                        self.state = 57
+                        self.state = 104
                         self.match(SQLSimpleParser.OR)
-                        self.state = 58
+                        self.state = 105
                         self.condition(4)
                         pass
 
              
-                self.state = 63
+                self.state = 110
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,5,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,11,self._ctx)
 
         except RecognitionException as re:
             localctx.exception = re
@@ -684,45 +1046,45 @@ class SQLSimpleParser ( Parser ):
     def comparisonOp(self):
 
         localctx = SQLSimpleParser.ComparisonOpContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 10, self.RULE_comparisonOp)
+        self.enterRule(localctx, 20, self.RULE_comparisonOp)
         try:
-            self.state = 70
+            self.state = 117
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [9]:
+            if token in [27]:
                 localctx = SQLSimpleParser.EqualContext(self, localctx)
                 self.enterOuterAlt(localctx, 1)
-                self.state = 64
+                self.state = 111
                 self.match(SQLSimpleParser.EQ)
                 pass
-            elif token in [10]:
+            elif token in [28]:
                 localctx = SQLSimpleParser.NotEqualContext(self, localctx)
                 self.enterOuterAlt(localctx, 2)
-                self.state = 65
+                self.state = 112
                 self.match(SQLSimpleParser.NEQ)
                 pass
-            elif token in [11]:
+            elif token in [29]:
                 localctx = SQLSimpleParser.LessThanContext(self, localctx)
                 self.enterOuterAlt(localctx, 3)
-                self.state = 66
+                self.state = 113
                 self.match(SQLSimpleParser.LT)
                 pass
-            elif token in [12]:
+            elif token in [30]:
                 localctx = SQLSimpleParser.GreaterThanContext(self, localctx)
                 self.enterOuterAlt(localctx, 4)
-                self.state = 67
+                self.state = 114
                 self.match(SQLSimpleParser.GT)
                 pass
-            elif token in [13]:
+            elif token in [31]:
                 localctx = SQLSimpleParser.LessThanOrEqualContext(self, localctx)
                 self.enterOuterAlt(localctx, 5)
-                self.state = 68
+                self.state = 115
                 self.match(SQLSimpleParser.LTE)
                 pass
-            elif token in [14]:
+            elif token in [32]:
                 localctx = SQLSimpleParser.GreaterThanOrEqualContext(self, localctx)
                 self.enterOuterAlt(localctx, 6)
-                self.state = 69
+                self.state = 116
                 self.match(SQLSimpleParser.GTE)
                 pass
             else:
@@ -744,8 +1106,9 @@ class SQLSimpleParser ( Parser ):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def IDENTIFIER(self):
-            return self.getToken(SQLSimpleParser.IDENTIFIER, 0)
+        def identifier(self):
+            return self.getTypedRuleContext(SQLSimpleParser.IdentifierContext,0)
+
 
         def getRuleIndex(self):
             return SQLSimpleParser.RULE_tableName
@@ -762,11 +1125,11 @@ class SQLSimpleParser ( Parser ):
     def tableName(self):
 
         localctx = SQLSimpleParser.TableNameContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 12, self.RULE_tableName)
+        self.enterRule(localctx, 22, self.RULE_tableName)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 72
-            self.match(SQLSimpleParser.IDENTIFIER)
+            self.state = 119
+            self.identifier()
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -783,8 +1146,9 @@ class SQLSimpleParser ( Parser ):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def IDENTIFIER(self):
-            return self.getToken(SQLSimpleParser.IDENTIFIER, 0)
+        def identifier(self):
+            return self.getTypedRuleContext(SQLSimpleParser.IdentifierContext,0)
+
 
         def getRuleIndex(self):
             return SQLSimpleParser.RULE_columnName
@@ -801,11 +1165,77 @@ class SQLSimpleParser ( Parser ):
     def columnName(self):
 
         localctx = SQLSimpleParser.ColumnNameContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 14, self.RULE_columnName)
+        self.enterRule(localctx, 24, self.RULE_columnName)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 74
-            self.match(SQLSimpleParser.IDENTIFIER)
+            self.state = 121
+            self.identifier()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class IdentifierContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def IDENTIFIER(self):
+            return self.getToken(SQLSimpleParser.IDENTIFIER, 0)
+
+        def TOP(self):
+            return self.getToken(SQLSimpleParser.TOP, 0)
+
+        def ORDER(self):
+            return self.getToken(SQLSimpleParser.ORDER, 0)
+
+        def BY(self):
+            return self.getToken(SQLSimpleParser.BY, 0)
+
+        def ASC(self):
+            return self.getToken(SQLSimpleParser.ASC, 0)
+
+        def DESC(self):
+            return self.getToken(SQLSimpleParser.DESC, 0)
+
+        def LIMIT(self):
+            return self.getToken(SQLSimpleParser.LIMIT, 0)
+
+        def OFFSET(self):
+            return self.getToken(SQLSimpleParser.OFFSET, 0)
+
+        def getRuleIndex(self):
+            return SQLSimpleParser.RULE_identifier
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitIdentifier" ):
+                return visitor.visitIdentifier(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def identifier(self):
+
+        localctx = SQLSimpleParser.IdentifierContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 26, self.RULE_identifier)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 123
+            _la = self._input.LA(1)
+            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 137439018496) != 0)):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -916,39 +1346,39 @@ class SQLSimpleParser ( Parser ):
     def value(self):
 
         localctx = SQLSimpleParser.ValueContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 16, self.RULE_value)
+        self.enterRule(localctx, 28, self.RULE_value)
         try:
-            self.state = 81
+            self.state = 130
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [20]:
+            if token in [38]:
                 localctx = SQLSimpleParser.StringValueContext(self, localctx)
                 self.enterOuterAlt(localctx, 1)
-                self.state = 76
+                self.state = 125
                 self.match(SQLSimpleParser.STRING_LITERAL)
                 pass
-            elif token in [21]:
+            elif token in [39]:
                 localctx = SQLSimpleParser.NumberValueContext(self, localctx)
                 self.enterOuterAlt(localctx, 2)
-                self.state = 77
+                self.state = 126
                 self.match(SQLSimpleParser.NUMBER)
                 pass
             elif token in [6]:
                 localctx = SQLSimpleParser.BooleanTrueContext(self, localctx)
                 self.enterOuterAlt(localctx, 3)
-                self.state = 78
+                self.state = 127
                 self.match(SQLSimpleParser.TRUE)
                 pass
             elif token in [7]:
                 localctx = SQLSimpleParser.BooleanFalseContext(self, localctx)
                 self.enterOuterAlt(localctx, 4)
-                self.state = 79
+                self.state = 128
                 self.match(SQLSimpleParser.FALSE)
                 pass
             elif token in [8]:
                 localctx = SQLSimpleParser.NullValueContext(self, localctx)
                 self.enterOuterAlt(localctx, 5)
-                self.state = 80
+                self.state = 129
                 self.match(SQLSimpleParser.NULL)
                 pass
             else:
@@ -967,7 +1397,7 @@ class SQLSimpleParser ( Parser ):
     def sempred(self, localctx:RuleContext, ruleIndex:int, predIndex:int):
         if self._predicates == None:
             self._predicates = dict()
-        self._predicates[4] = self.condition_sempred
+        self._predicates[9] = self.condition_sempred
         pred = self._predicates.get(ruleIndex, None)
         if pred is None:
             raise Exception("No predicate with index:" + str(ruleIndex))
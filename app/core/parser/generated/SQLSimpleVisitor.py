@@ -19,6 +19,11 @@ class SQLSimpleVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
+    # Visit a parse tree produced by SQLSimpleParser#topClause.
+    def visitTopClause(self, ctx:SQLSimpleParser.TopClauseContext):
+        return self.visitChildren(ctx)
+
+
     # Visit a parse tree produced by SQLSimpleParser#SelectAll.
     def visitSelectAll(self, ctx:SQLSimpleParser.SelectAllContext):
         return self.visitChildren(ctx)
@@ -34,6 +39,26 @@ class SQLSimpleVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
+    # Visit a parse tree produced by SQLSimpleParser#orderByClause.
+    def visitOrderByClause(self, ctx:SQLSimpleParser.OrderByClauseContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by SQLSimpleParser#orderItem.
+    def visitOrderItem(self, ctx:SQLSimpleParser.OrderItemContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by SQLSimpleParser#limitClause.
+    def visitLimitClause(self, ctx:SQLSimpleParser.LimitClauseContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by SQLSimpleParser#offsetClause.
+    def visitOffsetClause(self, ctx:SQLSimpleParser.OffsetClauseContext):
+        return self.visitChildren(ctx)
+
+
     # Visit a parse tree produced by SQLSimpleParser#ComparisonCondition.
     def visitComparisonCondition(self, ctx:SQLSimpleParser.ComparisonConditionContext):
         return self.visitChildren(ctx)
@@ -94,6 +119,11 @@ class SQLSimpleVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
+    # Visit a parse tree produced by SQLSimpleParser#identifier.
+    def visitIdentifier(self, ctx:SQLSimpleParser.IdentifierContext):
+        return self.visitChildren(ctx)
+
+
     # Visit a parse tree produced by SQLSimpleParser#StringValue.
     def visitStringValue(self, ctx:SQLSimpleParser.StringValueContext):
         return self.visitChildren(ctx)
@@ -10,16 +10,18 @@ import org.antlr.v4.runtime.misc.*;
 
 @SuppressWarnings({"all", "warnings", "unchecked", "unused", "cast", "CheckReturnValue", "this-escape"})
 public class SQLSimpleLexer extends Lexer {
-	static { RuntimeMetaData.checkVersion("4.13.1", RuntimeMetaData.VERSION); }
+	static { RuntimeMetaData.checkVersion("4.13.2", RuntimeMetaData.VERSION); }
 
 	protected static final DFA[] _decisionToDFA;
 	protected static final PredictionContextCache _sharedContextCache =
 		new PredictionContextCache();
 	public static final int
-		SELECT=1, FROM=2, WHERE=3, AND=4, OR=5, TRUE=6, FALSE=7, NULL=8, EQ=9, 
-		NEQ=10, LT=11, GT=12, LTE=13, GTE=14, ASTERISK=15, COMMA=16, LPAREN=17, 
-		RPAREN=18, IDENTIFIER=19, STRING_LITERAL=20, NUMBER=21, WS=22, LINE_COMMENT=23, 
-		BLOCK_COMMENT=24;
+		SELECT=1, FROM=2, WHERE=3, AND=4, OR=5, TRUE=6, FALSE=7, NULL=8, TOP=9, 
+		ORDER=10, BY=11, ASC=12, DESC=13, LIMIT=14, OFFSET=15, DROP=16, DELETE=17, 
+		UPDATE=18, INSERT=19, CREATE=20, ALTER=21, TRUNCATE=22, GRANT=23, REVOKE=24, 
+		EXEC=25, EXECUTE=26, EQ=27, NEQ=28, LT=29, GT=30, LTE=31, GTE=32, ASTERISK=33, 
+		COMMA=34, LPAREN=35, RPAREN=36, IDENTIFIER=37, STRING_LITERAL=38, NUMBER=39, 
+		WS=40, LINE_COMMENT=41, BLOCK_COMMENT=42;
 	public static String[] channelNames = {
 		"DEFAULT_TOKEN_CHANNEL", "HIDDEN"
 	};
@@ -30,28 +32,35 @@ public class SQLSimpleLexer extends Lexer {
 
 	private static String[] makeRuleNames() {
 		return new String[] {
-			"SELECT", "FROM", "WHERE", "AND", "OR", "TRUE", "FALSE", "NULL", "EQ", 
-			"NEQ", "LT", "GT", "LTE", "GTE", "ASTERISK", "COMMA", "LPAREN", "RPAREN", 
-			"IDENTIFIER", "STRING_LITERAL", "NUMBER", "WS", "LINE_COMMENT", "BLOCK_COMMENT", 
-			"A", "B", "C", "D", "E", "F", "G", "H", "I", "J", "K", "L", "M", "N", 
-			"O", "P", "Q", "R", "S", "T", "U", "V", "W", "X", "Y", "Z"
+			"SELECT", "FROM", "WHERE", "AND", "OR", "TRUE", "FALSE", "NULL", "TOP", 
+			"ORDER", "BY", "ASC", "DESC", "LIMIT", "OFFSET", "DROP", "DELETE", "UPDATE", 
+			"INSERT", "CREATE", "ALTER", "TRUNCATE", "GRANT", "REVOKE", "EXEC", "EXECUTE", 
+			"EQ", "NEQ", "LT", "GT", "LTE", "GTE", "ASTERISK", "COMMA", "LPAREN", 
+			"RPAREN", "IDENTIFIER", "STRING_LITERAL", "NUMBER", "WS", "LINE_COMMENT", 
+			"BLOCK_COMMENT", "A", "B", "C", "D", "E", "F", "G", "H", "I", "J", "K", 
+			"L", "M", "N", "O", "P", "Q", "R", "S", "T", "U", "V", "W", "X", "Y", 
+			"Z"
 		};
 	}
 	public static final String[] ruleNames = makeRuleNames();
 
 	private static String[] makeLiteralNames() {
 		return new String[] {
-			null, null, null, null, null, null, null, null, null, "'='", null, "'<'", 
-			"'>'", "'<='", "'>='", "'*'", "','", "'('", "')'"
+			null, null, null, null, null, null, null, null, null, null, null, null, 
+			null, null, null, null, null, null, null, null, null, null, null, null, 
+			null, null, null, "'='", null, "'<'", "'>'", "'<='", "'>='", "'*'", "','", 
+			"'('", "')'"
 		};
 	}
 	private static final String[] _LITERAL_NAMES = makeLiteralNames();
 	private static String[] makeSymbolicNames() {
 		return new String[] {
 			null, "SELECT", "FROM", "WHERE", "AND", "OR", "TRUE", "FALSE", "NULL", 
-			"EQ", "NEQ", "LT", "GT", "LTE", "GTE", "ASTERISK", "COMMA", "LPAREN", 
-			"RPAREN", "IDENTIFIER", "STRING_LITERAL", "NUMBER", "WS", "LINE_COMMENT", 
-			"BLOCK_COMMENT"
+			"TOP", "ORDER", "BY", "ASC", "DESC", "LIMIT", "OFFSET", "DROP", "DELETE", 
+			"UPDATE", "INSERT", "CREATE", "ALTER", "TRUNCATE", "GRANT", "REVOKE", 
+			"EXEC", "EXECUTE", "EQ", "NEQ", "LT", "GT", "LTE", "GTE", "ASTERISK", 
+			"COMMA", "LPAREN", "RPAREN", "IDENTIFIER", "STRING_LITERAL", "NUMBER", 
+			"WS", "LINE_COMMENT", "BLOCK_COMMENT"
 		};
 	}
 	private static final String[] _SYMBOLIC_NAMES = makeSymbolicNames();
@@ -113,65 +122,82 @@ public class SQLSimpleLexer extends Lexer {
 	public ATN getATN() { return _ATN; }
 
 	public static final String _serializedATN =
-		"\u0004\u0000\u0018\u011b\u0006\uffff\uffff\u0002\u0000\u0007\u0000\u0002"+
-		"\u0001\u0007\u0001\u0002\u0002\u0007\u0002\u0002\u0003\u0007\u0003\u0002"+
-		"\u0004\u0007\u0004\u0002\u0005\u0007\u0005\u0002\u0006\u0007\u0006\u0002"+
-		"\u0007\u0007\u0007\u0002\b\u0007\b\u0002\t\u0007\t\u0002\n\u0007\n\u0002"+
-		"\u000b\u0007\u000b\u0002\f\u0007\f\u0002\r\u0007\r\u0002\u000e\u0007\u000e"+
-		"\u0002\u000f\u0007\u000f\u0002\u0010\u0007\u0010\u0002\u0011\u0007\u0011"+
-		"\u0002\u0012\u0007\u0012\u0002\u0013\u0007\u0013\u0002\u0014\u0007\u0014"+
-		"\u0002\u0015\u0007\u0015\u0002\u0016\u0007\u0016\u0002\u0017\u0007\u0017"+
-		"\u0002\u0018\u0007\u0018\u0002\u0019\u0007\u0019\u0002\u001a\u0007\u001a"+
-		"\u0002\u001b\u0007\u001b\u0002\u001c\u0007\u001c\u0002\u001d\u0007\u001d"+
-		"\u0002\u001e\u0007\u001e\u0002\u001f\u0007\u001f\u0002 \u0007 \u0002!"+
-		"\u0007!\u0002\"\u0007\"\u0002#\u0007#\u0002$\u0007$\u0002%\u0007%\u0002"+
-		"&\u0007&\u0002\'\u0007\'\u0002(\u0007(\u0002)\u0007)\u0002*\u0007*\u0002"+
-		"+\u0007+\u0002,\u0007,\u0002-\u0007-\u0002.\u0007.\u0002/\u0007/\u0002"+
-		"0\u00070\u00021\u00071\u0001\u0000\u0001\u0000\u0001\u0000\u0001\u0000"+
-		"\u0001\u0000\u0001\u0000\u0001\u0000\u0001\u0001\u0001\u0001\u0001\u0001"+
-		"\u0001\u0001\u0001\u0001\u0001\u0002\u0001\u0002\u0001\u0002\u0001\u0002"+
-		"\u0001\u0002\u0001\u0002\u0001\u0003\u0001\u0003\u0001\u0003\u0001\u0003"+
-		"\u0001\u0004\u0001\u0004\u0001\u0004\u0001\u0005\u0001\u0005\u0001\u0005"+
-		"\u0001\u0005\u0001\u0005\u0001\u0006\u0001\u0006\u0001\u0006\u0001\u0006"+
-		"\u0001\u0006\u0001\u0006\u0001\u0007\u0001\u0007\u0001\u0007\u0001\u0007"+
-		"\u0001\u0007\u0001\b\u0001\b\u0001\t\u0001\t\u0001\t\u0001\t\u0003\t\u0095"+
-		"\b\t\u0001\n\u0001\n\u0001\u000b\u0001\u000b\u0001\f\u0001\f\u0001\f\u0001"+
-		"\r\u0001\r\u0001\r\u0001\u000e\u0001\u000e\u0001\u000f\u0001\u000f\u0001"+
-		"\u0010\u0001\u0010\u0001\u0011\u0001\u0011\u0001\u0012\u0001\u0012\u0005"+
-		"\u0012\u00ab\b\u0012\n\u0012\f\u0012\u00ae\t\u0012\u0001\u0013\u0001\u0013"+
-		"\u0001\u0013\u0001\u0013\u0005\u0013\u00b4\b\u0013\n\u0013\f\u0013\u00b7"+
-		"\t\u0013\u0001\u0013\u0001\u0013\u0001\u0014\u0004\u0014\u00bc\b\u0014"+
-		"\u000b\u0014\f\u0014\u00bd\u0001\u0014\u0001\u0014\u0004\u0014\u00c2\b"+
-		"\u0014\u000b\u0014\f\u0014\u00c3\u0003\u0014\u00c6\b\u0014\u0001\u0015"+
-		"\u0004\u0015\u00c9\b\u0015\u000b\u0015\f\u0015\u00ca\u0001\u0015\u0001"+
-		"\u0015\u0001\u0016\u0001\u0016\u0001\u0016\u0001\u0016\u0005\u0016\u00d3"+
-		"\b\u0016\n\u0016\f\u0016\u00d6\t\u0016\u0001\u0016\u0001\u0016\u0001\u0017"+
-		"\u0001\u0017\u0001\u0017\u0001\u0017\u0005\u0017\u00de\b\u0017\n\u0017"+
-		"\f\u0017\u00e1\t\u0017\u0001\u0017\u0001\u0017\u0001\u0017\u0001\u0017"+
-		"\u0001\u0017\u0001\u0018\u0001\u0018\u0001\u0019\u0001\u0019\u0001\u001a"+
-		"\u0001\u001a\u0001\u001b\u0001\u001b\u0001\u001c\u0001\u001c\u0001\u001d"+
-		"\u0001\u001d\u0001\u001e\u0001\u001e\u0001\u001f\u0001\u001f\u0001 \u0001"+
-		" \u0001!\u0001!\u0001\"\u0001\"\u0001#\u0001#\u0001$\u0001$\u0001%\u0001"+
-		"%\u0001&\u0001&\u0001\'\u0001\'\u0001(\u0001(\u0001)\u0001)\u0001*\u0001"+
-		"*\u0001+\u0001+\u0001,\u0001,\u0001-\u0001-\u0001.\u0001.\u0001/\u0001"+
-		"/\u00010\u00010\u00011\u00011\u0001\u00df\u00002\u0001\u0001\u0003\u0002"+
-		"\u0005\u0003\u0007\u0004\t\u0005\u000b\u0006\r\u0007\u000f\b\u0011\t\u0013"+
-		"\n\u0015\u000b\u0017\f\u0019\r\u001b\u000e\u001d\u000f\u001f\u0010!\u0011"+
-		"#\u0012%\u0013\'\u0014)\u0015+\u0016-\u0017/\u00181\u00003\u00005\u0000"+
-		"7\u00009\u0000;\u0000=\u0000?\u0000A\u0000C\u0000E\u0000G\u0000I\u0000"+
-		"K\u0000M\u0000O\u0000Q\u0000S\u0000U\u0000W\u0000Y\u0000[\u0000]\u0000"+
-		"_\u0000a\u0000c\u0000\u0001\u0000 \u0003\u0000AZ__az\u0004\u000009AZ_"+
-		"_az\u0001\u0000\'\'\u0001\u000009\u0003\u0000\t\n\r\r  \u0002\u0000\n"+
-		"\n\r\r\u0002\u0000AAaa\u0002\u0000BBbb\u0002\u0000CCcc\u0002\u0000DDd"+
-		"d\u0002\u0000EEee\u0002\u0000FFff\u0002\u0000GGgg\u0002\u0000HHhh\u0002"+
-		"\u0000IIii\u0002\u0000JJjj\u0002\u0000KKkk\u0002\u0000LLll\u0002\u0000"+
-		"MMmm\u0002\u0000NNnn\u0002\u0000OOoo\u0002\u0000PPpp\u0002\u0000QQqq\u0002"+
-		"\u0000RRrr\u0002\u0000SSss\u0002\u0000TTtt\u0002\u0000UUuu\u0002\u0000"+
-		"VVvv\u0002\u0000WWww\u0002\u0000XXxx\u0002\u0000YYyy\u0002\u0000ZZzz\u010a"+
-		"\u0000\u0001\u0001\u0000\u0000\u0000\u0000\u0003\u0001\u0000\u0000\u0000"+
-		"\u0000\u0005\u0001\u0000\u0000\u0000\u0000\u0007\u0001\u0000\u0000\u0000"+
-		"\u0000\t\u0001\u0000\u0000\u0000\u0000\u000b\u0001\u0000\u0000\u0000\u0000"+
-		"\r\u0001\u0000\u0000\u0000\u0000\u000f\u0001\u0000\u0000\u0000\u0000\u0011"+
+		"\u0004\u0000*\u01ac\u0006\uffff\uffff\u0002\u0000\u0007\u0000\u0002\u0001"+
+		"\u0007\u0001\u0002\u0002\u0007\u0002\u0002\u0003\u0007\u0003\u0002\u0004"+
+		"\u0007\u0004\u0002\u0005\u0007\u0005\u0002\u0006\u0007\u0006\u0002\u0007"+
+		"\u0007\u0007\u0002\b\u0007\b\u0002\t\u0007\t\u0002\n\u0007\n\u0002\u000b"+
+		"\u0007\u000b\u0002\f\u0007\f\u0002\r\u0007\r\u0002\u000e\u0007\u000e\u0002"+
+		"\u000f\u0007\u000f\u0002\u0010\u0007\u0010\u0002\u0011\u0007\u0011\u0002"+
+		"\u0012\u0007\u0012\u0002\u0013\u0007\u0013\u0002\u0014\u0007\u0014\u0002"+
+		"\u0015\u0007\u0015\u0002\u0016\u0007\u0016\u0002\u0017\u0007\u0017\u0002"+
+		"\u0018\u0007\u0018\u0002\u0019\u0007\u0019\u0002\u001a\u0007\u001a\u0002"+
+		"\u001b\u0007\u001b\u0002\u001c\u0007\u001c\u0002\u001d\u0007\u001d\u0002"+
+		"\u001e\u0007\u001e\u0002\u001f\u0007\u001f\u0002 \u0007 \u0002!\u0007"+
+		"!\u0002\"\u0007\"\u0002#\u0007#\u0002$\u0007$\u0002%\u0007%\u0002&\u0007"+
+		"&\u0002\'\u0007\'\u0002(\u0007(\u0002)\u0007)\u0002*\u0007*\u0002+\u0007"+
+		"+\u0002,\u0007,\u0002-\u0007-\u0002.\u0007.\u0002/\u0007/\u00020\u0007"+
+		"0\u00021\u00071\u00022\u00072\u00023\u00073\u00024\u00074\u00025\u0007"+
+		"5\u00026\u00076\u00027\u00077\u00028\u00078\u00029\u00079\u0002:\u0007"+
+		":\u0002;\u0007;\u0002<\u0007<\u0002=\u0007=\u0002>\u0007>\u0002?\u0007"+
+		"?\u0002@\u0007@\u0002A\u0007A\u0002B\u0007B\u0002C\u0007C\u0001\u0000"+
+		"\u0001\u0000\u0001\u0000\u0001\u0000\u0001\u0000\u0001\u0000\u0001\u0000"+
+		"\u0001\u0001\u0001\u0001\u0001\u0001\u0001\u0001\u0001\u0001\u0001\u0002"+
+		"\u0001\u0002\u0001\u0002\u0001\u0002\u0001\u0002\u0001\u0002\u0001\u0003"+
+		"\u0001\u0003\u0001\u0003\u0001\u0003\u0001\u0004\u0001\u0004\u0001\u0004"+
+		"\u0001\u0005\u0001\u0005\u0001\u0005\u0001\u0005\u0001\u0005\u0001\u0006"+
+		"\u0001\u0006\u0001\u0006\u0001\u0006\u0001\u0006\u0001\u0006\u0001\u0007"+
+		"\u0001\u0007\u0001\u0007\u0001\u0007\u0001\u0007\u0001\b\u0001\b\u0001"+
+		"\b\u0001\b\u0001\t\u0001\t\u0001\t\u0001\t\u0001\t\u0001\t\u0001\n\u0001"+
+		"\n\u0001\n\u0001\u000b\u0001\u000b\u0001\u000b\u0001\u000b\u0001\f\u0001"+
+		"\f\u0001\f\u0001\f\u0001\f\u0001\r\u0001\r\u0001\r\u0001\r\u0001\r\u0001"+
+		"\r\u0001\u000e\u0001\u000e\u0001\u000e\u0001\u000e\u0001\u000e\u0001\u000e"+
+		"\u0001\u000e\u0001\u000f\u0001\u000f\u0001\u000f\u0001\u000f\u0001\u000f"+
+		"\u0001\u0010\u0001\u0010\u0001\u0010\u0001\u0010\u0001\u0010\u0001\u0010"+
+		"\u0001\u0010\u0001\u0011\u0001\u0011\u0001\u0011\u0001\u0011\u0001\u0011"+
+		"\u0001\u0011\u0001\u0011\u0001\u0012\u0001\u0012\u0001\u0012\u0001\u0012"+
+		"\u0001\u0012\u0001\u0012\u0001\u0012\u0001\u0013\u0001\u0013\u0001\u0013"+
+		"\u0001\u0013\u0001\u0013\u0001\u0013\u0001\u0013\u0001\u0014\u0001\u0014"+
+		"\u0001\u0014\u0001\u0014\u0001\u0014\u0001\u0014\u0001\u0015\u0001\u0015"+
+		"\u0001\u0015\u0001\u0015\u0001\u0015\u0001\u0015\u0001\u0015\u0001\u0015"+
+		"\u0001\u0015\u0001\u0016\u0001\u0016\u0001\u0016\u0001\u0016\u0001\u0016"+
+		"\u0001\u0016\u0001\u0017\u0001\u0017\u0001\u0017\u0001\u0017\u0001\u0017"+
+		"\u0001\u0017\u0001\u0017\u0001\u0018\u0001\u0018\u0001\u0018\u0001\u0018"+
+		"\u0001\u0018\u0001\u0019\u0001\u0019\u0001\u0019\u0001\u0019\u0001\u0019"+
+		"\u0001\u0019\u0001\u0019\u0001\u0019\u0001\u001a\u0001\u001a\u0001\u001b"+
+		"\u0001\u001b\u0001\u001b\u0001\u001b\u0003\u001b\u0126\b\u001b\u0001\u001c"+
+		"\u0001\u001c\u0001\u001d\u0001\u001d\u0001\u001e\u0001\u001e\u0001\u001e"+
+		"\u0001\u001f\u0001\u001f\u0001\u001f\u0001 \u0001 \u0001!\u0001!\u0001"+
+		"\"\u0001\"\u0001#\u0001#\u0001$\u0001$\u0005$\u013c\b$\n$\f$\u013f\t$"+
+		"\u0001%\u0001%\u0001%\u0001%\u0005%\u0145\b%\n%\f%\u0148\t%\u0001%\u0001"+
+		"%\u0001&\u0004&\u014d\b&\u000b&\f&\u014e\u0001&\u0001&\u0004&\u0153\b"+
+		"&\u000b&\f&\u0154\u0003&\u0157\b&\u0001\'\u0004\'\u015a\b\'\u000b\'\f"+
+		"\'\u015b\u0001\'\u0001\'\u0001(\u0001(\u0001(\u0001(\u0005(\u0164\b(\n"+
+		"(\f(\u0167\t(\u0001(\u0001(\u0001)\u0001)\u0001)\u0001)\u0005)\u016f\b"+
+		")\n)\f)\u0172\t)\u0001)\u0001)\u0001)\u0001)\u0001)\u0001*\u0001*\u0001"+
+		"+\u0001+\u0001,\u0001,\u0001-\u0001-\u0001.\u0001.\u0001/\u0001/\u0001"+
+		"0\u00010\u00011\u00011\u00012\u00012\u00013\u00013\u00014\u00014\u0001"+
+		"5\u00015\u00016\u00016\u00017\u00017\u00018\u00018\u00019\u00019\u0001"+
+		":\u0001:\u0001;\u0001;\u0001<\u0001<\u0001=\u0001=\u0001>\u0001>\u0001"+
+		"?\u0001?\u0001@\u0001@\u0001A\u0001A\u0001B\u0001B\u0001C\u0001C\u0001"+
+		"\u0170\u0000D\u0001\u0001\u0003\u0002\u0005\u0003\u0007\u0004\t\u0005"+
+		"\u000b\u0006\r\u0007\u000f\b\u0011\t\u0013\n\u0015\u000b\u0017\f\u0019"+
+		"\r\u001b\u000e\u001d\u000f\u001f\u0010!\u0011#\u0012%\u0013\'\u0014)\u0015"+
+		"+\u0016-\u0017/\u00181\u00193\u001a5\u001b7\u001c9\u001d;\u001e=\u001f"+
+		"? A!C\"E#G$I%K&M\'O(Q)S*U\u0000W\u0000Y\u0000[\u0000]\u0000_\u0000a\u0000"+
+		"c\u0000e\u0000g\u0000i\u0000k\u0000m\u0000o\u0000q\u0000s\u0000u\u0000"+
+		"w\u0000y\u0000{\u0000}\u0000\u007f\u0000\u0081\u0000\u0083\u0000\u0085"+
+		"\u0000\u0087\u0000\u0001\u0000 \u0003\u0000AZ__az\u0004\u000009AZ__az"+
+		"\u0001\u0000\'\'\u0001\u000009\u0003\u0000\t\n\r\r  \u0002\u0000\n\n\r"+
+		"\r\u0002\u0000AAaa\u0002\u0000BBbb\u0002\u0000CCcc\u0002\u0000DDdd\u0002"+
+		"\u0000EEee\u0002\u0000FFff\u0002\u0000GGgg\u0002\u0000HHhh\u0002\u0000"+
+		"IIii\u0002\u0000JJjj\u0002\u0000KKkk\u0002\u0000LLll\u0002\u0000MMmm\u0002"+
+		"\u0000NNnn\u0002\u0000OOoo\u0002\u0000PPpp\u0002\u0000QQqq\u0002\u0000"+
+		"RRrr\u0002\u0000SSss\u0002\u0000TTtt\u0002\u0000UUuu\u0002\u0000VVvv\u0002"+
+		"\u0000WWww\u0002\u0000XXxx\u0002\u0000YYyy\u0002\u0000ZZzz\u019b\u0000"+
+		"\u0001\u0001\u0000\u0000\u0000\u0000\u0003\u0001\u0000\u0000\u0000\u0000"+
+		"\u0005\u0001\u0000\u0000\u0000\u0000\u0007\u0001\u0000\u0000\u0000\u0000"+
+		"\t\u0001\u0000\u0000\u0000\u0000\u000b\u0001\u0000\u0000\u0000\u0000\r"+
+		"\u0001\u0000\u0000\u0000\u0000\u000f\u0001\u0000\u0000\u0000\u0000\u0011"+
 		"\u0001\u0000\u0000\u0000\u0000\u0013\u0001\u0000\u0000\u0000\u0000\u0015"+
 		"\u0001\u0000\u0000\u0000\u0000\u0017\u0001\u0000\u0000\u0000\u0000\u0019"+
 		"\u0001\u0000\u0000\u0000\u0000\u001b\u0001\u0000\u0000\u0000\u0000\u001d"+
@@ -179,114 +205,175 @@ public class SQLSimpleLexer extends Lexer {
 		"\u0000\u0000\u0000\u0000#\u0001\u0000\u0000\u0000\u0000%\u0001\u0000\u0000"+
 		"\u0000\u0000\'\u0001\u0000\u0000\u0000\u0000)\u0001\u0000\u0000\u0000"+
 		"\u0000+\u0001\u0000\u0000\u0000\u0000-\u0001\u0000\u0000\u0000\u0000/"+
-		"\u0001\u0000\u0000\u0000\u0001e\u0001\u0000\u0000\u0000\u0003l\u0001\u0000"+
-		"\u0000\u0000\u0005q\u0001\u0000\u0000\u0000\u0007w\u0001\u0000\u0000\u0000"+
-		"\t{\u0001\u0000\u0000\u0000\u000b~\u0001\u0000\u0000\u0000\r\u0083\u0001"+
-		"\u0000\u0000\u0000\u000f\u0089\u0001\u0000\u0000\u0000\u0011\u008e\u0001"+
-		"\u0000\u0000\u0000\u0013\u0094\u0001\u0000\u0000\u0000\u0015\u0096\u0001"+
-		"\u0000\u0000\u0000\u0017\u0098\u0001\u0000\u0000\u0000\u0019\u009a\u0001"+
-		"\u0000\u0000\u0000\u001b\u009d\u0001\u0000\u0000\u0000\u001d\u00a0\u0001"+
-		"\u0000\u0000\u0000\u001f\u00a2\u0001\u0000\u0000\u0000!\u00a4\u0001\u0000"+
-		"\u0000\u0000#\u00a6\u0001\u0000\u0000\u0000%\u00a8\u0001\u0000\u0000\u0000"+
-		"\'\u00af\u0001\u0000\u0000\u0000)\u00bb\u0001\u0000\u0000\u0000+\u00c8"+
-		"\u0001\u0000\u0000\u0000-\u00ce\u0001\u0000\u0000\u0000/\u00d9\u0001\u0000"+
-		"\u0000\u00001\u00e7\u0001\u0000\u0000\u00003\u00e9\u0001\u0000\u0000\u0000"+
-		"5\u00eb\u0001\u0000\u0000\u00007\u00ed\u0001\u0000\u0000\u00009\u00ef"+
-		"\u0001\u0000\u0000\u0000;\u00f1\u0001\u0000\u0000\u0000=\u00f3\u0001\u0000"+
-		"\u0000\u0000?\u00f5\u0001\u0000\u0000\u0000A\u00f7\u0001\u0000\u0000\u0000"+
-		"C\u00f9\u0001\u0000\u0000\u0000E\u00fb\u0001\u0000\u0000\u0000G\u00fd"+
-		"\u0001\u0000\u0000\u0000I\u00ff\u0001\u0000\u0000\u0000K\u0101\u0001\u0000"+
-		"\u0000\u0000M\u0103\u0001\u0000\u0000\u0000O\u0105\u0001\u0000\u0000\u0000"+
-		"Q\u0107\u0001\u0000\u0000\u0000S\u0109\u0001\u0000\u0000\u0000U\u010b"+
-		"\u0001\u0000\u0000\u0000W\u010d\u0001\u0000\u0000\u0000Y\u010f\u0001\u0000"+
-		"\u0000\u0000[\u0111\u0001\u0000\u0000\u0000]\u0113\u0001\u0000\u0000\u0000"+
-		"_\u0115\u0001\u0000\u0000\u0000a\u0117\u0001\u0000\u0000\u0000c\u0119"+
-		"\u0001\u0000\u0000\u0000ef\u0003U*\u0000fg\u00039\u001c\u0000gh\u0003"+
-		"G#\u0000hi\u00039\u001c\u0000ij\u00035\u001a\u0000jk\u0003W+\u0000k\u0002"+
-		"\u0001\u0000\u0000\u0000lm\u0003;\u001d\u0000mn\u0003S)\u0000no\u0003"+
-		"M&\u0000op\u0003I$\u0000p\u0004\u0001\u0000\u0000\u0000qr\u0003].\u0000"+
-		"rs\u0003?\u001f\u0000st\u00039\u001c\u0000tu\u0003S)\u0000uv\u00039\u001c"+
-		"\u0000v\u0006\u0001\u0000\u0000\u0000wx\u00031\u0018\u0000xy\u0003K%\u0000"+
-		"yz\u00037\u001b\u0000z\b\u0001\u0000\u0000\u0000{|\u0003M&\u0000|}\u0003"+
-		"S)\u0000}\n\u0001\u0000\u0000\u0000~\u007f\u0003W+\u0000\u007f\u0080\u0003"+
-		"S)\u0000\u0080\u0081\u0003Y,\u0000\u0081\u0082\u00039\u001c\u0000\u0082"+
-		"\f\u0001\u0000\u0000\u0000\u0083\u0084\u0003;\u001d\u0000\u0084\u0085"+
-		"\u00031\u0018\u0000\u0085\u0086\u0003G#\u0000\u0086\u0087\u0003U*\u0000"+
-		"\u0087\u0088\u00039\u001c\u0000\u0088\u000e\u0001\u0000\u0000\u0000\u0089"+
-		"\u008a\u0003K%\u0000\u008a\u008b\u0003Y,\u0000\u008b\u008c\u0003G#\u0000"+
-		"\u008c\u008d\u0003G#\u0000\u008d\u0010\u0001\u0000\u0000\u0000\u008e\u008f"+
-		"\u0005=\u0000\u0000\u008f\u0012\u0001\u0000\u0000\u0000\u0090\u0091\u0005"+
-		"!\u0000\u0000\u0091\u0095\u0005=\u0000\u0000\u0092\u0093\u0005<\u0000"+
-		"\u0000\u0093\u0095\u0005>\u0000\u0000\u0094\u0090\u0001\u0000\u0000\u0000"+
-		"\u0094\u0092\u0001\u0000\u0000\u0000\u0095\u0014\u0001\u0000\u0000\u0000"+
-		"\u0096\u0097\u0005<\u0000\u0000\u0097\u0016\u0001\u0000\u0000\u0000\u0098"+
-		"\u0099\u0005>\u0000\u0000\u0099\u0018\u0001\u0000\u0000\u0000\u009a\u009b"+
-		"\u0005<\u0000\u0000\u009b\u009c\u0005=\u0000\u0000\u009c\u001a\u0001\u0000"+
-		"\u0000\u0000\u009d\u009e\u0005>\u0000\u0000\u009e\u009f\u0005=\u0000\u0000"+
-		"\u009f\u001c\u0001\u0000\u0000\u0000\u00a0\u00a1\u0005*\u0000\u0000\u00a1"+
-		"\u001e\u0001\u0000\u0000\u0000\u00a2\u00a3\u0005,\u0000\u0000\u00a3 \u0001"+
-		"\u0000\u0000\u0000\u00a4\u00a5\u0005(\u0000\u0000\u00a5\"\u0001\u0000"+
-		"\u0000\u0000\u00a6\u00a7\u0005)\u0000\u0000\u00a7$\u0001\u0000\u0000\u0000"+
-		"\u00a8\u00ac\u0007\u0000\u0000\u0000\u00a9\u00ab\u0007\u0001\u0000\u0000"+
-		"\u00aa\u00a9\u0001\u0000\u0000\u0000\u00ab\u00ae\u0001\u0000\u0000\u0000"+
-		"\u00ac\u00aa\u0001\u0000\u0000\u0000\u00ac\u00ad\u0001\u0000\u0000\u0000"+
-		"\u00ad&\u0001\u0000\u0000\u0000\u00ae\u00ac\u0001\u0000\u0000\u0000\u00af"+
-		"\u00b5\u0005\'\u0000\u0000\u00b0\u00b4\b\u0002\u0000\u0000\u00b1\u00b2"+
-		"\u0005\'\u0000\u0000\u00b2\u00b4\u0005\'\u0000\u0000\u00b3\u00b0\u0001"+
-		"\u0000\u0000\u0000\u00b3\u00b1\u0001\u0000\u0000\u0000\u00b4\u00b7\u0001"+
-		"\u0000\u0000\u0000\u00b5\u00b3\u0001\u0000\u0000\u0000\u00b5\u00b6\u0001"+
-		"\u0000\u0000\u0000\u00b6\u00b8\u0001\u0000\u0000\u0000\u00b7\u00b5\u0001"+
-		"\u0000\u0000\u0000\u00b8\u00b9\u0005\'\u0000\u0000\u00b9(\u0001\u0000"+
-		"\u0000\u0000\u00ba\u00bc\u0007\u0003\u0000\u0000\u00bb\u00ba\u0001\u0000"+
-		"\u0000\u0000\u00bc\u00bd\u0001\u0000\u0000\u0000\u00bd\u00bb\u0001\u0000"+
-		"\u0000\u0000\u00bd\u00be\u0001\u0000\u0000\u0000\u00be\u00c5\u0001\u0000"+
-		"\u0000\u0000\u00bf\u00c1\u0005.\u0000\u0000\u00c0\u00c2\u0007\u0003\u0000"+
-		"\u0000\u00c1\u00c0\u0001\u0000\u0000\u0000\u00c2\u00c3\u0001\u0000\u0000"+
-		"\u0000\u00c3\u00c1\u0001\u0000\u0000\u0000\u00c3\u00c4\u0001\u0000\u0000"+
-		"\u0000\u00c4\u00c6\u0001\u0000\u0000\u0000\u00c5\u00bf\u0001\u0000\u0000"+
-		"\u0000\u00c5\u00c6\u0001\u0000\u0000\u0000\u00c6*\u0001\u0000\u0000\u0000"+
-		"\u00c7\u00c9\u0007\u0004\u0000\u0000\u00c8\u00c7\u0001\u0000\u0000\u0000"+
-		"\u00c9\u00ca\u0001\u0000\u0000\u0000\u00ca\u00c8\u0001\u0000\u0000\u0000"+
-		"\u00ca\u00cb\u0001\u0000\u0000\u0000\u00cb\u00cc\u0001\u0000\u0000\u0000"+
-		"\u00cc\u00cd\u0006\u0015\u0000\u0000\u00cd,\u0001\u0000\u0000\u0000\u00ce"+
-		"\u00cf\u0005-\u0000\u0000\u00cf\u00d0\u0005-\u0000\u0000\u00d0\u00d4\u0001"+
-		"\u0000\u0000\u0000\u00d1\u00d3\b\u0005\u0000\u0000\u00d2\u00d1\u0001\u0000"+
-		"\u0000\u0000\u00d3\u00d6\u0001\u0000\u0000\u0000\u00d4\u00d2\u0001\u0000"+
-		"\u0000\u0000\u00d4\u00d5\u0001\u0000\u0000\u0000\u00d5\u00d7\u0001\u0000"+
-		"\u0000\u0000\u00d6\u00d4\u0001\u0000\u0000\u0000\u00d7\u00d8\u0006\u0016"+
-		"\u0000\u0000\u00d8.\u0001\u0000\u0000\u0000\u00d9\u00da\u0005/\u0000\u0000"+
-		"\u00da\u00db\u0005*\u0000\u0000\u00db\u00df\u0001\u0000\u0000\u0000\u00dc"+
-		"\u00de\t\u0000\u0000\u0000\u00dd\u00dc\u0001\u0000\u0000\u0000\u00de\u00e1"+
-		"\u0001\u0000\u0000\u0000\u00df\u00e0\u0001\u0000\u0000\u0000\u00df\u00dd"+
-		"\u0001\u0000\u0000\u0000\u00e0\u00e2\u0001\u0000\u0000\u0000\u00e1\u00df"+
-		"\u0001\u0000\u0000\u0000\u00e2\u00e3\u0005*\u0000\u0000\u00e3\u00e4\u0005"+
-		"/\u0000\u0000\u00e4\u00e5\u0001\u0000\u0000\u0000\u00e5\u00e6\u0006\u0017"+
-		"\u0000\u0000\u00e60\u0001\u0000\u0000\u0000\u00e7\u00e8\u0007\u0006\u0000"+
-		"\u0000\u00e82\u0001\u0000\u0000\u0000\u00e9\u00ea\u0007\u0007\u0000\u0000"+
-		"\u00ea4\u0001\u0000\u0000\u0000\u00eb\u00ec\u0007\b\u0000\u0000\u00ec"+
-		"6\u0001\u0000\u0000\u0000\u00ed\u00ee\u0007\t\u0000\u0000\u00ee8\u0001"+
-		"\u0000\u0000\u0000\u00ef\u00f0\u0007\n\u0000\u0000\u00f0:\u0001\u0000"+
-		"\u0000\u0000\u00f1\u00f2\u0007\u000b\u0000\u0000\u00f2<\u0001\u0000\u0000"+
-		"\u0000\u00f3\u00f4\u0007\f\u0000\u0000\u00f4>\u0001\u0000\u0000\u0000"+
-		"\u00f5\u00f6\u0007\r\u0000\u0000\u00f6@\u0001\u0000\u0000\u0000\u00f7"+
-		"\u00f8\u0007\u000e\u0000\u0000\u00f8B\u0001\u0000\u0000\u0000\u00f9\u00fa"+
-		"\u0007\u000f\u0000\u0000\u00faD\u0001\u0000\u0000\u0000\u00fb\u00fc\u0007"+
-		"\u0010\u0000\u0000\u00fcF\u0001\u0000\u0000\u0000\u00fd\u00fe\u0007\u0011"+
-		"\u0000\u0000\u00feH\u0001\u0000\u0000\u0000\u00ff\u0100\u0007\u0012\u0000"+
-		"\u0000\u0100J\u0001\u0000\u0000\u0000\u0101\u0102\u0007\u0013\u0000\u0000"+
-		"\u0102L\u0001\u0000\u0000\u0000\u0103\u0104\u0007\u0014\u0000\u0000\u0104"+
-		"N\u0001\u0000\u0000\u0000\u0105\u0106\u0007\u0015\u0000\u0000\u0106P\u0001"+
-		"\u0000\u0000\u0000\u0107\u0108\u0007\u0016\u0000\u0000\u0108R\u0001\u0000"+
-		"\u0000\u0000\u0109\u010a\u0007\u0017\u0000\u0000\u010aT\u0001\u0000\u0000"+
-		"\u0000\u010b\u010c\u0007\u0018\u0000\u0000\u010cV\u0001\u0000\u0000\u0000"+
-		"\u010d\u010e\u0007\u0019\u0000\u0000\u010eX\u0001\u0000\u0000\u0000\u010f"+
-		"\u0110\u0007\u001a\u0000\u0000\u0110Z\u0001\u0000\u0000\u0000\u0111\u0112"+
-		"\u0007\u001b\u0000\u0000\u0112\\\u0001\u0000\u0000\u0000\u0113\u0114\u0007"+
-		"\u001c\u0000\u0000\u0114^\u0001\u0000\u0000\u0000\u0115\u0116\u0007\u001d"+
-		"\u0000\u0000\u0116`\u0001\u0000\u0000\u0000\u0117\u0118\u0007\u001e\u0000"+
-		"\u0000\u0118b\u0001\u0000\u0000\u0000\u0119\u011a\u0007\u001f\u0000\u0000"+
-		"\u011ad\u0001\u0000\u0000\u0000\u000b\u0000\u0094\u00ac\u00b3\u00b5\u00bd"+
-		"\u00c3\u00c5\u00ca\u00d4\u00df\u0001\u0006\u0000\u0000";
+		"\u0001\u0000\u0000\u0000\u00001\u0001\u0000\u0000\u0000\u00003\u0001\u0000"+
+		"\u0000\u0000\u00005\u0001\u0000\u0000\u0000\u00007\u0001\u0000\u0000\u0000"+
+		"\u00009\u0001\u0000\u0000\u0000\u0000;\u0001\u0000\u0000\u0000\u0000="+
+		"\u0001\u0000\u0000\u0000\u0000?\u0001\u0000\u0000\u0000\u0000A\u0001\u0000"+
+		"\u0000\u0000\u0000C\u0001\u0000\u0000\u0000\u0000E\u0001\u0000\u0000\u0000"+
+		"\u0000G\u0001\u0000\u0000\u0000\u0000I\u0001\u0000\u0000\u0000\u0000K"+
+		"\u0001\u0000\u0000\u0000\u0000M\u0001\u0000\u0000\u0000\u0000O\u0001\u0000"+
+		"\u0000\u0000\u0000Q\u0001\u0000\u0000\u0000\u0000S\u0001\u0000\u0000\u0000"+
+		"\u0001\u0089\u0001\u0000\u0000\u0000\u0003\u0090\u0001\u0000\u0000\u0000"+
+		"\u0005\u0095\u0001\u0000\u0000\u0000\u0007\u009b\u0001\u0000\u0000\u0000"+
+		"\t\u009f\u0001\u0000\u0000\u0000\u000b\u00a2\u0001\u0000\u0000\u0000\r"+
+		"\u00a7\u0001\u0000\u0000\u0000\u000f\u00ad\u0001\u0000\u0000\u0000\u0011"+
+		"\u00b2\u0001\u0000\u0000\u0000\u0013\u00b6\u0001\u0000\u0000\u0000\u0015"+
+		"\u00bc\u0001\u0000\u0000\u0000\u0017\u00bf\u0001\u0000\u0000\u0000\u0019"+
+		"\u00c3\u0001\u0000\u0000\u0000\u001b\u00c8\u0001\u0000\u0000\u0000\u001d"+
+		"\u00ce\u0001\u0000\u0000\u0000\u001f\u00d5\u0001\u0000\u0000\u0000!\u00da"+
+		"\u0001\u0000\u0000\u0000#\u00e1\u0001\u0000\u0000\u0000%\u00e8\u0001\u0000"+
+		"\u0000\u0000\'\u00ef\u0001\u0000\u0000\u0000)\u00f6\u0001\u0000\u0000"+
+		"\u0000+\u00fc\u0001\u0000\u0000\u0000-\u0105\u0001\u0000\u0000\u0000/"+
+		"\u010b\u0001\u0000\u0000\u00001\u0112\u0001\u0000\u0000\u00003\u0117\u0001"+
+		"\u0000\u0000\u00005\u011f\u0001\u0000\u0000\u00007\u0125\u0001\u0000\u0000"+
+		"\u00009\u0127\u0001\u0000\u0000\u0000;\u0129\u0001\u0000\u0000\u0000="+
+		"\u012b\u0001\u0000\u0000\u0000?\u012e\u0001\u0000\u0000\u0000A\u0131\u0001"+
+		"\u0000\u0000\u0000C\u0133\u0001\u0000\u0000\u0000E\u0135\u0001\u0000\u0000"+
+		"\u0000G\u0137\u0001\u0000\u0000\u0000I\u0139\u0001\u0000\u0000\u0000K"+
+		"\u0140\u0001\u0000\u0000\u0000M\u014c\u0001\u0000\u0000\u0000O\u0159\u0001"+
+		"\u0000\u0000\u0000Q\u015f\u0001\u0000\u0000\u0000S\u016a\u0001\u0000\u0000"+
+		"\u0000U\u0178\u0001\u0000\u0000\u0000W\u017a\u0001\u0000\u0000\u0000Y"+
+		"\u017c\u0001\u0000\u0000\u0000[\u017e\u0001\u0000\u0000\u0000]\u0180\u0001"+
+		"\u0000\u0000\u0000_\u0182\u0001\u0000\u0000\u0000a\u0184\u0001\u0000\u0000"+
+		"\u0000c\u0186\u0001\u0000\u0000\u0000e\u0188\u0001\u0000\u0000\u0000g"+
+		"\u018a\u0001\u0000\u0000\u0000i\u018c\u0001\u0000\u0000\u0000k\u018e\u0001"+
+		"\u0000\u0000\u0000m\u0190\u0001\u0000\u0000\u0000o\u0192\u0001\u0000\u0000"+
+		"\u0000q\u0194\u0001\u0000\u0000\u0000s\u0196\u0001\u0000\u0000\u0000u"+
+		"\u0198\u0001\u0000\u0000\u0000w\u019a\u0001\u0000\u0000\u0000y\u019c\u0001"+
+		"\u0000\u0000\u0000{\u019e\u0001\u0000\u0000\u0000}\u01a0\u0001\u0000\u0000"+
+		"\u0000\u007f\u01a2\u0001\u0000\u0000\u0000\u0081\u01a4\u0001\u0000\u0000"+
+		"\u0000\u0083\u01a6\u0001\u0000\u0000\u0000\u0085\u01a8\u0001\u0000\u0000"+
+		"\u0000\u0087\u01aa\u0001\u0000\u0000\u0000\u0089\u008a\u0003y<\u0000\u008a"+
+		"\u008b\u0003].\u0000\u008b\u008c\u0003k5\u0000\u008c\u008d\u0003].\u0000"+
+		"\u008d\u008e\u0003Y,\u0000\u008e\u008f\u0003{=\u0000\u008f\u0002\u0001"+
+		"\u0000\u0000\u0000\u0090\u0091\u0003_/\u0000\u0091\u0092\u0003w;\u0000"+
+		"\u0092\u0093\u0003q8\u0000\u0093\u0094\u0003m6\u0000\u0094\u0004\u0001"+
+		"\u0000\u0000\u0000\u0095\u0096\u0003\u0081@\u0000\u0096\u0097\u0003c1"+
+		"\u0000\u0097\u0098\u0003].\u0000\u0098\u0099\u0003w;\u0000\u0099\u009a"+
+		"\u0003].\u0000\u009a\u0006\u0001\u0000\u0000\u0000\u009b\u009c\u0003U"+
+		"*\u0000\u009c\u009d\u0003o7\u0000\u009d\u009e\u0003[-\u0000\u009e\b\u0001"+
+		"\u0000\u0000\u0000\u009f\u00a0\u0003q8\u0000\u00a0\u00a1\u0003w;\u0000"+
+		"\u00a1\n\u0001\u0000\u0000\u0000\u00a2\u00a3\u0003{=\u0000\u00a3\u00a4"+
+		"\u0003w;\u0000\u00a4\u00a5\u0003}>\u0000\u00a5\u00a6\u0003].\u0000\u00a6"+
+		"\f\u0001\u0000\u0000\u0000\u00a7\u00a8\u0003_/\u0000\u00a8\u00a9\u0003"+
+		"U*\u0000\u00a9\u00aa\u0003k5\u0000\u00aa\u00ab\u0003y<\u0000\u00ab\u00ac"+
+		"\u0003].\u0000\u00ac\u000e\u0001\u0000\u0000\u0000\u00ad\u00ae\u0003o"+
+		"7\u0000\u00ae\u00af\u0003}>\u0000\u00af\u00b0\u0003k5\u0000\u00b0\u00b1"+
+		"\u0003k5\u0000\u00b1\u0010\u0001\u0000\u0000\u0000\u00b2\u00b3\u0003{"+
+		"=\u0000\u00b3\u00b4\u0003q8\u0000\u00b4\u00b5\u0003s9\u0000\u00b5\u0012"+
+		"\u0001\u0000\u0000\u0000\u00b6\u00b7\u0003q8\u0000\u00b7\u00b8\u0003w"+
+		";\u0000\u00b8\u00b9\u0003[-\u0000\u00b9\u00ba\u0003].\u0000\u00ba\u00bb"+
+		"\u0003w;\u0000\u00bb\u0014\u0001\u0000\u0000\u0000\u00bc\u00bd\u0003W"+
+		"+\u0000\u00bd\u00be\u0003\u0085B\u0000\u00be\u0016\u0001\u0000\u0000\u0000"+
+		"\u00bf\u00c0\u0003U*\u0000\u00c0\u00c1\u0003y<\u0000\u00c1\u00c2\u0003"+
+		"Y,\u0000\u00c2\u0018\u0001\u0000\u0000\u0000\u00c3\u00c4\u0003[-\u0000"+
+		"\u00c4\u00c5\u0003].\u0000\u00c5\u00c6\u0003y<\u0000\u00c6\u00c7\u0003"+
+		"Y,\u0000\u00c7\u001a\u0001\u0000\u0000\u0000\u00c8\u00c9\u0003k5\u0000"+
+		"\u00c9\u00ca\u0003e2\u0000\u00ca\u00cb\u0003m6\u0000\u00cb\u00cc\u0003"+
+		"e2\u0000\u00cc\u00cd\u0003{=\u0000\u00cd\u001c\u0001\u0000\u0000\u0000"+
+		"\u00ce\u00cf\u0003q8\u0000\u00cf\u00d0\u0003_/\u0000\u00d0\u00d1\u0003"+
+		"_/\u0000\u00d1\u00d2\u0003y<\u0000\u00d2\u00d3\u0003].\u0000\u00d3\u00d4"+
+		"\u0003{=\u0000\u00d4\u001e\u0001\u0000\u0000\u0000\u00d5\u00d6\u0003["+
+		"-\u0000\u00d6\u00d7\u0003w;\u0000\u00d7\u00d8\u0003q8\u0000\u00d8\u00d9"+
+		"\u0003s9\u0000\u00d9 \u0001\u0000\u0000\u0000\u00da\u00db\u0003[-\u0000"+
+		"\u00db\u00dc\u0003].\u0000\u00dc\u00dd\u0003k5\u0000\u00dd\u00de\u0003"+
+		"].\u0000\u00de\u00df\u0003{=\u0000\u00df\u00e0\u0003].\u0000\u00e0\"\u0001"+
+		"\u0000\u0000\u0000\u00e1\u00e2\u0003}>\u0000\u00e2\u00e3\u0003s9\u0000"+
+		"\u00e3\u00e4\u0003[-\u0000\u00e4\u00e5\u0003U*\u0000\u00e5\u00e6\u0003"+
+		"{=\u0000\u00e6\u00e7\u0003].\u0000\u00e7$\u0001\u0000\u0000\u0000\u00e8"+
+		"\u00e9\u0003e2\u0000\u00e9\u00ea\u0003o7\u0000\u00ea\u00eb\u0003y<\u0000"+
+		"\u00eb\u00ec\u0003].\u0000\u00ec\u00ed\u0003w;\u0000\u00ed\u00ee\u0003"+
+		"{=\u0000\u00ee&\u0001\u0000\u0000\u0000\u00ef\u00f0\u0003Y,\u0000\u00f0"+
+		"\u00f1\u0003w;\u0000\u00f1\u00f2\u0003].\u0000\u00f2\u00f3\u0003U*\u0000"+
+		"\u00f3\u00f4\u0003{=\u0000\u00f4\u00f5\u0003].\u0000\u00f5(\u0001\u0000"+
+		"\u0000\u0000\u00f6\u00f7\u0003U*\u0000\u00f7\u00f8\u0003k5\u0000\u00f8"+
+		"\u00f9\u0003{=\u0000\u00f9\u00fa\u0003].\u0000\u00fa\u00fb\u0003w;\u0000"+
+		"\u00fb*\u0001\u0000\u0000\u0000\u00fc\u00fd\u0003{=\u0000\u00fd\u00fe"+
+		"\u0003w;\u0000\u00fe\u00ff\u0003}>\u0000\u00ff\u0100\u0003o7\u0000\u0100"+
+		"\u0101\u0003Y,\u0000\u0101\u0102\u0003U*\u0000\u0102\u0103\u0003{=\u0000"+
+		"\u0103\u0104\u0003].\u0000\u0104,\u0001\u0000\u0000\u0000\u0105\u0106"+
+		"\u0003a0\u0000\u0106\u0107\u0003w;\u0000\u0107\u0108\u0003U*\u0000\u0108"+
+		"\u0109\u0003o7\u0000\u0109\u010a\u0003{=\u0000\u010a.\u0001\u0000\u0000"+
+		"\u0000\u010b\u010c\u0003w;\u0000\u010c\u010d\u0003].\u0000\u010d\u010e"+
+		"\u0003\u007f?\u0000\u010e\u010f\u0003q8\u0000\u010f\u0110\u0003i4\u0000"+
+		"\u0110\u0111\u0003].\u0000\u01110\u0001\u0000\u0000\u0000\u0112\u0113"+
+		"\u0003].\u0000\u0113\u0114\u0003\u0083A\u0000\u0114\u0115\u0003].\u0000"+
+		"\u0115\u0116\u0003Y,\u0000\u01162\u0001\u0000\u0000\u0000\u0117\u0118"+
+		"\u0003].\u0000\u0118\u0119\u0003\u0083A\u0000\u0119\u011a\u0003].\u0000"+
+		"\u011a\u011b\u0003Y,\u0000\u011b\u011c\u0003}>\u0000\u011c\u011d\u0003"+
+		"{=\u0000\u011d\u011e\u0003].\u0000\u011e4\u0001\u0000\u0000\u0000\u011f"+
+		"\u0120\u0005=\u0000\u0000\u01206\u0001\u0000\u0000\u0000\u0121\u0122\u0005"+
+		"!\u0000\u0000\u0122\u0126\u0005=\u0000\u0000\u0123\u0124\u0005<\u0000"+
+		"\u0000\u0124\u0126\u0005>\u0000\u0000\u0125\u0121\u0001\u0000\u0000\u0000"+
+		"\u0125\u0123\u0001\u0000\u0000\u0000\u01268\u0001\u0000\u0000\u0000\u0127"+
+		"\u0128\u0005<\u0000\u0000\u0128:\u0001\u0000\u0000\u0000\u0129\u012a\u0005"+
+		">\u0000\u0000\u012a<\u0001\u0000\u0000\u0000\u012b\u012c\u0005<\u0000"+
+		"\u0000\u012c\u012d\u0005=\u0000\u0000\u012d>\u0001\u0000\u0000\u0000\u012e"+
+		"\u012f\u0005>\u0000\u0000\u012f\u0130\u0005=\u0000\u0000\u0130@\u0001"+
+		"\u0000\u0000\u0000\u0131\u0132\u0005*\u0000\u0000\u0132B\u0001\u0000\u0000"+
+		"\u0000\u0133\u0134\u0005,\u0000\u0000\u0134D\u0001\u0000\u0000\u0000\u0135"+
+		"\u0136\u0005(\u0000\u0000\u0136F\u0001\u0000\u0000\u0000\u0137\u0138\u0005"+
+		")\u0000\u0000\u0138H\u0001\u0000\u0000\u0000\u0139\u013d\u0007\u0000\u0000"+
+		"\u0000\u013a\u013c\u0007\u0001\u0000\u0000\u013b\u013a\u0001\u0000\u0000"+
+		"\u0000\u013c\u013f\u0001\u0000\u0000\u0000\u013d\u013b\u0001\u0000\u0000"+
+		"\u0000\u013d\u013e\u0001\u0000\u0000\u0000\u013eJ\u0001\u0000\u0000\u0000"+
+		"\u013f\u013d\u0001\u0000\u0000\u0000\u0140\u0146\u0005\'\u0000\u0000\u0141"+
+		"\u0145\b\u0002\u0000\u0000\u0142\u0143\u0005\'\u0000\u0000\u0143\u0145"+
+		"\u0005\'\u0000\u0000\u0144\u0141\u0001\u0000\u0000\u0000\u0144\u0142\u0001"+
+		"\u0000\u0000\u0000\u0145\u0148\u0001\u0000\u0000\u0000\u0146\u0144\u0001"+
+		"\u0000\u0000\u0000\u0146\u0147\u0001\u0000\u0000\u0000\u0147\u0149\u0001"+
+		"\u0000\u0000\u0000\u0148\u0146\u0001\u0000\u0000\u0000\u0149\u014a\u0005"+
+		"\'\u0000\u0000\u014aL\u0001\u0000\u0000\u0000\u014b\u014d\u0007\u0003"+
+		"\u0000\u0000\u014c\u014b\u0001\u0000\u0000\u0000\u014d\u014e\u0001\u0000"+
+		"\u0000\u0000\u014e\u014c\u0001\u0000\u0000\u0000\u014e\u014f\u0001\u0000"+
+		"\u0000\u0000\u014f\u0156\u0001\u0000\u0000\u0000\u0150\u0152\u0005.\u0000"+
+		"\u0000\u0151\u0153\u0007\u0003\u0000\u0000\u0152\u0151\u0001\u0000\u0000"+
+		"\u0000\u0153\u0154\u0001\u0000\u0000\u0000\u0154\u0152\u0001\u0000\u0000"+
+		"\u0000\u0154\u0155\u0001\u0000\u0000\u0000\u0155\u0157\u0001\u0000\u0000"+
+		"\u0000\u0156\u0150\u0001\u0000\u0000\u0000\u0156\u0157\u0001\u0000\u0000"+
+		"\u0000\u0157N\u0001\u0000\u0000\u0000\u0158\u015a\u0007\u0004\u0000\u0000"+
+		"\u0159\u0158\u0001\u0000\u0000\u0000\u015a\u015b\u0001\u0000\u0000\u0000"+
+		"\u015b\u0159\u0001\u0000\u0000\u0000\u015b\u015c\u0001\u0000\u0000\u0000"+
+		"\u015c\u015d\u0001\u0000\u0000\u0000\u015d\u015e\u0006\'\u0000\u0000\u015e"+
+		"P\u0001\u0000\u0000\u0000\u015f\u0160\u0005-\u0000\u0000\u0160\u0161\u0005"+
+		"-\u0000\u0000\u0161\u0165\u0001\u0000\u0000\u0000\u0162\u0164\b\u0005"+
+		"\u0000\u0000\u0163\u0162\u0001\u0000\u0000\u0000\u0164\u0167\u0001\u0000"+
+		"\u0000\u0000\u0165\u0163\u0001\u0000\u0000\u0000\u0165\u0166\u0001\u0000"+
+		"\u0000\u0000\u0166\u0168\u0001\u0000\u0000\u0000\u0167\u0165\u0001\u0000"+
+		"\u0000\u0000\u0168\u0169\u0006(\u0000\u0000\u0169R\u0001\u0000\u0000\u0000"+
+		"\u016a\u016b\u0005/\u0000\u0000\u016b\u016c\u0005*\u0000\u0000\u016c\u0170"+
+		"\u0001\u0000\u0000\u0000\u016d\u016f\t\u0000\u0000\u0000\u016e\u016d\u0001"+
+		"\u0000\u0000\u0000\u016f\u0172\u0001\u0000\u0000\u0000\u0170\u0171\u0001"+
+		"\u0000\u0000\u0000\u0170\u016e\u0001\u0000\u0000\u0000\u0171\u0173\u0001"+
+		"\u0000\u0000\u0000\u0172\u0170\u0001\u0000\u0000\u0000\u0173\u0174\u0005"+
+		"*\u0000\u0000\u0174\u0175\u0005/\u0000\u0000\u0175\u0176\u0001\u0000\u0000"+
+		"\u0000\u0176\u0177\u0006)\u0000\u0000\u0177T\u0001\u0000\u0000\u0000\u0178"+
+		"\u0179\u0007\u0006\u0000\u0000\u0179V\u0001\u0000\u0000\u0000\u017a\u017b"+
+		"\u0007\u0007\u0000\u0000\u017bX\u0001\u0000\u0000\u0000\u017c\u017d\u0007"+
+		"\b\u0000\u0000\u017dZ\u0001\u0000\u0000\u0000\u017e\u017f\u0007\t\u0000"+
+		"\u0000\u017f\\\u0001\u0000\u0000\u0000\u0180\u0181\u0007\n\u0000\u0000"+
+		"\u0181^\u0001\u0000\u0000\u0000\u0182\u0183\u0007\u000b\u0000\u0000\u0183"+
+		"`\u0001\u0000\u0000\u0000\u0184\u0185\u0007\f\u0000\u0000\u0185b\u0001"+
+		"\u0000\u0000\u0000\u0186\u0187\u0007\r\u0000\u0000\u0187d\u0001\u0000"+
+		"\u0000\u0000\u0188\u0189\u0007\u000e\u0000\u0000\u0189f\u0001\u0000\u0000"+
+		"\u0000\u018a\u018b\u0007\u000f\u0000\u0000\u018bh\u0001\u0000\u0000\u0000"+
+		"\u018c\u018d\u0007\u0010\u0000\u0000\u018dj\u0001\u0000\u0000\u0000\u018e"+
+		"\u018f\u0007\u0011\u0000\u0000\u018fl\u0001\u0000\u0000\u0000\u0190\u0191"+
+		"\u0007\u0012\u0000\u0000\u0191n\u0001\u0000\u0000\u0000\u0192\u0193\u0007"+
+		"\u0013\u0000\u0000\u0193p\u0001\u0000\u0000\u0000\u0194\u0195\u0007\u0014"+
+		"\u0000\u0000\u0195r\u0001\u0000\u0000\u0000\u0196\u0197\u0007\u0015\u0000"+
+		"\u0000\u0197t\u0001\u0000\u0000\u0000\u0198\u0199\u0007\u0016\u0000\u0000"+
+		"\u0199v\u0001\u0000\u0000\u0000\u019a\u019b\u0007\u0017\u0000\u0000\u019b"+
+		"x\u0001\u0000\u0000\u0000\u019c\u019d\u0007\u0018\u0000\u0000\u019dz\u0001"+
+		"\u0000\u0000\u0000\u019e\u019f\u0007\u0019\u0000\u0000\u019f|\u0001\u0000"+
+		"\u0000\u0000\u01a0\u01a1\u0007\u001a\u0000\u0000\u01a1~\u0001\u0000\u0000"+
+		"\u0000\u01a2\u01a3\u0007\u001b\u0000\u0000\u01a3\u0080\u0001\u0000\u0000"+
+		"\u0000\u01a4\u01a5\u0007\u001c\u0000\u0000\u01a5\u0082\u0001\u0000\u0000"+
+		"\u0000\u01a6\u01a7\u0007\u001d\u0000\u0000\u01a7\u0084\u0001\u0000\u0000"+
+		"\u0000\u01a8\u01a9\u0007\u001e\u0000\u0000\u01a9\u0086\u0001\u0000\u0000"+
+		"\u0000\u01aa\u01ab\u0007\u001f\u0000\u0000\u01ab\u0088\u0001\u0000\u0000"+
+		"\u0000\u000b\u0000\u0125\u013d\u0144\u0146\u014e\u0154\u0156\u015b\u0165"+
+		"\u0170\u0001\u0006\u0000\u0000";
 	public static final ATN _ATN =
 		new ATNDeserializer().deserialize(_serializedATN.toCharArray());
 	static {
@@ -8,43 +8,51 @@ import java.util.List;
 import java.util.Iterator;
 import java.util.ArrayList;
 
-@SuppressWarnings({"all", "warnings", "unchecked", "unused", "cast", "CheckReturnValue"})
+@SuppressWarnings({"all", "warnings", "unchecked", "unused", "cast", "CheckReturnValue", "this-escape"})
 public class SQLSimpleParser extends Parser {
-	static { RuntimeMetaData.checkVersion("4.13.1", RuntimeMetaData.VERSION); }
+	static { RuntimeMetaData.checkVersion("4.13.2", RuntimeMetaData.VERSION); }
 
 	protected static final DFA[] _decisionToDFA;
 	protected static final PredictionContextCache _sharedContextCache =
 		new PredictionContextCache();
 	public static final int
-		SELECT=1, FROM=2, WHERE=3, AND=4, OR=5, TRUE=6, FALSE=7, NULL=8, EQ=9, 
-		NEQ=10, LT=11, GT=12, LTE=13, GTE=14, ASTERISK=15, COMMA=16, LPAREN=17, 
-		RPAREN=18, IDENTIFIER=19, STRING_LITERAL=20, NUMBER=21, WS=22, LINE_COMMENT=23, 
-		BLOCK_COMMENT=24;
+		SELECT=1, FROM=2, WHERE=3, AND=4, OR=5, TRUE=6, FALSE=7, NULL=8, TOP=9, 
+		ORDER=10, BY=11, ASC=12, DESC=13, LIMIT=14, OFFSET=15, DROP=16, DELETE=17, 
+		UPDATE=18, INSERT=19, CREATE=20, ALTER=21, TRUNCATE=22, GRANT=23, REVOKE=24, 
+		EXEC=25, EXECUTE=26, EQ=27, NEQ=28, LT=29, GT=30, LTE=31, GTE=32, ASTERISK=33, 
+		COMMA=34, LPAREN=35, RPAREN=36, IDENTIFIER=37, STRING_LITERAL=38, NUMBER=39, 
+		WS=40, LINE_COMMENT=41, BLOCK_COMMENT=42;
 	public static final int
-		RULE_query = 0, RULE_selectStatement = 1, RULE_selectList = 2, RULE_whereClause = 3, 
-		RULE_condition = 4, RULE_comparisonOp = 5, RULE_tableName = 6, RULE_columnName = 7, 
-		RULE_value = 8;
+		RULE_query = 0, RULE_selectStatement = 1, RULE_topClause = 2, RULE_selectList = 3, 
+		RULE_whereClause = 4, RULE_orderByClause = 5, RULE_orderItem = 6, RULE_limitClause = 7, 
+		RULE_offsetClause = 8, RULE_condition = 9, RULE_comparisonOp = 10, RULE_tableName = 11, 
+		RULE_columnName = 12, RULE_identifier = 13, RULE_value = 14;
 	private static String[] makeRuleNames() {
 		return new String[] {
-			"query", "selectStatement", "selectList", "whereClause", "condition", 
-			"comparisonOp", "tableName", "columnName", "value"
+			"query", "selectStatement", "topClause", "selectList", "whereClause", 
+			"orderByClause", "orderItem", "limitClause", "offsetClause", "condition", 
+			"comparisonOp", "tableName", "columnName", "identifier", "value"
 		};
 	}
 	public static final String[] ruleNames = makeRuleNames();
 
 	private static String[] makeLiteralNames() {
 		return new String[] {
-			null, null, null, null, null, null, null, null, null, "'='", null, "'<'", 
-			"'>'", "'<='", "'>='", "'*'", "','", "'('", "')'"
+			null, null, null, null, null, null, null, null, null, null, null, null, 
+			null, null, null, null, null, null, null, null, null, null, null, null, 
+			null, null, null, "'='", null, "'<'", "'>'", "'<='", "'>='", "'*'", "','", 
+			"'('", "')'"
 		};
 	}
 	private static final String[] _LITERAL_NAMES = makeLiteralNames();
 	private static String[] makeSymbolicNames() {
 		return new String[] {
 			null, "SELECT", "FROM", "WHERE", "AND", "OR", "TRUE", "FALSE", "NULL", 
-			"EQ", "NEQ", "LT", "GT", "LTE", "GTE", "ASTERISK", "COMMA", "LPAREN", 
-			"RPAREN", "IDENTIFIER", "STRING_LITERAL", "NUMBER", "WS", "LINE_COMMENT", 
-			"BLOCK_COMMENT"
+			"TOP", "ORDER", "BY", "ASC", "DESC", "LIMIT", "OFFSET", "DROP", "DELETE", 
+			"UPDATE", "INSERT", "CREATE", "ALTER", "TRUNCATE", "GRANT", "REVOKE", 
+			"EXEC", "EXECUTE", "EQ", "NEQ", "LT", "GT", "LTE", "GTE", "ASTERISK", 
+			"COMMA", "LPAREN", "RPAREN", "IDENTIFIER", "STRING_LITERAL", "NUMBER", 
+			"WS", "LINE_COMMENT", "BLOCK_COMMENT"
 		};
 	}
 	private static final String[] _SYMBOLIC_NAMES = makeSymbolicNames();
@@ -116,9 +124,9 @@ public class SQLSimpleParser extends Parser {
 		try {
 			enterOuterAlt(_localctx, 1);
 			{
-			setState(18);
+			setState(30);
 			selectStatement();
-			setState(19);
+			setState(31);
 			match(EOF);
 			}
 		}
@@ -143,9 +151,21 @@ public class SQLSimpleParser extends Parser {
 		public TableNameContext tableName() {
 			return getRuleContext(TableNameContext.class,0);
 		}
+		public TopClauseContext topClause() {
+			return getRuleContext(TopClauseContext.class,0);
+		}
 		public WhereClauseContext whereClause() {
 			return getRuleContext(WhereClauseContext.class,0);
 		}
+		public OrderByClauseContext orderByClause() {
+			return getRuleContext(OrderByClauseContext.class,0);
+		}
+		public LimitClauseContext limitClause() {
+			return getRuleContext(LimitClauseContext.class,0);
+		}
+		public OffsetClauseContext offsetClause() {
+			return getRuleContext(OffsetClauseContext.class,0);
+		}
 		public SelectStatementContext(ParserRuleContext parent, int invokingState) {
 			super(parent, invokingState);
 		}
@@ -159,24 +179,97 @@ public class SQLSimpleParser extends Parser {
 		try {
 			enterOuterAlt(_localctx, 1);
 			{
-			setState(21);
+			setState(33);
 			match(SELECT);
-			setState(22);
+			setState(35);
+			_errHandler.sync(this);
+			switch ( getInterpreter().adaptivePredict(_input,0,_ctx) ) {
+			case 1:
+				{
+				setState(34);
+				topClause();
+				}
+				break;
+			}
+			setState(37);
 			selectList();
-			setState(23);
+			setState(38);
 			match(FROM);
-			setState(24);
+			setState(39);
 			tableName();
-			setState(26);
+			setState(41);
 			_errHandler.sync(this);
 			_la = _input.LA(1);
 			if (_la==WHERE) {
 				{
-				setState(25);
+				setState(40);
 				whereClause();
 				}
 			}
 
+			setState(44);
+			_errHandler.sync(this);
+			_la = _input.LA(1);
+			if (_la==ORDER) {
+				{
+				setState(43);
+				orderByClause();
+				}
+			}
+
+			setState(47);
+			_errHandler.sync(this);
+			_la = _input.LA(1);
+			if (_la==LIMIT) {
+				{
+				setState(46);
+				limitClause();
+				}
+			}
+
+			setState(50);
+			_errHandler.sync(this);
+			_la = _input.LA(1);
+			if (_la==OFFSET) {
+				{
+				setState(49);
+				offsetClause();
+				}
+			}
+
+			}
+		}
+		catch (RecognitionException re) {
+			_localctx.exception = re;
+			_errHandler.reportError(this, re);
+			_errHandler.recover(this, re);
+		}
+		finally {
+			exitRule();
+		}
+		return _localctx;
+	}
+
+	@SuppressWarnings("CheckReturnValue")
+	public static class TopClauseContext extends ParserRuleContext {
+		public TerminalNode TOP() { return getToken(SQLSimpleParser.TOP, 0); }
+		public TerminalNode NUMBER() { return getToken(SQLSimpleParser.NUMBER, 0); }
+		public TopClauseContext(ParserRuleContext parent, int invokingState) {
+			super(parent, invokingState);
+		}
+		@Override public int getRuleIndex() { return RULE_topClause; }
+	}
+
+	public final TopClauseContext topClause() throws RecognitionException {
+		TopClauseContext _localctx = new TopClauseContext(_ctx, getState());
+		enterRule(_localctx, 4, RULE_topClause);
+		try {
+			enterOuterAlt(_localctx, 1);
+			{
+			setState(52);
+			match(TOP);
+			setState(53);
+			match(NUMBER);
 			}
 		}
 		catch (RecognitionException re) {
@@ -224,39 +317,46 @@ public class SQLSimpleParser extends Parser {
 
 	public final SelectListContext selectList() throws RecognitionException {
 		SelectListContext _localctx = new SelectListContext(_ctx, getState());
-		enterRule(_localctx, 4, RULE_selectList);
+		enterRule(_localctx, 6, RULE_selectList);
 		int _la;
 		try {
-			setState(37);
+			setState(64);
 			_errHandler.sync(this);
 			switch (_input.LA(1)) {
 			case ASTERISK:
 				_localctx = new SelectAllContext(_localctx);
 				enterOuterAlt(_localctx, 1);
 				{
-				setState(28);
+				setState(55);
 				match(ASTERISK);
 				}
 				break;
+			case TOP:
+			case ORDER:
+			case BY:
+			case ASC:
+			case DESC:
+			case LIMIT:
+			case OFFSET:
 			case IDENTIFIER:
 				_localctx = new SelectColumnsContext(_localctx);
 				enterOuterAlt(_localctx, 2);
 				{
-				setState(29);
+				setState(56);
 				columnName();
-				setState(34);
+				setState(61);
 				_errHandler.sync(this);
 				_la = _input.LA(1);
 				while (_la==COMMA) {
 					{
 					{
-					setState(30);
+					setState(57);
 					match(COMMA);
-					setState(31);
+					setState(58);
 					columnName();
 					}
 					}
-					setState(36);
+					setState(63);
 					_errHandler.sync(this);
 					_la = _input.LA(1);
 				}
@@ -291,13 +391,13 @@ public class SQLSimpleParser extends Parser {
 
 	public final WhereClauseContext whereClause() throws RecognitionException {
 		WhereClauseContext _localctx = new WhereClauseContext(_ctx, getState());
-		enterRule(_localctx, 6, RULE_whereClause);
+		enterRule(_localctx, 8, RULE_whereClause);
 		try {
 			enterOuterAlt(_localctx, 1);
 			{
-			setState(39);
+			setState(66);
 			match(WHERE);
-			setState(40);
+			setState(67);
 			condition(0);
 			}
 		}
@@ -312,6 +412,187 @@ public class SQLSimpleParser extends Parser {
 		return _localctx;
 	}
 
+	@SuppressWarnings("CheckReturnValue")
+	public static class OrderByClauseContext extends ParserRuleContext {
+		public TerminalNode ORDER() { return getToken(SQLSimpleParser.ORDER, 0); }
+		public TerminalNode BY() { return getToken(SQLSimpleParser.BY, 0); }
+		public List<OrderItemContext> orderItem() {
+			return getRuleContexts(OrderItemContext.class);
+		}
+		public OrderItemContext orderItem(int i) {
+			return getRuleContext(OrderItemContext.class,i);
+		}
+		public List<TerminalNode> COMMA() { return getTokens(SQLSimpleParser.COMMA); }
+		public TerminalNode COMMA(int i) {
+			return getToken(SQLSimpleParser.COMMA, i);
+		}
+		public OrderByClauseContext(ParserRuleContext parent, int invokingState) {
+			super(parent, invokingState);
+		}
+		@Override public int getRuleIndex() { return RULE_orderByClause; }
+	}
+
+	public final OrderByClauseContext orderByClause() throws RecognitionException {
+		OrderByClauseContext _localctx = new OrderByClauseContext(_ctx, getState());
+		enterRule(_localctx, 10, RULE_orderByClause);
+		int _la;
+		try {
+			enterOuterAlt(_localctx, 1);
+			{
+			setState(69);
+			match(ORDER);
+			setState(70);
+			match(BY);
+			setState(71);
+			orderItem();
+			setState(76);
+			_errHandler.sync(this);
+			_la = _input.LA(1);
+			while (_la==COMMA) {
+				{
+				{
+				setState(72);
+				match(COMMA);
+				setState(73);
+				orderItem();
+				}
+				}
+				setState(78);
+				_errHandler.sync(this);
+				_la = _input.LA(1);
+			}
+			}
+		}
+		catch (RecognitionException re) {
+			_localctx.exception = re;
+			_errHandler.reportError(this, re);
+			_errHandler.recover(this, re);
+		}
+		finally {
+			exitRule();
+		}
+		return _localctx;
+	}
+
+	@SuppressWarnings("CheckReturnValue")
+	public static class OrderItemContext extends ParserRuleContext {
+		public ColumnNameContext columnName() {
+			return getRuleContext(ColumnNameContext.class,0);
+		}
+		public TerminalNode ASC() { return getToken(SQLSimpleParser.ASC, 0); }
+		public TerminalNode DESC() { return getToken(SQLSimpleParser.DESC, 0); }
+		public OrderItemContext(ParserRuleContext parent, int invokingState) {
+			super(parent, invokingState);
+		}
+		@Override public int getRuleIndex() { return RULE_orderItem; }
+	}
+
+	public final OrderItemContext orderItem() throws RecognitionException {
+		OrderItemContext _localctx = new OrderItemContext(_ctx, getState());
+		enterRule(_localctx, 12, RULE_orderItem);
+		int _la;
+		try {
+			enterOuterAlt(_localctx, 1);
+			{
+			setState(79);
+			columnName();
+			setState(81);
+			_errHandler.sync(this);
+			_la = _input.LA(1);
+			if (_la==ASC || _la==DESC) {
+				{
+				setState(80);
+				_la = _input.LA(1);
+				if ( !(_la==ASC || _la==DESC) ) {
+				_errHandler.recoverInline(this);
+				}
+				else {
+					if ( _input.LA(1)==Token.EOF ) matchedEOF = true;
+					_errHandler.reportMatch(this);
+					consume();
+				}
+				}
+			}
+
+			}
+		}
+		catch (RecognitionException re) {
+			_localctx.exception = re;
+			_errHandler.reportError(this, re);
+			_errHandler.recover(this, re);
+		}
+		finally {
+			exitRule();
+		}
+		return _localctx;
+	}
+
+	@SuppressWarnings("CheckReturnValue")
+	public static class LimitClauseContext extends ParserRuleContext {
+		public TerminalNode LIMIT() { return getToken(SQLSimpleParser.LIMIT, 0); }
+		public TerminalNode NUMBER() { return getToken(SQLSimpleParser.NUMBER, 0); }
+		public LimitClauseContext(ParserRuleContext parent, int invokingState) {
+			super(parent, invokingState);
+		}
+		@Override public int getRuleIndex() { return RULE_limitClause; }
+	}
+
+	public final LimitClauseContext limitClause() throws RecognitionException {
+		LimitClauseContext _localctx = new LimitClauseContext(_ctx, getState());
+		enterRule(_localctx, 14, RULE_limitClause);
+		try {
+			enterOuterAlt(_localctx, 1);
+			{
+			setState(83);
+			match(LIMIT);
+			setState(84);
+			match(NUMBER);
+			}
+		}
+		catch (RecognitionException re) {
+			_localctx.exception = re;
+			_errHandler.reportError(this, re);
+			_errHandler.recover(this, re);
+		}
+		finally {
+			exitRule();
+		}
+		return _localctx;
+	}
+
+	@SuppressWarnings("CheckReturnValue")
+	public static class OffsetClauseContext extends ParserRuleContext {
+		public TerminalNode OFFSET() { return getToken(SQLSimpleParser.OFFSET, 0); }
+		public TerminalNode NUMBER() { return getToken(SQLSimpleParser.NUMBER, 0); }
+		public OffsetClauseContext(ParserRuleContext parent, int invokingState) {
+			super(parent, invokingState);
+		}
+		@Override public int getRuleIndex() { return RULE_offsetClause; }
+	}
+
+	public final OffsetClauseContext offsetClause() throws RecognitionException {
+		OffsetClauseContext _localctx = new OffsetClauseContext(_ctx, getState());
+		enterRule(_localctx, 16, RULE_offsetClause);
+		try {
+			enterOuterAlt(_localctx, 1);
+			{
+			setState(86);
+			match(OFFSET);
+			setState(87);
+			match(NUMBER);
+			}
+		}
+		catch (RecognitionException re) {
+			_localctx.exception = re;
+			_errHandler.reportError(this, re);
+			_errHandler.recover(this, re);
+		}
+		finally {
+			exitRule();
+		}
+		return _localctx;
+	}
+
 	@SuppressWarnings("CheckReturnValue")
 	public static class ConditionContext extends ParserRuleContext {
 		public ConditionContext(ParserRuleContext parent, int invokingState) {
@@ -378,26 +659,33 @@ public class SQLSimpleParser extends Parser {
 		int _parentState = getState();
 		ConditionContext _localctx = new ConditionContext(_ctx, _parentState);
 		ConditionContext _prevctx = _localctx;
-		int _startState = 8;
-		enterRecursionRule(_localctx, 8, RULE_condition, _p);
+		int _startState = 18;
+		enterRecursionRule(_localctx, 18, RULE_condition, _p);
 		try {
 			int _alt;
 			enterOuterAlt(_localctx, 1);
 			{
-			setState(51);
+			setState(98);
 			_errHandler.sync(this);
 			switch (_input.LA(1)) {
+			case TOP:
+			case ORDER:
+			case BY:
+			case ASC:
+			case DESC:
+			case LIMIT:
+			case OFFSET:
 			case IDENTIFIER:
 				{
 				_localctx = new ComparisonConditionContext(_localctx);
 				_ctx = _localctx;
 				_prevctx = _localctx;
 
-				setState(43);
+				setState(90);
 				columnName();
-				setState(44);
+				setState(91);
 				comparisonOp();
-				setState(45);
+				setState(92);
 				value();
 				}
 				break;
@@ -406,11 +694,11 @@ public class SQLSimpleParser extends Parser {
 				_localctx = new ParenConditionContext(_localctx);
 				_ctx = _localctx;
 				_prevctx = _localctx;
-				setState(47);
+				setState(94);
 				match(LPAREN);
-				setState(48);
+				setState(95);
 				condition(0);
-				setState(49);
+				setState(96);
 				match(RPAREN);
 				}
 				break;
@@ -418,26 +706,26 @@ public class SQLSimpleParser extends Parser {
 				throw new NoViableAltException(this);
 			}
 			_ctx.stop = _input.LT(-1);
-			setState(61);
+			setState(108);
 			_errHandler.sync(this);
-			_alt = getInterpreter().adaptivePredict(_input,5,_ctx);
+			_alt = getInterpreter().adaptivePredict(_input,11,_ctx);
 			while ( _alt!=2 && _alt!=org.antlr.v4.runtime.atn.ATN.INVALID_ALT_NUMBER ) {
 				if ( _alt==1 ) {
 					if ( _parseListeners!=null ) triggerExitRuleEvent();
 					_prevctx = _localctx;
 					{
-					setState(59);
+					setState(106);
 					_errHandler.sync(this);
-					switch ( getInterpreter().adaptivePredict(_input,4,_ctx) ) {
+					switch ( getInterpreter().adaptivePredict(_input,10,_ctx) ) {
 					case 1:
 						{
 						_localctx = new AndConditionContext(new ConditionContext(_parentctx, _parentState));
 						pushNewRecursionContext(_localctx, _startState, RULE_condition);
-						setState(53);
+						setState(100);
 						if (!(precpred(_ctx, 4))) throw new FailedPredicateException(this, "precpred(_ctx, 4)");
-						setState(54);
+						setState(101);
 						match(AND);
-						setState(55);
+						setState(102);
 						condition(5);
 						}
 						break;
@@ -445,20 +733,20 @@ public class SQLSimpleParser extends Parser {
 						{
 						_localctx = new OrConditionContext(new ConditionContext(_parentctx, _parentState));
 						pushNewRecursionContext(_localctx, _startState, RULE_condition);
-						setState(56);
+						setState(103);
 						if (!(precpred(_ctx, 3))) throw new FailedPredicateException(this, "precpred(_ctx, 3)");
-						setState(57);
+						setState(104);
 						match(OR);
-						setState(58);
+						setState(105);
 						condition(4);
 						}
 						break;
 					}
 					} 
 				}
-				setState(63);
+				setState(110);
 				_errHandler.sync(this);
-				_alt = getInterpreter().adaptivePredict(_input,5,_ctx);
+				_alt = getInterpreter().adaptivePredict(_input,11,_ctx);
 			}
 			}
 		}
@@ -518,16 +806,16 @@ public class SQLSimpleParser extends Parser {
 
 	public final ComparisonOpContext comparisonOp() throws RecognitionException {
 		ComparisonOpContext _localctx = new ComparisonOpContext(_ctx, getState());
-		enterRule(_localctx, 10, RULE_comparisonOp);
+		enterRule(_localctx, 20, RULE_comparisonOp);
 		try {
-			setState(70);
+			setState(117);
 			_errHandler.sync(this);
 			switch (_input.LA(1)) {
 			case EQ:
 				_localctx = new EqualContext(_localctx);
 				enterOuterAlt(_localctx, 1);
 				{
-				setState(64);
+				setState(111);
 				match(EQ);
 				}
 				break;
@@ -535,7 +823,7 @@ public class SQLSimpleParser extends Parser {
 				_localctx = new NotEqualContext(_localctx);
 				enterOuterAlt(_localctx, 2);
 				{
-				setState(65);
+				setState(112);
 				match(NEQ);
 				}
 				break;
@@ -543,7 +831,7 @@ public class SQLSimpleParser extends Parser {
 				_localctx = new LessThanContext(_localctx);
 				enterOuterAlt(_localctx, 3);
 				{
-				setState(66);
+				setState(113);
 				match(LT);
 				}
 				break;
@@ -551,7 +839,7 @@ public class SQLSimpleParser extends Parser {
 				_localctx = new GreaterThanContext(_localctx);
 				enterOuterAlt(_localctx, 4);
 				{
-				setState(67);
+				setState(114);
 				match(GT);
 				}
 				break;
@@ -559,7 +847,7 @@ public class SQLSimpleParser extends Parser {
 				_localctx = new LessThanOrEqualContext(_localctx);
 				enterOuterAlt(_localctx, 5);
 				{
-				setState(68);
+				setState(115);
 				match(LTE);
 				}
 				break;
@@ -567,7 +855,7 @@ public class SQLSimpleParser extends Parser {
 				_localctx = new GreaterThanOrEqualContext(_localctx);
 				enterOuterAlt(_localctx, 6);
 				{
-				setState(69);
+				setState(116);
 				match(GTE);
 				}
 				break;
@@ -588,7 +876,9 @@ public class SQLSimpleParser extends Parser {
 
 	@SuppressWarnings("CheckReturnValue")
 	public static class TableNameContext extends ParserRuleContext {
-		public TerminalNode IDENTIFIER() { return getToken(SQLSimpleParser.IDENTIFIER, 0); }
+		public IdentifierContext identifier() {
+			return getRuleContext(IdentifierContext.class,0);
+		}
 		public TableNameContext(ParserRuleContext parent, int invokingState) {
 			super(parent, invokingState);
 		}
@@ -597,12 +887,12 @@ public class SQLSimpleParser extends Parser {
 
 	public final TableNameContext tableName() throws RecognitionException {
 		TableNameContext _localctx = new TableNameContext(_ctx, getState());
-		enterRule(_localctx, 12, RULE_tableName);
+		enterRule(_localctx, 22, RULE_tableName);
 		try {
 			enterOuterAlt(_localctx, 1);
 			{
-			setState(72);
-			match(IDENTIFIER);
+			setState(119);
+			identifier();
 			}
 		}
 		catch (RecognitionException re) {
@@ -618,7 +908,9 @@ public class SQLSimpleParser extends Parser {
 
 	@SuppressWarnings("CheckReturnValue")
 	public static class ColumnNameContext extends ParserRuleContext {
-		public TerminalNode IDENTIFIER() { return getToken(SQLSimpleParser.IDENTIFIER, 0); }
+		public IdentifierContext identifier() {
+			return getRuleContext(IdentifierContext.class,0);
+		}
 		public ColumnNameContext(ParserRuleContext parent, int invokingState) {
 			super(parent, invokingState);
 		}
@@ -627,12 +919,58 @@ public class SQLSimpleParser extends Parser {
 
 	public final ColumnNameContext columnName() throws RecognitionException {
 		ColumnNameContext _localctx = new ColumnNameContext(_ctx, getState());
-		enterRule(_localctx, 14, RULE_columnName);
+		enterRule(_localctx, 24, RULE_columnName);
 		try {
 			enterOuterAlt(_localctx, 1);
 			{
-			setState(74);
-			match(IDENTIFIER);
+			setState(121);
+			identifier();
+			}
+		}
+		catch (RecognitionException re) {
+			_localctx.exception = re;
+			_errHandler.reportError(this, re);
+			_errHandler.recover(this, re);
+		}
+		finally {
+			exitRule();
+		}
+		return _localctx;
+	}
+
+	@SuppressWarnings("CheckReturnValue")
+	public static class IdentifierContext extends ParserRuleContext {
+		public TerminalNode IDENTIFIER() { return getToken(SQLSimpleParser.IDENTIFIER, 0); }
+		public TerminalNode TOP() { return getToken(SQLSimpleParser.TOP, 0); }
+		public TerminalNode ORDER() { return getToken(SQLSimpleParser.ORDER, 0); }
+		public TerminalNode BY() { return getToken(SQLSimpleParser.BY, 0); }
+		public TerminalNode ASC() { return getToken(SQLSimpleParser.ASC, 0); }
+		public TerminalNode DESC() { return getToken(SQLSimpleParser.DESC, 0); }
+		public TerminalNode LIMIT() { return getToken(SQLSimpleParser.LIMIT, 0); }
+		public TerminalNode OFFSET() { return getToken(SQLSimpleParser.OFFSET, 0); }
+		public IdentifierContext(ParserRuleContext parent, int invokingState) {
+			super(parent, invokingState);
+		}
+		@Override public int getRuleIndex() { return RULE_identifier; }
+	}
+
+	public final IdentifierContext identifier() throws RecognitionException {
+		IdentifierContext _localctx = new IdentifierContext(_ctx, getState());
+		enterRule(_localctx, 26, RULE_identifier);
+		int _la;
+		try {
+			enterOuterAlt(_localctx, 1);
+			{
+			setState(123);
+			_la = _input.LA(1);
+			if ( !((((_la) & ~0x3f) == 0 && ((1L << _la) & 137439018496L) != 0)) ) {
+			_errHandler.recoverInline(this);
+			}
+			else {
+				if ( _input.LA(1)==Token.EOF ) matchedEOF = true;
+				_errHandler.reportMatch(this);
+				consume();
+			}
 			}
 		}
 		catch (RecognitionException re) {
@@ -686,16 +1024,16 @@ public class SQLSimpleParser extends Parser {
 
 	public final ValueContext value() throws RecognitionException {
 		ValueContext _localctx = new ValueContext(_ctx, getState());
-		enterRule(_localctx, 16, RULE_value);
+		enterRule(_localctx, 28, RULE_value);
 		try {
-			setState(81);
+			setState(130);
 			_errHandler.sync(this);
 			switch (_input.LA(1)) {
 			case STRING_LITERAL:
 				_localctx = new StringValueContext(_localctx);
 				enterOuterAlt(_localctx, 1);
 				{
-				setState(76);
+				setState(125);
 				match(STRING_LITERAL);
 				}
 				break;
@@ -703,7 +1041,7 @@ public class SQLSimpleParser extends Parser {
 				_localctx = new NumberValueContext(_localctx);
 				enterOuterAlt(_localctx, 2);
 				{
-				setState(77);
+				setState(126);
 				match(NUMBER);
 				}
 				break;
@@ -711,7 +1049,7 @@ public class SQLSimpleParser extends Parser {
 				_localctx = new BooleanTrueContext(_localctx);
 				enterOuterAlt(_localctx, 3);
 				{
-				setState(78);
+				setState(127);
 				match(TRUE);
 				}
 				break;
@@ -719,7 +1057,7 @@ public class SQLSimpleParser extends Parser {
 				_localctx = new BooleanFalseContext(_localctx);
 				enterOuterAlt(_localctx, 4);
 				{
-				setState(79);
+				setState(128);
 				match(FALSE);
 				}
 				break;
@@ -727,7 +1065,7 @@ public class SQLSimpleParser extends Parser {
 				_localctx = new NullValueContext(_localctx);
 				enterOuterAlt(_localctx, 5);
 				{
-				setState(80);
+				setState(129);
 				match(NULL);
 				}
 				break;
@@ -748,7 +1086,7 @@ public class SQLSimpleParser extends Parser {
 
 	public boolean sempred(RuleContext _localctx, int ruleIndex, int predIndex) {
 		switch (ruleIndex) {
-		case 4:
+		case 9:
 			return condition_sempred((ConditionContext)_localctx, predIndex);
 		}
 		return true;
@@ -764,56 +1102,80 @@ public class SQLSimpleParser extends Parser {
 	}
 
 	public static final String _serializedATN =
-		"\u0004\u0001\u0018T\u0002\u0000\u0007\u0000\u0002\u0001\u0007\u0001\u0002"+
+		"\u0004\u0001*\u0085\u0002\u0000\u0007\u0000\u0002\u0001\u0007\u0001\u0002"+
 		"\u0002\u0007\u0002\u0002\u0003\u0007\u0003\u0002\u0004\u0007\u0004\u0002"+
 		"\u0005\u0007\u0005\u0002\u0006\u0007\u0006\u0002\u0007\u0007\u0007\u0002"+
-		"\b\u0007\b\u0001\u0000\u0001\u0000\u0001\u0000\u0001\u0001\u0001\u0001"+
-		"\u0001\u0001\u0001\u0001\u0001\u0001\u0003\u0001\u001b\b\u0001\u0001\u0002"+
-		"\u0001\u0002\u0001\u0002\u0001\u0002\u0005\u0002!\b\u0002\n\u0002\f\u0002"+
-		"$\t\u0002\u0003\u0002&\b\u0002\u0001\u0003\u0001\u0003\u0001\u0003\u0001"+
-		"\u0004\u0001\u0004\u0001\u0004\u0001\u0004\u0001\u0004\u0001\u0004\u0001"+
-		"\u0004\u0001\u0004\u0001\u0004\u0003\u00044\b\u0004\u0001\u0004\u0001"+
-		"\u0004\u0001\u0004\u0001\u0004\u0001\u0004\u0001\u0004\u0005\u0004<\b"+
-		"\u0004\n\u0004\f\u0004?\t\u0004\u0001\u0005\u0001\u0005\u0001\u0005\u0001"+
-		"\u0005\u0001\u0005\u0001\u0005\u0003\u0005G\b\u0005\u0001\u0006\u0001"+
-		"\u0006\u0001\u0007\u0001\u0007\u0001\b\u0001\b\u0001\b\u0001\b\u0001\b"+
-		"\u0003\bR\b\b\u0001\b\u0000\u0001\b\t\u0000\u0002\u0004\u0006\b\n\f\u000e"+
-		"\u0010\u0000\u0000Y\u0000\u0012\u0001\u0000\u0000\u0000\u0002\u0015\u0001"+
-		"\u0000\u0000\u0000\u0004%\u0001\u0000\u0000\u0000\u0006\'\u0001\u0000"+
-		"\u0000\u0000\b3\u0001\u0000\u0000\u0000\nF\u0001\u0000\u0000\u0000\fH"+
-		"\u0001\u0000\u0000\u0000\u000eJ\u0001\u0000\u0000\u0000\u0010Q\u0001\u0000"+
-		"\u0000\u0000\u0012\u0013\u0003\u0002\u0001\u0000\u0013\u0014\u0005\u0000"+
-		"\u0000\u0001\u0014\u0001\u0001\u0000\u0000\u0000\u0015\u0016\u0005\u0001"+
-		"\u0000\u0000\u0016\u0017\u0003\u0004\u0002\u0000\u0017\u0018\u0005\u0002"+
-		"\u0000\u0000\u0018\u001a\u0003\f\u0006\u0000\u0019\u001b\u0003\u0006\u0003"+
-		"\u0000\u001a\u0019\u0001\u0000\u0000\u0000\u001a\u001b\u0001\u0000\u0000"+
-		"\u0000\u001b\u0003\u0001\u0000\u0000\u0000\u001c&\u0005\u000f\u0000\u0000"+
-		"\u001d\"\u0003\u000e\u0007\u0000\u001e\u001f\u0005\u0010\u0000\u0000\u001f"+
-		"!\u0003\u000e\u0007\u0000 \u001e\u0001\u0000\u0000\u0000!$\u0001\u0000"+
-		"\u0000\u0000\" \u0001\u0000\u0000\u0000\"#\u0001\u0000\u0000\u0000#&\u0001"+
-		"\u0000\u0000\u0000$\"\u0001\u0000\u0000\u0000%\u001c\u0001\u0000\u0000"+
-		"\u0000%\u001d\u0001\u0000\u0000\u0000&\u0005\u0001\u0000\u0000\u0000\'"+
-		"(\u0005\u0003\u0000\u0000()\u0003\b\u0004\u0000)\u0007\u0001\u0000\u0000"+
-		"\u0000*+\u0006\u0004\uffff\uffff\u0000+,\u0003\u000e\u0007\u0000,-\u0003"+
-		"\n\u0005\u0000-.\u0003\u0010\b\u0000.4\u0001\u0000\u0000\u0000/0\u0005"+
-		"\u0011\u0000\u000001\u0003\b\u0004\u000012\u0005\u0012\u0000\u000024\u0001"+
-		"\u0000\u0000\u00003*\u0001\u0000\u0000\u00003/\u0001\u0000\u0000\u0000"+
-		"4=\u0001\u0000\u0000\u000056\n\u0004\u0000\u000067\u0005\u0004\u0000\u0000"+
-		"7<\u0003\b\u0004\u000589\n\u0003\u0000\u00009:\u0005\u0005\u0000\u0000"+
-		":<\u0003\b\u0004\u0004;5\u0001\u0000\u0000\u0000;8\u0001\u0000\u0000\u0000"+
-		"<?\u0001\u0000\u0000\u0000=;\u0001\u0000\u0000\u0000=>\u0001\u0000\u0000"+
-		"\u0000>\t\u0001\u0000\u0000\u0000?=\u0001\u0000\u0000\u0000@G\u0005\t"+
-		"\u0000\u0000AG\u0005\n\u0000\u0000BG\u0005\u000b\u0000\u0000CG\u0005\f"+
-		"\u0000\u0000DG\u0005\r\u0000\u0000EG\u0005\u000e\u0000\u0000F@\u0001\u0000"+
-		"\u0000\u0000FA\u0001\u0000\u0000\u0000FB\u0001\u0000\u0000\u0000FC\u0001"+
-		"\u0000\u0000\u0000FD\u0001\u0000\u0000\u0000FE\u0001\u0000\u0000\u0000"+
-		"G\u000b\u0001\u0000\u0000\u0000HI\u0005\u0013\u0000\u0000I\r\u0001\u0000"+
-		"\u0000\u0000JK\u0005\u0013\u0000\u0000K\u000f\u0001\u0000\u0000\u0000"+
-		"LR\u0005\u0014\u0000\u0000MR\u0005\u0015\u0000\u0000NR\u0005\u0006\u0000"+
-		"\u0000OR\u0005\u0007\u0000\u0000PR\u0005\b\u0000\u0000QL\u0001\u0000\u0000"+
-		"\u0000QM\u0001\u0000\u0000\u0000QN\u0001\u0000\u0000\u0000QO\u0001\u0000"+
-		"\u0000\u0000QP\u0001\u0000\u0000\u0000R\u0011\u0001\u0000\u0000\u0000"+
-		"\b\u001a\"%3;=FQ";
+		"\b\u0007\b\u0002\t\u0007\t\u0002\n\u0007\n\u0002\u000b\u0007\u000b\u0002"+
+		"\f\u0007\f\u0002\r\u0007\r\u0002\u000e\u0007\u000e\u0001\u0000\u0001\u0000"+
+		"\u0001\u0000\u0001\u0001\u0001\u0001\u0003\u0001$\b\u0001\u0001\u0001"+
+		"\u0001\u0001\u0001\u0001\u0001\u0001\u0003\u0001*\b\u0001\u0001\u0001"+
+		"\u0003\u0001-\b\u0001\u0001\u0001\u0003\u00010\b\u0001\u0001\u0001\u0003"+
+		"\u00013\b\u0001\u0001\u0002\u0001\u0002\u0001\u0002\u0001\u0003\u0001"+
+		"\u0003\u0001\u0003\u0001\u0003\u0005\u0003<\b\u0003\n\u0003\f\u0003?\t"+
+		"\u0003\u0003\u0003A\b\u0003\u0001\u0004\u0001\u0004\u0001\u0004\u0001"+
+		"\u0005\u0001\u0005\u0001\u0005\u0001\u0005\u0001\u0005\u0005\u0005K\b"+
+		"\u0005\n\u0005\f\u0005N\t\u0005\u0001\u0006\u0001\u0006\u0003\u0006R\b"+
+		"\u0006\u0001\u0007\u0001\u0007\u0001\u0007\u0001\b\u0001\b\u0001\b\u0001"+
+		"\t\u0001\t\u0001\t\u0001\t\u0001\t\u0001\t\u0001\t\u0001\t\u0001\t\u0003"+
+		"\tc\b\t\u0001\t\u0001\t\u0001\t\u0001\t\u0001\t\u0001\t\u0005\tk\b\t\n"+
+		"\t\f\tn\t\t\u0001\n\u0001\n\u0001\n\u0001\n\u0001\n\u0001\n\u0003\nv\b"+
+		"\n\u0001\u000b\u0001\u000b\u0001\f\u0001\f\u0001\r\u0001\r\u0001\u000e"+
+		"\u0001\u000e\u0001\u000e\u0001\u000e\u0001\u000e\u0003\u000e\u0083\b\u000e"+
+		"\u0001\u000e\u0000\u0001\u0012\u000f\u0000\u0002\u0004\u0006\b\n\f\u000e"+
+		"\u0010\u0012\u0014\u0016\u0018\u001a\u001c\u0000\u0002\u0001\u0000\f\r"+
+		"\u0002\u0000\t\u000f%%\u008a\u0000\u001e\u0001\u0000\u0000\u0000\u0002"+
+		"!\u0001\u0000\u0000\u0000\u00044\u0001\u0000\u0000\u0000\u0006@\u0001"+
+		"\u0000\u0000\u0000\bB\u0001\u0000\u0000\u0000\nE\u0001\u0000\u0000\u0000"+
+		"\fO\u0001\u0000\u0000\u0000\u000eS\u0001\u0000\u0000\u0000\u0010V\u0001"+
+		"\u0000\u0000\u0000\u0012b\u0001\u0000\u0000\u0000\u0014u\u0001\u0000\u0000"+
+		"\u0000\u0016w\u0001\u0000\u0000\u0000\u0018y\u0001\u0000\u0000\u0000\u001a"+
+		"{\u0001\u0000\u0000\u0000\u001c\u0082\u0001\u0000\u0000\u0000\u001e\u001f"+
+		"\u0003\u0002\u0001\u0000\u001f \u0005\u0000\u0000\u0001 \u0001\u0001\u0000"+
+		"\u0000\u0000!#\u0005\u0001\u0000\u0000\"$\u0003\u0004\u0002\u0000#\"\u0001"+
+		"\u0000\u0000\u0000#$\u0001\u0000\u0000\u0000$%\u0001\u0000\u0000\u0000"+
+		"%&\u0003\u0006\u0003\u0000&\'\u0005\u0002\u0000\u0000\')\u0003\u0016\u000b"+
+		"\u0000(*\u0003\b\u0004\u0000)(\u0001\u0000\u0000\u0000)*\u0001\u0000\u0000"+
+		"\u0000*,\u0001\u0000\u0000\u0000+-\u0003\n\u0005\u0000,+\u0001\u0000\u0000"+
+		"\u0000,-\u0001\u0000\u0000\u0000-/\u0001\u0000\u0000\u0000.0\u0003\u000e"+
+		"\u0007\u0000/.\u0001\u0000\u0000\u0000/0\u0001\u0000\u0000\u000002\u0001"+
+		"\u0000\u0000\u000013\u0003\u0010\b\u000021\u0001\u0000\u0000\u000023\u0001"+
+		"\u0000\u0000\u00003\u0003\u0001\u0000\u0000\u000045\u0005\t\u0000\u0000"+
+		"56\u0005\'\u0000\u00006\u0005\u0001\u0000\u0000\u00007A\u0005!\u0000\u0000"+
+		"8=\u0003\u0018\f\u00009:\u0005\"\u0000\u0000:<\u0003\u0018\f\u0000;9\u0001"+
+		"\u0000\u0000\u0000<?\u0001\u0000\u0000\u0000=;\u0001\u0000\u0000\u0000"+
+		"=>\u0001\u0000\u0000\u0000>A\u0001\u0000\u0000\u0000?=\u0001\u0000\u0000"+
+		"\u0000@7\u0001\u0000\u0000\u0000@8\u0001\u0000\u0000\u0000A\u0007\u0001"+
+		"\u0000\u0000\u0000BC\u0005\u0003\u0000\u0000CD\u0003\u0012\t\u0000D\t"+
+		"\u0001\u0000\u0000\u0000EF\u0005\n\u0000\u0000FG\u0005\u000b\u0000\u0000"+
+		"GL\u0003\f\u0006\u0000HI\u0005\"\u0000\u0000IK\u0003\f\u0006\u0000JH\u0001"+
+		"\u0000\u0000\u0000KN\u0001\u0000\u0000\u0000LJ\u0001\u0000\u0000\u0000"+
+		"LM\u0001\u0000\u0000\u0000M\u000b\u0001\u0000\u0000\u0000NL\u0001\u0000"+
+		"\u0000\u0000OQ\u0003\u0018\f\u0000PR\u0007\u0000\u0000\u0000QP\u0001\u0000"+
+		"\u0000\u0000QR\u0001\u0000\u0000\u0000R\r\u0001\u0000\u0000\u0000ST\u0005"+
+		"\u000e\u0000\u0000TU\u0005\'\u0000\u0000U\u000f\u0001\u0000\u0000\u0000"+
+		"VW\u0005\u000f\u0000\u0000WX\u0005\'\u0000\u0000X\u0011\u0001\u0000\u0000"+
+		"\u0000YZ\u0006\t\uffff\uffff\u0000Z[\u0003\u0018\f\u0000[\\\u0003\u0014"+
+		"\n\u0000\\]\u0003\u001c\u000e\u0000]c\u0001\u0000\u0000\u0000^_\u0005"+
+		"#\u0000\u0000_`\u0003\u0012\t\u0000`a\u0005$\u0000\u0000ac\u0001\u0000"+
+		"\u0000\u0000bY\u0001\u0000\u0000\u0000b^\u0001\u0000\u0000\u0000cl\u0001"+
+		"\u0000\u0000\u0000de\n\u0004\u0000\u0000ef\u0005\u0004\u0000\u0000fk\u0003"+
+		"\u0012\t\u0005gh\n\u0003\u0000\u0000hi\u0005\u0005\u0000\u0000ik\u0003"+
+		"\u0012\t\u0004jd\u0001\u0000\u0000\u0000jg\u0001\u0000\u0000\u0000kn\u0001"+
+		"\u0000\u0000\u0000lj\u0001\u0000\u0000\u0000lm\u0001\u0000\u0000\u0000"+
+		"m\u0013\u0001\u0000\u0000\u0000nl\u0001\u0000\u0000\u0000ov\u0005\u001b"+
+		"\u0000\u0000pv\u0005\u001c\u0000\u0000qv\u0005\u001d\u0000\u0000rv\u0005"+
+		"\u001e\u0000\u0000sv\u0005\u001f\u0000\u0000tv\u0005 \u0000\u0000uo\u0001"+
+		"\u0000\u0000\u0000up\u0001\u0000\u0000\u0000uq\u0001\u0000\u0000\u0000"+
+		"ur\u0001\u0000\u0000\u0000us\u0001\u0000\u0000\u0000ut\u0001\u0000\u0000"+
+		"\u0000v\u0015\u0001\u0000\u0000\u0000wx\u0003\u001a\r\u0000x\u0017\u0001"+
+		"\u0000\u0000\u0000yz\u0003\u001a\r\u0000z\u0019\u0001\u0000\u0000\u0000"+
+		"{|\u0007\u0001\u0000\u0000|\u001b\u0001\u0000\u0000\u0000}\u0083\u0005"+
+		"&\u0000\u0000~\u0083\u0005\'\u0000\u0000\u007f\u0083\u0005\u0006\u0000"+
+		"\u0000\u0080\u0083\u0005\u0007\u0000\u0000\u0081\u0083\u0005\b\u0000\u0000"+
+		"\u0082}\u0001\u0000\u0000\u0000\u0082~\u0001\u0000\u0000\u0000\u0082\u007f"+
+		"\u0001\u0000\u0000\u0000\u0082\u0080\u0001\u0000\u0000\u0000\u0082\u0081"+
+		"\u0001\u0000\u0000\u0000\u0083\u001d\u0001\u0000\u0000\u0000\u000e#),"+
+		"/2=@LQbjlu\u0082";
 	public static final ATN _ATN =
 		new ATNDeserializer().deserialize(_serializedATN.toCharArray());
 	static {
@@ -11,7 +11,13 @@ query
 
 // SELECT statement básico
 selectStatement
-    : SELECT selectList FROM tableName whereClause?
+    : SELECT topClause? selectList FROM tableName whereClause?
+      orderByClause? limitClause? offsetClause?
+    ;
+
+// TOP n de SQL Server
+topClause
+    : TOP NUMBER
     ;
 
 // Lista de columnas en SELECT
@@ -25,6 +31,24 @@ whereClause
     : WHERE condition
     ;
 
+// Cláusula ORDER BY opcional
+orderByClause
+    : ORDER BY orderItem (COMMA orderItem)*
+    ;
+
+orderItem
+    : columnName (ASC | DESC)?
+    ;
+
+// LIMIT n y OFFSET n opcionales
+limitClause
+    : LIMIT NUMBER
+    ;
+
+offsetClause
+    : OFFSET NUMBER
+    ;
+
 // Condiciones en WHERE
 condition
     : condition AND condition           # AndCondition
@@ -45,11 +69,24 @@ comparisonOp
 
 // Nombres de tablas y columnas
 tableName
-    : IDENTIFIER
+    : identifier
     ;
 
 columnName
+    : identifier
+    ;
+
+// Las palabras clave de TOP, ORDER BY, LIMIT y OFFSET no están reservadas:
+// una columna o tabla puede llamarse order, desc, top, limit u offset
+identifier
     : IDENTIFIER
+    | TOP
+    | ORDER
+    | BY
+    | ASC
+    | DESC
+    | LIMIT
+    | OFFSET
     ;
 
 // Valores literales
@@ -74,6 +111,28 @@ OR          : O R ;
 TRUE        : T R U E ;
 FALSE       : F A L S E ;
 NULL        : N U L L ;
+TOP         : T O P ;
+ORDER       : O R D E R ;
+BY          : B Y ;
+ASC         : A S C ;
+DESC        : D E S C ;
+LIMIT       : L I M I T ;
+OFFSET      : O F F S E T ;
+
+// Palabras clave DDL/DML no soportadas. Se reconocen como tokens propios
+// para que la validación de seguridad trabaje sobre el mismo token stream
+// que el parser, sin volver a escanear el texto.
+DROP        : D R O P ;
+DELETE      : D E L E T E ;
+UPDATE      : U P D A T E ;
+INSERT      : I N S E R T ;
+CREATE      : C R E A T E ;
+ALTER       : A L T E R ;
+TRUNCATE    : T R U N C A T E ;
+GRANT       : G R A N T ;
+REVOKE      : R E V O K E ;
+EXEC        : E X E C ;
+EXECUTE     : E X E C U T E ;
 
 // Operadores de comparación
 EQ          : '=' ;
@@ -0,0 +1,134 @@
+"""
+Normalización de consultas SQL para claves de caché.
+
+Produce una forma canónica de la consulta a partir de los tokens del lexer de
+SQLSimple, de modo que dos entradas con la misma secuencia de tokens tienen la
+misma forma: los comentarios y espacios ya fueron descartados por el lexer y
+las palabras clave se pasan a mayúsculas. Los identificadores y literales de
+cadena se conservan tal cual porque forman parte de la consulta Cypher
+generada. Las palabras clave no reservadas (TOP, ORDER, BY, ASC, DESC, LIMIT
+y OFFSET) también se conservan: pueden ser nombres de columna o tabla, y sin
+parsear no se sabe en qué papel aparecen.
+
+Para traducciones parametrizadas también se obtiene la "forma" de la consulta,
+donde cada literal se sustituye por un marcador y se devuelve aparte. Los
+números de TOP, LIMIT y OFFSET no se extraen: el visitor los emite en línea,
+así que forman parte de la forma.
+
+Las entradas con errores léxicos no deben normalizarse para la caché: el lexer
+descarta los caracteres no reconocidos y la forma no los reflejaría.
+"""
+
+from antlr4 import Token
+
+from app.core.parser.engine import get_parser_engine
+from app.core.parser.generated.SQLSimpleLexer import SQLSimpleLexer
+
+# Tokens cuyo texto se conserva literalmente
+_CASE_SENSITIVE_TYPES = frozenset(
+    {
+        SQLSimpleLexer.IDENTIFIER,
+        SQLSimpleLexer.STRING_LITERAL,
+        SQLSimpleLexer.TOP,
+        SQLSimpleLexer.ORDER,
+        SQLSimpleLexer.BY,
+        SQLSimpleLexer.ASC,
+        SQLSimpleLexer.DESC,
+        SQLSimpleLexer.LIMIT,
+        SQLSimpleLexer.OFFSET,
+    }
+)
+
+# Tokens que son valores literales
+_LITERAL_TYPES = frozenset(
+    {
+        SQLSimpleLexer.STRING_LITERAL,
+        SQLSimpleLexer.NUMBER,
+        SQLSimpleLexer.TRUE,
+        SQLSimpleLexer.FALSE,
+        SQLSimpleLexer.NULL,
+    }
+)
+
+# Palabras clave cuyo número siguiente es un recuento de filas, no un literal
+_ROW_COUNT_TYPES = frozenset(
+    {SQLSimpleLexer.TOP, SQLSimpleLexer.LIMIT, SQLSimpleLexer.OFFSET}
+)
+
+# Marcador de literal en la forma de la consulta. Ningún token del lexer
+# puede producirlo.
+LITERAL_PLACEHOLDER = "$?"
+
+
+def _token_text(token) -> str:
+    """Texto canónico de un token."""
+    if token.type in _CASE_SENSITIVE_TYPES:
+        return token.text
+    return token.text.upper()
+
+
+def normalize_tokens(tokens) -> str:
+    """
+    Obtiene la forma canónica de una secuencia de tokens.
+
+    Args:
+        tokens: Tokens del lexer (el token EOF se ignora)
+
+    Returns:
+        str: Tokens de la consulta separados por un espacio
+    """
+    return " ".join(_token_text(t) for t in tokens if t.type != Token.EOF)
+
+
+def normalize_token_shape(tokens) -> tuple[str, list[str]]:
+    """
+    Obtiene la forma canónica de una secuencia de tokens con los literales
+    extraídos.
+
+    Args:
+        tokens: Tokens del lexer (el token EOF se ignora)
+
+    Returns:
+        tuple: (forma con marcadores en lugar de literales, textos de los
+            literales en orden de aparición)
+    """
+    parts = []
+    literals = []
+    previous_type = None
+    for token in tokens:
+        if token.type == Token.EOF:
+            continue
+        text = _token_text(token)
+        if token.type in _LITERAL_TYPES and previous_type not in _ROW_COUNT_TYPES:
+            literals.append(text)
+            text = LITERAL_PLACEHOLDER
+        parts.append(text)
+        previous_type = token.type
+    return " ".join(parts), literals
+
+
+def normalize_sql(sql_query: str) -> str:
+    """
+    Obtiene la forma canónica de una consulta SQL.
+
+    Args:
+        sql_query: Consulta SQL original
+
+    Returns:
+        str: Tokens de la consulta separados por un espacio
+    """
+    return normalize_tokens(get_parser_engine().tokenize(sql_query))
+
+
+def normalize_sql_shape(sql_query: str) -> tuple[str, list[str]]:
+    """
+    Obtiene la forma canónica de una consulta con los literales extraídos.
+
+    Args:
+        sql_query: Consulta SQL original
+
+    Returns:
+        tuple: (forma con marcadores en lugar de literales, textos de los
+            literales en orden de aparición)
+    """
+    return normalize_token_shape(get_parser_engine().tokenize(sql_query))
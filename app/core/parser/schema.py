@@ -0,0 +1,196 @@
+"""
+Catálogo del esquema de una base de datos SQL Server de origen.
+
+Describe las tablas, columnas, claves primarias y claves foráneas leídas de
+INFORMATION_SCHEMA y permite al visitor resolver con búsquedas O(1) el label
+de Neo4j de cada tabla y el nombre real de cada propiedad, en lugar de
+adivinarlos a partir del texto de la consulta:
+- Tablas y columnas se buscan sin distinguir mayúsculas (como en SQL Server
+  con su intercalación por defecto) y se devuelven con su nombre real
+- El label de una tabla es su nombre con la primera letra en mayúscula,
+  conservando el resto (OrderItems -> OrderItems, users -> Users)
+- Si el mismo nombre de tabla existe en varios esquemas se usa el de dbo o,
+  si no está, el primero por orden alfabético
+
+El catálogo es inmutable y se puede serializar (to_dict/from_dict) para
+guardarlo en disco o enviarlo a los workers del pool de traducción. Su
+versión es un hash del contenido: dos lecturas del mismo esquema tienen la
+misma versión.
+"""
+
+import hashlib
+import json
+from typing import NamedTuple, Optional
+
+# Esquema por defecto de SQL Server, preferido ante nombres repetidos
+DEFAULT_SCHEMA = "dbo"
+
+
+class ColumnSchema(NamedTuple):
+    """Columna de una tabla."""
+
+    name: str
+    data_type: str
+    nullable: bool
+
+
+class ForeignKey(NamedTuple):
+    """Clave foránea de una tabla (posible relación en el grafo)."""
+
+    name: str
+    columns: tuple[str, ...]
+    referenced_schema: str
+    referenced_table: str
+    referenced_columns: tuple[str, ...]
+
+
+class TableSchema:
+    """Tabla o vista con sus columnas y claves."""
+
+    def __init__(
+        self,
+        schema: str,
+        name: str,
+        columns: list[ColumnSchema],
+        primary_key: tuple[str, ...] = (),
+        foreign_keys: tuple[ForeignKey, ...] = (),
+    ):
+        """
+        Construye la tabla e indexa sus columnas.
+
+        Args:
+            schema: Esquema de SQL Server (dbo, sales...)
+            name: Nombre real de la tabla
+            columns: Columnas en orden de definición
+            primary_key: Columnas de la clave primaria, en orden
+            foreign_keys: Claves foráneas de la tabla
+        """
+        self.schema = schema
+        self.name = name
+        self.label = name[:1].upper() + name[1:]
+        self.columns = tuple(columns)
+        self.primary_key = tuple(primary_key)
+        self.foreign_keys = tuple(foreign_keys)
+        self._columns = {column.name.casefold(): column for column in self.columns}
+
+    def column(self, name: str) -> Optional[ColumnSchema]:
+        """
+        Busca una columna sin distinguir mayúsculas.
+
+        Args:
+            name: Nombre de la columna tal como aparece en la consulta
+
+        Returns:
+            ColumnSchema o None si la tabla no tiene esa columna
+        """
+        return self._columns.get(name.casefold())
+
+    def to_dict(self) -> dict:
+        """Representación JSON de la tabla."""
+        return {
+            "schema": self.schema,
+            "name": self.name,
+            "columns": [column._asdict() for column in self.columns],
+            "primary_key": list(self.primary_key),
+            "foreign_keys": [
+                {
+                    **foreign_key._asdict(),
+                    "columns": list(foreign_key.columns),
+                    "referenced_columns": list(foreign_key.referenced_columns),
+                }
+                for foreign_key in self.foreign_keys
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TableSchema":
+        """Reconstruye una tabla desde to_dict()."""
+        return cls(
+            schema=data["schema"],
+            name=data["name"],
+            columns=[ColumnSchema(**column) for column in data["columns"]],
+            primary_key=tuple(data["primary_key"]),
+            foreign_keys=tuple(
+                ForeignKey(
+                    name=foreign_key["name"],
+                    columns=tuple(foreign_key["columns"]),
+                    referenced_schema=foreign_key["referenced_schema"],
+                    referenced_table=foreign_key["referenced_table"],
+                    referenced_columns=tuple(foreign_key["referenced_columns"]),
+                )
+                for foreign_key in data["foreign_keys"]
+            ),
+        )
+
+
+class SchemaCatalog:
+    """Esquema completo de una base de datos, indexado por nombre de tabla."""
+
+    def __init__(self, tables: list[TableSchema]):
+        """
+        Construye el catálogo, su versión y sus índices.
+
+        Args:
+            tables: Tablas y vistas de la base de datos
+        """
+        self.tables = tuple(
+            sorted(tables, key=lambda table: (table.schema, table.name))
+        )
+        self.version = hashlib.sha256(
+            json.dumps(
+                [table.to_dict() for table in self.tables], sort_keys=True
+            ).encode("utf-8")
+        ).hexdigest()[:16]
+
+        # Índices: tabla por nombre y claves foráneas que apuntan a cada tabla
+        self._tables: dict[str, TableSchema] = {}
+        preferred = sorted(
+            self.tables, key=lambda table: table.schema.casefold() != DEFAULT_SCHEMA
+        )
+        for table in preferred:
+            self._tables.setdefault(table.name.casefold(), table)
+        self._referenced_by: dict[tuple[str, str], list] = {}
+        for table in self.tables:
+            for foreign_key in table.foreign_keys:
+                key = (
+                    foreign_key.referenced_schema.casefold(),
+                    foreign_key.referenced_table.casefold(),
+                )
+                self._referenced_by.setdefault(key, []).append((table, foreign_key))
+
+    def table(self, name: str) -> Optional[TableSchema]:
+        """
+        Busca una tabla sin distinguir mayúsculas.
+
+        Args:
+            name: Nombre de la tabla tal como aparece en la consulta
+
+        Returns:
+            TableSchema o None si la base de datos no tiene esa tabla
+        """
+        return self._tables.get(name.casefold())
+
+    def referenced_by(self, table: TableSchema) -> list[tuple[TableSchema, ForeignKey]]:
+        """
+        Claves foráneas de otras tablas que apuntan a una tabla.
+
+        Args:
+            table: Tabla referenciada
+
+        Returns:
+            list: (tabla que referencia, clave foránea) por cada relación
+        """
+        key = (table.schema.casefold(), table.name.casefold())
+        return list(self._referenced_by.get(key, ()))
+
+    def to_dict(self) -> dict:
+        """Representación JSON del catálogo."""
+        return {
+            "version": self.version,
+            "tables": [table.to_dict() for table in self.tables],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SchemaCatalog":
+        """Reconstruye un catálogo desde to_dict()."""
+        return cls([TableSchema.from_dict(table) for table in data["tables"]])
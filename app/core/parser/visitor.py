@@ -7,9 +7,57 @@ Mapeo básico según CORE-03:
 - SELECT col FROM table -> MATCH (n:Table) RETURN n.col
 - WHERE con operadores =, >, <, <=, >=, !=
 - Soporte para AND, OR
+- ORDER BY col [ASC|DESC] -> ORDER BY n.col [DESC]
+- OFFSET n -> SKIP n; LIMIT n y TOP n (SQL Server) -> LIMIT n
+
+En modo parametrizado los literales se sustituyen por parámetros ($p0, $p1...)
+para que Neo4j reutilice un mismo plan por forma de consulta. Los valores de
+TOP, LIMIT y OFFSET se emiten siempre en línea: forman parte de la forma de
+la consulta (ver normalizer) y deben ser enteros.
+
+Con TRANSLATION_PARSER="fast" las consultas se parsean primero con el parser
+escrito a mano de fast_parser y solo las que este no reconoce pasan por ANTLR.
+Ambos caminos construyen el Cypher con los mismos métodos del visitor.
+
+Si se indica el catálogo del esquema de la base de datos de origen (ver
+schema), el label y los nombres de las propiedades se toman de él y las
+tablas o columnas que no existen se rechazan antes de llegar a Neo4j. Sin
+catálogo el label es el nombre de la tabla capitalizado y las columnas se
+usan tal cual.
 """
 
+from typing import Optional
+
+from app.core.config import settings
+from app.core.parser.engine import get_parser_engine
+from app.core.parser.fast_parser import (
+    Comparison,
+    Condition,
+    LogicalCondition,
+    SelectStatement,
+    parse_select,
+)
+from app.core.parser.generated.SQLSimpleLexer import SQLSimpleLexer
 from app.core.parser.generated.SQLSimpleVisitor import SQLSimpleVisitor
+from app.core.parser.schema import SchemaCatalog
+
+# Mapeo de operadores SQL a Cypher
+CYPHER_OPERATORS = {
+    "=": "=",
+    "!=": "<>",
+    "<>": "<>",
+    "<": "<",
+    ">": ">",
+    "<=": "<=",
+    ">=": ">=",
+}
+
+# Literales SQL cuyo texto en Cypher es fijo
+_CYPHER_KEYWORD_LITERALS = {
+    SQLSimpleLexer.TRUE: "true",
+    SQLSimpleLexer.FALSE: "false",
+    SQLSimpleLexer.NULL: "null",
+}
 
 
 class SQLToCypherVisitor(SQLSimpleVisitor):
@@ -19,12 +67,30 @@ class SQLToCypherVisitor(SQLSimpleVisitor):
     Implementa el mapeo definido en el documento CORE-03 del proyecto.
     """
 
-    def __init__(self):
-        """Inicializa el visitor con estado limpio."""
+    def __init__(
+        self, parameterize: bool = False, schema: Optional[SchemaCatalog] = None
+    ):
+        """
+        Inicializa el visitor con estado limpio.
+
+        Args:
+            parameterize: Si True, los literales se emiten como parámetros
+            schema: Catálogo del esquema de origen con el que resolver tablas
+                y columnas (opcional)
+        """
         self.table_name = None
+        self.schema = schema
+        self.table = None
+        self.unknown_columns = []
         self.columns = []
         self.conditions = []
+        self.order_by = []
+        self.top = None
+        self.limit = None
+        self.skip = None
         self.errors = []
+        self.parameterize = parameterize
+        self.parameters = {}
 
     def visitQuery(self, ctx):
         """
@@ -49,7 +115,11 @@ class SQLToCypherVisitor(SQLSimpleVisitor):
             str: Consulta Cypher completa
         """
         # Obtener nombre de tabla
-        self.table_name = ctx.tableName().getText()
+        self._set_table(ctx.tableName().getText())
+
+        # Visitar TOP si existe
+        if ctx.topClause():
+            self.visit(ctx.topClause())
 
         # Visitar la lista de columnas
         self.visit(ctx.selectList())
@@ -58,9 +128,36 @@ class SQLToCypherVisitor(SQLSimpleVisitor):
         if ctx.whereClause():
             self.visit(ctx.whereClause())
 
+        # Visitar ORDER BY, LIMIT y OFFSET si existen
+        if ctx.orderByClause():
+            self.visit(ctx.orderByClause())
+        if ctx.limitClause():
+            self.visit(ctx.limitClause())
+        if ctx.offsetClause():
+            self.visit(ctx.offsetClause())
+
         # Construir consulta Cypher
         return self._build_cypher_query()
 
+    def visitTopClause(self, ctx):
+        """Procesa TOP n (SQL Server)."""
+        self.top = _row_count(ctx.NUMBER().getText(), "TOP")
+
+    def visitOrderByClause(self, ctx):
+        """Procesa ORDER BY con una o varias columnas."""
+        self.order_by = [
+            (item.columnName().getText(), "DESC" if item.DESC() else "ASC")
+            for item in ctx.orderItem()
+        ]
+
+    def visitLimitClause(self, ctx):
+        """Procesa LIMIT n."""
+        self.limit = _row_count(ctx.NUMBER().getText(), "LIMIT")
+
+    def visitOffsetClause(self, ctx):
+        """Procesa OFFSET n."""
+        self.skip = _row_count(ctx.NUMBER().getText(), "OFFSET")
+
     def visitSelectAll(self, ctx):
         """Procesa SELECT * - retorna todas las propiedades del nodo."""
         self.columns = ["*"]
@@ -98,9 +195,12 @@ class SQLToCypherVisitor(SQLSimpleVisitor):
         """
         column = ctx.columnName().getText()
         operator = self._get_operator(ctx.comparisonOp())
-        value = self.visit(ctx.value())
+        if self.parameterize:
+            value = self._add_parameter(ctx.value().getText())
+        else:
+            value = self.visit(ctx.value())
 
-        return f"n.{column} {operator} {value}"
+        return self._comparison(column, operator, value)
 
     def visitParenCondition(self, ctx):
         """Procesa condición entre paréntesis."""
@@ -127,6 +227,85 @@ class SQLToCypherVisitor(SQLSimpleVisitor):
         """Procesa valor NULL."""
         return "null"
 
+    def translate_statement(self, statement: SelectStatement) -> str:
+        """
+        Traduce una consulta obtenida con el parser rápido.
+
+        Args:
+            statement: Consulta devuelta por fast_parser.parse_select()
+
+        Returns:
+            str: Consulta Cypher completa
+        """
+        self._set_table(statement.table)
+        if statement.top is not None:
+            self.top = _row_count(statement.top, "TOP")
+        self.columns = list(statement.columns)
+        if statement.condition is not None:
+            self.conditions.append(self._translate_condition(statement.condition))
+        self.order_by = list(statement.order_by)
+        if statement.limit is not None:
+            self.limit = _row_count(statement.limit, "LIMIT")
+        if statement.offset is not None:
+            self.skip = _row_count(statement.offset, "OFFSET")
+        return self._build_cypher_query()
+
+    def _translate_condition(self, condition: Condition) -> str:
+        """
+        Traduce una condición del parser rápido igual que visit().
+
+        Args:
+            condition: Condición de fast_parser
+
+        Returns:
+            str: Condición Cypher
+        """
+        if isinstance(condition, Comparison):
+            if self.parameterize:
+                value = self._add_parameter(condition.value)
+            else:
+                value = _CYPHER_KEYWORD_LITERALS.get(
+                    condition.value_type, condition.value
+                )
+            operator = CYPHER_OPERATORS.get(condition.operator, condition.operator)
+            return self._comparison(condition.column, operator, value)
+        if isinstance(condition, LogicalCondition):
+            left = self._translate_condition(condition.left)
+            right = self._translate_condition(condition.right)
+            return f"({left} {condition.operator} {right})"
+        return f"({self._translate_condition(condition.condition)})"
+
+    def _comparison(self, column, operator, value):
+        """
+        Construye una comparación sobre una propiedad del nodo.
+
+        Args:
+            column: Nombre de la columna
+            operator: Operador Cypher
+            value: Literal o parámetro Cypher
+
+        Returns:
+            str: Comparación Cypher
+        """
+        return f"n.{self._property(column)} {operator} {value}"
+
+    def _add_parameter(self, literal_text):
+        """
+        Registra un literal como parámetro de la consulta.
+
+        Los parámetros se numeran en el orden en que aparecen los literales
+        en la consulta SQL.
+
+        Args:
+            literal_text: Texto del literal SQL
+
+        Returns:
+            str: Referencia al parámetro en Cypher ($p0, $p1...)
+        """
+        name = f"p{len(self.parameters)}"
+        self.parameters[name] = sql_literal_to_python(literal_text)
+        return f"${name}"
+
     def _get_operator(self, op_ctx):
         """
         Obtiene el operador Cypher equivalente al operador SQL.
@@ -138,19 +317,7 @@ class SQLToCypherVisitor(SQLSimpleVisitor):
             str: Operador Cypher equivalente
         """
         op_text = op_ctx.getText()
-
-        # Mapeo de operadores SQL a Cypher
-        operator_map = {
-            "=": "=",
-            "!=": "<>",
-            "<>": "<>",
-            "<": "<",
-            ">": ">",
-            "<=": "<=",
-            ">=": ">=",
-        }
-
-        return operator_map.get(op_text, op_text)
+        return CYPHER_OPERATORS.get(op_text, op_text)
 
     def _build_cypher_query(self):
         """
@@ -160,15 +327,24 @@ class SQLToCypherVisitor(SQLSimpleVisitor):
         MATCH (n:TableName)
         [WHERE n.col = value]
         RETURN n.col1, n.col2 [o n para SELECT *]
+        [ORDER BY n.col [DESC]]
+        [SKIP n]
+        [LIMIT n]
 
         Returns:
             str: Consulta Cypher completa
         """
         if not self.table_name:
             raise ValueError("No se especificó nombre de tabla")
+        if self.top is not None and self.limit is not None:
+            raise ValueError("TOP y LIMIT no pueden usarse en la misma consulta")
 
         # Construir cláusula MATCH
-        cypher_parts = [f"MATCH (n:{self._capitalize_label(self.table_name)})"]
+        if self.table is not None:
+            label = self.table.label
+        else:
+            label = self._capitalize_label(self.table_name)
+        cypher_parts = [f"MATCH (n:{label})"]
 
         # Agregar cláusula WHERE si hay condiciones
         if self.conditions:
@@ -179,11 +355,74 @@ class SQLToCypherVisitor(SQLSimpleVisitor):
         if "*" in self.columns:
             cypher_parts.append("RETURN n")
         else:
-            return_cols = ", ".join([f"n.{col}" for col in self.columns])
+            return_cols = ", ".join(
+                [f"n.{self._property(col)}" for col in self.columns]
+            )
             cypher_parts.append(f"RETURN {return_cols}")
 
+        # Ordenación y límites: se aplican en Neo4j, no al leer el resultado
+        if self.order_by:
+            order_cols = ", ".join(
+                f"n.{self._property(col)}" + (" DESC" if direction == "DESC" else "")
+                for col, direction in self.order_by
+            )
+            cypher_parts.append(f"ORDER BY {order_cols}")
+        if self.skip is not None:
+            cypher_parts.append(f"SKIP {self.skip}")
+        limit = self.limit if self.limit is not None else self.top
+        if limit is not None:
+            cypher_parts.append(f"LIMIT {limit}")
+
+        # Todas las columnas se han resuelto: informar de todas las que faltan
+        if self.unknown_columns:
+            raise ValueError(
+                f"Columnas desconocidas en la tabla '{self.table.name}': "
+                + ", ".join(self.unknown_columns)
+            )
+
         return "\n".join(cypher_parts)
 
+    def _set_table(self, table_name):
+        """
+        Registra la tabla de la consulta y la busca en el catálogo.
+
+        Args:
+            table_name: Nombre de la tabla tal como aparece en la consulta
+
+        Raises:
+            ValueError: Si hay catálogo y la tabla no está en él
+        """
+        self.table_name = table_name
+        if self.schema is None:
+            return
+        self.table = self.schema.table(table_name)
+        if self.table is None:
+            raise ValueError(
+                f"La tabla '{table_name}' no existe en el esquema de la conexión"
+            )
+
+    def _property(self, column):
+        """
+        Obtiene el nombre de la propiedad de Neo4j para una columna.
+
+        Con catálogo se usa el nombre real de la columna; las desconocidas se
+        anotan en unknown_columns y se informan al construir la consulta.
+
+        Args:
+            column: Nombre de la columna tal como aparece en la consulta
+
+        Returns:
+            str: Nombre de la propiedad
+        """
+        if self.table is None:
+            return column
+        resolved = self.table.column(column)
+        if resolved is None:
+            if column not in self.unknown_columns:
+                self.unknown_columns.append(column)
+            return column
+        return resolved.name
+
     def _capitalize_label(self, label):
         """
         Capitaliza el label de Neo4j siguiendo convenciones.
@@ -198,73 +437,114 @@ class SQLToCypherVisitor(SQLSimpleVisitor):
         return label.capitalize()
 
 
-def translate_sql_to_cypher(sql_query: str) -> dict:
+def _row_count(literal_text: str, clause: str) -> int:
     """
-    Función principal para traducir SQL a Cypher.
+    Valida el número de filas de TOP, LIMIT u OFFSET.
 
     Args:
-        sql_query: Consulta SQL a traducir
+        literal_text: Texto del literal numérico
+        clause: Cláusula en la que aparece (para el mensaje de error)
 
     Returns:
-        dict: Diccionario con 'cypher' (consulta traducida) y opcionalmente 'errors'
+        int: Número de filas
 
     Raises:
-        ValueError: Si la consulta SQL es inválida
+        ValueError: Si el número no es entero
     """
-    from antlr4 import CommonTokenStream, InputStream
-    from antlr4.error.ErrorListener import ErrorListener
-
-    from app.core.parser.generated.SQLSimpleLexer import SQLSimpleLexer
-    from app.core.parser.generated.SQLSimpleParser import SQLSimpleParser
+    if "." in literal_text:
+        raise ValueError(f"{clause} requiere un número entero de filas")
+    return int(literal_text)
 
-    class SQLErrorListener(ErrorListener):
-        """Captura errores de parsing."""
 
-        def __init__(self):
-            super().__init__()
-            self.errors = []
-
-        def syntaxError(self, recognizer, offending_symbol, line, column, msg, e):
-            self.errors.append(f"Línea {line}:{column} - {msg}")
+def sql_literal_to_python(literal_text: str):
+    """
+    Convierte el texto de un literal SQL a su valor Python.
 
-    try:
-        # Crear input stream
-        input_stream = InputStream(sql_query)
+    Args:
+        literal_text: Literal tal como aparece en la consulta SQL
 
-        # Crear lexer con manejo de errores
-        lexer = SQLSimpleLexer(input_stream)
-        error_listener = SQLErrorListener()
-        lexer.removeErrorListeners()
-        lexer.addErrorListener(error_listener)
+    Returns:
+        str | int | float | bool | None: Valor del literal
+    """
+    if literal_text.startswith("'"):
+        # Quitar comillas y deshacer el escape de comillas dobladas
+        return literal_text[1:-1].replace("''", "'")
+
+    keyword = literal_text.upper()
+    if keyword == "TRUE":
+        return True
+    if keyword == "FALSE":
+        return False
+    if keyword == "NULL":
+        return None
+
+    if "." in literal_text:
+        return float(literal_text)
+    return int(literal_text)
+
+
+def translate_sql_to_cypher(
+    sql_query: str,
+    parameterize: bool = False,
+    schema: Optional[SchemaCatalog] = None,
+) -> dict:
+    """
+    Función principal para traducir SQL a Cypher.
 
-        # Crear stream de tokens
-        token_stream = CommonTokenStream(lexer)
+    Args:
+        sql_query: Consulta SQL a traducir
+        parameterize: Si True, los literales se devuelven como parámetros
+        schema: Catálogo del esquema de origen con el que resolver tablas y
+            columnas (opcional)
 
-        # Crear parser con manejo de errores
-        parser = SQLSimpleParser(token_stream)
-        parser.removeErrorListeners()
-        parser.addErrorListener(error_listener)
+    Returns:
+        dict: Diccionario con 'cypher' (consulta traducida), 'parameters'
+            (valores de los parámetros) y opcionalmente 'errors'
 
-        # Parsear la consulta
-        tree = parser.query()
+    Raises:
+        ValueError: Si la consulta SQL es inválida
+    """
+    try:
+        # Camino rápido: si el parser escrito a mano reconoce la consulta no
+        # hace falta ANTLR; si no, ANTLR la parsea y reporta los errores
+        if settings.TRANSLATION_PARSER == "fast":
+            statement = parse_select(sql_query)
+            if statement is not None:
+                visitor = SQLToCypherVisitor(parameterize=parameterize, schema=schema)
+                return {
+                    "cypher": visitor.translate_statement(statement),
+                    "parameters": visitor.parameters,
+                    "errors": [],
+                    "success": True,
+                }
+
+        # Parsear con el motor reutilizable del hilo actual
+        tree, errors = get_parser_engine().parse(sql_query)
 
         # Verificar errores de parsing
-        if error_listener.errors:
+        if errors:
             return {
                 "cypher": None,
-                "errors": error_listener.errors,
+                "parameters": {},
+                "errors": errors,
                 "success": False,
             }
 
         # Traducir con el visitor
-        visitor = SQLToCypherVisitor()
+        visitor = SQLToCypherVisitor(parameterize=parameterize, schema=schema)
         cypher_query = visitor.visit(tree)
 
-        return {"cypher": cypher_query, "errors": [], "success": True}
+        return {
+            "cypher": cypher_query,
+            "parameters": visitor.parameters,
+            "errors": [],
+            "success": True,
+        }
 
     except Exception as e:
         return {
             "cypher": None,
+            "parameters": {},
             "errors": [f"Error durante la traducción: {str(e)}"],
             "success": False,
         }
@@ -0,0 +1,236 @@
+"""
+Caché en memoria y en disco de los catálogos de esquema de SQL Server.
+
+Leer INFORMATION_SCHEMA cuesta varias consultas a la base de datos de
+origen; el esquema cambia muy poco, así que el catálogo de cada conexión
+guardada se conserva:
+- En memoria, para las traducciones de este proceso
+- En disco (un JSON por conexión en SCHEMA_CACHE_DIR), para que los
+  reinicios y los demás procesos del servidor no vuelvan a leerlo
+
+Cada entrada guarda la huella de los datos de la conexión de los que
+depende el esquema (host, puerto, base de datos y usuario): si cambian, la
+entrada se ignora. Las entradas caducan a los SCHEMA_CACHE_TTL_SECONDS de
+la lectura. Los ficheros llevan un número de formato para descartar los
+escritos por versiones anteriores, y el catálogo su propia versión (hash
+del contenido).
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Callable, Optional
+
+from app.core.config import settings
+from app.core.parser.schema import SchemaCatalog
+from app.models.connection import Connection
+
+# Versión del formato de los ficheros de la caché en disco
+FORMAT_VERSION = 1
+
+
+def _fingerprint(connection: Connection) -> str:
+    """Huella de los datos de la conexión de los que depende el esquema."""
+    data = json.dumps(
+        [
+            connection.host,
+            connection.port,
+            connection.database_name,
+            connection.db_user,
+        ]
+    )
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+class SchemaCache:
+    """Catálogos de esquema por conexión guardada, en memoria y en disco."""
+
+    def __init__(self, directory: Optional[str], ttl: Optional[float]):
+        """
+        Inicializa la caché vacía.
+
+        Args:
+            directory: Directorio de los ficheros JSON (None o "" = solo en
+                memoria)
+            ttl: Segundos de validez de cada catálogo (None = sin caducidad)
+        """
+        self.directory = directory or None
+        self.ttl = ttl
+        # connection_id -> (huella, catálogo, instante de la lectura)
+        self._entries: dict[int, tuple[str, SchemaCatalog, float]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.introspections = 0
+
+    def _path(self, connection_id: int) -> Optional[str]:
+        if self.directory is None:
+            return None
+        return os.path.join(self.directory, f"{connection_id}.json")
+
+    def _fresh(self, introspected_at: float) -> bool:
+        return self.ttl is None or time.time() - introspected_at < self.ttl
+
+    def get(
+        self,
+        connection: Connection,
+        loader: Callable[[Connection], SchemaCatalog],
+        refresh: bool = False,
+    ) -> tuple[SchemaCatalog, float]:
+        """
+        Obtiene el catálogo de una conexión, leyéndolo solo si hace falta.
+
+        Se busca primero en memoria, después en disco y, si no está o ha
+        caducado, se lee con loader y se guarda en ambos sitios.
+
+        Args:
+            connection: Conexión SQL Server guardada
+            loader: Función que lee el catálogo de la base de datos
+            refresh: Si True, se lee de nuevo aunque esté en caché
+
+        Returns:
+            tuple: (catálogo, instante de la lectura en segundos desde epoch)
+        """
+        fingerprint = _fingerprint(connection)
+        if not refresh:
+            with self._lock:
+                entry = self._entries.get(connection.connection_id)
+                if (
+                    entry is not None
+                    and entry[0] == fingerprint
+                    and self._fresh(entry[2])
+                ):
+                    self.hits += 1
+                    return entry[1], entry[2]
+
+            stored = self._read(connection.connection_id, fingerprint)
+            if stored is not None:
+                with self._lock:
+                    self._entries[connection.connection_id] = (fingerprint, *stored)
+                    self.disk_hits += 1
+                return stored
+
+        catalog = loader(connection)
+        introspected_at = time.time()
+        with self._lock:
+            self._entries[connection.connection_id] = (
+                fingerprint,
+                catalog,
+                introspected_at,
+            )
+            self.introspections += 1
+        self._write(connection.connection_id, fingerprint, catalog, introspected_at)
+        return catalog, introspected_at
+
+    def _read(
+        self, connection_id: int, fingerprint: str
+    ) -> Optional[tuple[SchemaCatalog, float]]:
+        """Lee el catálogo del disco si es válido para la conexión."""
+        path = self._path(connection_id)
+        if path is None:
+            return None
+        try:
+            with open(path, encoding="utf-8") as file:
+                data = json.load(file)
+            if (
+                data["format"] != FORMAT_VERSION
+                or data["fingerprint"] != fingerprint
+                or not self._fresh(data["introspected_at"])
+            ):
+                return None
+            return SchemaCatalog.from_dict(data["catalog"]), data["introspected_at"]
+        except OSError, ValueError, KeyError, TypeError:
+            # Fichero ausente, corrupto o de otro formato: se vuelve a leer
+            return None
+
+    def _write(
+        self,
+        connection_id: int,
+        fingerprint: str,
+        catalog: SchemaCatalog,
+        introspected_at: float,
+    ) -> None:
+        """Guarda el catálogo en disco de forma atómica (mejor esfuerzo)."""
+        path = self._path(connection_id)
+        if path is None:
+            return
+        data = {
+            "format": FORMAT_VERSION,
+            "fingerprint": fingerprint,
+            "introspected_at": introspected_at,
+            "catalog": catalog.to_dict(),
+        }
+        temporary = None
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            descriptor, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+                json.dump(data, file)
+            os.replace(temporary, path)
+            temporary = None
+        except OSError:
+            # Sin disco la caché sigue funcionando en memoria
+            pass
+        finally:
+            # Si el temporal no llegó a sustituir al fichero, no se deja atrás
+            if temporary is not None:
+                try:
+                    os.remove(temporary)
+                except OSError:
+                    pass
+
+    def invalidate(self, connection_id: int) -> bool:
+        """
+        Descarta el catálogo de una conexión en memoria y en disco.
+
+        Args:
+            connection_id: ID de la conexión
+
+        Returns:
+            bool: True si había un catálogo en memoria o en disco
+        """
+        with self._lock:
+            found = self._entries.pop(connection_id, None) is not None
+        path = self._path(connection_id)
+        if path is not None:
+            try:
+                os.remove(path)
+                found = True
+            except OSError:
+                pass
+        return found
+
+    def clear(self) -> None:
+        """Vacía la caché en memoria y reinicia los contadores."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.disk_hits = 0
+            self.introspections = 0
+
+    def stats(self) -> dict:
+        """
+        Devuelve el estado de la caché.
+
+        Returns:
+            dict: Catálogos en memoria, caducidad y contadores de aciertos en
+                memoria, aciertos en disco y lecturas de la base de datos
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "introspections": self.introspections,
+            }
+
+
+# Caché de esquemas compartida por toda la aplicación
+schema_cache = SchemaCache(
+    directory=settings.SCHEMA_CACHE_DIR,
+    ttl=settings.SCHEMA_CACHE_TTL_SECONDS or None,
+)
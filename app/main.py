@@ -1,13 +1,45 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.v1.api import api_router
 from app.core.config import settings
+from app.core.parser.engine import warm_up
+from app.core.parser.executor import (
+    get_translation_executor,
+    shutdown_translation_executor,
+)
+from app.services.connection_service import sql_server_pools
+from app.services.execution_service import neo4j_drivers
+from app.services.health_monitor import health_monitor
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Inicializa recursos compartidos al arrancar la aplicación."""
+    # Precalentar el parser para que las primeras traducciones no sean lentas
+    if settings.PARSER_WARMUP_ENABLED:
+        warm_up()
+    # Arrancar los workers del pool de traducción, que se precalientan solos
+    executor = get_translation_executor()
+    if executor is not None:
+        executor.start()
+    # Probar periódicamente las conexiones guardadas en segundo plano
+    if settings.HEALTH_MONITOR_ENABLED:
+        health_monitor.start()
+    yield
+    await health_monitor.stop()
+    shutdown_translation_executor()
+    await neo4j_drivers.aclose_all()
+    sql_server_pools.close_all()
+
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     description="Middleware para traducción de SQL a Cypher y ejecución en Neo4j",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Configurar CORS
@@ -2,7 +2,7 @@
 
 import enum
 
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, Integer, String
+from sqlalchemy import Column, DateTime, Enum, Float, ForeignKey, Integer, String
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -38,6 +38,9 @@ class Connection(Base):
     database_name = Column(
         String(255), nullable=True
     )  # Para SQL Server, nombre de la BD
+    query_timeout_seconds = Column(
+        Float, nullable=True
+    )  # Para Neo4j, tiempo límite de ejecución (None usa el global)
     created_at = Column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
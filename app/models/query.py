@@ -9,6 +9,8 @@ import enum
 from datetime import datetime
 
 from sqlalchemy import (
+    JSON,
+    Boolean,
     Column,
     DateTime,
     Enum,
@@ -18,6 +20,7 @@ from sqlalchemy import (
     Text,
 )
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import false
 
 from app.db.base import Base
 
@@ -28,6 +31,8 @@ class QueryStatus(str, enum.Enum):
     TRADUCIDO = "traducido"
     EJECUTADO = "ejecutado"
     FALLIDO = "fallido"
+    CANCELADO = "cancelado"
+    TIEMPO_AGOTADO = "tiempo_agotado"
 
 
 class Query(Base):
@@ -60,6 +65,11 @@ class Query(Base):
     # Consultas
     sql_query = Column(Text, nullable=False)
     cypher_query = Column(Text, nullable=True)
+    cypher_parameters = Column(
+        JSON,
+        nullable=True,
+        comment="Parámetros de la consulta Cypher parametrizada",
+    )
 
     # Estado y errores
     status = Column(
@@ -86,6 +96,18 @@ class Query(Base):
         nullable=True,
         comment="Número de nodos afectados en la ejecución",
     )
+    from_cache = Column(
+        Boolean,
+        nullable=False,
+        default=False,
+        server_default=false(),
+        comment="Indica si la traducción se obtuvo de la caché",
+    )
+    plan_summary = Column(
+        JSON,
+        nullable=True,
+        comment="Resumen del último plan EXPLAIN/PROFILE capturado",
+    )
 
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -1,7 +1,7 @@
 """Schemas de validación para conexiones de bases de datos."""
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -38,6 +38,12 @@ class ConnectionCreate(ConnectionBase):
         max_length=255,
         description="Nombre de la base de datos (requerido para SQL Server)",
     )
+    query_timeout_seconds: Optional[float] = Field(
+        None,
+        gt=0,
+        le=3600,
+        description="Tiempo límite de ejecución en segundos (None usa el global)",
+    )
 
     @field_validator("database_name")
     @classmethod
@@ -95,6 +101,7 @@ class ConnectionUpdate(BaseModel):
     db_user: Optional[str] = Field(None, min_length=1, max_length=255)
     db_password: Optional[str] = Field(None, min_length=1, max_length=255)
     database_name: Optional[str] = Field(None, max_length=255)
+    query_timeout_seconds: Optional[float] = Field(None, gt=0, le=3600)
 
     @field_validator("host")
     @classmethod
@@ -125,17 +132,39 @@ class ConnectionUpdate(BaseModel):
         return v
 
 
+class ConnectionHealth(BaseModel):
+    """Schema del último estado conocido de una conexión según el monitor."""
+
+    status: str = Field(..., description='"up" si respondió, "down" si falló')
+    message: Optional[str] = None
+    checked_at: datetime
+    last_success_at: Optional[datetime] = None
+    latency_ms: Optional[float] = Field(
+        None, description="Duración de la última prueba en milisegundos"
+    )
+    p50_ms: Optional[float] = None
+    p95_ms: Optional[float] = None
+    p99_ms: Optional[float] = None
+    samples: int = Field(0, description="Pruebas correctas usadas para los percentiles")
+    consecutive_failures: int = 0
+
+
 class ConnectionResponse(ConnectionBase):
     """Schema para respuestas de conexión (sin contraseña)."""
 
     connection_id: int
     user_id: int
     database_name: Optional[str] = None
+    query_timeout_seconds: Optional[float] = None
     created_at: datetime
     is_active: bool = Field(
         default=False,
         description="Indica si la conexión está activa (probada exitosamente)",
     )
+    health: Optional[ConnectionHealth] = Field(
+        None,
+        description="Último estado conocido según el monitor en segundo plano",
+    )
 
     class Config:
         from_attributes = True
@@ -172,3 +201,99 @@ class ConnectionTestResponse(BaseModel):
     connection_time_ms: Optional[float] = Field(
         None, description="Tiempo de conexión en milisegundos"
     )
+
+
+class ConnectionBulkTestRequest(BaseModel):
+    """Schema para probar a la vez varias conexiones guardadas."""
+
+    connection_ids: Optional[List[int]] = Field(
+        None,
+        min_length=1,
+        max_length=500,
+        description="IDs de las conexiones a probar (por defecto todas)",
+    )
+    concurrency: Optional[int] = Field(
+        None,
+        ge=1,
+        le=64,
+        description="Pruebas simultáneas (por defecto CONNECTION_TEST_CONCURRENCY)",
+    )
+    timeout: Optional[float] = Field(
+        None,
+        gt=0,
+        le=60,
+        description=(
+            "Espera máxima por conexión en segundos (por defecto "
+            "CONNECTION_TEST_TIMEOUT_SECONDS)"
+        ),
+    )
+
+
+class ConnectionBulkTestResult(ConnectionTestResponse):
+    """Schema de cada línea de la prueba simultánea de conexiones."""
+
+    connection_id: int = Field(..., description="ID de la conexión probada")
+    conn_name: str = Field(..., description="Nombre de la conexión")
+    db_type: DatabaseType = Field(..., description="Tipo de base de datos")
+
+
+class CredentialCacheStatsResponse(BaseModel):
+    """Schema de las métricas de la caché de contraseñas desencriptadas."""
+
+    enabled: bool
+    entries: int
+    max_entries: int
+    ttl_seconds: Optional[float] = Field(
+        None,
+        description="Segundos de validez de cada contraseña (None = sin caducidad)",
+    )
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    decrypts: int = Field(..., description="Desencriptados hechos (fallos de caché)")
+    decrypt_ms_total: float
+    decrypt_ms_avg: float
+    saved_ms: float = Field(
+        ..., description="Tiempo de desencriptado ahorrado: aciertos × media"
+    )
+
+
+class SchemaColumnResponse(BaseModel):
+    """Schema de una columna del esquema de origen."""
+
+    name: str
+    data_type: str
+    nullable: bool
+
+
+class SchemaForeignKeyResponse(BaseModel):
+    """Schema de una clave foránea del esquema de origen."""
+
+    name: str
+    columns: List[str]
+    referenced_schema: str
+    referenced_table: str
+    referenced_columns: List[str]
+
+
+class SchemaTableResponse(BaseModel):
+    """Schema de una tabla o vista del esquema de origen."""
+
+    schema_name: str = Field(..., description="Esquema de SQL Server (dbo...)")
+    name: str = Field(..., description="Nombre real de la tabla")
+    label: str = Field(..., description="Label de Neo4j usado en la traducción")
+    columns: List[SchemaColumnResponse]
+    primary_key: List[str]
+    foreign_keys: List[SchemaForeignKeyResponse]
+
+
+class SchemaCatalogResponse(BaseModel):
+    """Schema del catálogo de esquema de una conexión SQL Server."""
+
+    connection_id: int
+    version: str = Field(..., description="Hash del contenido del catálogo")
+    introspected_at: datetime = Field(
+        ..., description="Momento en que se leyó de la base de datos (UTC)"
+    )
+    tables: List[SchemaTableResponse]
@@ -4,12 +4,14 @@ Schemas Pydantic para operaciones de traducción y consultas.
 Define estructuras de datos para:
 - Solicitudes de traducción SQL -> Cypher
 - Respuestas de traducción
+- Traducción por lotes
+- Ejecución de consultas traducidas en Neo4j (una a una o por lotes)
 - Ejemplos de traducción
 - Historial de consultas
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -21,6 +23,8 @@ class TranslateRequest(BaseModel):
     Attributes:
         sql_query: Consulta SQL a traducir
         neo4j_connection_id: ID de conexión Neo4j (opcional, para guardar en historial)
+        parameterize: Emitir los literales como parámetros de Cypher
+        source_connection_id: Conexión SQL Server cuyo esquema se usa (opcional)
     """
 
     sql_query: str = Field(
@@ -35,6 +39,22 @@ class TranslateRequest(BaseModel):
         description="ID de conexión Neo4j para asociar con la traducción",
         json_schema_extra={"example": 1},
     )
+    parameterize: bool = Field(
+        False,
+        description=(
+            "Sustituir los literales por parámetros ($p0, $p1...) para que "
+            "Neo4j reutilice el plan de ejecución"
+        ),
+    )
+    source_connection_id: Optional[int] = Field(
+        None,
+        description=(
+            "ID de la conexión SQL Server de origen cuyo esquema se usa para "
+            "resolver labels y propiedades y rechazar tablas o columnas "
+            "desconocidas"
+        ),
+        json_schema_extra={"example": 2},
+    )
 
     @field_validator("sql_query")
     @classmethod
@@ -64,9 +84,11 @@ class TranslateResponse(BaseModel):
         success: Indica si la traducción fue exitosa
         sql_query: Consulta SQL original
         cypher: Consulta Cypher traducida (None si falló)
+        parameters: Valores de los parámetros (solo en modo parametrizado)
         errors: Lista de errores encontrados durante la traducción
         query_id: ID del registro en BD (si se guardó)
         translation_time: Tiempo de traducción en milisegundos
+        from_cache: Indica si la traducción se obtuvo de la caché
     """
 
     success: bool = Field(..., description="Indica si la traducción fue exitosa")
@@ -76,6 +98,11 @@ class TranslateResponse(BaseModel):
         description="Consulta Cypher traducida (null si hubo errores)",
         json_schema_extra={"example": "MATCH (n:Users)\nWHERE n.age > 18\nRETURN n"},
     )
+    parameters: Optional[Dict[str, Any]] = Field(
+        None,
+        description="Valores de los parámetros de la consulta Cypher parametrizada",
+        json_schema_extra={"example": {"p0": 18}},
+    )
     errors: List[str] = Field(
         default_factory=list,
         description="Lista de errores encontrados durante la traducción",
@@ -84,6 +111,401 @@ class TranslateResponse(BaseModel):
     translation_time: Optional[float] = Field(
         None, description="Tiempo de traducción en milisegundos"
     )
+    from_cache: bool = Field(
+        False, description="Indica si la traducción se obtuvo de la caché"
+    )
+
+
+class TranslateBatchRequest(BaseModel):
+    """
+    Solicitud de traducción de un lote de consultas SQL.
+
+    Attributes:
+        sql_queries: Consultas SQL a traducir, en orden
+        neo4j_connection_id: ID de conexión Neo4j (opcional, para guardar en historial)
+        parameterize: Emitir los literales como parámetros de Cypher
+        source_connection_id: Conexión SQL Server cuyo esquema se usa (opcional)
+    """
+
+    sql_queries: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=500,
+        description="Consultas SQL a traducir a Cypher (máximo 500)",
+        json_schema_extra={
+            "example": ["SELECT * FROM Users", "SELECT name FROM Users WHERE age > 18"]
+        },
+    )
+    neo4j_connection_id: Optional[int] = Field(
+        None,
+        description="ID de conexión Neo4j para asociar con las traducciones",
+        json_schema_extra={"example": 1},
+    )
+    parameterize: bool = Field(
+        False,
+        description=(
+            "Sustituir los literales por parámetros ($p0, $p1...) para que "
+            "Neo4j reutilice el plan de ejecución"
+        ),
+    )
+    source_connection_id: Optional[int] = Field(
+        None,
+        description=(
+            "ID de la conexión SQL Server de origen cuyo esquema se usa para "
+            "resolver labels y propiedades y rechazar tablas o columnas "
+            "desconocidas"
+        ),
+        json_schema_extra={"example": 2},
+    )
+
+    @field_validator("sql_queries")
+    @classmethod
+    def validate_sql_queries(cls, v: List[str]) -> List[str]:
+        """
+        Valida la longitud de cada consulta del lote.
+
+        Las consultas vacías no invalidan el lote: se reportan como error
+        en su propio elemento de la respuesta.
+
+        Args:
+            v: Valor del campo sql_queries
+
+        Returns:
+            List[str]: Consultas recibidas
+
+        Raises:
+            ValueError: Si alguna consulta supera los 5000 caracteres
+        """
+        for index, sql_query in enumerate(v):
+            if len(sql_query) > 5000:
+                raise ValueError(
+                    f"La consulta {index} excede el límite de 5000 caracteres"
+                )
+        return v
+
+
+class TranslateBatchItem(TranslateResponse):
+    """
+    Resultado de una consulta dentro de un lote.
+
+    Attributes:
+        index: Posición de la consulta en la solicitud
+    """
+
+    index: int = Field(..., description="Posición de la consulta en la solicitud")
+
+
+class TranslateBatchResponse(BaseModel):
+    """
+    Respuesta de traducción de un lote de consultas.
+
+    Attributes:
+        results: Resultado de cada consulta, en el orden de la solicitud
+        total: Número de consultas recibidas
+        successful: Número de traducciones exitosas
+        failed: Número de traducciones fallidas
+        unique: Número de consultas distintas traducidas
+    """
+
+    results: List[TranslateBatchItem] = Field(
+        ..., description="Resultado de cada consulta, en el orden de la solicitud"
+    )
+    total: int = Field(..., description="Número de consultas recibidas")
+    successful: int = Field(..., description="Número de traducciones exitosas")
+    failed: int = Field(..., description="Número de traducciones fallidas")
+    unique: int = Field(..., description="Número de consultas distintas traducidas")
+
+
+class ExecuteRequest(BaseModel):
+    """
+    Solicitud de ejecución de una consulta traducida en Neo4j.
+
+    Attributes:
+        query_id: ID de la consulta del historial a ejecutar
+        neo4j_connection_id: Conexión Neo4j (por defecto la de la consulta)
+        format: Formato de salida: NDJSON, array JSON, Arrow IPC o Parquet
+        fetch_size: Registros por lote pedido a Neo4j
+        cache_ttl: Segundos de validez del resultado en la caché
+        timeout: Tiempo límite de la ejecución en segundos
+    """
+
+    query_id: int = Field(..., description="ID de la consulta del historial")
+    neo4j_connection_id: Optional[int] = Field(
+        None,
+        description="ID de conexión Neo4j (por defecto la asociada a la consulta)",
+        json_schema_extra={"example": 1},
+    )
+    format: Literal["ndjson", "json", "arrow", "parquet"] = Field(
+        "ndjson",
+        description=(
+            "`ndjson` emite un registro por línea; `json` un único array; "
+            "`arrow` un flujo Arrow IPC y `parquet` un fichero Parquet"
+        ),
+    )
+    fetch_size: Optional[int] = Field(
+        None,
+        ge=1,
+        le=10000,
+        description="Registros por lote pedido a Neo4j (por defecto NEO4J_FETCH_SIZE)",
+    )
+    cache_ttl: Optional[float] = Field(
+        None,
+        ge=0,
+        le=86400,
+        description=(
+            "Segundos que el resultado puede servirse desde la caché (0 no la "
+            "usa; por defecto EXECUTION_CACHE_TTL_SECONDS)"
+        ),
+    )
+    timeout: Optional[float] = Field(
+        None,
+        gt=0,
+        le=3600,
+        description="Tiempo límite en segundos; solo puede acortar el de la conexión",
+    )
+
+
+class ExecutePageRequest(BaseModel):
+    """
+    Solicitud de una página de resultados de una consulta traducida.
+
+    Attributes:
+        query_id: ID de la consulta del historial a ejecutar
+        neo4j_connection_id: Conexión Neo4j (por defecto la de la consulta)
+        page_size: Filas por página
+        cursor: Cursor devuelto por la página anterior
+        order_key: Clave de ordenación estable (elementId o una propiedad)
+        cache_ttl: Segundos de validez de la página en la caché
+        timeout: Tiempo límite de la ejecución en segundos
+    """
+
+    query_id: int = Field(..., description="ID de la consulta del historial")
+    neo4j_connection_id: Optional[int] = Field(
+        None,
+        description="ID de conexión Neo4j (por defecto la asociada a la consulta)",
+        json_schema_extra={"example": 1},
+    )
+    page_size: int = Field(100, ge=1, le=1000, description="Filas por página")
+    cursor: Optional[str] = Field(
+        None,
+        max_length=2000,
+        description="Cursor opaco devuelto como `next_cursor` por la página anterior",
+    )
+    order_key: str = Field(
+        "elementId",
+        min_length=1,
+        max_length=100,
+        description=(
+            "Clave de ordenación: `elementId` o el nombre de una propiedad del "
+            "nodo (conviene que tenga índice)"
+        ),
+    )
+    cache_ttl: Optional[float] = Field(
+        None,
+        ge=0,
+        le=86400,
+        description=(
+            "Segundos que la página puede servirse desde la caché (0 no la "
+            "usa; por defecto EXECUTION_CACHE_TTL_SECONDS)"
+        ),
+    )
+    timeout: Optional[float] = Field(
+        None,
+        gt=0,
+        le=3600,
+        description="Tiempo límite en segundos; solo puede acortar el de la conexión",
+    )
+
+
+class ExecutePageResponse(BaseModel):
+    """
+    Página de resultados de una consulta ejecutada.
+
+    Attributes:
+        rows: Filas de la página
+        next_cursor: Cursor para pedir la página siguiente
+        has_more: Indica si hay más páginas
+        page_size: Filas por página solicitadas
+    """
+
+    rows: List[Dict[str, Any]] = Field(..., description="Filas de la página")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor de la página siguiente (null en la última)"
+    )
+    has_more: bool = Field(..., description="Indica si hay más páginas")
+    page_size: int = Field(..., description="Filas por página solicitadas")
+
+
+class ExecuteBatchRequest(BaseModel):
+    """
+    Solicitud de ejecución de un lote de consultas traducidas en Neo4j.
+
+    Attributes:
+        query_ids: IDs de las consultas del historial a ejecutar, en orden
+        neo4j_connection_id: Conexión Neo4j (por defecto la común al lote)
+        unwind: Agrupar las consultas con el mismo Cypher en un UNWIND
+        timeout: Tiempo límite de la transacción del lote en segundos
+    """
+
+    query_ids: List[int] = Field(
+        ...,
+        min_length=1,
+        max_length=500,
+        description="IDs de las consultas del historial (máximo 500)",
+        json_schema_extra={"example": [1, 2, 3]},
+    )
+    neo4j_connection_id: Optional[int] = Field(
+        None,
+        description=(
+            "ID de conexión Neo4j (por defecto la asociada a todas las consultas)"
+        ),
+        json_schema_extra={"example": 1},
+    )
+    unwind: bool = Field(
+        True,
+        description=(
+            "Reescribir las consultas con el mismo Cypher parametrizado en una "
+            "única sentencia `UNWIND $rows`"
+        ),
+    )
+    timeout: Optional[float] = Field(
+        None,
+        gt=0,
+        le=3600,
+        description="Tiempo límite en segundos; solo puede acortar el de la conexión",
+    )
+
+
+class ExecuteBatchItem(BaseModel):
+    """
+    Resultado de una consulta dentro de un lote.
+
+    Attributes:
+        index: Posición de la consulta en la solicitud
+        query_id: ID de la consulta del historial
+        success: Indica si la consulta se ejecutó sin errores
+        rows: Registros devueltos por Neo4j
+        row_count: Número de registros devueltos
+        error: Mensaje de error si la consulta falló o no se ejecutó
+    """
+
+    index: int = Field(..., description="Posición de la consulta en la solicitud")
+    query_id: int = Field(..., description="ID de la consulta del historial")
+    success: bool = Field(..., description="Indica si la consulta se ejecutó")
+    rows: List[Dict[str, Any]] = Field(
+        default_factory=list, description="Registros devueltos por Neo4j"
+    )
+    row_count: int = Field(..., description="Número de registros devueltos")
+    error: Optional[str] = Field(None, description="Mensaje de error")
+
+
+class ExecuteBatchResponse(BaseModel):
+    """
+    Respuesta de la ejecución de un lote de consultas.
+
+    Attributes:
+        results: Resultado de cada consulta en el orden de la solicitud
+        total: Número de consultas recibidas
+        successful: Número de consultas ejecutadas sin errores
+        failed: Número de consultas fallidas o no ejecutadas
+        statements: Sentencias Cypher enviadas a Neo4j
+        execution_time: Tiempo total del lote en milisegundos
+    """
+
+    results: List[ExecuteBatchItem] = Field(
+        ..., description="Resultado de cada consulta en orden"
+    )
+    total: int = Field(..., description="Número de consultas recibidas")
+    successful: int = Field(..., description="Número de consultas ejecutadas")
+    failed: int = Field(..., description="Número de consultas fallidas")
+    statements: int = Field(..., description="Sentencias Cypher enviadas a Neo4j")
+    execution_time: float = Field(..., description="Tiempo total en milisegundos")
+
+
+class ExplainRequest(BaseModel):
+    """
+    Solicitud del plan de ejecución de una consulta traducida.
+
+    Attributes:
+        query_id: ID de la consulta del historial
+        neo4j_connection_id: Conexión Neo4j (por defecto la de la consulta)
+        profile: Ejecutar con PROFILE (métricas reales) en lugar de EXPLAIN
+        timeout: Tiempo límite en segundos
+    """
+
+    query_id: int = Field(..., description="ID de la consulta del historial")
+    neo4j_connection_id: Optional[int] = Field(
+        None,
+        description="ID de conexión Neo4j (por defecto la asociada a la consulta)",
+        json_schema_extra={"example": 1},
+    )
+    profile: bool = Field(
+        False,
+        description=(
+            "Usar PROFILE: ejecuta la consulta (descartando sus filas y "
+            "deshaciendo la transacción) para medir db hits y filas reales"
+        ),
+    )
+    timeout: Optional[float] = Field(
+        None,
+        gt=0,
+        le=3600,
+        description="Tiempo límite en segundos; solo puede acortar el de la conexión",
+    )
+
+
+class PlanNode(BaseModel):
+    """
+    Operador del plan de ejecución de Neo4j.
+
+    Attributes:
+        operator: Nombre del operador (p. ej. NodeByLabelScan)
+        details: Detalle del operador (variables, etiquetas, predicados)
+        identifiers: Variables que produce el operador
+        estimated_rows: Filas estimadas por el planificador
+        db_hits: Accesos a la base de datos (solo PROFILE)
+        rows: Filas reales producidas (solo PROFILE)
+        children: Operadores de los que recibe filas
+    """
+
+    operator: str
+    details: Optional[str] = None
+    identifiers: List[str] = Field(default_factory=list)
+    estimated_rows: float
+    db_hits: Optional[int] = None
+    rows: Optional[int] = None
+    children: List["PlanNode"] = Field(default_factory=list)
+
+
+class ExplainResponse(BaseModel):
+    """
+    Plan de ejecución y coste estimado de una consulta.
+
+    Attributes:
+        query_id: ID de la consulta
+        mode: EXPLAIN o PROFILE
+        plan: Árbol de operadores
+        estimated_rows: Filas estimadas del resultado
+        estimated_cost: Suma de filas estimadas de todos los operadores
+        db_hits: Accesos totales a la base de datos (solo PROFILE)
+        rows: Filas reales del resultado (solo PROFILE)
+        operators: Número de operadores del plan
+        warnings: Avisos sobre recorridos sin índice
+        admitted: Indica si la política de admisión permite ejecutarla
+        max_estimated_cost: Umbral de admisión (null si no hay)
+    """
+
+    query_id: int
+    mode: Literal["EXPLAIN", "PROFILE"]
+    plan: PlanNode
+    estimated_rows: float
+    estimated_cost: float
+    db_hits: Optional[int] = None
+    rows: Optional[int] = None
+    operators: int
+    warnings: List[str] = Field(default_factory=list)
+    admitted: bool
+    max_estimated_cost: Optional[float] = None
 
 
 class QueryHistoryResponse(BaseModel):
@@ -94,6 +516,7 @@ class QueryHistoryResponse(BaseModel):
         query_id: ID de la consulta
         sql_query: Consulta SQL
         cypher_query: Consulta Cypher traducida
+        cypher_parameters: Parámetros de la consulta Cypher parametrizada
         status: Estado de la consulta (traducido, ejecutado, fallido)
         error_message: Mensaje de error si falló
         translation_time: Tiempo de traducción en ms
@@ -101,11 +524,14 @@ class QueryHistoryResponse(BaseModel):
         nodes_affected: Número de nodos afectados
         created_at: Fecha de creación
         neo4j_connection_id: ID de conexión Neo4j asociada
+        from_cache: Indica si la traducción se obtuvo de la caché
+        plan_summary: Resumen del último plan capturado (EXPLAIN o PROFILE)
     """
 
     query_id: int
     sql_query: str
     cypher_query: Optional[str]
+    cypher_parameters: Optional[Dict[str, Any]] = None
     status: str
     error_message: Optional[str] = None
     translation_time: Optional[float] = None
@@ -113,6 +539,8 @@ class QueryHistoryResponse(BaseModel):
     nodes_affected: Optional[int] = None
     created_at: datetime
     neo4j_connection_id: Optional[int] = None
+    from_cache: bool = False
+    plan_summary: Optional[Dict[str, Any]] = None
 
     class Config:
         from_attributes = True
@@ -144,3 +572,50 @@ class TranslationExamplesResponse(BaseModel):
     examples: List[TranslationExample] = Field(
         ..., description="Lista de ejemplos de traducción SQL -> Cypher"
     )
+
+
+class TranslationCacheStatsResponse(BaseModel):
+    """
+    Métricas de la caché de traducciones.
+
+    Attributes:
+        enabled: Indica si la caché está activa
+        entries: Número de traducciones almacenadas
+        bytes: Tamaño aproximado ocupado en bytes
+        max_entries: Límite de entradas
+        max_bytes: Límite de bytes
+        hits: Aciertos desde el arranque o la última limpieza
+        misses: Fallos desde el arranque o la última limpieza
+        evictions: Entradas desalojadas por LRU
+    """
+
+    enabled: bool
+    entries: int
+    bytes: int
+    max_entries: int
+    max_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+class ExecutionCacheStatsResponse(TranslationCacheStatsResponse):
+    """
+    Métricas de la caché de resultados de ejecución.
+
+    Attributes:
+        expirations: Entradas descartadas por caducar su TTL
+    """
+
+    expirations: int
+
+
+class CacheInvalidationResponse(BaseModel):
+    """
+    Resultado de invalidar entradas de una caché.
+
+    Attributes:
+        invalidated: Número de entradas eliminadas
+    """
+
+    invalidated: int = Field(..., description="Número de entradas eliminadas")
@@ -1,19 +1,42 @@
-"""Servicio para gestionar conexiones a bases de datos externas."""
-
+"""Servicio para gestionar conexiones a bases de datos externas.
+
+Las conexiones a SQL Server guardadas se sirven desde un pool pyodbc por
+connection_id, para no repetir el login TDS en cada lectura del origen. Cada
+pool mantiene un mínimo de conexiones abiertas y un máximo prestado a la vez,
+comprueba con SELECT 1 las conexiones libres antes de prestarlas, cierra las
+que llevan demasiado tiempo sin uso y se descarta cuando cambian los datos de
+la conexión. Como con los drivers de Neo4j, el número de pools está acotado
+(se cierran los menos usados) y los pools sin uso durante
+SQL_SERVER_POOL_IDLE_SECONDS se cierran enteros.
+
+check_connections() prueba muchas conexiones guardadas a la vez, reutilizando
+esos pools y los drivers de Neo4j compartidos si ya existen (sin crearlos:
+las demás se prueban con una conexión propia que se cierra al terminar), con
+un número acotado de pruebas simultáneas y un tiempo límite por conexión.
+"""
+
+import asyncio
+import threading
 import time
-from typing import List
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, AsyncIterator, Callable, Iterator, List, Optional
 
 import pyodbc
 from neo4j import GraphDatabase
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
+from app.core.credentials import credential_cache
 from app.core.exceptions import (
     DatabaseConnectionError,
     ForbiddenError,
     NotFoundError,
     ValidationError,
 )
-from app.core.security import decrypt_data, encrypt_data
+from app.core.schema_cache import schema_cache
+from app.core.security import encrypt_data
 from app.models.connection import Connection, DatabaseType
 from app.schemas.connection import (
     ConnectionCreate,
@@ -21,6 +44,525 @@ from app.schemas.connection import (
     ConnectionTestResponse,
     ConnectionUpdate,
 )
+from app.services.execution_service import ExecutionService, neo4j_drivers
+
+# Una conexión devuelta al pool hace menos de estos segundos se presta sin
+# comprobarla: casi seguro sigue viva y se ahorra un viaje de ida y vuelta
+_ALIVE_BYPASS_SECONDS = 0.5
+# Segundos de espera del login de SQL Server
+_SQL_SERVER_LOGIN_TIMEOUT = 5
+
+
+def _sql_server_connection_string(
+    host: str, port: int, user: str, password: str, database: str
+) -> str:
+    """Construye la cadena de conexión ODBC de SQL Server."""
+    return (
+        f"DRIVER={{ODBC Driver 17 for SQL Server}};"
+        f"SERVER={host},{port};"
+        f"DATABASE={database};"
+        f"UID={user};"
+        f"PWD={password};"
+        f"Connection Timeout={_SQL_SERVER_LOGIN_TIMEOUT};"
+    )
+
+
+def _sql_server_error_message(error: Exception) -> str:
+    """Mensaje de error de SQL Server sin información sensible."""
+    error_msg = str(error).lower()
+    if "login failed" in error_msg:
+        return "Credenciales inválidas"
+    if "server not found" in error_msg or "network" in error_msg:
+        return "No se puede alcanzar el servidor"
+    if "timeout" in error_msg:
+        return "Tiempo de espera agotado"
+    return "Error de conexión a SQL Server"
+
+
+# Hilos propios para las pruebas bloqueantes (pyodbc y el driver síncrono de
+# Neo4j). pyodbc no se puede interrumpir: una prueba que agota su tiempo sigue
+# ocupando su hilo hasta que vence el login, pero solo uno de estos, nunca el
+# threadpool compartido de Starlette.
+_probe_executor = ThreadPoolExecutor(
+    max_workers=settings.CONNECTION_TEST_CONCURRENCY,
+    thread_name_prefix="connection-probe",
+)
+
+
+async def _run_probe(function: Callable, *args: Any) -> Any:
+    """Ejecuta una prueba bloqueante en los hilos de prueba."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_probe_executor, function, *args)
+
+
+class _ProbeFailed(Exception):
+    """Prueba de conexión fallida con su mensaje ya saneado."""
+
+
+def _neo4j_error_message(error: Exception) -> str:
+    """Mensaje de error de Neo4j sin información sensible."""
+    error_msg = str(error).lower()
+    if "authentication" in error_msg or "unauthorized" in error_msg:
+        return "Credenciales inválidas"
+    if "connection refused" in error_msg or "cannot connect" in error_msg:
+        return "No se puede alcanzar el servidor"
+    if "timeout" in error_msg:
+        return "Tiempo de espera agotado"
+    return "Error de conexión a Neo4j"
+
+
+class SQLServerConnectionPool:
+    """Pool thread-safe de conexiones pyodbc a una base de SQL Server.
+
+    Las conexiones libres se prestan en orden LIFO (la usada más
+    recientemente primero, la que con más probabilidad sigue viva), de modo
+    que las sobrantes envejecen al fondo y el desalojo por inactividad las
+    cierra.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        min_size: int,
+        max_size: int,
+        idle_timeout: float,
+        acquire_timeout: float,
+    ):
+        """Inicializa el pool sin conexiones abiertas.
+
+        Args:
+            connect: Función que abre una conexión nueva
+            min_size: Conexiones que se mantienen abiertas aunque no se usen
+            max_size: Conexiones abiertas como máximo
+            idle_timeout: Segundos sin uso tras los que se cierra una
+                conexión por encima de min_size (0 = nunca)
+            acquire_timeout: Segundos de espera por una conexión libre
+        """
+        self._connect = connect
+        self.min_size = min(min_size, max_size)
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.acquire_timeout = acquire_timeout
+        # Conexiones libres (conexión, último uso), de la más antigua a la
+        # más reciente
+        self._idle: list = []
+        # Conexiones abiertas: libres y prestadas
+        self._open = 0
+        self._condition = threading.Condition()
+        self.closed = False
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+        self.waits = 0
+
+    def _open_connection(self) -> Any:
+        """Abre una conexión con una plaza ya reservada en _open."""
+        try:
+            connection = self._connect()
+        except Exception:
+            with self._condition:
+                self._open -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self.created += 1
+        return connection
+
+    @staticmethod
+    def _is_alive(connection: Any) -> bool:
+        """Comprueba una conexión con SELECT 1."""
+        try:
+            cursor = connection.cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+            cursor.close()
+            return True
+        except Exception:
+            return False
+
+    def _discard(self, connection: Any) -> None:
+        """Cierra una conexión y libera su plaza."""
+        try:
+            connection.close()
+        except Exception:
+            pass
+        with self._condition:
+            self._open -= 1
+            self.discarded += 1
+            self._condition.notify()
+
+    def prefill(self) -> None:
+        """Abre conexiones hasta alcanzar min_size.
+
+        Raises:
+            pyodbc.Error: Si no se puede abrir una conexión
+        """
+        while True:
+            with self._condition:
+                if self.closed or self._open >= self.min_size:
+                    return
+                self._open += 1
+            connection = self._open_connection()
+            with self._condition:
+                self._idle.append((connection, time.monotonic()))
+                self._condition.notify()
+
+    def acquire(self) -> Any:
+        """Presta una conexión viva, abriéndola si no hay ninguna libre.
+
+        Returns:
+            Conexión pyodbc que debe devolverse con release()
+
+        Raises:
+            DatabaseConnectionError: Si el pool está cerrado o no queda
+                ninguna conexión libre dentro de acquire_timeout
+            pyodbc.Error: Si no se puede abrir una conexión nueva
+        """
+        deadline = time.monotonic() + self.acquire_timeout
+        waited = False
+        while True:
+            with self._condition:
+                if self.closed:
+                    raise DatabaseConnectionError("El pool de SQL Server está cerrado")
+                if self._idle:
+                    connection, last_used = self._idle.pop()
+                elif self._open < self.max_size:
+                    self._open += 1
+                    connection = None
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise DatabaseConnectionError(
+                            "No hay conexiones libres a SQL Server"
+                        )
+                    if not waited:
+                        self.waits += 1
+                        waited = True
+                    self._condition.wait(remaining)
+                    continue
+
+            if connection is None:
+                return self._open_connection()
+            fresh = time.monotonic() - last_used < _ALIVE_BYPASS_SECONDS
+            if fresh or self._is_alive(connection):
+                with self._condition:
+                    self.reused += 1
+                return connection
+            self._discard(connection)
+
+    def release(self, connection: Any, discard: bool = False) -> None:
+        """Devuelve una conexión al pool.
+
+        La transacción pendiente se deshace; si eso falla (o el pool está
+        cerrado) la conexión se cierra.
+
+        Args:
+            connection: Conexión obtenida con acquire()
+            discard: Cerrar la conexión en lugar de devolverla
+        """
+        if not discard:
+            try:
+                connection.rollback()
+            except Exception:
+                discard = True
+        with self._condition:
+            if not discard and not self.closed:
+                self._idle.append((connection, time.monotonic()))
+                self._condition.notify()
+                return
+        self._discard(connection)
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """Presta una conexión durante un bloque with y la devuelve al salir."""
+        connection = self.acquire()
+        try:
+            yield connection
+        finally:
+            self.release(connection)
+
+    def reap_idle(self) -> int:
+        """Cierra las conexiones libres sin uso reciente por encima de min_size.
+
+        Returns:
+            Número de conexiones cerradas
+        """
+        if self.idle_timeout <= 0:
+            return 0
+        deadline = time.monotonic() - self.idle_timeout
+        expired = []
+        with self._condition:
+            keep = []
+            for connection, last_used in self._idle:
+                if last_used < deadline and self._open - len(expired) > self.min_size:
+                    expired.append(connection)
+                else:
+                    keep.append((connection, last_used))
+            self._idle = keep
+        for connection in expired:
+            self._discard(connection)
+        return len(expired)
+
+    def close(self) -> None:
+        """Cierra las conexiones libres; las prestadas se cierran al devolverlas."""
+        with self._condition:
+            self.closed = True
+            idle = [connection for connection, _ in self._idle]
+            self._idle = []
+            self._condition.notify_all()
+        for connection in idle:
+            self._discard(connection)
+
+    def stats(self) -> dict:
+        """Devuelve el estado del pool.
+
+        Returns:
+            Conexiones abiertas, libres y prestadas, límites y contadores
+        """
+        with self._condition:
+            return {
+                "size": self._open,
+                "idle": len(self._idle),
+                "in_use": self._open - len(self._idle),
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                "created": self.created,
+                "reused": self.reused,
+                "discarded": self.discarded,
+                "waits": self.waits,
+            }
+
+
+class SQLServerPoolRegistry:
+    """Registro thread-safe de pools de SQL Server indexado por connection_id.
+
+    Igual que el registro de drivers de Neo4j, cada entrada guarda la huella
+    de los datos de conexión con los que se creó: si el registro `Connection`
+    cambia por cualquier vía, el pool se recrea en el siguiente uso. También
+    como allí, el número de pools está acotado por max_pools (se cierran los
+    menos usados) y un pool sin conexiones prestadas ni uso durante
+    idle_timeout se cierra entero, incluidas las min_size que mantiene.
+    """
+
+    def __init__(
+        self,
+        min_size: int,
+        max_size: int,
+        idle_timeout: float,
+        acquire_timeout: float,
+        max_pools: int = 32,
+    ):
+        """Inicializa el registro vacío.
+
+        Args:
+            min_size: Conexiones mínimas abiertas por pool
+            max_size: Conexiones máximas por pool
+            idle_timeout: Segundos sin uso tras los que se cierra una conexión
+                y, si no queda ninguna prestada, el pool entero
+            acquire_timeout: Segundos de espera por una conexión libre
+            max_pools: Número máximo de pools abiertos a la vez
+        """
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.acquire_timeout = acquire_timeout
+        self.max_pools = max_pools
+        # connection_id -> (pool, huella, último uso)
+        self._pools: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    @staticmethod
+    def _fingerprint(connection: Connection) -> tuple:
+        """Datos de la conexión de los que depende el pool."""
+        return (
+            connection.host,
+            connection.port,
+            connection.db_user,
+            connection.db_password,
+            connection.database_name,
+        )
+
+    def _create_pool(self, connection: Connection) -> SQLServerConnectionPool:
+        """Crea el pool de una conexión guardada (sin abrir conexiones).
+
+        Raises:
+            DatabaseConnectionError: Si no se puede desencriptar la contraseña
+        """
+        connection_string = _sql_server_connection_string(
+            host=connection.host,
+            port=connection.port,
+            user=connection.db_user,
+            password=ConnectionService.get_decrypted_password(connection),
+            database=connection.database_name,
+        )
+        return SQLServerConnectionPool(
+            lambda: pyodbc.connect(
+                connection_string, timeout=_SQL_SERVER_LOGIN_TIMEOUT
+            ),
+            min_size=self.min_size,
+            max_size=self.max_size,
+            idle_timeout=self.idle_timeout,
+            acquire_timeout=self.acquire_timeout,
+        )
+
+    def get_pool(
+        self, connection: Connection, touch: bool = True
+    ) -> SQLServerConnectionPool:
+        """Obtiene el pool de una conexión, creándolo si no existe.
+
+        Args:
+            connection: Conexión SQL Server guardada
+            touch: Contar el uso para el desalojo por inactividad; las
+                pruebas de estado usan False para no mantener vivo el pool
+
+        Returns:
+            Pool de la conexión, con las conexiones inactivas ya desalojadas
+
+        Raises:
+            ValidationError: Si la conexión no es de SQL Server o no tiene base
+                de datos
+            DatabaseConnectionError: Si no se puede desencriptar la contraseña
+        """
+        if connection.db_type != DatabaseType.SQL_SERVER:
+            raise ValidationError("La conexión no es de tipo SQL Server")
+        if not connection.database_name:
+            raise ValidationError("database_name es requerido para SQL Server")
+
+        to_close = self._evict_idle()
+        fingerprint = self._fingerprint(connection)
+        connection_id = connection.connection_id
+        try:
+            with self._lock:
+                entry = self._pools.get(connection_id)
+                if entry is not None and entry[1] == fingerprint:
+                    pool = entry[0]
+                    if touch:
+                        self._pools[connection_id] = (
+                            pool,
+                            fingerprint,
+                            time.monotonic(),
+                        )
+                        self._pools.move_to_end(connection_id)
+                else:
+                    # Nueva, o la conexión cambió sin pasar por invalidate()
+                    if entry is not None:
+                        to_close.append(entry[0])
+                    pool = self._create_pool(connection)
+                    self._pools[connection_id] = (pool, fingerprint, time.monotonic())
+                    self._pools.move_to_end(connection_id)
+
+                    # Respetar el máximo de pools cerrando los menos usados
+                    while len(self._pools) > self.max_pools:
+                        _, (evicted, _, _) = self._pools.popitem(last=False)
+                        to_close.append(evicted)
+                        self.evictions += 1
+        finally:
+            # Las conexiones se cierran fuera del lock: close() espera a la red
+            for old_pool in to_close:
+                old_pool.close()
+        pool.reap_idle()
+        return pool
+
+    def _evict_idle(self) -> list:
+        """Retira los pools sin uso reciente ni conexiones prestadas."""
+        if self.idle_timeout <= 0:
+            return []
+        deadline = time.monotonic() - self.idle_timeout
+        evicted = []
+        with self._lock:
+            for connection_id, (pool, _, last_used) in list(self._pools.items()):
+                if last_used < deadline and pool.stats()["in_use"] == 0:
+                    del self._pools[connection_id]
+                    evicted.append(pool)
+                    self.evictions += 1
+        return evicted
+
+    def evict_idle(self) -> int:
+        """Cierra los pools que llevan más de idle_timeout segundos sin uso.
+
+        Returns:
+            Número de pools cerrados
+        """
+        evicted = self._evict_idle()
+        for pool in evicted:
+            pool.close()
+        return len(evicted)
+
+    def invalidate(self, connection_id: int) -> bool:
+        """Cierra y olvida el pool de una conexión.
+
+        Las conexiones prestadas se cierran al devolverse; las siguientes
+        lecturas abren un pool nuevo con los datos actualizados.
+
+        Args:
+            connection_id: ID de la conexión
+
+        Returns:
+            True si había un pool abierto
+        """
+        with self._lock:
+            entry = self._pools.pop(connection_id, None)
+        if entry is None:
+            return False
+        entry[0].close()
+        return True
+
+    def reap_idle(self) -> int:
+        """Cierra los pools inactivos y las conexiones inactivas del resto.
+
+        Returns:
+            Número de conexiones cerradas en los pools que siguen abiertos
+        """
+        self.evict_idle()
+        with self._lock:
+            pools = [entry[0] for entry in self._pools.values()]
+        return sum(pool.reap_idle() for pool in pools)
+
+    def close_all(self) -> None:
+        """Cierra todos los pools."""
+        with self._lock:
+            pools = [entry[0] for entry in self._pools.values()]
+            self._pools.clear()
+        for pool in pools:
+            pool.close()
+
+    def stats(self) -> dict:
+        """Devuelve el estado agregado de los pools.
+
+        Returns:
+            Pools abiertos, límites y totales de conexiones y contadores
+        """
+        with self._lock:
+            pools = [entry[0] for entry in self._pools.values()]
+        totals = {"size": 0, "idle": 0, "in_use": 0, "created": 0, "reused": 0}
+        totals.update({"discarded": 0, "waits": 0})
+        for pool in pools:
+            pool_stats = pool.stats()
+            for key in totals:
+                totals[key] += pool_stats[key]
+        return {
+            "pools": len(pools),
+            "max_pools": self.max_pools,
+            "evictions": self.evictions,
+            "min_size": self.min_size,
+            "max_size": self.max_size,
+            "idle_timeout": self.idle_timeout,
+            **totals,
+        }
+
+    def __contains__(self, connection_id: int) -> bool:
+        return connection_id in self._pools
+
+
+# Registro compartido por toda la aplicación
+sql_server_pools = SQLServerPoolRegistry(
+    min_size=settings.SQL_SERVER_POOL_MIN_SIZE,
+    max_size=settings.SQL_SERVER_POOL_MAX_SIZE,
+    idle_timeout=settings.SQL_SERVER_POOL_IDLE_SECONDS,
+    acquire_timeout=settings.SQL_SERVER_POOL_ACQUIRE_TIMEOUT_SECONDS,
+    max_pools=settings.SQL_SERVER_MAX_POOLS,
+)
 
 
 class ConnectionService:
@@ -70,6 +612,7 @@ class ConnectionService:
             db_user=connection_data.db_user,
             db_password=encrypted_password,
             database_name=connection_data.database_name,
+            query_timeout_seconds=connection_data.query_timeout_seconds,
         )
 
         db.add(db_connection)
@@ -108,6 +651,39 @@ class ConnectionService:
 
         return connection
 
+    @staticmethod
+    def get_connections_by_ids(
+        db: Session, connection_ids: List[int], user_id: int
+    ) -> List[Connection]:
+        """Obtiene varias conexiones por ID con una sola lectura.
+
+        Args:
+            db: Sesión de base de datos
+            connection_ids: IDs de las conexiones (los repetidos se ignoran)
+            user_id: ID del usuario (para validar ownership)
+
+        Returns:
+            Conexiones en el orden de connection_ids
+
+        Raises:
+            NotFoundError: Si alguna conexión no existe
+            ForbiddenError: Si el usuario no es el propietario de alguna
+        """
+        unique_ids = list(dict.fromkeys(connection_ids))
+        stored = {
+            connection.connection_id: connection
+            for connection in db.query(Connection).filter(
+                Connection.connection_id.in_(unique_ids)
+            )
+        }
+        for connection_id in unique_ids:
+            connection = stored.get(connection_id)
+            if connection is None:
+                raise NotFoundError(f"Conexión {connection_id} no encontrada")
+            if connection.user_id != user_id:
+                raise ForbiddenError("No tienes permiso para acceder a esta conexión")
+        return [stored[connection_id] for connection_id in unique_ids]
+
     @staticmethod
     def get_user_connections(db: Session, user_id: int) -> List[Connection]:
         """Obtiene todas las conexiones de un usuario.
@@ -176,6 +752,14 @@ class ConnectionService:
         db.commit()
         db.refresh(connection)
 
+        # El driver o pool compartido, los resultados cacheados, la
+        # contraseña en claro y el esquema cacheados usan los datos anteriores
+        ExecutionService.invalidate_driver(connection_id)
+        ExecutionService.invalidate_results(connection_id=connection_id)
+        sql_server_pools.invalidate(connection_id)
+        credential_cache.invalidate(connection_id)
+        schema_cache.invalidate(connection_id)
+
         return connection
 
     @staticmethod
@@ -195,6 +779,57 @@ class ConnectionService:
         db.delete(connection)
         db.commit()
 
+        ExecutionService.invalidate_driver(connection_id)
+        ExecutionService.invalidate_results(connection_id=connection_id)
+        sql_server_pools.invalidate(connection_id)
+        credential_cache.invalidate(connection_id)
+        schema_cache.invalidate(connection_id)
+
+    @staticmethod
+    @contextmanager
+    def sql_server_connection(
+        connection: Connection, touch: bool = True
+    ) -> Iterator[Any]:
+        """Presta una conexión pyodbc del pool de una conexión SQL Server guardada.
+
+        La conexión vuelve al pool al salir del bloque with, con su
+        transacción deshecha.
+
+        Args:
+            connection: Conexión SQL Server ya validada (existencia y ownership)
+            touch: Contar el uso para el desalojo del pool por inactividad
+
+        Yields:
+            Conexión pyodbc viva
+
+        Raises:
+            ValidationError: Si la conexión no es de SQL Server
+            DatabaseConnectionError: Si no se puede conectar o no hay
+                conexiones libres
+        """
+        pool = sql_server_pools.get_pool(connection, touch=touch)
+        try:
+            pool.prefill()
+            pooled = pool.acquire()
+        except pyodbc.Error as e:
+            raise DatabaseConnectionError(_sql_server_error_message(e)) from e
+        try:
+            yield pooled
+        finally:
+            pool.release(pooled)
+
+    @staticmethod
+    def invalidate_sql_server_pool(connection_id: int) -> bool:
+        """Cierra el pool de una conexión SQL Server modificada o eliminada.
+
+        Args:
+            connection_id: ID de la conexión
+
+        Returns:
+            True si había un pool abierto
+        """
+        return sql_server_pools.invalidate(connection_id)
+
     @staticmethod
     def test_sql_server_connection(
         host: str, port: int, user: str, password: str, database: str
@@ -215,18 +850,12 @@ class ConnectionService:
 
         try:
             # Construir cadena de conexión ODBC
-            # Usar DRIVER={ODBC Driver 17 for SQL Server} o el disponible
-            connection_string = (
-                f"DRIVER={{ODBC Driver 17 for SQL Server}};"
-                f"SERVER={host},{port};"
-                f"DATABASE={database};"
-                f"UID={user};"
-                f"PWD={password};"
-                f"Connection Timeout=5;"
+            connection_string = _sql_server_connection_string(
+                host, port, user, password, database
             )
 
             # Intentar conexión
-            conn = pyodbc.connect(connection_string, timeout=5)
+            conn = pyodbc.connect(connection_string, timeout=_SQL_SERVER_LOGIN_TIMEOUT)
             cursor = conn.cursor()
 
             # Ejecutar una consulta simple para verificar
@@ -247,22 +876,10 @@ class ConnectionService:
 
         except pyodbc.Error as e:
             elapsed_ms = (time.time() - start_time) * 1000
-            error_msg = str(e)
-            # Sanitizar mensaje de error para no exponer información sensible
-            safe_msg = "Error de conexión a SQL Server"
-            if "login failed" in error_msg.lower():
-                safe_msg = "Credenciales inválidas"
-            elif (
-                "server not found" in error_msg.lower()
-                or "network" in error_msg.lower()
-            ):
-                safe_msg = "No se puede alcanzar el servidor"
-            elif "timeout" in error_msg.lower():
-                safe_msg = "Tiempo de espera agotado"
-
             return ConnectionTestResponse(
                 success=False,
-                message=safe_msg,
+                # Sanitizar mensaje de error para no exponer información sensible
+                message=_sql_server_error_message(e),
                 connection_time_ms=round(elapsed_ms, 2),
             )
         except Exception as e:
@@ -318,20 +935,10 @@ class ConnectionService:
 
         except Exception as e:
             elapsed_ms = (time.time() - start_time) * 1000
-            error_msg = str(e).lower()
-
-            # Sanitizar mensaje de error
-            safe_msg = "Error de conexión a Neo4j"
-            if "authentication" in error_msg or "unauthorized" in error_msg:
-                safe_msg = "Credenciales inválidas"
-            elif "connection refused" in error_msg or "cannot connect" in error_msg:
-                safe_msg = "No se puede alcanzar el servidor"
-            elif "timeout" in error_msg:
-                safe_msg = "Tiempo de espera agotado"
-
             return ConnectionTestResponse(
                 success=False,
-                message=safe_msg,
+                # Sanitizar mensaje de error
+                message=_neo4j_error_message(e),
                 connection_time_ms=round(elapsed_ms, 2),
             )
 
@@ -375,10 +982,172 @@ class ConnectionService:
                 f"Tipo de base de datos no soportado: {connection_data.db_type}"
             )
 
+    @staticmethod
+    def _check_sql_server(connection: Connection) -> None:
+        """Ejecuta SELECT 1 con una conexión del pool (bloqueante).
+
+        Raises:
+            pyodbc.Error: Si la consulta falla
+            DatabaseConnectionError: Si no se puede conectar
+        """
+        # Una prueba de estado no cuenta como uso: no mantiene vivo el pool
+        with ConnectionService.sql_server_connection(connection, touch=False) as pooled:
+            cursor = pooled.cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+            cursor.close()
+
+    @staticmethod
+    def _test_stored_once(connection: Connection) -> ConnectionTestResponse:
+        """Prueba una conexión guardada abriendo y cerrando una conexión propia."""
+        password = ConnectionService.get_decrypted_password(connection)
+        if connection.db_type == DatabaseType.SQL_SERVER:
+            return ConnectionService.test_sql_server_connection(
+                host=connection.host,
+                port=connection.port,
+                user=connection.db_user,
+                password=password,
+                database=connection.database_name,
+            )
+        return ConnectionService.test_neo4j_connection(
+            host=connection.host,
+            port=connection.port,
+            user=connection.db_user,
+            password=password,
+        )
+
+    @staticmethod
+    async def check_stored_connection(
+        connection: Connection,
+        timeout: Optional[float] = None,
+    ) -> ConnectionTestResponse:
+        """Prueba una conexión guardada reutilizando su pool o driver.
+
+        Si la conexión ya tiene pool, SQL Server se prueba con SELECT 1 sobre
+        una conexión del pool; si ya tiene driver, Neo4j se prueba con
+        verify_connectivity() del driver asíncrono compartido. Si no, se
+        prueba con una conexión propia que se cierra al terminar: una prueba
+        no deja pools ni drivers abiertos. Las pruebas bloqueantes corren en
+        los hilos de prueba, acotados por CONNECTION_TEST_CONCURRENCY.
+
+        Args:
+            connection: Conexión guardada ya validada (existencia y ownership)
+            timeout: Segundos de espera máxima (por defecto
+                CONNECTION_TEST_TIMEOUT_SECONDS)
+
+        Returns:
+            Resultado de la prueba de conexión
+        """
+        if timeout is None:
+            timeout = settings.CONNECTION_TEST_TIMEOUT_SECONDS
+        shared = (
+            connection.connection_id in sql_server_pools
+            or connection.connection_id in neo4j_drivers
+        )
+        start_time = time.perf_counter()
+        try:
+            async with asyncio.timeout(timeout):
+                if not shared:
+                    outcome = await _run_probe(
+                        ConnectionService._test_stored_once, connection
+                    )
+                    message = outcome.message
+                    if not outcome.success:
+                        raise _ProbeFailed(message)
+                elif connection.db_type == DatabaseType.SQL_SERVER:
+                    await _run_probe(ConnectionService._check_sql_server, connection)
+                    message = "Conexión exitosa a SQL Server"
+                else:
+                    # Como con SQL Server, la prueba no mantiene vivo el driver
+                    driver = ExecutionService.get_driver(connection, touch=False)
+                    await driver.verify_connectivity()
+                    message = "Conexión exitosa a Neo4j"
+            success = True
+        except TimeoutError:
+            # pyodbc no se puede interrumpir: el hilo de prueba termina con el
+            # tiempo límite del login, pero la prueba no lo espera
+            success, message = False, "Tiempo de espera agotado"
+        except pyodbc.Error as e:
+            success, message = False, _sql_server_error_message(e)
+        except (DatabaseConnectionError, ValidationError) as e:
+            success, message = False, e.detail
+        except _ProbeFailed as e:
+            success, message = False, str(e)
+        except Exception as e:
+            success, message = False, _neo4j_error_message(e)
+
+        return ConnectionTestResponse(
+            success=success,
+            message=message,
+            connection_time_ms=round((time.perf_counter() - start_time) * 1000, 2),
+        )
+
+    @staticmethod
+    async def check_connections(
+        connections: List[Connection],
+        concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[dict]:
+        """Prueba varias conexiones guardadas a la vez.
+
+        Como mucho `concurrency` pruebas corren a la vez, cada una con su
+        tiempo límite, así que el tiempo total se acerca al de la conexión
+        más lenta en lugar de a la suma de todas. Si el consumidor deja de
+        leer, las pruebas pendientes se cancelan. Las pruebas bloqueantes
+        comparten además los hilos de prueba: si siguen ocupados por pruebas
+        que agotaron su tiempo, las nuevas esperan dentro de su tiempo límite.
+
+        Args:
+            connections: Conexiones guardadas ya validadas
+            concurrency: Pruebas simultáneas (por defecto
+                CONNECTION_TEST_CONCURRENCY)
+            timeout: Segundos de espera máxima por conexión
+
+        Yields:
+            dict: connection_id, conn_name, db_type y el resultado de la
+                prueba, en el orden en que terminan
+        """
+        semaphore = asyncio.Semaphore(
+            concurrency or settings.CONNECTION_TEST_CONCURRENCY
+        )
+
+        async def check(connection: Connection) -> dict:
+            async with semaphore:
+                result = await ConnectionService.check_stored_connection(
+                    connection, timeout
+                )
+            return {
+                "connection_id": connection.connection_id,
+                "conn_name": connection.conn_name,
+                "db_type": connection.db_type,
+                **result.model_dump(),
+            }
+
+        tasks = [asyncio.create_task(check(connection)) for connection in connections]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                yield await finished
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @staticmethod
+    def get_credential_cache_stats() -> dict:
+        """Devuelve las métricas de la caché de contraseñas desencriptadas.
+
+        Returns:
+            Entradas, límites, contadores de uso y tiempo de desencriptado
+            ahorrado
+        """
+        return credential_cache.stats()
+
     @staticmethod
     def get_decrypted_password(connection: Connection) -> str:
         """Obtiene la contraseña desencriptada de una conexión.
 
+        Usa la caché de credenciales, así que abrir varias conexiones seguidas
+        con la misma contraseña solo la desencripta una vez.
+
         Args:
             connection: Objeto Connection
 
@@ -389,7 +1158,9 @@ class ConnectionService:
             DatabaseConnectionError: Si no se puede desencriptar
         """
         try:
-            return decrypt_data(connection.db_password)
+            return credential_cache.decrypt(
+                connection.connection_id, connection.db_password
+            )
         except Exception as e:
             raise DatabaseConnectionError(
                 f"Error al obtener contraseña: {str(e)}"
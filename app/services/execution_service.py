@@ -0,0 +1,1737 @@
+"""
+Servicio para ejecutar consultas Cypher traducidas en Neo4j.
+
+Mantiene un registro de drivers de Neo4j de larga duración, uno por conexión
+guardada, para no repetir el handshake TCP/TLS y la autenticación en cada
+ejecución. Los drivers se crean bajo demanda a partir del registro
+`Connection`, tienen el tamaño de su pool acotado, se cierran tras un tiempo
+sin uso y se invalidan cuando la conexión se modifica o se elimina.
+
+La ejecución usa el driver asíncrono (AsyncGraphDatabase): mientras Neo4j
+responde, la petición espera en el bucle de eventos sin ocupar un hilo del
+threadpool de Starlette, de modo que miles de consultas lentas pueden estar
+en curso a la vez. Solo los accesos breves a la base de datos relacional se
+delegan al threadpool.
+
+Opcionalmente los resultados se guardan en una caché en memoria indexada por
+usuario, conexión, Cypher y parámetros, con caducidad por consulta, límite en
+bytes y desalojo LRU, para los paneles que repiten la misma consulta cada
+pocos segundos.
+
+Cada ejecución corre en una transacción explícita con tiempo límite (de la
+petición, de la conexión o NEO4J_QUERY_TIMEOUT_SECONDS), que Neo4j aborta en
+el servidor al vencer. Si el cliente HTTP se desconecta a mitad del
+resultado la transacción se cancela en lugar de leer el resto, y en ambos
+casos la consulta queda registrada como cancelada o con tiempo agotado.
+
+Con EXECUTION_MAX_ESTIMATED_COST > 0, cada ejecución pide antes el plan
+EXPLAIN en la misma transacción y se rechaza si su coste estimado supera el
+umbral; explain_query() devuelve el plan (EXPLAIN o PROFILE) sin entregar
+las filas de la consulta.
+
+Además de NDJSON y JSON, los resultados pueden exportarse en formato
+columnar (Arrow IPC o Parquet, ver export_service) construyendo los lotes
+directamente desde el cursor de Neo4j.
+
+execute_batch() ejecuta muchas consultas en una sola sesión y transacción:
+las que comparten el mismo Cypher parametrizado se reescriben en una única
+sentencia `UNWIND $rows AS _row` y el resto se envían una tras otra sin abrir
+sesiones nuevas.
+"""
+
+import asyncio
+import base64
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Optional
+
+import anyio
+from neo4j import (
+    READ_ACCESS,
+    AsyncDriver,
+    AsyncGraphDatabase,
+    Driver,
+    GraphDatabase,
+)
+from neo4j.exceptions import AuthError, DriverError, Neo4jError
+from neo4j.graph import Node, Path, Relationship
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.core.credentials import credential_cache
+from app.core.exceptions import (
+    DatabaseConnectionError,
+    ForbiddenError,
+    NotFoundError,
+    QueryTimeoutError,
+    ValidationError,
+)
+from app.models.connection import Connection, DatabaseType
+from app.models.query import Query, QueryStatus
+from app.services.export_service import (
+    COLUMNAR_MEDIA_TYPES,
+    ColumnarWriter,
+    return_columns,
+)
+from app.services.plan_service import is_admitted, plan_record, summarize_plan
+
+# Clave de paginación por defecto: el identificador interno del nodo
+ELEMENT_ID_KEY = "elementId"
+# Columnas auxiliares que el Cypher paginado devuelve para construir el cursor
+_CURSOR_VALUE = "_cursor_value"
+_CURSOR_ELEMENT_ID = "_cursor_id"
+_PROPERTY_NAME = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+# Columna auxiliar con la posición de la fila de $rows en las sentencias UNWIND
+_BATCH_INDEX = "_batch_index"
+_PARAMETER = re.compile(r"\$([A-Za-z_][A-Za-z0-9_]*)")
+# Margen sobre el tiempo límite de la transacción antes de abandonar la espera
+# en el cliente (por si el servidor no responde)
+_CLIENT_TIMEOUT_GRACE_SECONDS = 1.0
+
+
+class Neo4jDriverRegistry:
+    """
+    Registro thread-safe de drivers de Neo4j indexado por connection_id.
+
+    Cada entrada guarda la huella de los datos de conexión con los que se creó
+    el driver: si el registro `Connection` cambia por cualquier vía, el driver
+    se recrea en el siguiente uso aunque nadie lo haya invalidado.
+    """
+
+    def __init__(
+        self,
+        max_drivers: int,
+        max_pool_size: int,
+        idle_timeout: float,
+        acquisition_timeout: float,
+    ):
+        """
+        Inicializa el registro vacío.
+
+        Args:
+            max_drivers: Número máximo de drivers abiertos a la vez
+            max_pool_size: Conexiones Bolt máximas por driver
+            idle_timeout: Segundos sin uso tras los que se cierra un driver
+            acquisition_timeout: Segundos de espera por una conexión libre
+        """
+        self.max_drivers = max_drivers
+        self.max_pool_size = max_pool_size
+        self.idle_timeout = idle_timeout
+        self.acquisition_timeout = acquisition_timeout
+        # connection_id -> (driver, huella, último uso)
+        self._drivers: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.created = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _fingerprint(connection: Connection) -> tuple:
+        """Datos de la conexión de los que depende el driver."""
+        return (
+            connection.host,
+            connection.port,
+            connection.db_user,
+            connection.db_password,
+        )
+
+    def _create_driver(self, connection: Connection) -> Driver:
+        """
+        Crea un driver para una conexión guardada.
+
+        Args:
+            connection: Conexión Neo4j con la contraseña encriptada
+
+        Returns:
+            Driver de Neo4j
+
+        Raises:
+            DatabaseConnectionError: Si no se puede desencriptar la contraseña
+        """
+        try:
+            password = credential_cache.decrypt(
+                connection.connection_id, connection.db_password
+            )
+        except Exception as e:
+            raise DatabaseConnectionError(
+                f"Error al obtener contraseña: {str(e)}"
+            ) from e
+
+        return self._open_driver(
+            f"bolt://{connection.host}:{connection.port}",
+            auth=(connection.db_user, password),
+            connection_timeout=5,
+            max_connection_pool_size=self.max_pool_size,
+            connection_acquisition_timeout=self.acquisition_timeout,
+        )
+
+    def _open_driver(self, uri: str, **config) -> Driver:
+        """Abre el driver de Neo4j (síncrono)."""
+        return GraphDatabase.driver(uri, **config)
+
+    def _close_driver(self, driver: Driver) -> None:
+        """Cierra un driver retirado del registro."""
+        driver.close()
+
+    def get_driver(self, connection: Connection, touch: bool = True) -> Driver:
+        """
+        Obtiene el driver de una conexión, creándolo si no existe.
+
+        Args:
+            connection: Conexión Neo4j guardada
+            touch: Contar el uso para el desalojo por inactividad; las
+                pruebas de estado usan False para no mantener vivo el driver
+
+        Returns:
+            Driver de Neo4j reutilizable
+
+        Raises:
+            ValidationError: Si la conexión no es de tipo Neo4j
+            DatabaseConnectionError: Si no se puede desencriptar la contraseña
+        """
+        if connection.db_type != DatabaseType.NEO4J:
+            raise ValidationError("La conexión no es de tipo Neo4j")
+
+        to_close = self._evict_idle()
+        fingerprint = self._fingerprint(connection)
+        connection_id = connection.connection_id
+        try:
+            with self._lock:
+                entry = self._drivers.get(connection_id)
+                if entry is not None and entry[1] == fingerprint:
+                    if touch:
+                        self._drivers[connection_id] = (
+                            entry[0],
+                            fingerprint,
+                            time.monotonic(),
+                        )
+                        self._drivers.move_to_end(connection_id)
+                    return entry[0]
+                if entry is not None:
+                    # La conexión cambió sin pasar por invalidate()
+                    del self._drivers[connection_id]
+                    to_close.append(entry[0])
+
+                driver = self._create_driver(connection)
+                self.created += 1
+                self._drivers[connection_id] = (driver, fingerprint, time.monotonic())
+
+                # Respetar el máximo de drivers cerrando los menos usados
+                while len(self._drivers) > self.max_drivers:
+                    _, (evicted, _, _) = self._drivers.popitem(last=False)
+                    to_close.append(evicted)
+                    self.evictions += 1
+                return driver
+        finally:
+            # Los drivers se cierran fuera del lock: close() espera a la red
+            for old_driver in to_close:
+                self._close_driver(old_driver)
+
+    def _evict_idle(self) -> list:
+        """Retira los drivers sin uso reciente y los devuelve para cerrarlos."""
+        if self.idle_timeout <= 0:
+            return []
+        deadline = time.monotonic() - self.idle_timeout
+        evicted = []
+        with self._lock:
+            for connection_id, (driver, _, last_used) in list(self._drivers.items()):
+                if last_used < deadline:
+                    del self._drivers[connection_id]
+                    evicted.append(driver)
+                    self.evictions += 1
+        return evicted
+
+    def evict_idle(self) -> int:
+        """
+        Cierra los drivers que llevan más de idle_timeout segundos sin uso.
+
+        Returns:
+            Número de drivers cerrados
+        """
+        evicted = self._evict_idle()
+        for driver in evicted:
+            self._close_driver(driver)
+        return len(evicted)
+
+    def invalidate(self, connection_id: int) -> bool:
+        """
+        Cierra y olvida el driver de una conexión.
+
+        Las ejecuciones en curso con ese driver pueden fallar; las siguientes
+        crearán un driver nuevo con los datos actualizados.
+
+        Args:
+            connection_id: ID de la conexión
+
+        Returns:
+            True si había un driver abierto
+        """
+        with self._lock:
+            entry = self._drivers.pop(connection_id, None)
+        if entry is None:
+            return False
+        self._close_driver(entry[0])
+        return True
+
+    def close_all(self) -> None:
+        """Cierra todos los drivers abiertos."""
+        with self._lock:
+            drivers = [entry[0] for entry in self._drivers.values()]
+            self._drivers.clear()
+        for driver in drivers:
+            self._close_driver(driver)
+
+    def stats(self) -> dict:
+        """
+        Devuelve el estado del registro.
+
+        Returns:
+            Drivers abiertos, límites y contadores de creación y desalojo
+        """
+        with self._lock:
+            return {
+                "drivers": len(self._drivers),
+                "max_drivers": self.max_drivers,
+                "max_pool_size": self.max_pool_size,
+                "idle_timeout": self.idle_timeout,
+                "created": self.created,
+                "evictions": self.evictions,
+            }
+
+    def __contains__(self, connection_id: int) -> bool:
+        return connection_id in self._drivers
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """Bucle de eventos del hilo actual, o None si no hay ninguno en marcha."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class AsyncNeo4jDriverRegistry(Neo4jDriverRegistry):
+    """
+    Registro de drivers asíncronos de Neo4j.
+
+    Un AsyncDriver solo puede usarse desde el bucle de eventos en el que se
+    creó, así que el bucle forma parte de la huella: si cambia (por ejemplo,
+    al reiniciar la aplicación) el driver se recrea. Como el registro también
+    se usa desde código síncrono (invalidación desde ConnectionService), el
+    cierre se programa en el bucle del driver sin bloquear al llamante.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Inicializa el registro vacío (mismos argumentos que el síncrono)."""
+        super().__init__(*args, **kwargs)
+        # id(driver) -> bucle en el que se creó
+        self._loops: dict = {}
+        # Referencias a los cierres en curso para que no los recoja el GC
+        self._closing: set = set()
+
+    def _fingerprint(self, connection: Connection) -> tuple:
+        """Datos de la conexión y bucle de eventos de los que depende el driver."""
+        return Neo4jDriverRegistry._fingerprint(connection) + (_running_loop(),)
+
+    def _open_driver(self, uri: str, **config) -> AsyncDriver:
+        """Abre el driver asíncrono en el bucle de eventos actual."""
+        driver = AsyncGraphDatabase.driver(uri, **config)
+        self._loops[id(driver)] = _running_loop()
+        return driver
+
+    def _close_driver(self, driver: AsyncDriver) -> None:
+        """Programa el cierre de un driver en su bucle de eventos."""
+        loop = self._loops.pop(id(driver), None)
+        coroutine = driver.close()
+        running = _running_loop()
+        if loop is not None and loop is running:
+            task = loop.create_task(coroutine)
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+        elif loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(coroutine, loop)
+        elif running is None:
+            # El bucle del driver ya terminó (o nunca hubo uno): se cierra en
+            # un bucle propio y se ignoran los errores de sockets huérfanos
+            try:
+                asyncio.run(coroutine)
+            except Exception:
+                pass
+        else:
+            coroutine.close()
+
+    async def aclose_all(self) -> None:
+        """Cierra todos los drivers esperando a que terminen."""
+        with self._lock:
+            drivers = [entry[0] for entry in self._drivers.values()]
+            self._drivers.clear()
+        for driver in drivers:
+            self._loops.pop(id(driver), None)
+            await driver.close()
+
+
+# Registro compartido por toda la aplicación
+neo4j_drivers = AsyncNeo4jDriverRegistry(
+    max_drivers=settings.NEO4J_MAX_DRIVERS,
+    max_pool_size=settings.NEO4J_MAX_POOL_SIZE,
+    idle_timeout=settings.NEO4J_DRIVER_IDLE_SECONDS,
+    acquisition_timeout=settings.NEO4J_ACQUISITION_TIMEOUT_SECONDS,
+)
+
+
+# Caché de resultados compartida por toda la aplicación
+execution_cache = LRUCache(
+    max_entries=(
+        settings.EXECUTION_CACHE_MAX_ENTRIES if settings.EXECUTION_CACHE_ENABLED else 0
+    ),
+    max_bytes=settings.EXECUTION_CACHE_MAX_BYTES,
+)
+
+
+class ExecutionService:
+    """Servicio para ejecutar consultas en las conexiones Neo4j del usuario."""
+
+    @staticmethod
+    def get_driver(connection: Connection, touch: bool = True) -> AsyncDriver:
+        """
+        Obtiene el driver asíncrono compartido de una conexión Neo4j.
+
+        Args:
+            connection: Conexión Neo4j ya validada (existencia y ownership)
+            touch: Contar el uso para el desalojo del driver por inactividad
+
+        Returns:
+            Driver asíncrono de Neo4j reutilizable
+
+        Raises:
+            ValidationError: Si la conexión no es de tipo Neo4j
+            DatabaseConnectionError: Si no se puede desencriptar la contraseña
+        """
+        return neo4j_drivers.get_driver(connection, touch=touch)
+
+    @staticmethod
+    def invalidate_driver(connection_id: int) -> bool:
+        """
+        Cierra el driver de una conexión modificada o eliminada.
+
+        Args:
+            connection_id: ID de la conexión
+
+        Returns:
+            True si había un driver abierto
+        """
+        return neo4j_drivers.invalidate(connection_id)
+
+    @staticmethod
+    def uses_result_cache(ttl: Optional[float] = None) -> bool:
+        """
+        Indica si una ejecución con ese TTL usa la caché de resultados.
+
+        Args:
+            ttl: Segundos de validez pedidos (None usa el valor por defecto)
+
+        Returns:
+            True si la caché está activa y el TTL es positivo
+        """
+        if ttl is None:
+            ttl = settings.EXECUTION_CACHE_TTL_SECONDS
+        return execution_cache.enabled and ttl > 0
+
+    @staticmethod
+    def result_cache_key(
+        user_id: int,
+        connection_id: int,
+        cypher: str,
+        parameters: Optional[dict],
+        ttl: Optional[float] = None,
+    ) -> Optional[tuple]:
+        """
+        Construye la clave de caché de un resultado.
+
+        El usuario forma parte de la clave además de la conexión, de modo que
+        un resultado nunca se sirve a alguien distinto de quien lo ejecutó.
+
+        Args:
+            user_id: ID del usuario que ejecuta
+            connection_id: ID de la conexión Neo4j
+            cypher: Cypher que se ejecuta
+            parameters: Parámetros del Cypher
+            ttl: Segundos de validez pedidos (None usa el valor por defecto)
+
+        Returns:
+            Clave de caché, o None si la caché está desactivada o ttl es 0
+        """
+        if not ExecutionService.uses_result_cache(ttl):
+            return None
+        encoded_parameters = json.dumps(
+            parameters or {}, sort_keys=True, separators=(",", ":"), default=str
+        )
+        return (user_id, connection_id, cypher, encoded_parameters)
+
+    @staticmethod
+    def get_cached_result(cache_key: Optional[tuple]) -> Optional[tuple[Any, float]]:
+        """
+        Busca un resultado en la caché.
+
+        Args:
+            cache_key: Clave de result_cache_key() (None no consulta la caché)
+
+        Returns:
+            (resultado, antigüedad en segundos) o None si no está o caducó
+        """
+        if cache_key is None:
+            return None
+        return execution_cache.get_with_age(cache_key)
+
+    @staticmethod
+    def invalidate_results(
+        user_id: Optional[int] = None, connection_id: Optional[int] = None
+    ) -> int:
+        """
+        Elimina resultados cacheados de un usuario y/o una conexión.
+
+        Args:
+            user_id: Solo las entradas de este usuario (None = todos)
+            connection_id: Solo las entradas de esta conexión (None = todas)
+
+        Returns:
+            Número de entradas eliminadas
+        """
+        return execution_cache.invalidate_where(
+            lambda key: (user_id is None or key[0] == user_id)
+            and (connection_id is None or key[1] == connection_id)
+        )
+
+    @staticmethod
+    def get_cache_stats() -> dict:
+        """
+        Devuelve las métricas de la caché de resultados.
+
+        Returns:
+            Entradas, bytes, límites y contadores de uso
+        """
+        return execution_cache.stats()
+
+    @staticmethod
+    def cached_chunks(rows: list, output_format: str) -> Iterator[bytes]:
+        """
+        Genera la respuesta de un resultado servido desde la caché.
+
+        Args:
+            rows: Filas ya codificadas en JSON guardadas por stream_results()
+            output_format: "ndjson" o "json"
+
+        Yields:
+            Respuesta completa en un único trozo
+        """
+        if output_format == "ndjson":
+            yield "".join(row + "\n" for row in rows).encode()
+        else:
+            yield ("[" + ",".join(rows) + "]").encode()
+
+    @staticmethod
+    def apply_row_limit(cypher: str) -> tuple[str, Optional[int]]:
+        """
+        Añade el LIMIT por defecto a una consulta que no limita sus filas.
+
+        Así el corte lo hace Neo4j y no la lectura del resultado. Las
+        consultas con LIMIT (o TOP, que se traduce a LIMIT) no se modifican.
+
+        Args:
+            cypher: Consulta Cypher traducida
+
+        Returns:
+            Cypher a ejecutar y límite añadido (None si no se añadió)
+        """
+        row_limit = settings.EXECUTION_DEFAULT_ROW_LIMIT
+        if row_limit <= 0 or cypher.splitlines()[-1].startswith("LIMIT "):
+            return cypher, None
+        return f"{cypher}\nLIMIT {row_limit}", row_limit
+
+    @staticmethod
+    def effective_timeout(
+        connection: Connection, requested: Optional[float] = None
+    ) -> Optional[float]:
+        """
+        Calcula el tiempo límite de una ejecución.
+
+        La petición puede acortar el límite de la conexión (o el global si la
+        conexión no tiene uno), pero nunca ampliarlo.
+
+        Args:
+            connection: Conexión Neo4j en la que se ejecuta
+            requested: Segundos pedidos en la petición
+
+        Returns:
+            Segundos de tiempo límite, o None si no hay ninguno
+        """
+        limit = connection.query_timeout_seconds or settings.NEO4J_QUERY_TIMEOUT_SECONDS
+        candidates = [value for value in (requested, limit) if value and value > 0]
+        return min(candidates) if candidates else None
+
+    @staticmethod
+    def get_executable_query(db: Session, query_id: int, user_id: int) -> Query:
+        """
+        Obtiene una consulta traducida del historial lista para ejecutarse.
+
+        Args:
+            db: Sesión de base de datos
+            query_id: ID de la consulta
+            user_id: ID del usuario (para validar ownership)
+
+        Returns:
+            Consulta con su Cypher traducido
+
+        Raises:
+            NotFoundError: Si la consulta no existe
+            ForbiddenError: Si el usuario no es el propietario
+            ValidationError: Si la consulta no tiene traducción Cypher
+        """
+        query = db.query(Query).filter(Query.query_id == query_id).first()
+        if not query:
+            raise NotFoundError("Consulta no encontrada")
+        if query.user_id != user_id:
+            raise ForbiddenError("No tienes permiso para acceder a esta consulta")
+        if not query.cypher_query:
+            raise ValidationError("La consulta no tiene una traducción Cypher")
+        return query
+
+    @staticmethod
+    def get_executable_queries(
+        db: Session, query_ids: list[int], user_id: int
+    ) -> list[Query]:
+        """
+        Obtiene con una sola lectura las consultas traducidas de un lote.
+
+        Args:
+            db: Sesión de base de datos
+            query_ids: IDs de las consultas (pueden repetirse)
+            user_id: ID del usuario (para validar ownership)
+
+        Returns:
+            Consultas en el orden de query_ids
+
+        Raises:
+            NotFoundError: Si alguna consulta no existe
+            ForbiddenError: Si el usuario no es el propietario de alguna
+            ValidationError: Si alguna consulta no tiene traducción Cypher
+        """
+        stored = {
+            query.query_id: query
+            for query in db.query(Query).filter(Query.query_id.in_(set(query_ids)))
+        }
+        for query_id in query_ids:
+            query = stored.get(query_id)
+            if query is None:
+                raise NotFoundError(f"Consulta {query_id} no encontrada")
+            if query.user_id != user_id:
+                raise ForbiddenError("No tienes permiso para acceder a esta consulta")
+            if not query.cypher_query:
+                raise ValidationError(
+                    f"La consulta {query_id} no tiene una traducción Cypher"
+                )
+        return [stored[query_id] for query_id in query_ids]
+
+    @staticmethod
+    async def open_stream(
+        db: Session,
+        query: Query,
+        connection: Connection,
+        fetch_size: Optional[int] = None,
+        cypher: Optional[str] = None,
+        parameters: Optional[dict] = None,
+        timeout: Optional[float] = None,
+    ) -> "ResultStream":
+        """
+        Lanza una consulta en Neo4j y prepara la lectura de sus registros.
+
+        Se espera al primer lote de resultados antes de devolver, de modo que
+        los errores de conexión o de Cypher se informan como errores HTTP y no
+        a mitad de la respuesta. Debe llamarse desde el bucle de eventos.
+
+        Args:
+            db: Sesión de base de datos (para registrar el fallo)
+            query: Consulta del historial a ejecutar
+            connection: Conexión Neo4j ya validada (existencia y ownership)
+            fetch_size: Registros por lote pedido a Neo4j
+            cypher: Cypher a ejecutar en lugar del de la consulta (p. ej.
+                reescrito para paginar)
+            parameters: Parámetros de `cypher`
+            timeout: Tiempo límite de la transacción en segundos
+
+        Returns:
+            Flujo de resultados abierto
+
+        Raises:
+            ValidationError: Si la conexión no es Neo4j, el Cypher es inválido
+                o la política de admisión rechaza su plan
+            DatabaseConnectionError: Si no se puede conectar con Neo4j
+            QueryTimeoutError: Si el primer lote no llega a tiempo
+        """
+        driver = ExecutionService.get_driver(connection)
+        start_time = time.perf_counter()
+        fetch_size = fetch_size or settings.NEO4J_FETCH_SIZE
+        if cypher is None:
+            cypher, parameters = query.cypher_query, query.cypher_parameters
+
+        session = driver.session(
+            **_session_config(connection, fetch_size, read_only=True)
+        )
+        stream = ResultStream(session, start_time, fetch_size)
+        stream.columns = return_columns(cypher)
+        try:
+            async with asyncio.timeout(_client_timeout(timeout)):
+                stream.transaction = await session.begin_transaction(timeout=timeout)
+                if settings.EXECUTION_MAX_ESTIMATED_COST > 0:
+                    summary = await _capture_plan(
+                        stream.transaction, cypher, parameters
+                    )
+                    stream.plan_summary = plan_record(summary)
+                    _check_admission(summary)
+                stream.result = await stream.transaction.run(cypher, parameters or {})
+                await stream.result.peek()
+        except Exception as e:
+            error = _execution_error(e)
+            await stream.close(completed=False)
+            await run_in_threadpool(
+                ExecutionService._record_execution,
+                db,
+                query.query_id,
+                start_time,
+                error_message=error.detail,
+                status=_error_status(error),
+                plan_summary=stream.plan_summary,
+            )
+            raise error from e
+
+        return stream
+
+    @staticmethod
+    async def explain_query(
+        db: Session,
+        query: Query,
+        connection: Connection,
+        profile: bool = False,
+        timeout: Optional[float] = None,
+    ) -> dict:
+        """
+        Obtiene el plan de ejecución de una consulta y lo guarda en su registro.
+
+        Con EXPLAIN la consulta no se ejecuta. Con PROFILE se ejecuta para
+        medir db hits y filas reales, descartando sus filas y deshaciendo la
+        transacción. Debe llamarse desde el bucle de eventos.
+
+        Args:
+            db: Sesión de base de datos (para guardar el resumen)
+            query: Consulta del historial
+            connection: Conexión Neo4j ya validada (existencia y ownership)
+            profile: Usar PROFILE en lugar de EXPLAIN
+            timeout: Tiempo límite de la transacción en segundos
+
+        Returns:
+            Resumen del plan (ver summarize_plan) con query_id, admitted y
+            max_estimated_cost
+
+        Raises:
+            ValidationError: Si la conexión no es Neo4j o el Cypher es inválido
+            DatabaseConnectionError: Si no se puede conectar con Neo4j
+            QueryTimeoutError: Si el plan no se obtiene a tiempo
+        """
+        driver = ExecutionService.get_driver(connection)
+        session = driver.session(**_session_config(connection, read_only=True))
+        transaction = None
+        try:
+            async with asyncio.timeout(_client_timeout(timeout)):
+                transaction = await session.begin_transaction(timeout=timeout)
+                summary = await _capture_plan(
+                    transaction, query.cypher_query, query.cypher_parameters, profile
+                )
+        except Exception as e:
+            if transaction is not None:
+                transaction.cancel()
+            raise _execution_error(e) from e
+        else:
+            # Sin commit: con PROFILE se deshace cualquier efecto de la consulta
+            await transaction.close()
+        finally:
+            await session.close()
+
+        await run_in_threadpool(
+            ExecutionService._store_plan_summary,
+            db,
+            query.query_id,
+            plan_record(summary),
+        )
+        max_cost = settings.EXECUTION_MAX_ESTIMATED_COST
+        return {
+            **summary,
+            "query_id": query.query_id,
+            "admitted": is_admitted(summary),
+            "max_estimated_cost": max_cost if max_cost > 0 else None,
+        }
+
+    @staticmethod
+    async def stream_results(
+        db: Session,
+        query_id: int,
+        stream: "ResultStream",
+        output_format: str,
+        cache_key: Optional[tuple] = None,
+        cache_ttl: Optional[float] = None,
+        receive: Optional[Callable[[], Awaitable[dict]]] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Serializa un flujo de resultados por trozos a medida que llegan.
+
+        Cada trozo corresponde a un lote de fetch_size registros, así la
+        memoria usada no depende del tamaño total del resultado. Al terminar
+        se guardan el tiempo de ejecución y el número de nodos devueltos en
+        el registro Query.
+
+        Con cache_key, las filas se conservan mientras quepan en la caché y,
+        si el resultado se lee completo sin errores, se guardan en ella (solo
+        en NDJSON y JSON; los formatos columnares no se cachean).
+
+        Con receive (el canal ASGI de la petición) se vigila la desconexión
+        del cliente: si se va, la transacción se cancela en Neo4j y la
+        consulta se registra como cancelada.
+
+        Args:
+            db: Sesión de base de datos
+            query_id: ID de la consulta ejecutada
+            stream: Flujo abierto con open_stream()
+            output_format: "ndjson" (un objeto por línea), "json" (array),
+                "arrow" (Arrow IPC) o "parquet"
+            cache_key: Clave de result_cache_key() o None para no cachear
+            cache_ttl: Segundos de validez de la entrada cacheada
+            receive: Función receive de ASGI para detectar la desconexión
+
+        Yields:
+            Trozos de la respuesta (texto UTF-8 o binario columnar)
+        """
+        ndjson = output_format == "ndjson"
+        columnar = output_format in COLUMNAR_MEDIA_TYPES
+        error, completed = None, False
+        watcher = (
+            asyncio.create_task(_cancel_on_disconnect(receive, stream))
+            if receive is not None
+            else None
+        )
+        try:
+            if columnar:
+                async for chunk in _columnar_chunks(stream, output_format):
+                    yield chunk
+                completed = not stream.cancelled
+                return
+            if not ndjson:
+                yield b"["
+            separator = "" if ndjson else ","
+            first = True
+            buffer = []
+            cached_rows, cached_bytes = [], 0
+            async for row in stream:
+                encoded = json.dumps(row, ensure_ascii=False, default=str)
+                if cache_key is not None:
+                    cached_rows.append(encoded)
+                    # La caché se limita en bytes, no en caracteres
+                    cached_bytes += len(encoded.encode())
+                    if cached_bytes > execution_cache.max_bytes:
+                        # El resultado no cabe en la caché: se deja de copiar
+                        cache_key, cached_rows = None, None
+                if ndjson:
+                    buffer.append(encoded + "\n")
+                else:
+                    buffer.append(encoded if first else separator + encoded)
+                first = False
+                if len(buffer) >= stream.fetch_size:
+                    yield "".join(buffer).encode()
+                    buffer = []
+            if stream.cancelled:
+                # El cliente se fue: ni se termina la respuesta ni se cachea
+                return
+            if buffer:
+                yield "".join(buffer).encode()
+            if not ndjson:
+                yield b"]"
+            completed = True
+            if cache_key is not None:
+                if cache_ttl is None:
+                    cache_ttl = settings.EXECUTION_CACHE_TTL_SECONDS
+                execution_cache.set(
+                    cache_key, cached_rows, size=cached_bytes, ttl=cache_ttl
+                )
+        except Exception as e:
+            error = _execution_error(e)
+            # Las cabeceras ya se enviaron: en NDJSON el error se informa en
+            # una última línea; el array JSON se deja sin cerrar para que el
+            # cliente no confunda un resultado parcial con uno completo
+            if ndjson and not stream.cancelled:
+                yield (json.dumps({"error": error.detail}) + "\n").encode()
+        except asyncio.CancelledError, GeneratorExit:
+            # El servidor abandona la respuesta (cliente desconectado)
+            stream.cancel()
+            raise
+        finally:
+            if watcher is not None:
+                watcher.cancel()
+            # Registrar aunque la tarea esté cancelada
+            with anyio.CancelScope(shield=True):
+                await stream.close(completed=completed)
+                status = None
+                if stream.cancelled:
+                    status = QueryStatus.CANCELADO
+                elif error is not None:
+                    status = _error_status(error)
+                await run_in_threadpool(
+                    ExecutionService._record_execution,
+                    db,
+                    query_id,
+                    stream.start_time,
+                    nodes_affected=stream.row_count,
+                    error_message=(
+                        "Ejecución cancelada: el cliente se desconectó"
+                        if stream.cancelled
+                        else error.detail if error else None
+                    ),
+                    status=status,
+                    plan_summary=stream.plan_summary,
+                )
+
+    @staticmethod
+    async def execute_page(
+        db: Session,
+        query: Query,
+        connection: Connection,
+        page_size: int,
+        cursor: Optional[str] = None,
+        order_key: str = ELEMENT_ID_KEY,
+        user_id: Optional[int] = None,
+        cache_ttl: Optional[float] = 0,
+        timeout: Optional[float] = None,
+    ) -> tuple[dict, Optional[float]]:
+        """
+        Ejecuta una página de resultados con paginación por cursor.
+
+        El Cypher traducido se reescribe con
+        `WHERE key > $cursor ORDER BY key LIMIT $n` (keyset pagination): Neo4j
+        empieza a leer justo después de la última fila de la página anterior,
+        así que cualquier página cuesta lo mismo que la primera en vez de
+        recorrer y descartar todas las anteriores.
+
+        Args:
+            db: Sesión de base de datos
+            query: Consulta del historial a ejecutar
+            connection: Conexión Neo4j ya validada (existencia y ownership)
+            page_size: Filas por página
+            cursor: Cursor devuelto por la página anterior (None = primera)
+            order_key: "elementId" o nombre de una propiedad del nodo
+            user_id: Usuario que ejecuta (para la clave de caché)
+            cache_ttl: Segundos de validez en la caché (0 = no cachear, None
+                usa EXECUTION_CACHE_TTL_SECONDS)
+            timeout: Tiempo límite de la transacción en segundos
+
+        Returns:
+            tuple: Página (rows, next_cursor —None en la última—, has_more y
+                page_size) y antigüedad en segundos si se sirvió desde la
+                caché (None si se ejecutó)
+
+        Raises:
+            ValidationError: Si el cursor o la clave no son válidos, o la
+                consulta no se puede paginar
+            DatabaseConnectionError: Si no se puede conectar con Neo4j
+            QueryTimeoutError: Si la página no se obtiene a tiempo
+        """
+        after = decode_cursor(cursor, order_key) if cursor else None
+        cypher, page_parameters = paginate_cypher(
+            query.cypher_query, order_key, after, page_size + 1
+        )
+        parameters = {**(query.cypher_parameters or {}), **page_parameters}
+
+        cache_key = ExecutionService.result_cache_key(
+            user_id, connection.connection_id, cypher, parameters, cache_ttl
+        )
+        cached = ExecutionService.get_cached_result(cache_key)
+        if cached is not None:
+            return cached
+
+        # Se pide una fila de más para saber si hay página siguiente
+        stream = await ExecutionService.open_stream(
+            db, query, connection, page_size + 1, cypher, parameters, timeout
+        )
+        rows, keys, error = [], [], None
+        try:
+            async for row in stream:
+                keys.append((row.pop(_CURSOR_VALUE, None), row.pop(_CURSOR_ELEMENT_ID)))
+                rows.append(row)
+        except Exception as e:
+            error = _execution_error(e)
+        finally:
+            await stream.close(completed=error is None)
+            await run_in_threadpool(
+                ExecutionService._record_execution,
+                db,
+                query.query_id,
+                stream.start_time,
+                nodes_affected=min(len(rows), page_size),
+                error_message=error.detail if error else None,
+                status=_error_status(error) if error else None,
+                plan_summary=stream.plan_summary,
+            )
+        if error is not None:
+            raise error
+
+        has_more = len(rows) > page_size
+        next_cursor = None
+        if has_more:
+            rows = rows[:page_size]
+            value, element_id = keys[page_size - 1]
+            next_cursor = encode_cursor(order_key, value, element_id)
+        page = {
+            "rows": rows,
+            "next_cursor": next_cursor,
+            "has_more": has_more,
+            "page_size": page_size,
+        }
+        if cache_key is not None:
+            if cache_ttl is None:
+                cache_ttl = settings.EXECUTION_CACHE_TTL_SECONDS
+            execution_cache.set(
+                cache_key,
+                page,
+                size=len(json.dumps(page, ensure_ascii=False, default=str).encode()),
+                ttl=cache_ttl,
+            )
+        return page, None
+
+    @staticmethod
+    def resolve_batch_connection_id(
+        queries: list[Query], requested: Optional[int] = None
+    ) -> int:
+        """
+        Determina la conexión Neo4j en la que se ejecuta un lote.
+
+        Args:
+            queries: Consultas del lote
+            requested: Conexión indicada en la petición
+
+        Returns:
+            ID de la conexión indicada o, si no hay, la común a las consultas
+
+        Raises:
+            ValidationError: Si las consultas no tienen una conexión común
+        """
+        if requested is not None:
+            return requested
+        connection_ids = {query.neo4j_connection_id for query in queries}
+        if len(connection_ids) != 1 or None in connection_ids:
+            raise ValidationError(
+                "Las consultas del lote no comparten una conexión Neo4j: "
+                "indica neo4j_connection_id"
+            )
+        return connection_ids.pop()
+
+    @staticmethod
+    async def execute_batch(
+        db: Session,
+        queries: list[Query],
+        connection: Connection,
+        timeout: Optional[float] = None,
+        unwind: bool = True,
+    ) -> dict:
+        """
+        Ejecuta un lote de consultas en una sola sesión y transacción.
+
+        Las consultas con el mismo Cypher y los mismos parámetros se ejecutan
+        una vez. Con unwind, las que comparten Cypher pero no parámetros se
+        reescriben con unwind_cypher() en una única sentencia, y cada fila
+        devuelta indica a qué consulta pertenece; el resto se envían una tras
+        otra en la misma transacción. La transacción no se confirma.
+
+        Un error de Neo4j aborta la transacción: las consultas de la sentencia
+        que falló reciben el error y las posteriores no se ejecutan. El
+        rechazo por coste estimado solo afecta a su sentencia. Debe llamarse
+        desde el bucle de eventos.
+
+        Args:
+            db: Sesión de base de datos (para registrar las ejecuciones)
+            queries: Consultas del historial en el orden de la petición
+            connection: Conexión Neo4j ya validada (existencia y ownership)
+            timeout: Tiempo límite de la transacción en segundos
+            unwind: Agrupar las consultas con el mismo Cypher en un UNWIND
+
+        Returns:
+            dict: results (por consulta: index, query_id, success, rows,
+                row_count y error), statements (sentencias enviadas) y
+                execution_time (ms)
+
+        Raises:
+            ValidationError: Si la conexión no es de tipo Neo4j
+            DatabaseConnectionError: Si no se puede conectar con Neo4j
+        """
+        driver = ExecutionService.get_driver(connection)
+        start_time = time.perf_counter()
+        statements = _batch_statements(queries, unwind)
+        # Por consulta: (filas, error, estado, ms) una vez ejecutada
+        outcomes: list[Optional[tuple]] = [None] * len(queries)
+        sent = 0
+
+        session = driver.session(**_session_config(connection, read_only=True))
+        transaction = None
+        current = None
+        try:
+            async with asyncio.timeout(_client_timeout(timeout)):
+                transaction = await session.begin_transaction(timeout=timeout)
+                for current in statements:
+                    cypher, parameters, targets = current
+                    statement_start = time.perf_counter()
+                    if settings.EXECUTION_MAX_ESTIMATED_COST > 0:
+                        sent += 1
+                        summary = await _capture_plan(transaction, cypher, parameters)
+                        try:
+                            _check_admission(summary)
+                        except ValidationError as e:
+                            _set_outcomes(
+                                outcomes,
+                                targets,
+                                error_message=e.detail,
+                                status=QueryStatus.FALLIDO,
+                                elapsed=_elapsed_ms(statement_start),
+                            )
+                            continue
+                    sent += 1
+                    result = await transaction.run(cypher, parameters)
+                    rows = [[] for _ in targets]
+                    async for record in result:
+                        row = {
+                            key: serialize_value(value) for key, value in record.items()
+                        }
+                        rows[row.pop(_BATCH_INDEX, 0)].append(row)
+                    _set_outcomes(
+                        outcomes,
+                        targets,
+                        rows=rows,
+                        elapsed=_elapsed_ms(statement_start),
+                    )
+                current = None
+        except Exception as e:
+            error = _execution_error(e)
+            if transaction is not None:
+                transaction.cancel()
+            if current is None:
+                # Fallo al abrir la transacción: no se ejecutó nada
+                raise error from e
+            _set_outcomes(
+                outcomes,
+                current[2],
+                error_message=error.detail,
+                status=_error_status(error),
+            )
+        else:
+            # Sin commit: el lote solo lee
+            await transaction.close()
+        finally:
+            await session.close()
+
+        await run_in_threadpool(
+            ExecutionService._record_batch, db, queries, outcomes, start_time
+        )
+        results = []
+        for index, (query, outcome) in enumerate(zip(queries, outcomes, strict=True)):
+            rows, error_message = (outcome or ([], None))[:2]
+            if outcome is None:
+                error_message = (
+                    "Consulta no ejecutada: el lote se interrumpió por un error "
+                    "anterior"
+                )
+            results.append(
+                {
+                    "index": index,
+                    "query_id": query.query_id,
+                    "success": error_message is None,
+                    "rows": rows,
+                    "row_count": len(rows),
+                    "error": error_message,
+                }
+            )
+        return {
+            "results": results,
+            "statements": sent,
+            "execution_time": _elapsed_ms(start_time),
+        }
+
+    @staticmethod
+    def _record_execution(
+        db: Session,
+        query_id: int,
+        start_time: float,
+        nodes_affected: Optional[int] = None,
+        error_message: Optional[str] = None,
+        status: Optional[QueryStatus] = None,
+        plan_summary: Optional[dict] = None,
+    ) -> None:
+        """
+        Guarda el resultado de una ejecución en el registro Query.
+
+        Args:
+            db: Sesión de base de datos
+            query_id: ID de la consulta
+            start_time: Instante de inicio (time.perf_counter())
+            nodes_affected: Registros devueltos por Neo4j
+            error_message: Mensaje de error si la ejecución falló
+            status: Estado a registrar (por defecto FALLIDO si hay error y
+                EJECUTADO si no)
+            plan_summary: Resumen del plan comprobado antes de ejecutar
+        """
+        query = db.query(Query).filter(Query.query_id == query_id).first()
+        if query is None:
+            return
+        query.execution_time = (time.perf_counter() - start_time) * 1000
+        query.nodes_affected = nodes_affected
+        if status is None:
+            status = QueryStatus.FALLIDO if error_message else QueryStatus.EJECUTADO
+        query.status = status
+        query.error_message = error_message
+        if plan_summary is not None:
+            query.plan_summary = plan_summary
+        db.commit()
+
+    @staticmethod
+    def _store_plan_summary(db: Session, query_id: int, plan_summary: dict) -> None:
+        """
+        Guarda el resumen de un plan en el registro Query.
+
+        Args:
+            db: Sesión de base de datos
+            query_id: ID de la consulta
+            plan_summary: Resumen del plan sin el árbol de operadores
+        """
+        query = db.query(Query).filter(Query.query_id == query_id).first()
+        if query is None:
+            return
+        query.plan_summary = plan_summary
+        db.commit()
+
+    @staticmethod
+    def _record_batch(
+        db: Session,
+        queries: list[Query],
+        outcomes: list[Optional[tuple]],
+        start_time: float,
+    ) -> None:
+        """
+        Guarda el resultado de las consultas de un lote con un solo commit.
+
+        Las consultas que no llegaron a ejecutarse no se modifican.
+
+        Args:
+            db: Sesión de base de datos
+            queries: Consultas del lote
+            outcomes: (filas, error, estado, ms) de cada consulta o None
+            start_time: Instante de inicio del lote (time.perf_counter())
+        """
+        executed = {}
+        for query, outcome in zip(queries, outcomes, strict=True):
+            if outcome is not None:
+                executed[query.query_id] = outcome
+        if not executed:
+            return
+        stored = db.query(Query).filter(Query.query_id.in_(executed)).all()
+        for query in stored:
+            rows, error_message, status, elapsed = executed[query.query_id]
+            query.execution_time = (
+                elapsed if elapsed is not None else _elapsed_ms(start_time)
+            )
+            query.nodes_affected = len(rows)
+            if status is None:
+                status = QueryStatus.FALLIDO if error_message else QueryStatus.EJECUTADO
+            query.status = status
+            query.error_message = error_message
+        db.commit()
+
+
+class ResultStream:
+    """
+    Lectura perezosa de los registros de un resultado de Neo4j.
+
+    El driver pide a Neo4j lotes de fetch_size registros según se consumen,
+    por lo que nunca hay más de un lote en memoria. La consulta corre en una
+    transacción explícita para poder cancelarla sin leer los registros
+    pendientes (cerrar una sesión con un resultado autocommit los consume).
+    """
+
+    def __init__(self, session, start_time: float, fetch_size: int):
+        """
+        Envuelve una sesión abierta; open_stream() asigna la transacción.
+
+        Args:
+            session: Sesión de Neo4j que se cerrará al terminar
+            start_time: Instante de inicio de la ejecución
+            fetch_size: Registros por lote pedido a Neo4j
+        """
+        self.session = session
+        self.transaction = None
+        self.result = None
+        self.start_time = start_time
+        self.fetch_size = fetch_size
+        self.row_count = 0
+        self.cancelled = False
+        self.plan_summary = None
+        self.columns = None
+
+    async def __aiter__(self) -> AsyncIterator[dict]:
+        """Recorre los registros ya convertidos a diccionarios serializables."""
+        async for row in self.raw_rows():
+            yield {key: serialize_value(value) for key, value in row.items()}
+
+    async def raw_rows(self) -> AsyncIterator[dict]:
+        """Recorre los registros con los valores tal como los entrega Neo4j."""
+        async for record in self.result:
+            if self.cancelled:
+                break
+            self.row_count += 1
+            yield dict(record.items())
+
+    def cancel(self) -> None:
+        """Aborta la transacción en el servidor sin esperar (no bloquea)."""
+        self.cancelled = True
+        if self.transaction is not None:
+            self.transaction.cancel()
+
+    async def close(self, completed: bool = True) -> None:
+        """
+        Termina la transacción y cierra la sesión.
+
+        Args:
+            completed: True si el resultado se leyó entero; si no, la
+                transacción se cancela en lugar de leer lo pendiente
+        """
+        try:
+            if self.transaction is not None and not self.cancelled:
+                if completed:
+                    await self.transaction.close()
+                else:
+                    self.transaction.cancel()
+        finally:
+            await self.session.close()
+
+
+def _session_config(
+    connection: Connection, fetch_size: Optional[int] = None, read_only: bool = False
+) -> dict:
+    """
+    Configuración de sesión de Neo4j para una conexión.
+
+    Con read_only la sesión se abre en modo lectura, de modo que en un
+    clúster sus transacciones se envían a un seguidor y no al líder.
+    """
+    session_config = {"fetch_size": fetch_size} if fetch_size else {}
+    if connection.database_name:
+        session_config["database"] = connection.database_name
+    if read_only:
+        session_config["default_access_mode"] = READ_ACCESS
+    return session_config
+
+
+def _elapsed_ms(start_time: float) -> float:
+    """Milisegundos transcurridos desde start_time (time.perf_counter())."""
+    return (time.perf_counter() - start_time) * 1000
+
+
+def _client_timeout(timeout: Optional[float]) -> Optional[float]:
+    """Espera máxima en el cliente para una transacción con tiempo límite."""
+    return timeout + _CLIENT_TIMEOUT_GRACE_SECONDS if timeout else None
+
+
+async def _capture_plan(
+    transaction, cypher: str, parameters: Optional[dict], profile: bool = False
+) -> dict:
+    """
+    Obtiene y resume el plan de un Cypher con EXPLAIN o PROFILE.
+
+    Args:
+        transaction: Transacción de Neo4j abierta
+        cypher: Consulta Cypher
+        parameters: Parámetros de la consulta
+        profile: Usar PROFILE (ejecuta la consulta) en lugar de EXPLAIN
+
+    Returns:
+        Resumen devuelto por summarize_plan()
+    """
+    prefix = "PROFILE" if profile else "EXPLAIN"
+    result = await transaction.run(f"{prefix} {cypher}", parameters or {})
+    summary = await result.consume()
+    raw_plan = summary.profile if profile else summary.plan
+    if not raw_plan:
+        raise ValidationError("Neo4j no devolvió un plan de ejecución")
+    return summarize_plan(raw_plan, profile)
+
+
+def _check_admission(summary: dict) -> None:
+    """
+    Rechaza la ejecución si el coste estimado supera el umbral configurado.
+
+    Raises:
+        ValidationError: Si la política de admisión rechaza el plan
+    """
+    if not is_admitted(summary):
+        raise ValidationError(
+            f"Consulta rechazada: coste estimado {summary['estimated_cost']:.0f} "
+            f"supera el máximo de {settings.EXECUTION_MAX_ESTIMATED_COST:.0f} "
+            "filas procesadas"
+        )
+
+
+async def _columnar_chunks(
+    stream: ResultStream, output_format: str
+) -> AsyncIterator[bytes]:
+    """
+    Codifica un flujo de resultados como Arrow IPC o Parquet por lotes.
+
+    Cada lote de fetch_size registros se convierte en un RecordBatch sin
+    pasar por JSON. Si el flujo se interrumpe no se escribe el final (fin de
+    IPC o pie de Parquet), así el cliente no confunde un resultado parcial
+    con uno completo.
+
+    Args:
+        stream: Flujo abierto con open_stream()
+        output_format: "arrow" o "parquet"
+
+    Yields:
+        Trozos binarios del fichero
+    """
+    writer = ColumnarWriter(output_format, stream.columns, serialize_value)
+    batch = []
+    async for row in stream.raw_rows():
+        batch.append(row)
+        if len(batch) >= stream.fetch_size:
+            yield writer.write(batch)
+            batch = []
+    if stream.cancelled:
+        return
+    chunk = writer.write(batch) + writer.close()
+    if chunk:
+        yield chunk
+
+
+async def _cancel_on_disconnect(
+    receive: Callable[[], Awaitable[dict]], stream: ResultStream
+) -> None:
+    """
+    Cancela la transacción de un flujo cuando el cliente HTTP se desconecta.
+
+    Args:
+        receive: Función receive de ASGI de la petición
+        stream: Flujo cuya transacción se cancela
+    """
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            stream.cancel()
+            return
+
+
+def serialize_value(value: Any) -> Any:
+    """
+    Convierte un valor devuelto por Neo4j a un tipo serializable en JSON.
+
+    Args:
+        value: Valor de un registro (nodo, relación, camino, lista, mapa,
+            tipos temporales o valores simples)
+
+    Returns:
+        Valor equivalente con solo dict, list, str, números, bool y None
+    """
+    if isinstance(value, Node):
+        return {
+            "element_id": value.element_id,
+            "labels": sorted(value.labels),
+            "properties": serialize_value(dict(value)),
+        }
+    if isinstance(value, Relationship):
+        return {
+            "element_id": value.element_id,
+            "type": value.type,
+            "start": value.start_node.element_id if value.start_node else None,
+            "end": value.end_node.element_id if value.end_node else None,
+            "properties": serialize_value(dict(value)),
+        }
+    if isinstance(value, Path):
+        return {
+            "nodes": [serialize_value(node) for node in value.nodes],
+            "relationships": [serialize_value(rel) for rel in value.relationships],
+        }
+    if isinstance(value, dict):
+        return {key: serialize_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [serialize_value(item) for item in value]
+    if hasattr(value, "iso_format"):
+        # Tipos temporales de Neo4j (Date, DateTime, Time, Duration)
+        return value.iso_format()
+    return value
+
+
+def encode_cursor(order_key: str, value: Any, element_id: str) -> str:
+    """
+    Codifica la posición de la última fila de una página en un cursor opaco.
+
+    Args:
+        order_key: Clave de ordenación usada en la página
+        value: Valor de la propiedad de ordenación (None si es elementId)
+        element_id: elementId del nodo, que desempata valores repetidos
+
+    Returns:
+        str: Cursor en base64 URL-safe
+    """
+    payload = json.dumps([order_key, value, element_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, order_key: str) -> tuple:
+    """
+    Decodifica un cursor creado con encode_cursor().
+
+    Args:
+        cursor: Cursor recibido del cliente
+        order_key: Clave de ordenación de la petición actual
+
+    Returns:
+        tuple: (valor de la propiedad, elementId) de la última fila
+
+    Raises:
+        ValidationError: Si el cursor está mal formado o se creó con otra clave
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key, value, element_id = json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError) as e:
+        raise ValidationError("Cursor de paginación inválido") from e
+    if key != order_key or not isinstance(element_id, str):
+        raise ValidationError("El cursor no corresponde a esta ordenación")
+    return value, element_id
+
+
+def paginate_cypher(
+    cypher: str, order_key: str, after: Optional[tuple], limit: int
+) -> tuple[str, dict]:
+    """
+    Reescribe un Cypher traducido para leer una página ordenada por clave.
+
+    Las filas se ordenan por la propiedad elegida y, para desempatar, por
+    elementId(n); con order_key="elementId" solo por elementId(n). La clave
+    se devuelve en columnas auxiliares (_cursor_value, _cursor_id) que
+    execute_page() retira de cada fila.
+
+    Neo4j coloca los nodos sin la propiedad (null) al final del ORDER BY y
+    cualquier comparación con null es null, así que la condición del cursor
+    trata ese tramo aparte: tras un valor no nulo siguen también los nulos, y
+    tras un nulo solo los nulos con elementId mayor.
+
+    Args:
+        cypher: Cypher generado por el traductor (MATCH / WHERE / RETURN)
+        order_key: "elementId" o nombre de una propiedad del nodo
+        after: (valor, elementId) de la última fila ya leída, o None
+        limit: Filas a devolver
+
+    Returns:
+        tuple: Cypher reescrito y parámetros de paginación
+
+    Raises:
+        ValidationError: Si la clave no es válida o el Cypher ya ordena o
+            limita sus resultados
+    """
+    if order_key != ELEMENT_ID_KEY and not _PROPERTY_NAME.fullmatch(order_key):
+        raise ValidationError(f"Clave de ordenación inválida: {order_key}")
+
+    lines = cypher.split("\n")
+    if not lines[-1].startswith("RETURN ") or any(
+        line.startswith(("ORDER BY", "SKIP", "LIMIT")) for line in lines
+    ):
+        raise ValidationError(
+            "Solo se pueden paginar consultas sin ORDER BY, SKIP ni LIMIT"
+        )
+    match_lines, return_line = lines[:-1], lines[-1]
+
+    parameters = {"page_limit": limit}
+    if order_key == ELEMENT_ID_KEY:
+        order_by = "elementId(n)"
+        returned = f"{return_line}, elementId(n) AS {_CURSOR_ELEMENT_ID}"
+        after_condition = "elementId(n) > $cursor_id"
+    else:
+        order_by = f"n.{order_key}, elementId(n)"
+        returned = (
+            f"{return_line}, n.{order_key} AS {_CURSOR_VALUE}, "
+            f"elementId(n) AS {_CURSOR_ELEMENT_ID}"
+        )
+        if after is not None and after[0] is None:
+            after_condition = f"(n.{order_key} IS NULL AND elementId(n) > $cursor_id)"
+        else:
+            after_condition = (
+                f"(n.{order_key} > $cursor_value OR "
+                f"(n.{order_key} = $cursor_value AND elementId(n) > $cursor_id) "
+                f"OR n.{order_key} IS NULL)"
+            )
+
+    if after is not None:
+        parameters["cursor_value"], parameters["cursor_id"] = after
+        if order_key == ELEMENT_ID_KEY or parameters["cursor_value"] is None:
+            del parameters["cursor_value"]
+        if len(match_lines) > 1 and match_lines[-1].startswith("WHERE "):
+            condition = match_lines[-1][len("WHERE ") :]
+            match_lines[-1] = f"WHERE ({condition}) AND {after_condition}"
+        else:
+            match_lines.append(f"WHERE {after_condition}")
+
+    rewritten = match_lines + [
+        returned,
+        f"ORDER BY {order_by}",
+        "LIMIT $page_limit",
+    ]
+    return "\n".join(rewritten), parameters
+
+
+def unwind_cypher(cypher: str) -> Optional[str]:
+    """
+    Reescribe un Cypher parametrizado para ejecutarlo una vez por fila de $rows.
+
+    Cada fila de `$rows` lleva los parámetros de una consulta y su posición
+    en `_index`. El Cypher original corre en un subquery
+    `CALL { WITH _row ... }` con `$param` sustituido por `_row.param`, de modo
+    que ORDER BY, SKIP y LIMIT siguen aplicándose a cada consulta por
+    separado. Cada fila devuelta incluye la columna auxiliar `_batch_index`.
+    Se usa la importación con WITH y no `CALL (_row) {...}`, que solo admite
+    Neo4j 5.23 o posterior.
+
+    Args:
+        cypher: Cypher parametrizado generado por el traductor
+
+    Returns:
+        Cypher reescrito, o None si la consulta no tiene un RETURN simple
+    """
+    lines = cypher.split("\n")
+    return_at = next(
+        (i for i, line in enumerate(lines) if line.startswith("RETURN ")), None
+    )
+    if return_at is None or lines[return_at].upper().startswith("RETURN DISTINCT "):
+        return None
+    columns = return_columns("\n".join(lines[: return_at + 1]))
+    if not columns:
+        return None
+
+    body = [_PARAMETER.sub(r"_row.\1", line) for line in lines]
+    names = ["`" + name.replace("`", "``") + "`" for name, _ in columns]
+    expressions = [_PARAMETER.sub(r"_row.\1", expression) for _, expression in columns]
+    body[return_at] = "RETURN " + ", ".join(
+        f"{expression} AS {name}"
+        for expression, name in zip(expressions, names, strict=True)
+    )
+    return "\n".join(
+        ["UNWIND $rows AS _row", "CALL {", "  WITH _row"]
+        + [f"  {line}" for line in body]
+        + ["}", f"RETURN _row._index AS {_BATCH_INDEX}, " + ", ".join(names)]
+    )
+
+
+def _set_outcomes(
+    outcomes: list,
+    targets: list,
+    rows: Optional[list] = None,
+    error_message: Optional[str] = None,
+    status: Optional[QueryStatus] = None,
+    elapsed: Optional[float] = None,
+) -> None:
+    """
+    Asigna el resultado de una sentencia a las consultas del lote que cubre.
+
+    Args:
+        outcomes: (filas, error, estado, ms) por posición en el lote
+        targets: Destinos de la sentencia (ver _batch_statements)
+        rows: Filas de cada destino, en el orden de `_batch_index`
+        error_message: Mensaje de error si la sentencia falló
+        status: Estado a registrar (None lo deduce del error)
+        elapsed: Milisegundos que tardó la sentencia
+    """
+    for position, (_, items) in enumerate(targets):
+        for index in items:
+            outcomes[index] = (
+                rows[position] if rows else [],
+                error_message,
+                status,
+                elapsed,
+            )
+
+
+def _batch_statements(queries: list[Query], unwind: bool) -> list[tuple]:
+    """
+    Agrupa las consultas de un lote en las sentencias a enviar a Neo4j.
+
+    Args:
+        queries: Consultas del lote en orden
+        unwind: Reescribir con unwind_cypher() las que comparten Cypher
+
+    Returns:
+        list: (cypher, parámetros, destinos) por sentencia, donde destinos
+            son pares (parámetros, posiciones de las consultas en el lote)
+            en el orden de `_batch_index`
+    """
+    groups: OrderedDict = OrderedDict()
+    for index, query in enumerate(queries):
+        cypher, _ = ExecutionService.apply_row_limit(query.cypher_query)
+        parameters = query.cypher_parameters or {}
+        key = json.dumps(parameters, sort_keys=True, default=str)
+        targets = groups.setdefault(cypher, OrderedDict())
+        targets.setdefault(key, (parameters, []))[1].append(index)
+
+    statements = []
+    for cypher, targets in groups.items():
+        targets = list(targets.values())
+        rewritten = unwind_cypher(cypher) if unwind and len(targets) > 1 else None
+        if rewritten is None:
+            statements.extend(
+                (cypher, parameters, [(parameters, items)])
+                for parameters, items in targets
+            )
+            continue
+        rows = [
+            {**parameters, "_index": position}
+            for position, (parameters, _) in enumerate(targets)
+        ]
+        statements.append((rewritten, {"rows": rows}, targets))
+    return statements
+
+
+def _error_status(error: Exception) -> QueryStatus:
+    """Estado de Query correspondiente a un error de ejecución ya traducido."""
+    if isinstance(error, QueryTimeoutError):
+        return QueryStatus.TIEMPO_AGOTADO
+    return QueryStatus.FALLIDO
+
+
+def _execution_error(error: Exception) -> Exception:
+    """
+    Traduce un error del driver de Neo4j a una excepción HTTP.
+
+    Args:
+        error: Excepción producida al ejecutar o leer la consulta
+
+    Returns:
+        QueryTimeoutError si se agotó el tiempo límite, DatabaseConnectionError
+        para errores de conexión o autenticación y ValidationError para
+        errores de la consulta
+    """
+    if isinstance(error, (ValidationError, DatabaseConnectionError, QueryTimeoutError)):
+        return error
+    if isinstance(error, TimeoutError) or (
+        isinstance(error, Neo4jError) and "TransactionTimedOut" in (error.code or "")
+    ):
+        return QueryTimeoutError("La consulta excedió el tiempo límite de ejecución")
+    if isinstance(error, (AuthError, DriverError)):
+        return DatabaseConnectionError("No se puede conectar con Neo4j")
+    if isinstance(error, Neo4jError):
+        return ValidationError(f"Error de Neo4j: {error.message}")
+    return DatabaseConnectionError(
+        f"Error inesperado durante la ejecución: {type(error).__name__}"
+    )
@@ -0,0 +1,263 @@
+"""
+Servicio de exportación columnar de resultados de ejecución.
+
+Convierte los registros de Neo4j en lotes de Apache Arrow (RecordBatch) a
+medida que llegan del cursor, sin pasar por JSON, y los escribe como:
+- "arrow": flujo Arrow IPC (application/vnd.apache.arrow.stream), legible
+  con pyarrow.ipc.open_stream() o pandas sin copiar los datos
+- "parquet": fichero Parquet con un row group por lote
+
+El esquema se fija con el primer lote: los nombres y el orden de columnas
+salen del RETURN del Cypher traducido y los tipos de los valores de ese
+lote (booleanos, enteros, reales, textos, fechas y fechas con hora). Los
+nodos, relaciones, caminos, listas y mapas se guardan como texto JSON.
+"""
+
+import io
+import json
+import re
+from datetime import date, datetime, timezone
+from typing import Any, Callable, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from app.core.exceptions import ValidationError
+
+# Tipo MIME de cada formato columnar
+COLUMNAR_MEDIA_TYPES = {
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet",
+}
+# Extensión de fichero de cada formato columnar
+COLUMNAR_EXTENSIONS = {"arrow": "arrows", "parquet": "parquet"}
+
+_ALIAS = re.compile(r"^(.*\S)\s+AS\s+(\w+)$", re.IGNORECASE | re.DOTALL)
+_VARIABLE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+def return_columns(cypher: Optional[str]) -> Optional[list[tuple[str, str]]]:
+    """
+    Obtiene las columnas del RETURN final de un Cypher.
+
+    Args:
+        cypher: Consulta Cypher traducida
+
+    Returns:
+        list: Pares (nombre de columna, expresión) en orden, o None si la
+            consulta no termina en un RETURN reconocible
+    """
+    lines = (cypher or "").strip().splitlines()
+    if not lines or not lines[-1].upper().startswith("RETURN "):
+        return None
+    clause = lines[-1][len("RETURN ") :].strip()
+    if clause.upper().startswith("DISTINCT "):
+        clause = clause[len("DISTINCT ") :].strip()
+
+    items, depth, current, quote = [], 0, [], None
+    for char in clause:
+        if quote:
+            quote = None if char == quote else quote
+        elif char in "'\"`":
+            quote = char
+        elif char in "([{":
+            depth += 1
+        elif char in ")]}":
+            depth -= 1
+        elif char == "," and depth == 0:
+            items.append("".join(current).strip())
+            current = []
+            continue
+        current.append(char)
+    items.append("".join(current).strip())
+
+    columns = []
+    for item in items:
+        alias = _ALIAS.match(item)
+        if alias:
+            columns.append((alias.group(2), alias.group(1).strip()))
+        else:
+            columns.append((item, item))
+    return columns
+
+
+def _value_type(value: Any) -> Optional[pa.DataType]:
+    """Tipo Arrow de un valor escalar, o None si se guarda como JSON."""
+    if isinstance(value, bool):
+        return pa.bool_()
+    if isinstance(value, int):
+        return pa.int64()
+    if isinstance(value, float):
+        return pa.float64()
+    if isinstance(value, str):
+        return pa.string()
+    native = value.to_native() if hasattr(value, "to_native") else value
+    if isinstance(native, datetime):
+        return pa.timestamp("us", tz="UTC" if native.tzinfo else None)
+    if isinstance(native, date):
+        return pa.date32()
+    return None
+
+
+def infer_schema(columns: list[tuple[str, str]], rows: list[dict]) -> pa.Schema:
+    """
+    Deduce el esquema Arrow de un resultado a partir de su primer lote.
+
+    Una columna que es una variable del patrón (p. ej. `RETURN n`) contiene
+    nodos y se guarda como JSON. Las demás toman el tipo de sus valores; si
+    mezclan enteros y reales se usa float64, y si no tienen valores o mezclan
+    otros tipos, texto.
+
+    Args:
+        columns: Pares (nombre, expresión) de return_columns()
+        rows: Registros del primer lote con sus valores originales
+
+    Returns:
+        pa.Schema: Esquema con un campo anulable por columna
+    """
+    fields = []
+    for name, expression in columns:
+        types = set()
+        if not _VARIABLE.fullmatch(expression):
+            for row in rows:
+                value = row.get(name)
+                if value is not None:
+                    types.add(_value_type(value))
+        if types == {pa.int64(), pa.float64()}:
+            types = {pa.float64()}
+        if len(types) == 1 and None not in types:
+            arrow_type, encoding = types.pop(), None
+        else:
+            arrow_type, encoding = pa.string(), "json"
+        metadata = {"expression": expression}
+        if encoding:
+            metadata["encoding"] = encoding
+        fields.append(pa.field(name, arrow_type, nullable=True, metadata=metadata))
+    return pa.schema(fields)
+
+
+class _DrainingSink(io.RawIOBase):
+    """Destino de escritura que acumula bytes hasta que se recogen.
+
+    tell() devuelve la posición absoluta, que Parquet necesita para los
+    desplazamientos de su pie aunque los bytes ya se hayan enviado.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._parts = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._parts.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        """Devuelve y descarta los bytes escritos desde la última llamada."""
+        data = b"".join(self._parts)
+        self._parts = []
+        return data
+
+
+class ColumnarWriter:
+    """Codifica lotes de registros como Arrow IPC o Parquet."""
+
+    def __init__(
+        self,
+        output_format: str,
+        columns: Optional[list[tuple[str, str]]],
+        serialize: Callable[[Any], Any],
+    ):
+        """
+        Prepara el escritor; el esquema se fija con el primer lote.
+
+        Args:
+            output_format: "arrow" o "parquet"
+            columns: Columnas del RETURN (None las toma del primer registro)
+            serialize: Conversión de valores de Neo4j a tipos JSON, para las
+                columnas que se guardan como texto JSON
+        """
+        self.output_format = output_format
+        self.columns = columns
+        self.serialize = serialize
+        self.schema = None
+        self._sink = _DrainingSink()
+        self._writer = None
+
+    def _open(self, rows: list[dict]) -> None:
+        if self.columns is None:
+            self.columns = [(name, name) for name in (rows[0] if rows else {})]
+        self.schema = infer_schema(self.columns, rows)
+        if self.output_format == "parquet":
+            self._writer = pq.ParquetWriter(self._sink, self.schema)
+        else:
+            self._writer = pa.ipc.new_stream(self._sink, self.schema)
+
+    def _column(self, field: pa.Field, rows: list[dict]) -> pa.Array:
+        values = [row.get(field.name) for row in rows]
+        if field.metadata and field.metadata.get(b"encoding") == b"json":
+            values = [
+                (
+                    None
+                    if value is None
+                    else json.dumps(
+                        self.serialize(value), ensure_ascii=False, default=str
+                    )
+                )
+                for value in values
+            ]
+        elif pa.types.is_temporal(field.type):
+            values = [_native_temporal(value) for value in values]
+        try:
+            return pa.array(values, type=field.type)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError) as e:
+            raise ValidationError(
+                f"La columna '{field.name}' cambia de tipo a mitad del resultado "
+                f"(esperado {field.type})"
+            ) from e
+
+    def write(self, rows: list[dict]) -> bytes:
+        """
+        Codifica un lote de registros.
+
+        Args:
+            rows: Registros con sus valores originales de Neo4j
+
+        Returns:
+            bytes: Datos listos para enviar (el esquema va con el primer lote)
+
+        Raises:
+            ValidationError: Si un valor no encaja en el tipo de su columna
+        """
+        if self._writer is None:
+            self._open(rows)
+        if rows:
+            arrays = [self._column(field, rows) for field in self.schema]
+            self._writer.write_batch(
+                pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+            )
+        return self._sink.drain()
+
+    def close(self) -> bytes:
+        """Termina el flujo (fin de IPC o pie de Parquet) y devuelve lo pendiente."""
+        if self._writer is None:
+            self._open([])
+        self._writer.close()
+        return self._sink.drain()
+
+
+def _native_temporal(value: Any) -> Any:
+    """Convierte fechas de Neo4j a datetime/date de Python (UTC si hay zona)."""
+    if hasattr(value, "to_native"):
+        value = value.to_native()
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value
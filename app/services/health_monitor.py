@@ -0,0 +1,268 @@
+"""
+Monitor en segundo plano del estado de las conexiones guardadas.
+
+Prueba periódicamente todas las conexiones `Connection` y guarda en memoria
+su último estado y un historial acotado de latencias, de modo que listar las
+conexiones no necesita ninguna llamada de red:
+- Cada conexión se prueba cada HEALTH_MONITOR_INTERVAL_SECONDS con un
+  desfase aleatorio (jitter) para repartir las pruebas en el tiempo
+- Las conexiones que fallan se prueban con espera exponencial, hasta
+  HEALTH_MONITOR_MAX_BACKOFF_SECONDS
+- Las pruebas reutilizan el pool de SQL Server o el driver de Neo4j de la
+  conexión si ya existe; si no, abren una conexión propia y la cierran
+- Si cambian los datos de una conexión su historial se descarta y se
+  vuelve a probar enseguida
+"""
+
+import asyncio
+import logging
+import math
+import random
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Callable, Optional
+
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.connection import Connection
+from app.services.connection_service import ConnectionService, sql_server_pools
+
+logger = logging.getLogger(__name__)
+
+# Estados de una conexión probada
+STATUS_UP = "up"
+STATUS_DOWN = "down"
+
+
+def _percentile(sorted_samples: list[float], fraction: float) -> float:
+    """Percentil por el método del rango más cercano."""
+    index = max(
+        0,
+        min(len(sorted_samples) - 1, math.ceil(fraction * len(sorted_samples)) - 1),
+    )
+    return sorted_samples[index]
+
+
+def _fingerprint(connection: Connection) -> tuple:
+    """Datos de la conexión de los que depende su estado."""
+    return (
+        connection.db_type,
+        connection.host,
+        connection.port,
+        connection.db_user,
+        connection.db_password,
+        connection.database_name,
+    )
+
+
+class _HealthRecord:
+    """Estado conocido de una conexión."""
+
+    def __init__(self, fingerprint: tuple, history_size: int):
+        self.fingerprint = fingerprint
+        self.status: Optional[str] = None
+        self.message: Optional[str] = None
+        self.checked_at: Optional[datetime] = None
+        self.last_success_at: Optional[datetime] = None
+        self.latency_ms: Optional[float] = None
+        self.consecutive_failures = 0
+        self.latencies: deque = deque(maxlen=history_size)
+        # Instante (time.monotonic()) de la próxima prueba
+        self.next_check = 0.0
+
+
+class ConnectionHealthMonitor:
+    """Programador de pruebas periódicas de conexiones con estado en memoria."""
+
+    def __init__(
+        self,
+        interval: float,
+        jitter: float,
+        max_backoff: float,
+        history_size: int,
+        session_factory: Callable[[], Session] = SessionLocal,
+    ):
+        """
+        Inicializa el monitor sin estado ni tarea en marcha.
+
+        Args:
+            interval: Segundos entre pruebas de una conexión que responde
+            jitter: Fracción de desfase aleatorio del intervalo (0.2 = ±20 %)
+            max_backoff: Segundos máximos entre pruebas de una conexión que
+                falla
+            history_size: Latencias guardadas por conexión
+            session_factory: Crea las sesiones con las que se leen las
+                conexiones guardadas
+        """
+        self.interval = interval
+        self.jitter = jitter
+        self.max_backoff = max_backoff
+        self.history_size = history_size
+        self.session_factory = session_factory
+        self.random = random.Random()
+        self._records: dict[int, _HealthRecord] = {}
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self.probes = 0
+
+    def _delay(self, failures: int) -> float:
+        """Segundos hasta la siguiente prueba, con espera exponencial y jitter."""
+        delay = self.interval
+        if failures:
+            delay = min(self.interval * 2**failures, self.max_backoff)
+        return delay * self.random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def _load_connections(self) -> list[Connection]:
+        """Lee todas las conexiones guardadas (bloqueante)."""
+        db = self.session_factory()
+        try:
+            return db.query(Connection).all()
+        finally:
+            db.close()
+
+    def _due(self, connections: list[Connection], now: float) -> list[Connection]:
+        """Sincroniza los registros con las conexiones y devuelve las pendientes."""
+        due = []
+        with self._lock:
+            current = {connection.connection_id for connection in connections}
+            for connection_id in list(self._records):
+                if connection_id not in current:
+                    del self._records[connection_id]
+            for connection in connections:
+                fingerprint = _fingerprint(connection)
+                record = self._records.get(connection.connection_id)
+                if record is None or record.fingerprint != fingerprint:
+                    record = _HealthRecord(fingerprint, self.history_size)
+                    self._records[connection.connection_id] = record
+                if record.next_check <= now:
+                    due.append(connection)
+        return due
+
+    def _record(self, connection_id: int, result: dict) -> None:
+        """Guarda el resultado de una prueba y programa la siguiente."""
+        checked_at = datetime.now(timezone.utc)
+        with self._lock:
+            record = self._records.get(connection_id)
+            if record is None:
+                return
+            record.checked_at = checked_at
+            record.message = result["message"]
+            record.latency_ms = result["connection_time_ms"]
+            if result["success"]:
+                record.status = STATUS_UP
+                record.last_success_at = checked_at
+                record.consecutive_failures = 0
+                record.latencies.append(result["connection_time_ms"])
+            else:
+                record.status = STATUS_DOWN
+                record.consecutive_failures += 1
+            record.next_check = time.monotonic() + self._delay(
+                record.consecutive_failures
+            )
+            self.probes += 1
+
+    async def check_due(self, connections: Optional[list[Connection]] = None) -> int:
+        """
+        Prueba las conexiones a las que les toca.
+
+        Args:
+            connections: Conexiones guardadas (por defecto se leen todas)
+
+        Returns:
+            Número de conexiones probadas
+        """
+        if connections is None:
+            connections = await run_in_threadpool(self._load_connections)
+        due = self._due(connections, time.monotonic())
+        async for result in ConnectionService.check_connections(due):
+            self._record(result["connection_id"], result)
+        return len(due)
+
+    def _sleep_seconds(self) -> float:
+        """Espera hasta la próxima prueba pendiente (entre 1 s y el intervalo)."""
+        with self._lock:
+            upcoming = [record.next_check for record in self._records.values()]
+        if not upcoming:
+            return self.interval
+        return min(max(min(upcoming) - time.monotonic(), 1.0), self.interval)
+
+    async def _run(self) -> None:
+        """Bucle del monitor: prueba las conexiones pendientes y espera."""
+        while True:
+            try:
+                # De paso se cierran los pools de SQL Server sin uso, aunque
+                # no llegue ninguna lectura nueva que lo haga
+                await run_in_threadpool(sql_server_pools.reap_idle)
+                await self.check_due()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # Un fallo en una pasada no detiene el monitor, pero se registra
+                logger.exception("Error en la pasada del monitor de conexiones")
+            await asyncio.sleep(self._sleep_seconds())
+
+    def start(self) -> None:
+        """Arranca el monitor en el bucle de eventos actual."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Detiene el monitor y espera a que termine la pasada en curso."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def snapshot(self, connection_id: int) -> Optional[dict]:
+        """
+        Devuelve el último estado conocido de una conexión.
+
+        Args:
+            connection_id: ID de la conexión
+
+        Returns:
+            dict: status ("up" o "down"), message, checked_at,
+                last_success_at, latency_ms, consecutive_failures, samples y
+                percentiles p50_ms, p95_ms y p99_ms de las pruebas correctas;
+                None si aún no se ha probado
+        """
+        with self._lock:
+            record = self._records.get(connection_id)
+            if record is None or record.status is None:
+                return None
+            latencies = sorted(record.latencies)
+            snapshot = {
+                "status": record.status,
+                "message": record.message,
+                "checked_at": record.checked_at,
+                "last_success_at": record.last_success_at,
+                "latency_ms": record.latency_ms,
+                "consecutive_failures": record.consecutive_failures,
+                "samples": len(latencies),
+            }
+        for name, fraction in (("p50_ms", 0.50), ("p95_ms", 0.95), ("p99_ms", 0.99)):
+            snapshot[name] = _percentile(latencies, fraction) if latencies else None
+        return snapshot
+
+    def clear(self) -> None:
+        """Olvida el estado de todas las conexiones."""
+        with self._lock:
+            self._records.clear()
+
+
+# Monitor compartido por toda la aplicación
+health_monitor = ConnectionHealthMonitor(
+    interval=settings.HEALTH_MONITOR_INTERVAL_SECONDS,
+    jitter=settings.HEALTH_MONITOR_JITTER,
+    max_backoff=settings.HEALTH_MONITOR_MAX_BACKOFF_SECONDS,
+    history_size=settings.HEALTH_MONITOR_HISTORY_SIZE,
+)
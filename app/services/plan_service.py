@@ -0,0 +1,141 @@
+"""
+Servicio de análisis de planes de ejecución de Neo4j.
+
+Convierte el plan que Neo4j devuelve para EXPLAIN o PROFILE (metadatos
+"plan"/"profile" del resumen del resultado) en un árbol serializable y un
+resumen de coste:
+- estimated_rows: filas estimadas que produce la consulta
+- estimated_cost: suma de las filas estimadas de todos los operadores, una
+  aproximación del trabajo total que sirve para la política de admisión
+- db_hits y rows: accesos a la base de datos y filas reales (solo PROFILE)
+- warnings: recorridos completos de etiquetas que un índice evitaría
+
+Con EXECUTION_MAX_ESTIMATED_COST > 0 las ejecuciones cuyo coste estimado lo
+supera se rechazan antes de lanzarlas.
+"""
+
+from datetime import datetime, timezone
+from typing import Optional
+
+from app.core.config import settings
+
+# Operadores que leen todos los nodos (de una etiqueta o de la base entera)
+_FULL_SCAN_OPERATORS = {"AllNodesScan", "NodeByLabelScan"}
+# Operadores que filtran las filas recibidas de sus hijos
+_FILTER_OPERATORS = {"Filter"}
+
+
+def _operator_name(raw_plan: dict) -> str:
+    """Nombre del operador sin el sufijo del runtime (p. ej. "@neo4j")."""
+    return raw_plan.get("operatorType", "").split("@", 1)[0]
+
+
+def build_plan_tree(raw_plan: dict) -> dict:
+    """
+    Convierte un plan crudo de Neo4j en un árbol serializable.
+
+    Args:
+        raw_plan: Plan tal como lo devuelve el driver (summary.plan o
+            summary.profile)
+
+    Returns:
+        dict: operator, details, identifiers, estimated_rows, db_hits, rows
+            y children (db_hits y rows son None con EXPLAIN)
+    """
+    args = raw_plan.get("args", {})
+    return {
+        "operator": _operator_name(raw_plan),
+        "details": args.get("Details"),
+        "identifiers": list(raw_plan.get("identifiers", [])),
+        "estimated_rows": float(args.get("EstimatedRows", 0.0)),
+        "db_hits": raw_plan.get("dbHits"),
+        "rows": raw_plan.get("rows"),
+        "children": [build_plan_tree(child) for child in raw_plan.get("children", [])],
+    }
+
+
+def _walk(node: dict, filtered: bool = False):
+    """Recorre el árbol indicando si algún antecesor filtra las filas."""
+    yield node, filtered
+    filtered = filtered or node["operator"] in _FILTER_OPERATORS
+    for child in node["children"]:
+        yield from _walk(child, filtered)
+
+
+def plan_warnings(tree: dict) -> list[str]:
+    """
+    Detecta recorridos completos que un índice podría evitar.
+
+    Un NodeByLabelScan o AllNodesScan bajo un Filter indica que el predicado
+    se evalúa nodo a nodo: no hay índice sobre la propiedad filtrada.
+
+    Args:
+        tree: Árbol devuelto por build_plan_tree()
+
+    Returns:
+        list[str]: Avisos legibles, uno por recorrido
+    """
+    warnings = []
+    for node, filtered in _walk(tree):
+        if node["operator"] not in _FULL_SCAN_OPERATORS or not filtered:
+            continue
+        target = node["details"] or ", ".join(node["identifiers"])
+        if node["operator"] == "AllNodesScan":
+            warnings.append(
+                f"Recorrido de todos los nodos ({target}) filtrado sin índice"
+            )
+        else:
+            warnings.append(
+                f"Recorrido por etiqueta sin índice ({target}): crear un índice "
+                "sobre la propiedad filtrada evitaría leer todos los nodos"
+            )
+    return warnings
+
+
+def summarize_plan(raw_plan: dict, profile: bool = False) -> dict:
+    """
+    Resume un plan de Neo4j para guardarlo junto a la consulta.
+
+    Args:
+        raw_plan: Plan crudo devuelto por el driver
+        profile: True si el plan procede de PROFILE (con métricas reales)
+
+    Returns:
+        dict: mode, plan (árbol), estimated_rows, estimated_cost, db_hits,
+            rows, operators, warnings y captured_at
+    """
+    tree = build_plan_tree(raw_plan)
+    nodes = [node for node, _ in _walk(tree)]
+    return {
+        "mode": "PROFILE" if profile else "EXPLAIN",
+        "plan": tree,
+        "estimated_rows": tree["estimated_rows"],
+        "estimated_cost": sum(node["estimated_rows"] for node in nodes),
+        "db_hits": sum(node["db_hits"] or 0 for node in nodes) if profile else None,
+        "rows": tree["rows"] if profile else None,
+        "operators": len(nodes),
+        "warnings": plan_warnings(tree),
+        "captured_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def is_admitted(summary: dict, max_cost: Optional[float] = None) -> bool:
+    """
+    Aplica la política de admisión a un plan resumido.
+
+    Args:
+        summary: Resumen devuelto por summarize_plan()
+        max_cost: Coste estimado máximo (por defecto
+            EXECUTION_MAX_ESTIMATED_COST; 0 o menos no limita)
+
+    Returns:
+        bool: True si la consulta puede ejecutarse
+    """
+    if max_cost is None:
+        max_cost = settings.EXECUTION_MAX_ESTIMATED_COST
+    return max_cost <= 0 or summary["estimated_cost"] <= max_cost
+
+
+def plan_record(summary: dict) -> dict:
+    """Resumen sin el árbol completo, para guardarlo en el historial."""
+    return {key: value for key, value in summary.items() if key != "plan"}
@@ -0,0 +1,207 @@
+"""Introspección del esquema de las conexiones SQL Server guardadas.
+
+Lee de INFORMATION_SCHEMA las tablas y vistas, sus columnas, claves
+primarias y claves foráneas con una conexión del pool de la conexión
+guardada, y construye el catálogo que usa el traductor para resolver
+labels y propiedades. Los catálogos se guardan en la caché de esquemas
+(memoria y disco).
+"""
+
+from datetime import datetime, timezone
+
+import pyodbc
+
+from app.core.exceptions import DatabaseConnectionError, ValidationError
+from app.core.parser.schema import (
+    ColumnSchema,
+    ForeignKey,
+    SchemaCatalog,
+    TableSchema,
+)
+from app.core.schema_cache import schema_cache
+from app.models.connection import Connection, DatabaseType
+from app.services.connection_service import (
+    ConnectionService,
+    _sql_server_error_message,
+)
+
+# Consultas de introspección. Solo usan INFORMATION_SCHEMA (SQL estándar),
+# así que no dependen de la versión de SQL Server.
+_TABLES_SQL = """
+SELECT TABLE_SCHEMA, TABLE_NAME
+FROM INFORMATION_SCHEMA.TABLES
+WHERE TABLE_TYPE IN ('BASE TABLE', 'VIEW')
+"""
+
+_COLUMNS_SQL = """
+SELECT TABLE_SCHEMA, TABLE_NAME, COLUMN_NAME, DATA_TYPE, IS_NULLABLE
+FROM INFORMATION_SCHEMA.COLUMNS
+ORDER BY TABLE_SCHEMA, TABLE_NAME, ORDINAL_POSITION
+"""
+
+_PRIMARY_KEYS_SQL = """
+SELECT kcu.TABLE_SCHEMA, kcu.TABLE_NAME, kcu.COLUMN_NAME
+FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS tc
+JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE kcu
+  ON kcu.CONSTRAINT_SCHEMA = tc.CONSTRAINT_SCHEMA
+ AND kcu.CONSTRAINT_NAME = tc.CONSTRAINT_NAME
+WHERE tc.CONSTRAINT_TYPE = 'PRIMARY KEY'
+ORDER BY kcu.TABLE_SCHEMA, kcu.TABLE_NAME, kcu.ORDINAL_POSITION
+"""
+
+# Las columnas de una clave foránea y las de la clave que referencia se
+# emparejan por su posición dentro de cada restricción
+_FOREIGN_KEYS_SQL = """
+SELECT fk.CONSTRAINT_NAME, fk.TABLE_SCHEMA, fk.TABLE_NAME, fk.COLUMN_NAME,
+       pk.TABLE_SCHEMA, pk.TABLE_NAME, pk.COLUMN_NAME
+FROM INFORMATION_SCHEMA.REFERENTIAL_CONSTRAINTS rc
+JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE fk
+  ON fk.CONSTRAINT_SCHEMA = rc.CONSTRAINT_SCHEMA
+ AND fk.CONSTRAINT_NAME = rc.CONSTRAINT_NAME
+JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE pk
+  ON pk.CONSTRAINT_SCHEMA = rc.UNIQUE_CONSTRAINT_SCHEMA
+ AND pk.CONSTRAINT_NAME = rc.UNIQUE_CONSTRAINT_NAME
+ AND pk.ORDINAL_POSITION = fk.ORDINAL_POSITION
+ORDER BY fk.TABLE_SCHEMA, fk.TABLE_NAME, fk.CONSTRAINT_NAME, fk.ORDINAL_POSITION
+"""
+
+
+def _fetch_all(conn, sql: str) -> list:
+    """Ejecuta una consulta de introspección y devuelve todas sus filas."""
+    cursor = conn.cursor()
+    try:
+        cursor.execute(sql)
+        return cursor.fetchall()
+    finally:
+        cursor.close()
+
+
+def introspect_sql_server(connection: Connection) -> SchemaCatalog:
+    """Lee el esquema de una conexión SQL Server guardada.
+
+    Args:
+        connection: Conexión SQL Server ya validada (existencia y ownership)
+
+    Returns:
+        Catálogo con las tablas, columnas y claves de la base de datos
+
+    Raises:
+        DatabaseConnectionError: Si no se puede conectar o leer el esquema
+    """
+    with ConnectionService.sql_server_connection(connection) as conn:
+        try:
+            tables = _fetch_all(conn, _TABLES_SQL)
+            columns = _fetch_all(conn, _COLUMNS_SQL)
+            primary_keys = _fetch_all(conn, _PRIMARY_KEYS_SQL)
+            foreign_keys = _fetch_all(conn, _FOREIGN_KEYS_SQL)
+        except pyodbc.Error as e:
+            raise DatabaseConnectionError(
+                f"No se pudo leer el esquema: {_sql_server_error_message(e)}"
+            ) from e
+
+    keys = [(schema, name) for schema, name in tables]
+    table_columns = {key: [] for key in keys}
+    for schema, table, name, data_type, nullable in columns:
+        if (schema, table) in table_columns:
+            table_columns[(schema, table)].append(
+                ColumnSchema(name=name, data_type=data_type, nullable=nullable == "YES")
+            )
+
+    table_primary_keys = {key: [] for key in keys}
+    for schema, table, name in primary_keys:
+        if (schema, table) in table_primary_keys:
+            table_primary_keys[(schema, table)].append(name)
+
+    # Agrupar las columnas de cada clave foránea conservando su orden
+    grouped = {}
+    for (
+        name,
+        schema,
+        table,
+        column,
+        referenced_schema,
+        referenced_table,
+        referenced_column,
+    ) in foreign_keys:
+        entry = grouped.setdefault(
+            (schema, table, name),
+            {
+                "referenced": (referenced_schema, referenced_table),
+                "columns": [],
+                "referenced_columns": [],
+            },
+        )
+        entry["columns"].append(column)
+        entry["referenced_columns"].append(referenced_column)
+    table_foreign_keys = {key: [] for key in keys}
+    for (schema, table, name), entry in grouped.items():
+        if (schema, table) in table_foreign_keys:
+            table_foreign_keys[(schema, table)].append(
+                ForeignKey(
+                    name=name,
+                    columns=tuple(entry["columns"]),
+                    referenced_schema=entry["referenced"][0],
+                    referenced_table=entry["referenced"][1],
+                    referenced_columns=tuple(entry["referenced_columns"]),
+                )
+            )
+
+    return SchemaCatalog(
+        [
+            TableSchema(
+                schema=schema,
+                name=name,
+                columns=table_columns[(schema, name)],
+                primary_key=tuple(table_primary_keys[(schema, name)]),
+                foreign_keys=tuple(table_foreign_keys[(schema, name)]),
+            )
+            for schema, name in keys
+        ]
+    )
+
+
+class SchemaService:
+    """Servicio para obtener el esquema de las conexiones SQL Server."""
+
+    @staticmethod
+    def get_catalog(connection: Connection, refresh: bool = False) -> SchemaCatalog:
+        """Obtiene el catálogo de una conexión, de la caché si es posible.
+
+        Args:
+            connection: Conexión ya validada (existencia y ownership)
+            refresh: Si True, se vuelve a leer de la base de datos
+
+        Returns:
+            Catálogo del esquema
+
+        Raises:
+            ValidationError: Si la conexión no es de SQL Server
+            DatabaseConnectionError: Si no se puede leer el esquema
+        """
+        return SchemaService.get_catalog_info(connection, refresh)[0]
+
+    @staticmethod
+    def get_catalog_info(
+        connection: Connection, refresh: bool = False
+    ) -> tuple[SchemaCatalog, datetime]:
+        """Obtiene el catálogo de una conexión y el momento en que se leyó.
+
+        Args:
+            connection: Conexión ya validada (existencia y ownership)
+            refresh: Si True, se vuelve a leer de la base de datos
+
+        Returns:
+            (catálogo, fecha de la lectura en UTC)
+
+        Raises:
+            ValidationError: Si la conexión no es de SQL Server
+            DatabaseConnectionError: Si no se puede leer el esquema
+        """
+        if connection.db_type != DatabaseType.SQL_SERVER:
+            raise ValidationError(
+                "El esquema solo se puede leer de conexiones SQL Server"
+            )
+        catalog, introspected_at = schema_cache.get(
+            connection, introspect_sql_server, refresh=refresh
+        )
+        return catalog, datetime.fromtimestamp(introspected_at, tz=timezone.utc)
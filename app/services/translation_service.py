@@ -3,15 +3,28 @@ Servicio de traducción de SQL a Cypher.
 
 Gestiona la lógica de negocio para la traducción de consultas SQL a Cypher,
 incluyendo validación, sanitización, logging y persistencia.
+
+Las traducciones pueden usar el catálogo del esquema de una conexión SQL
+Server de origen; la versión del catálogo forma parte de la clave de caché,
+así que un cambio de esquema nunca sirve traducciones anteriores.
 """
 
-import re
 import time
 from typing import Optional
 
 from sqlalchemy.orm import Session
 
-from app.core.parser.visitor import translate_sql_to_cypher
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.core.parser.engine import get_parser_engine
+from app.core.parser.executor import (
+    TranslationTimeoutError,
+    get_translation_executor,
+)
+from app.core.parser.generated.SQLSimpleLexer import SQLSimpleLexer
+from app.core.parser.normalizer import normalize_token_shape, normalize_tokens
+from app.core.parser.schema import SchemaCatalog
+from app.core.parser.visitor import sql_literal_to_python, translate_sql_to_cypher
 from app.models.query import Query, QueryStatus
 
 
@@ -40,6 +53,21 @@ class TranslationService:
     # Longitud máxima de consulta (protección contra DoS)
     MAX_QUERY_LENGTH = 5000
 
+    # Tipos de token del lexer para las palabras clave peligrosas
+    _DANGEROUS_TOKEN_TYPES = frozenset(
+        getattr(SQLSimpleLexer, keyword) for keyword in DANGEROUS_KEYWORDS
+    )
+
+    # Caché de traducciones exitosas indexada por la consulta normalizada
+    _cache = LRUCache(
+        max_entries=(
+            settings.TRANSLATION_CACHE_MAX_ENTRIES
+            if settings.TRANSLATION_CACHE_ENABLED
+            else 0
+        ),
+        max_bytes=settings.TRANSLATION_CACHE_MAX_BYTES,
+    )
+
     @classmethod
     def validate_sql_query(cls, sql_query: str) -> dict:
         """
@@ -65,13 +93,16 @@ class TranslationService:
                 ),
             }
 
-        # Convertir a mayúsculas para verificación
-        sql_upper = sql_query.upper()
+        # Tokenizar una sola vez: el parser reutilizará estos mismos tokens.
+        # El lexer ya descarta comentarios y agrupa los literales de cadena,
+        # así que sus palabras nunca se confunden con palabras clave.
+        tokens = get_parser_engine().tokenize(sql_query)
 
-        # Verificar palabras clave peligrosas
-        for keyword in cls.DANGEROUS_KEYWORDS:
-            # Usar palabra completa con límites de palabra
-            if re.search(rf"\b{keyword}\b", sql_upper):
+        # Buscar la primera palabra clave peligrosa. Esto cubre también los
+        # patrones de inyección del tipo "; DROP ...".
+        for token in tokens:
+            if token.type in cls._DANGEROUS_TOKEN_TYPES:
+                keyword = SQLSimpleLexer.symbolicNames[token.type]
                 return {
                     "valid": False,
                     "error": (
@@ -81,20 +112,12 @@ class TranslationService:
                 }
 
         # Verificar que sea un SELECT
-        if not re.match(r"^\s*SELECT\b", sql_upper):
+        if tokens[0].type != SQLSimpleLexer.SELECT:
             return {
                 "valid": False,
                 "error": "Solo se soportan consultas SELECT",
             }
 
-        # Validación de caracteres peligrosos (inyección)
-        # Permitimos comillas simples para strings, pero detectamos patrones sospechosos
-        if re.search(r";\s*(DROP|DELETE|UPDATE|INSERT)", sql_upper):
-            return {
-                "valid": False,
-                "error": "Patrón de consulta sospechoso detectado",
-            }
-
         return {"valid": True, "error": None}
 
     @classmethod
@@ -104,6 +127,8 @@ class TranslationService:
         db: Optional[Session] = None,
         user_id: Optional[int] = None,
         neo4j_connection_id: Optional[int] = None,
+        parameterize: bool = False,
+        schema: Optional[SchemaCatalog] = None,
     ) -> dict:
         """
         Traduce una consulta SQL a Cypher y opcionalmente guarda en BD.
@@ -113,107 +138,371 @@ class TranslationService:
             db: Sesión de base de datos (opcional, para persistir)
             user_id: ID del usuario (opcional, para persistir)
             neo4j_connection_id: ID de conexión Neo4j (opcional)
+            parameterize: Si True, los literales se devuelven como parámetros
+                y la caché se indexa por la forma de la consulta
+            schema: Catálogo del esquema de origen con el que resolver
+                labels y propiedades (opcional)
 
         Returns:
             dict: {
                 'success': bool,
                 'cypher': Optional[str],
+                'parameters': Optional[dict],
                 'errors': List[str],
                 'sql_query': str,
                 'query_id': Optional[int],
-                'translation_time': Optional[float]
+                'translation_time': Optional[float],
+                'from_cache': bool
             }
         """
-        # Sanitizar y normalizar entrada
-        sql_query = sql_query.strip()
+        result = cls._translate_one(sql_query, parameterize=parameterize, schema=schema)
+
+        # Guardar en BD si tenemos sesión y usuario (también los fallos)
+        query_record = None
+        if db and user_id:
+            query_record = cls._save_query(
+                db=db,
+                user_id=user_id,
+                sql_query=result["sql_query"],
+                cypher_query=result["cypher"],
+                cypher_parameters=result["parameters"],
+                status=(
+                    QueryStatus.TRADUCIDO if result["success"] else QueryStatus.FALLIDO
+                ),
+                error_message=(result["errors"][0] if result["errors"] else None),
+                translation_time=result["translation_time"],
+                neo4j_connection_id=neo4j_connection_id,
+                from_cache=result["from_cache"],
+            )
+
+        return cls._public_result(
+            result, query_record.query_id if query_record else None
+        )
 
-        # Validar consulta
-        validation = cls.validate_sql_query(sql_query)
-        if not validation["valid"]:
-            # Si tenemos sesión de BD, guardar el intento fallido
-            query_record = None
-            if db and user_id:
-                query_record = cls._save_query(
-                    db=db,
-                    user_id=user_id,
-                    sql_query=sql_query,
-                    cypher_query=None,
-                    status=QueryStatus.FALLIDO,
-                    error_message=validation["error"],
-                    neo4j_connection_id=neo4j_connection_id,
-                )
+    @classmethod
+    def translate_batch(
+        cls,
+        sql_queries: list[str],
+        db: Optional[Session] = None,
+        user_id: Optional[int] = None,
+        neo4j_connection_id: Optional[int] = None,
+        parameterize: bool = False,
+        schema: Optional[SchemaCatalog] = None,
+    ) -> list[dict]:
+        """
+        Traduce un lote de consultas SQL y guarda su historial de una vez.
 
-            return {
-                "success": False,
-                "cypher": None,
-                "errors": [validation["error"]],
-                "sql_query": sql_query,
-                "query_id": query_record.query_id if query_record else None,
-                "translation_time": None,
-            }
+        Las consultas idénticas (tras quitar espacios en los extremos) se
+        traducen una sola vez; sus repeticiones reutilizan el resultado y se
+        marcan como obtenidas de caché. Las que no están en caché se traducen
+        juntas, repartidas entre los workers si el pool de procesos está
+        activo. Cada elemento del lote conserva su propio registro de
+        historial, pero todos se insertan con un único flush y un único
+        commit.
 
-        # Realizar traducción midiendo tiempo
-        start_time = time.perf_counter()
-        try:
-            result = translate_sql_to_cypher(sql_query)
-            end_time = time.perf_counter()
-            translation_time_ms = (end_time - start_time) * 1000
-
-            # Guardar en BD si tenemos sesión y usuario
-            query_record = None
-            if db and user_id:
-                query_record = cls._save_query(
-                    db=db,
+        Args:
+            sql_queries: Consultas SQL a traducir
+            db: Sesión de base de datos (opcional, para persistir)
+            user_id: ID del usuario (opcional, para persistir)
+            neo4j_connection_id: ID de conexión Neo4j (opcional)
+            parameterize: Si True, los literales se devuelven como parámetros
+            schema: Catálogo del esquema de origen (opcional)
+
+        Returns:
+            list[dict]: Un resultado por consulta, en el orden recibido y con
+                el mismo formato que translate()
+        """
+        # Validar y consultar la caché para cada consulta distinta; las que
+        # falten se traducen juntas para repartirlas en el pool de procesos
+        translated = {}
+        pending = []
+        for key in dict.fromkeys(sql_query.strip() for sql_query in sql_queries):
+            result, cache_key = cls._lookup(key, parameterize, schema)
+            if result is not None:
+                translated[key] = result
+            else:
+                pending.append((key, cache_key))
+
+        outcomes = cls._run_translations(
+            [key for key, _ in pending], parameterize, schema
+        )
+        for (key, cache_key), (outcome, translation_time_ms) in zip(
+            pending, outcomes, strict=True
+        ):
+            translated[key] = cls._complete(
+                key, parameterize, cache_key, outcome, translation_time_ms
+            )
+
+        results = []
+        seen = set()
+        for sql_query in sql_queries:
+            key = sql_query.strip()
+            result = translated[key]
+            if key in seen and result["success"]:
+                # Repetición dentro del lote: mismo resultado sin reparsear
+                result = {**result, "translation_time": 0.0, "from_cache": True}
+            seen.add(key)
+            results.append(result)
+
+        query_ids = [None] * len(results)
+        if db and user_id and results:
+            records = [
+                Query(
                     user_id=user_id,
-                    sql_query=sql_query,
+                    sql_query=result["sql_query"],
                     cypher_query=result["cypher"],
+                    cypher_parameters=result["parameters"],
                     status=(
                         QueryStatus.TRADUCIDO
                         if result["success"]
                         else QueryStatus.FALLIDO
                     ),
                     error_message=(result["errors"][0] if result["errors"] else None),
-                    translation_time=translation_time_ms,
+                    translation_time=result["translation_time"],
                     neo4j_connection_id=neo4j_connection_id,
+                    from_cache=result["from_cache"],
                 )
+                for result in results
+            ]
+            db.add_all(records)
+            # Los IDs se leen tras el flush: después del commit cada acceso
+            # recargaría el registro con un SELECT
+            db.flush()
+            query_ids = [record.query_id for record in records]
+            db.commit()
+
+        return [
+            cls._public_result(result, query_id)
+            for result, query_id in zip(results, query_ids, strict=True)
+        ]
+
+    @staticmethod
+    def _public_result(result: dict, query_id: Optional[int]) -> dict:
+        """
+        Completa un resultado de _translate_one() para devolverlo al cliente.
+
+        Args:
+            result: Resultado interno de la traducción
+            query_id: ID del registro guardado (None si no se guardó)
+
+        Returns:
+            dict: Resultado con query_id y el tiempo redondeado
+        """
+        translation_time = result["translation_time"]
+        return {
+            **result,
+            "query_id": query_id,
+            "translation_time": (
+                round(translation_time, 3) if translation_time is not None else None
+            ),
+        }
+
+    @classmethod
+    def _translate_one(
+        cls,
+        sql_query: str,
+        parameterize: bool = False,
+        schema: Optional[SchemaCatalog] = None,
+    ) -> dict:
+        """
+        Valida y traduce una consulta sin persistirla.
+
+        Args:
+            sql_query: Consulta SQL a traducir
+            parameterize: Si True, los literales se devuelven como parámetros
+            schema: Catálogo del esquema de origen (opcional)
+
+        Returns:
+            dict: {
+                'success': bool,
+                'cypher': Optional[str],
+                'parameters': Optional[dict],
+                'errors': List[str],
+                'sql_query': str,
+                'translation_time': Optional[float] (ms, sin redondear),
+                'from_cache': bool
+            }
+        """
+        # Sanitizar y normalizar entrada
+        sql_query = sql_query.strip()
+
+        result, cache_key = cls._lookup(sql_query, parameterize, schema)
+        if result is not None:
+            return result
+
+        [(outcome, translation_time_ms)] = cls._run_translations(
+            [sql_query], parameterize, schema
+        )
+        return cls._complete(
+            sql_query, parameterize, cache_key, outcome, translation_time_ms
+        )
 
+    @classmethod
+    def _lookup(
+        cls,
+        sql_query: str,
+        parameterize: bool,
+        schema: Optional[SchemaCatalog] = None,
+    ) -> tuple[Optional[dict], Optional[tuple]]:
+        """
+        Valida una consulta y busca su traducción en la caché.
+
+        Args:
+            sql_query: Consulta SQL sin espacios en los extremos
+            parameterize: Si True, la clave de caché es la forma de la consulta
+            schema: Catálogo del esquema de origen; su versión se añade a la
+                clave de caché
+
+        Returns:
+            tuple: (resultado final si la consulta es inválida o está en caché,
+                clave de caché con la que guardar la traducción o None)
+        """
+        # Validar consulta
+        validation = cls.validate_sql_query(sql_query)
+        if not validation["valid"]:
             return {
-                "success": result["success"],
-                "cypher": result["cypher"],
-                "errors": result.get("errors", []),
+                "success": False,
+                "cypher": None,
+                "parameters": None,
+                "errors": [validation["error"]],
                 "sql_query": sql_query,
-                "query_id": query_record.query_id if query_record else None,
-                "translation_time": round(translation_time_ms, 3),
+                "translation_time": None,
+                "from_cache": False,
+            }, None
+
+        start_time = time.perf_counter()
+
+        # Consultar la caché antes de parsear, usando los tokens ya obtenidos
+        # en la validación. En modo parametrizado la clave es la forma de la
+        # consulta y los valores se toman de sus literales. Con errores léxicos
+        # no se usa la caché: el lexer descarta los caracteres no reconocidos.
+        cache_key = None
+        literals = []
+        engine = get_parser_engine()
+        if cls._cache.enabled:
+            tokens = engine.tokenize(sql_query)
+            if not engine.lexer_errors:
+                schema_version = schema.version if schema is not None else None
+                if parameterize:
+                    shape, literals = normalize_token_shape(tokens)
+                    cache_key = (True, shape, schema_version)
+                else:
+                    cache_key = (False, normalize_tokens(tokens), schema_version)
+        cached_cypher = cls._cache.get(cache_key) if cache_key else None
+        if cached_cypher is None:
+            return None, cache_key
+
+        parameters = (
+            {
+                f"p{index}": sql_literal_to_python(literal)
+                for index, literal in enumerate(literals)
             }
+            if parameterize
+            else None
+        )
+        return {
+            "success": True,
+            "cypher": cached_cypher,
+            "parameters": parameters,
+            "errors": [],
+            "sql_query": sql_query,
+            "translation_time": (time.perf_counter() - start_time) * 1000,
+            "from_cache": True,
+        }, cache_key
+
+    @classmethod
+    def _run_translations(
+        cls,
+        sql_queries: list[str],
+        parameterize: bool,
+        schema: Optional[SchemaCatalog] = None,
+    ) -> list[tuple]:
+        """
+        Traduce consultas ya validadas, en el pool de procesos si está activo.
 
-        except Exception as e:
-            end_time = time.perf_counter()
-            translation_time_ms = (end_time - start_time) * 1000
-            error_msg = f"Error inesperado durante la traducción: {str(e)}"
+        Args:
+            sql_queries: Consultas SQL validadas
+            parameterize: Si True, los literales se devuelven como parámetros
+            schema: Catálogo del esquema de origen (opcional)
 
-            # Guardar error en BD
-            query_record = None
-            if db and user_id:
-                query_record = cls._save_query(
-                    db=db,
-                    user_id=user_id,
-                    sql_query=sql_query,
-                    cypher_query=None,
-                    status=QueryStatus.FALLIDO,
-                    error_message=error_msg,
-                    translation_time=translation_time_ms,
-                    neo4j_connection_id=neo4j_connection_id,
+        Returns:
+            list[tuple]: (resultado del visitor o excepción, tiempo en ms)
+                por consulta, en orden
+        """
+        executor = get_translation_executor()
+        if executor is not None:
+            return executor.translate_many(sql_queries, parameterize, schema)
+
+        outcomes = []
+        for sql_query in sql_queries:
+            start_time = time.perf_counter()
+            try:
+                outcome = translate_sql_to_cypher(
+                    sql_query, parameterize=parameterize, schema=schema
                 )
+            except Exception as e:
+                outcome = e
+            outcomes.append((outcome, (time.perf_counter() - start_time) * 1000))
+        return outcomes
+
+    @classmethod
+    def _complete(
+        cls,
+        sql_query: str,
+        parameterize: bool,
+        cache_key: Optional[tuple],
+        outcome,
+        translation_time_ms: float,
+    ) -> dict:
+        """
+        Construye el resultado de una traducción y lo guarda en la caché.
 
+        Args:
+            sql_query: Consulta SQL traducida
+            parameterize: Si True, se devuelven los parámetros del visitor
+            cache_key: Clave de caché obtenida en _lookup() o None
+            outcome: Resultado del visitor o excepción producida
+            translation_time_ms: Tiempo de traducción en ms
+
+        Returns:
+            dict: Resultado con el mismo formato que _translate_one()
+        """
+        if isinstance(outcome, Exception):
+            if isinstance(outcome, TranslationTimeoutError):
+                error_msg = str(outcome)
+            else:
+                error_msg = f"Error inesperado durante la traducción: {str(outcome)}"
             return {
                 "success": False,
                 "cypher": None,
+                "parameters": None,
                 "errors": [error_msg],
                 "sql_query": sql_query,
-                "query_id": query_record.query_id if query_record else None,
-                "translation_time": round(translation_time_ms, 3),
+                "translation_time": translation_time_ms,
+                "from_cache": False,
             }
 
+        # Solo se cachean traducciones exitosas: los errores incluyen
+        # posiciones que dependen del formato original de la consulta
+        if outcome["success"] and cache_key:
+            cls._cache.set(
+                cache_key,
+                outcome["cypher"],
+                size=len(cache_key[1].encode()) + len(outcome["cypher"].encode()),
+            )
+
+        return {
+            "success": outcome["success"],
+            "cypher": outcome["cypher"],
+            "parameters": (
+                outcome["parameters"] if parameterize and outcome["success"] else None
+            ),
+            "errors": outcome.get("errors", []),
+            "sql_query": sql_query,
+            "translation_time": translation_time_ms,
+            "from_cache": False,
+        }
+
     @classmethod
     def _save_query(
         cls,
@@ -225,6 +514,8 @@ class TranslationService:
         error_message: Optional[str] = None,
         translation_time: Optional[float] = None,
         neo4j_connection_id: Optional[int] = None,
+        from_cache: bool = False,
+        cypher_parameters: Optional[dict] = None,
     ) -> Query:
         """
         Guarda un registro de consulta en la base de datos.
@@ -238,6 +529,8 @@ class TranslationService:
             error_message: Mensaje de error si falló
             translation_time: Tiempo de traducción en ms
             neo4j_connection_id: ID de conexión Neo4j
+            from_cache: Si la traducción se obtuvo de la caché
+            cypher_parameters: Parámetros de la consulta Cypher parametrizada
 
         Returns:
             Query: Registro de consulta guardado
@@ -246,16 +539,33 @@ class TranslationService:
             user_id=user_id,
             sql_query=sql_query,
             cypher_query=cypher_query,
+            cypher_parameters=cypher_parameters,
             status=status,
             error_message=error_message,
             translation_time=translation_time,
             neo4j_connection_id=neo4j_connection_id,
+            from_cache=from_cache,
         )
         db.add(query)
         db.commit()
         db.refresh(query)
         return query
 
+    @classmethod
+    def get_cache_stats(cls) -> dict:
+        """
+        Devuelve las métricas de la caché de traducciones.
+
+        Returns:
+            dict: Entradas, bytes, límites, aciertos, fallos y desalojos
+        """
+        return cls._cache.stats()
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Vacía la caché de traducciones y reinicia sus contadores."""
+        cls._cache.clear()
+
     @classmethod
     def get_user_queries(
         cls,
@@ -327,4 +637,20 @@ class TranslationService:
                 ),
                 "description": "SELECT con WHERE y operador OR",
             },
+            {
+                "sql": "SELECT name FROM Users ORDER BY age DESC LIMIT 10 OFFSET 20",
+                "cypher": (
+                    "MATCH (n:Users)\n"
+                    "RETURN n.name\n"
+                    "ORDER BY n.age DESC\n"
+                    "SKIP 20\n"
+                    "LIMIT 10"
+                ),
+                "description": "SELECT con ORDER BY, LIMIT y OFFSET",
+            },
+            {
+                "sql": "SELECT TOP 5 * FROM Products ORDER BY price",
+                "cypher": "MATCH (n:Products)\nRETURN n\nORDER BY n.price\nLIMIT 5",
+                "description": "SELECT TOP de SQL Server",
+            },
         ]
@@ -0,0 +1,263 @@
+"""
+Prueba de carga del endpoint de ejecución asíncrono.
+
+Lanza muchas peticiones concurrentes a POST /api/v1/queries/execute contra un
+Neo4j simulado en memoria (FakeBoltDriver) en el que cada consulta tarda
+`latency` segundos, y mide:
+- async_seconds: tiempo total de todas las peticiones con el camino asíncrono
+- peak_in_flight: máximo de consultas esperando a Neo4j a la vez
+- threadpool_seconds: tiempo que tardarían las mismas esperas si cada una
+  ocupara un hilo del threadpool de Starlette (lo que hacía un endpoint
+  síncrono), limitado a THREADPOOL_TOKENS hilos
+
+La aplicación se ejecuta en proceso (httpx.ASGITransport) con una base de
+datos SQLite temporal; no hace falta ningún servicio externo.
+
+Uso:
+    python -m benchmarks.execution_load [--requests N] [--latency SEGUNDOS]
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from unittest.mock import patch
+
+import anyio
+import httpx
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+from starlette.concurrency import run_in_threadpool
+
+from app.core.security import encrypt_data, get_current_user
+from app.db.base import Base
+from app.db.session import get_db
+from app.main import app
+from app.models.connection import Connection, DatabaseType
+from app.models.query import Query
+from app.models.user import User
+from app.services.execution_service import AsyncGraphDatabase, neo4j_drivers
+
+# Hilos del threadpool por defecto de Starlette (limitador de anyio)
+THREADPOOL_TOKENS = 40
+
+
+class FakeBoltResult:
+    """Resultado simulado con un solo registro."""
+
+    async def peek(self):
+        return {"n": 1}
+
+    async def __aiter__(self):
+        yield {"n": 1}
+
+
+class FakeBoltTransaction:
+    """Transacción simulada cuya consulta tarda `latency` segundos."""
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    async def run(self, cypher, parameters):
+        self.driver.in_flight += 1
+        self.driver.peak_in_flight = max(
+            self.driver.peak_in_flight, self.driver.in_flight
+        )
+        await asyncio.sleep(self.driver.latency)
+        return FakeBoltResult()
+
+    def cancel(self):
+        self.driver.in_flight -= 1
+
+    async def close(self):
+        self.driver.in_flight -= 1
+
+
+class FakeBoltSession:
+    """Sesión simulada que abre transacciones de FakeBoltTransaction."""
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    async def begin_transaction(self, timeout=None):
+        return FakeBoltTransaction(self.driver)
+
+    async def close(self):
+        pass
+
+
+class FakeBoltDriver:
+    """Sustituto de AsyncDriver que simula la latencia de red de Neo4j."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    def session(self, **config):
+        return FakeBoltSession(self)
+
+    async def close(self):
+        pass
+
+
+def _fast_sqlite(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.close()
+
+
+def _prepare_database(session_factory) -> tuple[User, int]:
+    """Crea un usuario, una conexión Neo4j y una consulta traducida."""
+    db = session_factory()
+    try:
+        user = User(
+            name="Carga",
+            last_name="Prueba",
+            email="carga@example.com",
+            password="no-usado",
+        )
+        db.add(user)
+        db.flush()
+        connection = Connection(
+            user_id=user.user_id,
+            conn_name="Neo4j simulado",
+            db_type=DatabaseType.NEO4J,
+            host="fake-bolt",
+            port=7687,
+            db_user="neo4j",
+            db_password=encrypt_data("secret"),
+        )
+        db.add(connection)
+        db.flush()
+        query = Query(
+            user_id=user.user_id,
+            neo4j_connection_id=connection.connection_id,
+            sql_query="SELECT * FROM Users",
+            cypher_query="MATCH (n:Users)\nRETURN n",
+        )
+        db.add(query)
+        db.commit()
+        db.refresh(user)
+        db.expunge(user)
+        return user, query.query_id
+    finally:
+        db.close()
+
+
+async def _threadpool_baseline(requests: int, latency: float) -> float:
+    """Tiempo de `requests` esperas bloqueantes repartidas en el threadpool."""
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    previous = limiter.total_tokens
+    limiter.total_tokens = THREADPOOL_TOKENS
+    try:
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(run_in_threadpool(time.sleep, latency) for _ in range(requests))
+        )
+        return time.perf_counter() - start
+    finally:
+        limiter.total_tokens = previous
+
+
+async def _async_load(requests: int, query_id: int) -> tuple[float, int]:
+    """Lanza las peticiones concurrentes y devuelve (segundos, errores)."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://carga", timeout=None
+    ) as client:
+        start = time.perf_counter()
+        responses = await asyncio.gather(
+            *(
+                client.post("/api/v1/queries/execute", json={"query_id": query_id})
+                for _ in range(requests)
+            )
+        )
+        elapsed = time.perf_counter() - start
+    errors = sum(1 for response in responses if response.status_code != 200)
+    return elapsed, errors
+
+
+def run_load(requests: int = 1000, latency: float = 0.5) -> dict:
+    """
+    Ejecuta la prueba de carga.
+
+    Args:
+        requests: Peticiones concurrentes
+        latency: Segundos que tarda cada consulta en el Neo4j simulado
+
+    Returns:
+        dict: requests, latency, async_seconds, peak_in_flight, errors y
+            threadpool_seconds
+    """
+    fake_driver = FakeBoltDriver(latency)
+    overrides = dict(app.dependency_overrides)
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(
+            f"sqlite:///{os.path.join(directory, 'carga.db')}",
+            connect_args={"check_same_thread": False, "timeout": 30},
+            poolclass=NullPool,
+        )
+        # Sin fsync ni bloqueo de lectores: la prueba mide la espera a Neo4j,
+        # no la escritura del historial en disco
+        event.listen(engine, "connect", _fast_sqlite)
+        Base.metadata.create_all(bind=engine)
+        session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        user, query_id = _prepare_database(session_factory)
+
+        def load_db():
+            db = session_factory()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        async def load_user():
+            return user
+
+        app.dependency_overrides[get_db] = load_db
+        app.dependency_overrides[get_current_user] = load_user
+        try:
+            with patch.object(
+                AsyncGraphDatabase, "driver", lambda *args, **kwargs: fake_driver
+            ):
+                elapsed, errors = asyncio.run(_async_load(requests, query_id))
+            threadpool_seconds = asyncio.run(_threadpool_baseline(requests, latency))
+        finally:
+            app.dependency_overrides.clear()
+            app.dependency_overrides.update(overrides)
+            neo4j_drivers.close_all()
+            engine.dispose()
+
+    return {
+        "requests": requests,
+        "latency": latency,
+        "async_seconds": round(elapsed, 3),
+        "peak_in_flight": fake_driver.peak_in_flight,
+        "errors": errors,
+        "threadpool_seconds": round(threadpool_seconds, 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.5)
+    args = parser.parse_args()
+
+    report = run_load(args.requests, args.latency)
+    print(
+        f"{report['requests']} peticiones, {report['latency']} s por consulta\n"
+        f"  asíncrono:  {report['async_seconds']:>8} s "
+        f"(máximo en vuelo: {report['peak_in_flight']}, errores: {report['errors']})\n"
+        f"  threadpool: {report['threadpool_seconds']:>8} s "
+        f"({THREADPOOL_TOKENS} hilos)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+"""
+Micro-benchmark del camino de traducción SQL -> Cypher.
+
+Recorre un corpus generado por categorías (listas SELECT pequeñas y grandes,
+anidación profunda de AND/OR, literales de cadena largos y entradas con muchos
+comentarios) y mide para cada objetivo:
+- translate: translate_sql_to_cypher()
+- service: TranslationService.translate() sin caché (se vacía en cada llamada)
+- service_cached: TranslationService.translate() con la caché ya poblada
+
+Por cada objetivo y categoría se informa la latencia p50/p99 en µs, el
+rendimiento en consultas por segundo y el pico de memoria asignada por
+consulta (tracemalloc, en una pasada aparte para no alterar las latencias).
+
+Los resultados pueden guardarse en JSON y compararse con una línea base; el
+proceso termina con código 1 si algún p50 empeora más que la tolerancia. El
+p99 se compara y se muestra, pero no bloquea: en una sola máquina es demasiado
+sensible al ruido del sistema. La línea base guardada en
+benchmarks/baseline_translation.json solo es comparable en la máquina donde
+se generó; conviene regenerarla con --output al cambiar de entorno.
+
+Uso:
+    python -m benchmarks.translation_benchmark [--number N] [--parser antlr|fast]
+        [--output resultados.json] [--baseline benchmarks/baseline_translation.json]
+        [--tolerance 0.25]
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from app.core.config import settings
+from app.core.parser.engine import warm_up
+from app.core.parser.visitor import translate_sql_to_cypher
+from app.services.translation_service import TranslationService
+
+# Consultas distintas por categoría; se recorren en ciclo durante la medición
+VARIANTS = 8
+
+
+def _select_small(i: int) -> str:
+    return f"SELECT name, email FROM Users WHERE age > {18 + i}"
+
+
+def _select_large(i: int) -> str:
+    columns = ", ".join(f"col_{i}_{c}" for c in range(60))
+    return f"SELECT {columns} FROM Measurements WHERE sensor = {i}"
+
+
+def _deep_nesting(i: int) -> str:
+    condition = f"a{i} = 0"
+    for level in range(24):
+        keyword = "AND" if level % 2 else "OR"
+        condition = f"(lvl{level} >= {level} {keyword} {condition})"
+    return f"SELECT * FROM Graph WHERE {condition}"
+
+
+def _long_literals(i: int) -> str:
+    text = f"texto {i} con comillas '' escapadas " * 40
+    return f"SELECT * FROM Documents WHERE body = '{text}' OR title = '{text[:200]}'"
+
+
+def _comment_heavy(i: int) -> str:
+    parts = [f"/* bloque {i}.{c}: {'x' * 80} */" for c in range(10)]
+    lines = "\n".join(f"-- línea de comentario {i}.{c} {'y' * 60}" for c in range(10))
+    return (
+        f"{parts[0]} SELECT {parts[1]} name {parts[2]} FROM {parts[3]} Users\n"
+        f"{lines}\nWHERE {parts[4]} age > {i} {parts[5]} AND {parts[6]} "
+        f"status = 'activo' {''.join(parts[7:])}"
+    )
+
+
+CATEGORIES = {
+    "select_small": _select_small,
+    "select_large": _select_large,
+    "deep_nesting": _deep_nesting,
+    "long_literals": _long_literals,
+    "comment_heavy": _comment_heavy,
+}
+
+
+def build_corpus(variants: int = VARIANTS) -> dict[str, list[str]]:
+    """
+    Genera el corpus de consultas por categoría.
+
+    Args:
+        variants: Consultas distintas por categoría
+
+    Returns:
+        dict: Nombre de categoría -> lista de consultas
+    """
+    corpus = {
+        name: [build(i) for i in range(variants)] for name, build in CATEGORIES.items()
+    }
+    for name, queries in corpus.items():
+        for sql_query in queries:
+            if len(sql_query) > TranslationService.MAX_QUERY_LENGTH:
+                raise ValueError(f"La categoría {name} supera MAX_QUERY_LENGTH")
+    return corpus
+
+
+def _translate(sql_query: str) -> None:
+    translate_sql_to_cypher(sql_query)
+
+
+def _service(sql_query: str) -> None:
+    TranslationService.clear_cache()
+    TranslationService.translate(sql_query)
+
+
+def _service_cached(sql_query: str) -> None:
+    TranslationService.translate(sql_query)
+
+
+TARGETS = {
+    "translate": _translate,
+    "service": _service,
+    "service_cached": _service_cached,
+}
+
+
+def _percentile(sorted_samples: list[float], fraction: float) -> float:
+    """Percentil por el método del rango más cercano."""
+    index = max(
+        0, min(len(sorted_samples) - 1, round(fraction * len(sorted_samples)) - 1)
+    )
+    return sorted_samples[index]
+
+
+def measure(func, queries: list[str], number: int) -> dict:
+    """
+    Mide una función sobre un conjunto de consultas.
+
+    Args:
+        func: Función que recibe una consulta
+        queries: Consultas a recorrer en ciclo
+        number: Número total de llamadas medidas
+
+    Returns:
+        dict: p50_us, p99_us, mean_us, throughput_qps y alloc_peak_kb
+    """
+    # Una pasada sin medir para poblar cachés y estabilizar
+    for sql_query in queries:
+        func(sql_query)
+
+    samples = []
+    perf_counter = time.perf_counter
+    for i in range(number):
+        sql_query = queries[i % len(queries)]
+        start = perf_counter()
+        func(sql_query)
+        samples.append(perf_counter() - start)
+
+    # Pico de memoria asignada por llamada, en una pasada aparte
+    peaks = []
+    tracemalloc.start()
+    try:
+        for sql_query in queries:
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            func(sql_query)
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - baseline)
+    finally:
+        tracemalloc.stop()
+
+    samples.sort()
+    total = sum(samples)
+    return {
+        "p50_us": round(_percentile(samples, 0.50) * 1e6, 2),
+        "p99_us": round(_percentile(samples, 0.99) * 1e6, 2),
+        "mean_us": round(total / number * 1e6, 2),
+        "throughput_qps": round(number / total, 1),
+        "alloc_peak_kb": round(sum(peaks) / len(peaks) / 1024, 2),
+    }
+
+
+def run(number: int, parser: str = None) -> dict:
+    """
+    Ejecuta el benchmark completo.
+
+    Args:
+        number: Llamadas medidas por objetivo y categoría
+        parser: Parser a usar ("antlr" o "fast"); por defecto el configurado
+
+    Returns:
+        dict: {'metadata': {...}, 'results': {objetivo: {categoría: métricas}}}
+    """
+    if parser:
+        settings.TRANSLATION_PARSER = parser
+    warm_up()
+    corpus = build_corpus()
+
+    results = {}
+    for target, func in TARGETS.items():
+        results[target] = {
+            category: measure(func, queries, number)
+            for category, queries in corpus.items()
+        }
+    TranslationService.clear_cache()
+
+    return {
+        "metadata": {
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "parser": settings.TRANSLATION_PARSER,
+            "number": number,
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list[dict]:
+    """
+    Compara unos resultados con una línea base.
+
+    Solo se comparan las latencias (p50 y p99) de los objetivos y categorías
+    presentes en ambos resultados; únicamente el p50 puede marcar regresión.
+
+    Args:
+        current: Resultados de run()
+        baseline: Resultados de run() guardados previamente
+        tolerance: Empeoramiento relativo permitido (0.25 = 25 %)
+
+    Returns:
+        list[dict]: Una fila por métrica con su variación y si es regresión
+    """
+    rows = []
+    for target, categories in current["results"].items():
+        for category, metrics in categories.items():
+            reference = baseline["results"].get(target, {}).get(category)
+            if reference is None:
+                continue
+            for metric in ("p50_us", "p99_us"):
+                change = metrics[metric] / reference[metric] - 1
+                rows.append(
+                    {
+                        "target": target,
+                        "category": category,
+                        "metric": metric,
+                        "baseline": reference[metric],
+                        "current": metrics[metric],
+                        "change": round(change, 4),
+                        "regression": metric == "p50_us" and change > tolerance,
+                    }
+                )
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=400)
+    parser.add_argument("--parser", choices=["antlr", "fast"], default=None)
+    parser.add_argument("--output", help="Ruta donde guardar los resultados JSON")
+    parser.add_argument("--baseline", help="Resultados JSON con los que comparar")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    current = run(args.number, args.parser)
+
+    print(
+        f"{'objetivo':<15} {'categoría':<14} {'p50 µs':>9} {'p99 µs':>9} "
+        f"{'qps':>9} {'KB/consulta':>12}"
+    )
+    for target, categories in current["results"].items():
+        for category, m in categories.items():
+            print(
+                f"{target:<15} {category:<14} {m['p50_us']:>9} {m['p99_us']:>9} "
+                f"{m['throughput_qps']:>9} {m['alloc_peak_kb']:>12}"
+            )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    rows = compare(current, baseline, args.tolerance)
+    regressions = [row for row in rows if row["regression"]]
+
+    print(f"\nComparación con {args.baseline} (tolerancia {args.tolerance:.0%})")
+    for row in rows:
+        mark = "REGRESIÓN" if row["regression"] else ""
+        print(
+            f"{row['target']:<15} {row['category']:<14} {row['metric']:<7} "
+            f"{row['baseline']:>9} -> {row['current']:>9} "
+            f"({row['change']:+.1%}) {mark}"
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+"""
+Micro-benchmark del validador de consultas SQL.
+
+Mide, por KB de SQL y para consultas de distintos tamaños:
+- validación: coste de TranslationService.validate_sql_query una vez que la
+  consulta está tokenizada (el lexer se ejecuta de todos modos para parsear)
+- petición: validación más parsing, tokenizando la consulta una sola vez
+- petición anterior: validador con una regex por palabra clave seguido de un
+  parsing que vuelve a leer el texto desde cero
+
+Uso:
+    python -m benchmarks.validation_benchmark [--number N]
+"""
+
+import argparse
+import itertools
+import re
+import timeit
+
+from app.core.parser.engine import get_parser_engine
+from app.services.translation_service import TranslationService
+
+
+def legacy_validate_sql_query(sql_query: str) -> dict:
+    """Validador anterior: una regex por palabra clave sobre la consulta."""
+    sql_upper = sql_query.upper()
+    for keyword in TranslationService.DANGEROUS_KEYWORDS:
+        if re.search(rf"\b{keyword}\b", sql_upper):
+            return {"valid": False, "error": keyword}
+    if not re.match(r"^\s*SELECT\b", sql_upper):
+        return {"valid": False, "error": "SELECT"}
+    if re.search(r";\s*(DROP|DELETE|UPDATE|INSERT)", sql_upper):
+        return {"valid": False, "error": "sospechoso"}
+    return {"valid": True, "error": None}
+
+
+def build_query(target_size: int) -> str:
+    """
+    Genera una consulta válida de aproximadamente target_size caracteres.
+
+    Mezcla comparaciones, literales de cadena y comentarios.
+    """
+    parts = []
+    size = 0
+    i = 0
+    while size < target_size:
+        term = (
+            f"(col{i} > {i} OR status = 'usuario activo {i}') " f"/* condición {i} */ "
+        )
+        parts.append(term)
+        size += len(term) + 5
+        i += 1
+    return "SELECT name, email FROM Users WHERE " + " AND ".join(parts)
+
+
+def _per_kb(seconds: float, number: int, size_kb: float) -> float:
+    return round(seconds / number * 1e6 / size_kb, 2)
+
+
+def measure(sql_query: str, number: int) -> dict:
+    """
+    Mide el validador actual y el anterior para una consulta.
+
+    Args:
+        sql_query: Consulta SQL a medir
+        number: Repeticiones por medición
+
+    Returns:
+        dict: Tamaño en KB y µs/KB de cada medición
+    """
+    engine = get_parser_engine()
+    size_kb = len(sql_query.encode()) / 1024
+
+    engine.tokenize(sql_query)
+    validation = timeit.timeit(
+        lambda: TranslationService.validate_sql_query(sql_query), number=number
+    )
+    legacy_validation = timeit.timeit(
+        lambda: legacy_validate_sql_query(sql_query), number=number
+    )
+
+    # Dos variantes del mismo texto para que el motor no reutilice los tokens
+    # de la iteración anterior al medir peticiones completas
+    next_variant = itertools.cycle([sql_query, sql_query + " "]).__next__
+
+    def request():
+        q = next_variant()
+        TranslationService.validate_sql_query(q)
+        engine.parse(q)
+
+    def legacy_request():
+        q = next_variant()
+        legacy_validate_sql_query(q)
+        engine.parse(q)
+
+    return {
+        "size_kb": round(size_kb, 2),
+        "validation_us_per_kb": _per_kb(validation, number, size_kb),
+        "legacy_validation_us_per_kb": _per_kb(legacy_validation, number, size_kb),
+        "request_us_per_kb": _per_kb(
+            timeit.timeit(request, number=number), number, size_kb
+        ),
+        "legacy_request_us_per_kb": _per_kb(
+            timeit.timeit(legacy_request, number=number), number, size_kb
+        ),
+    }
+
+
+def run(number: int) -> list[dict]:
+    """
+    Ejecuta el benchmark para varios tamaños de consulta.
+
+    Args:
+        number: Repeticiones por medición
+
+    Returns:
+        list[dict]: Resultados de measure() para cada tamaño
+    """
+    max_length = TranslationService.MAX_QUERY_LENGTH - 1
+    return [
+        measure(build_query(target_size)[:max_length], number)
+        for target_size in (256, 1024, 2048, 4096)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=500)
+    args = parser.parse_args()
+
+    print(
+        f"{'KB':>6} {'validación':>11} {'anterior':>9} "
+        f"{'petición':>9} {'anterior':>9}   (µs/KB)"
+    )
+    for row in run(args.number):
+        print(
+            f"{row['size_kb']:>6} {row['validation_us_per_kb']:>11} "
+            f"{row['legacy_validation_us_per_kb']:>9} "
+            f"{row['request_us_per_kb']:>9} {row['legacy_request_us_per_kb']:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
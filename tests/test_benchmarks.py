@@ -0,0 +1,62 @@
+"""
+Pruebas del benchmark de traducción.
+
+No miden rendimiento: comprueban que el corpus es válido, que las métricas
+tienen el formato esperado y que la comparación con la línea base detecta
+regresiones.
+"""
+
+from app.core.parser.visitor import translate_sql_to_cypher
+from benchmarks import translation_benchmark
+
+
+def test_corpus_queries_translate_successfully():
+    """Todas las consultas del corpus son válidas y caben en el límite."""
+    corpus = translation_benchmark.build_corpus(variants=2)
+
+    assert set(corpus) == set(translation_benchmark.CATEGORIES)
+    for queries in corpus.values():
+        for sql_query in queries:
+            assert translate_sql_to_cypher(sql_query)["success"] is True
+
+
+def test_measure_reports_latency_throughput_and_allocations():
+    """measure() devuelve percentiles, rendimiento y memoria por consulta."""
+    metrics = translation_benchmark.measure(
+        translation_benchmark._translate, ["SELECT * FROM Users"], number=5
+    )
+
+    assert set(metrics) == {
+        "p50_us",
+        "p99_us",
+        "mean_us",
+        "throughput_qps",
+        "alloc_peak_kb",
+    }
+    assert 0 < metrics["p50_us"] <= metrics["p99_us"]
+    assert metrics["throughput_qps"] > 0
+    assert metrics["alloc_peak_kb"] > 0
+
+
+def _results(p50, p99):
+    return {"results": {"translate": {"select_small": {"p50_us": p50, "p99_us": p99}}}}
+
+
+def test_compare_flags_p50_regressions_only():
+    """Solo un p50 por encima de la tolerancia es una regresión."""
+    baseline = _results(100.0, 200.0)
+
+    rows = translation_benchmark.compare(_results(110.0, 400.0), baseline, 0.25)
+    assert [row["regression"] for row in rows] == [False, False]
+
+    rows = translation_benchmark.compare(_results(130.0, 200.0), baseline, 0.25)
+    assert rows[0]["metric"] == "p50_us"
+    assert rows[0]["regression"] is True
+    assert rows[0]["change"] == 0.3
+
+
+def test_compare_skips_categories_missing_from_baseline():
+    """Las categorías nuevas no se comparan."""
+    baseline = {"results": {"translate": {}}}
+
+    assert translation_benchmark.compare(_results(1.0, 1.0), baseline, 0.1) == []
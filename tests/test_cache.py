@@ -0,0 +1,151 @@
+"""
+Pruebas unitarias para las cachés en memoria.
+
+Cubre:
+- Límite por número de entradas y desalojo LRU
+- Límite por tamaño en bytes
+- Contadores de aciertos, fallos y desalojos
+- Invalidación y caché desactivada
+- Caducidad por entrada (TTL) y antigüedad de las entradas
+- Aviso al descartar valores
+"""
+
+from unittest.mock import patch
+
+from app.core.cache import LRUCache
+
+
+def test_lru_cache_get_and_set():
+    """Un valor insertado se recupera y cuenta como acierto."""
+    cache = LRUCache(max_entries=10, max_bytes=1000)
+
+    assert cache.set("a", "valor", size=5) is True
+    assert cache.get("a") == "valor"
+    assert cache.get("b") is None
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["entries"] == 1
+    assert stats["bytes"] == 5
+
+
+def test_lru_cache_evicts_least_recently_used_by_entries():
+    """Al superar el número de entradas se desaloja la menos usada."""
+    cache = LRUCache(max_entries=2, max_bytes=1000)
+    cache.set("a", 1, size=1)
+    cache.set("b", 2, size=1)
+
+    # Usar "a" para que "b" sea la menos reciente
+    cache.get("a")
+    cache.set("c", 3, size=1)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.stats()["evictions"] == 1
+
+
+def test_lru_cache_evicts_by_bytes():
+    """Al superar el tamaño máximo se desalojan entradas hasta caber."""
+    cache = LRUCache(max_entries=100, max_bytes=10)
+    cache.set("a", 1, size=4)
+    cache.set("b", 2, size=4)
+    cache.set("c", 3, size=4)
+
+    assert "a" not in cache
+    assert len(cache) == 2
+    assert cache.stats()["bytes"] == 8
+
+
+def test_lru_cache_rejects_values_larger_than_limit():
+    """Un valor mayor que el límite de bytes no se almacena."""
+    cache = LRUCache(max_entries=10, max_bytes=10)
+
+    assert cache.set("a", 1, size=11) is False
+    assert len(cache) == 0
+
+
+def test_lru_cache_replace_updates_size():
+    """Reemplazar una clave no duplica su tamaño."""
+    cache = LRUCache(max_entries=10, max_bytes=100)
+    cache.set("a", 1, size=10)
+    cache.set("a", 2, size=20)
+
+    assert cache.get("a") == 2
+    assert cache.stats()["bytes"] == 20
+
+
+def test_lru_cache_invalidate_and_clear():
+    """Invalidar elimina la entrada y clear reinicia contadores."""
+    cache = LRUCache(max_entries=10, max_bytes=100)
+    cache.set("a", 1, size=1)
+    cache.get("a")
+
+    assert cache.invalidate("a") is True
+    assert cache.invalidate("a") is False
+
+    cache.clear()
+    assert cache.stats()["hits"] == 0
+    assert cache.stats()["bytes"] == 0
+
+
+def test_lru_cache_disabled():
+    """Con límite de entradas 0 la caché no almacena nada."""
+    cache = LRUCache(max_entries=0, max_bytes=100)
+
+    assert cache.enabled is False
+    assert cache.set("a", 1, size=1) is False
+    assert cache.get("a") is None
+
+
+def test_lru_cache_entries_expire_after_ttl():
+    """Una entrada con TTL deja de servirse al caducar y libera sus bytes."""
+    cache = LRUCache(max_entries=10, max_bytes=100)
+    with patch("app.core.cache.time.monotonic") as clock:
+        clock.return_value = 100.0
+        cache.set("a", 1, size=10, ttl=5)
+        cache.set("b", 2, size=10)
+
+        clock.return_value = 103.5
+        assert cache.get_with_age("a") == (1, 3.5)
+
+        clock.return_value = 105.0
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+    stats = cache.stats()
+    assert stats["expirations"] == 1
+    assert stats["bytes"] == 10
+
+
+def test_lru_cache_invalidate_where():
+    """invalidate_where elimina solo las claves que cumplen la condición."""
+    cache = LRUCache(max_entries=10, max_bytes=100)
+    cache.set((1, "x"), 1, size=3)
+    cache.set((1, "y"), 2, size=3)
+    cache.set((2, "x"), 3, size=3)
+
+    assert cache.invalidate_where(lambda key: key[0] == 1) == 2
+    assert list(cache._entries) == [(2, "x")]
+    assert cache.stats()["bytes"] == 3
+
+
+def test_lru_cache_on_discard_receives_every_removed_value():
+    """on_discard recibe los valores desalojados, caducados e invalidados."""
+    discarded = []
+    cache = LRUCache(max_entries=2, max_bytes=100, on_discard=discarded.append)
+    with patch("app.core.cache.time.monotonic") as clock:
+        clock.return_value = 100.0
+        cache.set("a", 1, size=1, ttl=5)
+        cache.set("b", 2, size=1)
+        cache.set("b", 3, size=1)
+        cache.set("c", 4, size=1)
+
+        clock.return_value = 110.0
+        cache.get("a")
+        cache.invalidate("b")
+        cache.clear()
+
+    # "b" reemplazado, "a" desalojado, "b" invalidado y "c" limpiado
+    assert discarded == [2, 1, 3, 4]
@@ -9,15 +9,22 @@ Cubre:
 - Eliminar conexiones (CON-02)
 - Seguridad y encriptación
 - Validación de ownership
+- Prueba simultánea de conexiones guardadas en streaming
 """
 
-from unittest.mock import MagicMock, patch
+import json
+import re
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
 
 from app.core.security import decrypt_data, encrypt_data
 from app.main import app
+from app.services.connection_service import sql_server_pools
+from app.services.execution_service import neo4j_drivers
 
 client = TestClient(app)
 
@@ -731,3 +738,172 @@ def test_encryption_decryption_cycle():
 
     # Verificar que el desencriptado es igual al original
     assert decrypted == original_password
+
+
+# ============================================================================
+# Prueba simultánea de conexiones guardadas
+# ============================================================================
+
+
+@pytest.fixture
+def stored_sources():
+    """Sustituye los drivers de SQL Server y Neo4j por versiones con retardo.
+
+    El login de SQL Server tarda lo indicado en delays según el host; el
+    host "denegado" rechaza las credenciales.
+    """
+    delays = {}
+
+    def connect(connection_string, timeout=None):
+        host = re.search(r"SERVER=([^,]+),", connection_string).group(1)
+        time.sleep(delays.get(host, 0))
+        if host == "denegado":
+            import pyodbc
+
+            raise pyodbc.Error("Login failed for user 'sa'")
+        return MagicMock()
+
+    def open_driver(*args, **kwargs):
+        driver = MagicMock()
+        driver.verify_connectivity = AsyncMock()
+        driver.close = AsyncMock()
+        return driver
+
+    with (
+        patch("app.services.connection_service.pyodbc.connect", side_effect=connect),
+        patch("app.services.connection_service.GraphDatabase.driver"),
+        patch(
+            "app.services.execution_service.AsyncGraphDatabase.driver",
+            side_effect=open_driver,
+        ),
+    ):
+        yield delays
+    sql_server_pools.close_all()
+    neo4j_drivers.close_all()
+
+
+def _store_connection(auth_token, conn_name, host, db_type="sql_server"):
+    body = {
+        "conn_name": conn_name,
+        "db_type": db_type,
+        "host": host,
+        "port": 1433 if db_type == "sql_server" else 7687,
+        "db_user": "sa",
+        "db_password": "Password123!",
+    }
+    if db_type == "sql_server":
+        body["database_name"] = "TestDB"
+    response = client.post(
+        "/api/v1/connections",
+        json=body,
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+    return response.json()["connection_id"]
+
+
+def _bulk_test(auth_token, **body):
+    response = client.post(
+        "/api/v1/connections/test/bulk",
+        json=body,
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    return response, lines
+
+
+def test_bulk_test_runs_connections_concurrently(stored_sources, auth_token):
+    """El tiempo total se acerca al de la conexión más lenta, no a la suma."""
+    for index in range(4):
+        stored_sources[f"origen{index}"] = 0.3
+        _store_connection(auth_token, f"Origen {index}", f"origen{index}")
+    _store_connection(auth_token, "Grafo", "grafo", db_type="neo4j")
+
+    start = time.perf_counter()
+    response, lines = _bulk_test(auth_token)
+    elapsed = time.perf_counter() - start
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert len(lines) == 5
+    assert all(line["success"] for line in lines)
+    # Neo4j responde al instante: es el primero en llegar
+    assert lines[0]["db_type"] == "neo4j"
+    assert elapsed < 1.0
+
+
+def test_bulk_test_applies_timeout_per_connection(stored_sources, auth_token):
+    """Una conexión colgada agota su tiempo sin retrasar a las demás."""
+    stored_sources["colgado"] = 1.0
+    hung = _store_connection(auth_token, "Colgado", "colgado")
+    _store_connection(auth_token, "Rapido", "rapido")
+
+    start = time.perf_counter()
+    _, lines = _bulk_test(auth_token, timeout=0.2)
+
+    assert time.perf_counter() - start < 0.9
+    assert lines[0]["conn_name"] == "Rapido"
+    assert lines[0]["success"] is True
+    assert lines[1]["connection_id"] == hung
+    assert lines[1]["success"] is False
+    assert lines[1]["message"] == "Tiempo de espera agotado"
+
+
+def test_bulk_test_runs_blocking_probes_on_dedicated_threads(
+    stored_sources, auth_token
+):
+    """pyodbc corre en los hilos de prueba, no en el threadpool de Starlette."""
+    threads = []
+
+    def connect(connection_string, timeout=None):
+        threads.append(threading.current_thread().name)
+        return MagicMock()
+
+    _store_connection(auth_token, "Origen", "origen")
+    with patch("app.services.connection_service.pyodbc.connect", side_effect=connect):
+        _, lines = _bulk_test(auth_token)
+
+    assert lines[0]["success"] is True
+    assert threads and all(name.startswith("connection-probe") for name in threads)
+
+
+def test_bulk_test_reports_failures_per_connection(stored_sources, auth_token):
+    """Un login fallido se informa en su línea con el mensaje saneado."""
+    _store_connection(auth_token, "Denegado", "denegado")
+
+    _, lines = _bulk_test(auth_token)
+
+    assert lines[0]["success"] is False
+    assert lines[0]["message"] == "Credenciales inválidas"
+
+
+def test_bulk_test_does_not_leave_pools_or_drivers_open(stored_sources, auth_token):
+    """Las conexiones sin pool ni driver se prueban con una conexión propia."""
+    source = _store_connection(auth_token, "Origen", "origen")
+    graph = _store_connection(auth_token, "Grafo", "grafo", db_type="neo4j")
+
+    _, lines = _bulk_test(auth_token)
+
+    assert all(line["success"] for line in lines)
+    assert source not in sql_server_pools
+    assert graph not in neo4j_drivers
+
+
+def test_bulk_test_only_chosen_connections(stored_sources, auth_token):
+    """Con connection_ids solo se prueban esas conexiones."""
+    chosen = _store_connection(auth_token, "Elegida", "elegida")
+    _store_connection(auth_token, "Otra", "otra")
+
+    _, lines = _bulk_test(auth_token, connection_ids=[chosen, chosen], concurrency=1)
+
+    assert [line["connection_id"] for line in lines] == [chosen]
+
+
+def test_bulk_test_forbidden_for_other_users_connections(
+    stored_sources, auth_token, auth_token_second_user
+):
+    """No se pueden probar conexiones de otro usuario."""
+    foreign = _store_connection(auth_token_second_user, "Ajena", "ajena")
+
+    response, _ = _bulk_test(auth_token, connection_ids=[foreign])
+
+    assert response.status_code == 403
@@ -0,0 +1,212 @@
+"""
+Pruebas de la caché de contraseñas desencriptadas.
+
+Cubre:
+- Una sola desencriptación por contraseña mientras dure la entrada
+- Clave por texto encriptado: un cambio de contraseña no sirve la anterior
+- Caducidad (TTL), límite de entradas y borrado del texto en claro
+- Métricas del tiempo de desencriptado ahorrado
+- Uso desde ConnectionService e invalidación al modificar conexiones
+"""
+
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core import credentials
+from app.core.credentials import CredentialCache, credential_cache
+from app.core.security import encrypt_data
+from app.main import app
+from app.models.connection import Connection
+from app.models.user import User, UserRole
+from app.services.connection_service import ConnectionService
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def decrypts():
+    """Cuenta las llamadas reales a decrypt_data."""
+    with patch.object(
+        credentials, "decrypt_data", wraps=credentials.decrypt_data
+    ) as decrypt:
+        yield decrypt
+    credential_cache.clear()
+
+
+def _stored_secret(cache, connection_id):
+    """Devuelve el bytearray guardado para una conexión."""
+    for key, entry in cache._cache._entries.items():
+        if key[0] == connection_id:
+            return entry[0]
+    return None
+
+
+def test_decrypt_is_cached(decrypts):
+    """La segunda petición de la misma contraseña no la desencripta."""
+    cache = CredentialCache(max_entries=4, ttl=60)
+    ciphertext = encrypt_data("Secreta123!")
+
+    assert cache.decrypt(1, ciphertext) == "Secreta123!"
+    assert cache.decrypt(1, ciphertext) == "Secreta123!"
+
+    assert decrypts.call_count == 1
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["decrypts"] == 1
+
+
+def test_changed_ciphertext_misses(decrypts):
+    """Una contraseña nueva de la misma conexión se desencripta de nuevo."""
+    cache = CredentialCache(max_entries=4, ttl=60)
+    cache.decrypt(1, encrypt_data("Antigua123!"))
+
+    assert cache.decrypt(1, encrypt_data("Nueva123!")) == "Nueva123!"
+    assert decrypts.call_count == 2
+
+
+def test_entries_expire_and_are_zeroed(decrypts):
+    """Al caducar, la entrada se desencripta otra vez y su copia se borra."""
+    cache = CredentialCache(max_entries=4, ttl=5)
+    ciphertext = encrypt_data("Secreta123!")
+    with patch("app.core.cache.time.monotonic") as clock:
+        clock.return_value = 100.0
+        cache.decrypt(1, ciphertext)
+        secret = _stored_secret(cache, 1)
+
+        clock.return_value = 106.0
+        assert cache.decrypt(1, ciphertext) == "Secreta123!"
+
+    assert decrypts.call_count == 2
+    assert secret == bytearray(len("Secreta123!"))
+    assert cache.stats()["expirations"] == 1
+
+
+def test_eviction_and_invalidation_zero_plaintext():
+    """Las entradas desalojadas o invalidadas se sobrescriben con ceros."""
+    cache = CredentialCache(max_entries=1, ttl=None)
+    cache.decrypt(1, encrypt_data("Primera1!"))
+    first = _stored_secret(cache, 1)
+    cache.decrypt(2, encrypt_data("Segunda2!"))
+    second = _stored_secret(cache, 2)
+
+    assert first == bytearray(9)
+    assert cache.invalidate(2) == 1
+    assert second == bytearray(9)
+    assert cache.stats()["entries"] == 0
+
+
+def test_disabled_cache_always_decrypts(decrypts):
+    """Con la caché desactivada cada petición desencripta."""
+    cache = CredentialCache(max_entries=0, ttl=60)
+    ciphertext = encrypt_data("Secreta123!")
+
+    assert cache.decrypt(1, ciphertext) == "Secreta123!"
+    assert cache.decrypt(1, ciphertext) == "Secreta123!"
+
+    assert decrypts.call_count == 2
+    assert cache.stats()["enabled"] is False
+
+
+def test_stats_estimate_saved_decrypt_time():
+    """El ahorro estimado es aciertos × media de desencriptado."""
+    cache = CredentialCache(max_entries=4, ttl=60)
+    ciphertext = encrypt_data("Secreta123!")
+    with patch("app.core.credentials.time.perf_counter", side_effect=[0.0, 0.002]):
+        cache.decrypt(1, ciphertext)
+    for _ in range(3):
+        cache.decrypt(1, ciphertext)
+
+    stats = cache.stats()
+    assert stats["decrypt_ms_total"] == 2.0
+    assert stats["decrypt_ms_avg"] == 2.0
+    assert stats["saved_ms"] == 6.0
+
+
+def test_invalid_ciphertext_raises_and_is_not_cached():
+    """Un texto que no se puede desencriptar falla y no ocupa la caché."""
+    cache = CredentialCache(max_entries=4, ttl=60)
+
+    with pytest.raises(ValueError):
+        cache.decrypt(1, "no-es-fernet")
+
+    assert cache.stats()["entries"] == 0
+
+
+@pytest.fixture
+def auth_token():
+    """Crea un usuario y retorna su token de autenticación."""
+    response = client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "credentials@example.com",
+            "password": "Test@2024!",
+            "name": "Credentials",
+            "last_name": "User",
+        },
+    )
+    return response.json()["access_token"]
+
+
+def _store_connection(auth_token):
+    response = client.post(
+        "/api/v1/connections",
+        json={
+            "conn_name": "Grafo",
+            "db_type": "neo4j",
+            "host": "localhost",
+            "port": 7687,
+            "db_user": "neo4j",
+            "db_password": "Password123!",
+        },
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+    return response.json()["connection_id"]
+
+
+def test_service_uses_cache_and_update_invalidates(decrypts, auth_token, db):
+    """ConnectionService reutiliza la contraseña hasta que cambia la conexión."""
+    connection_id = _store_connection(auth_token)
+    connection = db.query(Connection).first()
+
+    for _ in range(3):
+        assert ConnectionService.get_decrypted_password(connection) == "Password123!"
+    assert decrypts.call_count == 1
+    secret = _stored_secret(credential_cache, connection_id)
+
+    client.put(
+        f"/api/v1/connections/{connection_id}",
+        json={"db_password": "Nueva123!"},
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+
+    assert secret == bytearray(len("Password123!"))
+    db.refresh(connection)
+    assert ConnectionService.get_decrypted_password(connection) == "Nueva123!"
+
+
+def test_stats_endpoint_requires_admin(decrypts, auth_token, db):
+    """Las métricas solo las ve un administrador y no incluyen contraseñas."""
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    _store_connection(auth_token)
+    connection = db.query(Connection).first()
+    ConnectionService.get_decrypted_password(connection)
+    ConnectionService.get_decrypted_password(connection)
+
+    assert (
+        client.get("/api/v1/connections/credentials/cache/stats", headers=headers)
+    ).status_code == 403
+
+    db.query(User).update({User.role: UserRole.ADMIN})
+    db.commit()
+    response = client.get(
+        "/api/v1/connections/credentials/cache/stats", headers=headers
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["hits"] == 1
+    assert data["decrypts"] == 1
+    assert "Password123!" not in response.text
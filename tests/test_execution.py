@@ -0,0 +1,1304 @@
+"""
+Pruebas del servicio de ejecución en Neo4j.
+
+Cubre:
+- Registro de drivers por conexión (creación bajo demanda y reutilización)
+- Límites de drivers y desalojo por inactividad
+- Invalidación al actualizar o eliminar la conexión
+- Ejecución asíncrona en streaming (NDJSON y array JSON) y registro en el
+  historial
+- Concurrencia del camino asíncrono frente a un Bolt simulado
+- Paginación por cursor (reescritura del Cypher y cursores opacos)
+- Caché de resultados (aciertos, cabeceras, aislamiento e invalidación)
+- Tiempo límite de las transacciones y cancelación por desconexión
+- Plan EXPLAIN/PROFILE y política de admisión por coste estimado
+- Exportación columnar (Arrow IPC y Parquet) desde el endpoint
+- Ejecución por lotes en una transacción (agrupación con UNWIND)
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import neo4j
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from fastapi.testclient import TestClient
+from neo4j.exceptions import CypherSyntaxError, Neo4jError, ServiceUnavailable
+from neo4j.graph import Graph, Node
+from neo4j.time import Date
+
+from app.core.exceptions import ValidationError
+from app.core.security import encrypt_data
+from app.main import app
+from app.models.connection import Connection, DatabaseType
+from app.models.query import Query, QueryStatus
+from app.services.execution_service import (
+    AsyncNeo4jDriverRegistry,
+    ExecutionService,
+    Neo4jDriverRegistry,
+    decode_cursor,
+    encode_cursor,
+    execution_cache,
+    neo4j_drivers,
+    paginate_cypher,
+    serialize_value,
+    unwind_cypher,
+)
+from benchmarks.execution_load import THREADPOOL_TOKENS, run_load
+
+client = TestClient(app)
+
+
+def _connection(connection_id=1, host="localhost", password="secret", **kwargs):
+    """Crea un registro Connection de Neo4j sin guardarlo."""
+    return Connection(
+        connection_id=connection_id,
+        user_id=1,
+        conn_name=f"neo4j-{connection_id}",
+        db_type=kwargs.get("db_type", DatabaseType.NEO4J),
+        host=host,
+        port=7687,
+        db_user="neo4j",
+        db_password=encrypt_data(password),
+    )
+
+
+@pytest.fixture
+def mock_driver():
+    """Sustituye GraphDatabase.driver por un mock que crea drivers distintos."""
+    with patch("app.services.execution_service.GraphDatabase.driver") as factory:
+        factory.side_effect = lambda *args, **kwargs: MagicMock()
+        yield factory
+
+
+@pytest.fixture
+def mock_async_driver():
+    """Sustituye AsyncGraphDatabase.driver por un mock con close() asíncrono."""
+
+    def create(*args, **kwargs):
+        driver = MagicMock()
+        driver.close = AsyncMock()
+        return driver
+
+    with patch("app.services.execution_service.AsyncGraphDatabase.driver") as factory:
+        factory.side_effect = create
+        yield factory
+
+
+@pytest.fixture
+def registry():
+    """Registro pequeño para las pruebas."""
+    drivers = Neo4jDriverRegistry(
+        max_drivers=2, max_pool_size=7, idle_timeout=60, acquisition_timeout=3
+    )
+    yield drivers
+    drivers.close_all()
+
+
+def test_driver_created_lazily_and_reused(mock_driver, registry):
+    """El driver se crea en el primer uso y se reutiliza después."""
+    connection = _connection()
+
+    first = registry.get_driver(connection)
+    second = registry.get_driver(connection)
+
+    assert first is second
+    assert mock_driver.call_count == 1
+    args, kwargs = mock_driver.call_args
+    assert args == ("bolt://localhost:7687",)
+    assert kwargs["auth"] == ("neo4j", "secret")
+    assert kwargs["max_connection_pool_size"] == 7
+    assert kwargs["connection_acquisition_timeout"] == 3
+
+
+def test_driver_recreated_when_connection_changes(mock_driver, registry):
+    """Si cambian los datos de la conexión se crea un driver nuevo."""
+    connection = _connection()
+    first = registry.get_driver(connection)
+
+    connection.db_password = encrypt_data("otra")
+    second = registry.get_driver(connection)
+
+    assert second is not first
+    first.close.assert_called_once()
+    assert mock_driver.call_args.kwargs["auth"] == ("neo4j", "otra")
+
+
+def test_max_drivers_evicts_least_recently_used(mock_driver, registry):
+    """Al superar el máximo se cierra el driver menos usado."""
+    connections = {i: _connection(i) for i in (1, 2, 3)}
+    first = registry.get_driver(connections[1])
+    second = registry.get_driver(connections[2])
+    registry.get_driver(connections[1])
+    registry.get_driver(connections[3])
+
+    assert 1 in registry
+    assert 2 not in registry
+    assert 3 in registry
+    assert registry.stats()["evictions"] == 1
+    first.close.assert_not_called()
+    second.close.assert_called_once()
+
+
+def test_idle_drivers_are_evicted(mock_driver, registry):
+    """Los drivers sin uso durante idle_timeout se cierran."""
+    with patch("app.services.execution_service.time.monotonic") as clock:
+        clock.return_value = 1000.0
+        driver = registry.get_driver(_connection(1))
+
+        clock.return_value = 1059.0
+        assert registry.evict_idle() == 0
+
+        clock.return_value = 1061.0
+        assert registry.evict_idle() == 1
+
+    assert 1 not in registry
+    driver.close.assert_called_once()
+
+
+def test_invalidate_closes_driver(mock_driver, registry):
+    """invalidate() cierra el driver y el siguiente uso crea otro."""
+    connection = _connection()
+    driver = registry.get_driver(connection)
+
+    assert registry.invalidate(connection.connection_id) is True
+    assert registry.invalidate(connection.connection_id) is False
+    driver.close.assert_called_once()
+    assert registry.get_driver(connection) is not driver
+
+
+def test_non_neo4j_connection_rejected(mock_driver, registry):
+    """Solo las conexiones Neo4j tienen driver."""
+    with pytest.raises(ValidationError):
+        registry.get_driver(_connection(db_type=DatabaseType.SQL_SERVER))
+    mock_driver.assert_not_called()
+
+
+def test_async_driver_closed_outside_event_loop(mock_async_driver):
+    """Invalidar desde código síncrono cierra el driver asíncrono."""
+    drivers = AsyncNeo4jDriverRegistry(
+        max_drivers=2, max_pool_size=7, idle_timeout=60, acquisition_timeout=3
+    )
+    driver = drivers.get_driver(_connection())
+
+    assert drivers.invalidate(1) is True
+    driver.close.assert_awaited_once()
+
+
+def test_async_driver_recreated_per_event_loop(mock_async_driver):
+    """Un driver asíncrono no se reutiliza desde otro bucle de eventos."""
+    drivers = AsyncNeo4jDriverRegistry(
+        max_drivers=2, max_pool_size=7, idle_timeout=60, acquisition_timeout=3
+    )
+    connection = _connection()
+
+    async def get_twice():
+        first = drivers.get_driver(connection)
+        assert drivers.get_driver(connection) is first
+        return first
+
+    first = asyncio.run(get_twice())
+    second = asyncio.run(get_twice())
+
+    assert second is not first
+    first.close.assert_called_once()
+    asyncio.run(drivers.aclose_all())
+    second.close.assert_awaited_once()
+
+
+@pytest.fixture
+def auth_token():
+    """Crea un usuario y retorna su token de autenticación."""
+    response = client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "executor@example.com",
+            "password": "Test@2024!",
+            "name": "Exec",
+            "last_name": "User",
+        },
+    )
+    return response.json()["access_token"]
+
+
+def _create_neo4j_connection(auth_token, conn_name="Grafo"):
+    response = client.post(
+        "/api/v1/connections",
+        json={
+            "conn_name": conn_name,
+            "db_type": "neo4j",
+            "host": "localhost",
+            "port": 7687,
+            "db_user": "neo4j",
+            "db_password": "Password123!",
+        },
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+    return response.json()["connection_id"]
+
+
+@pytest.mark.parametrize("operation", ["update", "delete"])
+def test_connection_service_invalidates_driver(
+    mock_async_driver, auth_token, db, operation
+):
+    """Actualizar o eliminar una conexión cierra su driver compartido."""
+    connection_id = _create_neo4j_connection(auth_token)
+    connection = (
+        db.query(Connection).filter(Connection.connection_id == connection_id).first()
+    )
+    driver = neo4j_drivers.get_driver(connection)
+    headers = {"Authorization": f"Bearer {auth_token}"}
+
+    if operation == "update":
+        response = client.put(
+            f"/api/v1/connections/{connection_id}",
+            json={"host": "otrohost"},
+            headers=headers,
+        )
+    else:
+        response = client.delete(
+            f"/api/v1/connections/{connection_id}", headers=headers
+        )
+
+    assert response.status_code in (200, 204)
+    assert connection_id not in neo4j_drivers
+    driver.close.assert_called_once()
+
+
+class FakeResult:
+    """Resultado de Neo4j que entrega registros y opcionalmente falla."""
+
+    def __init__(self, records, fail_after=None, plan=None, profile=None):
+        self.records = records
+        self.fail_after = fail_after
+        self.consumed = 0
+        self.summary = SimpleNamespace(plan=plan, profile=profile)
+
+    async def consume(self):
+        return self.summary
+
+    async def peek(self):
+        return self.records[0] if self.records else None
+
+    async def __aiter__(self):
+        for record in self.records:
+            if self.fail_after is not None and self.consumed >= self.fail_after:
+                raise ServiceUnavailable("conexión perdida")
+            self.consumed += 1
+            yield record
+
+
+class FakeTransaction:
+    """Transacción de Neo4j que registra cómo termina."""
+
+    def __init__(self, session, timeout):
+        self.session = session
+        self.timeout = timeout
+        self.cancelled = False
+        self.closed = False
+
+    async def run(self, cypher, parameters):
+        self.session.runs.append((cypher, parameters))
+        if self.session.delay:
+            await asyncio.sleep(self.session.delay)
+        if self.session.error:
+            raise self.session.error
+        if self.session.results:
+            result = self.session.results.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+        return self.session.result
+
+    def cancel(self):
+        self.cancelled = True
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeSession:
+    """Sesión de Neo4j que devuelve un FakeResult o lanza un error al ejecutar."""
+
+    def __init__(self, result=None, error=None, delay=0, **config):
+        self.result = result
+        self.error = error
+        self.delay = delay
+        self.config = config
+        # Resultados (o errores) de las sucesivas sentencias, antes que result
+        self.results = []
+        self.runs = []
+        self.transactions = []
+        self.closed = False
+
+    async def begin_transaction(self, timeout=None):
+        self.transactions.append(FakeTransaction(self, timeout))
+        return self.transactions[-1]
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_session(mock_async_driver):
+    """Hace que los drivers creados abran siempre la misma FakeSession."""
+    session = FakeSession(result=FakeResult([]))
+
+    def open_session(**config):
+        session.config = config
+        return session
+
+    driver = MagicMock()
+    driver.session.side_effect = open_session
+    driver.close = AsyncMock()
+    mock_async_driver.side_effect = lambda *args, **kwargs: driver
+    yield session
+    neo4j_drivers.close_all()
+
+
+def _translated_query(auth_token, connection_id, sql="SELECT * FROM Users"):
+    response = client.post(
+        "/api/v1/queries/translate",
+        json={
+            "sql_query": sql,
+            "neo4j_connection_id": connection_id,
+            "parameterize": True,
+        },
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+    return response.json()["query_id"]
+
+
+def _execute(auth_token, query_id, **body):
+    return client.post(
+        "/api/v1/queries/execute",
+        json={"query_id": query_id, **body},
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+
+
+def _stored_query(db, query_id):
+    db.expire_all()
+    return db.query(Query).filter(Query.query_id == query_id).first()
+
+
+def test_execute_streams_ndjson_in_fetch_size_chunks(fake_session, auth_token, db):
+    """NDJSON emite un registro por línea y actualiza el historial."""
+    fake_session.result = FakeResult([{"n.name": f"user{i}"} for i in range(5)])
+    connection_id = _create_neo4j_connection(auth_token)
+    query_id = _translated_query(
+        auth_token, connection_id, "SELECT name FROM Users WHERE age > 18"
+    )
+
+    with client.stream(
+        "POST",
+        "/api/v1/queries/execute",
+        json={"query_id": query_id, "fetch_size": 2},
+        headers={"Authorization": f"Bearer {auth_token}"},
+    ) as response:
+        chunks = list(response.iter_raw())
+        media_type = response.headers["content-type"]
+
+    assert media_type.startswith("application/x-ndjson")
+    lines = b"".join(chunks).decode().splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"n.name": f"user{i}"} for i in range(5)
+    ]
+    assert fake_session.config["fetch_size"] == 2
+    assert fake_session.config["default_access_mode"] == neo4j.READ_ACCESS
+    assert fake_session.runs == [
+        ("MATCH (n:Users)\nWHERE n.age > $p0\nRETURN n.name", {"p0": 18})
+    ]
+    assert fake_session.closed
+
+    query = _stored_query(db, query_id)
+    assert query.status == QueryStatus.EJECUTADO
+    assert query.nodes_affected == 5
+    assert query.execution_time is not None
+
+
+def test_execute_streams_json_array(fake_session, auth_token, db):
+    """El formato json devuelve un array válido."""
+    fake_session.result = FakeResult([{"x": 1}, {"x": 2}, {"x": 3}])
+    connection_id = _create_neo4j_connection(auth_token)
+    query_id = _translated_query(auth_token, connection_id)
+
+    response = _execute(auth_token, query_id, format="json")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/json")
+    assert response.json() == [{"x": 1}, {"x": 2}, {"x": 3}]
+
+
+def test_execute_empty_result(fake_session, auth_token, db):
+    """Un resultado vacío produce un array vacío y 0 nodos afectados."""
+    connection_id = _create_neo4j_connection(auth_token)
+    query_id = _translated_query(auth_token, connection_id)
+
+    response = _execute(auth_token, query_id, format="json")
+
+    assert response.json() == []
+    assert _stored_query(db, query_id).nodes_affected == 0
+
+
+def test_execute_reports_cypher_error_before_streaming(fake_session, auth_token, db):
+    """Un error de Cypher se devuelve como 400 y queda registrado."""
+    fake_session.error = CypherSyntaxError("Invalid input")
+    connection_id = _create_neo4j_connection(auth_token)
+    query_id = _translated_query(auth_token, connection_id)
+
+    response = _execute(auth_token, query_id)
+
+    assert response.status_code == 400
+    assert fake_session.closed
+    query = _stored_query(db, query_id)
+    assert query.status == QueryStatus.FALLIDO
+    assert "Neo4j" in query.error_message
+
+
+def test_execute_reports_mid_stream_error(fake_session, auth_token, db):
+    """Un fallo a mitad del resultado se informa en la última línea NDJSON."""
+    fake_session.result = FakeResult([{"x": i} for i in range(4)], fail_after=2)
+    connection_id = _create_neo4j_connection(auth_token)
+    query_id = _translated_query(auth_token, connection_id)
+
+    response = _execute(auth_token, query_id, fetch_size=1)
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines[:2] == [{"x": 0}, {"x": 1}]
+    assert lines[2] == {"error": "No se puede conectar con Neo4j"}
+    query = _stored_query(db, query_id)
+    assert query.status == QueryStatus.FALLIDO
+    assert query.nodes_affected == 2
+
+
+def test_execute_requires_connection(fake_session, auth_token):
+    """Sin conexión en la solicitud ni en la consulta se devuelve 400."""
+    query_id = _translated_query(auth_token, None)
+
+    response = _execute(auth_token, query_id)
+
+    assert response.status_code == 400
+
+
+def test_execute_rejects_other_users_query(fake_session, auth_token):
+    """Un usuario no puede ejecutar la consulta de otro."""
+    connection_id = _create_neo4j_connection(auth_token)
+    query_id = _translated_query(auth_token, connection_id)
+    other = client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "otro.executor@example.com",
+            "password": "Test@2024!",
+            "name": "Otro",
+            "last_name": "User",
+        },
+    ).json()["access_token"]
+
+    assert _execute(other, query_id).status_code == 403
+    assert _execute(other, 999999).status_code == 404
+
+
+def test_serialize_value_converts_graph_and_temporal_types():
+    """Nodos y tipos temporales se convierten a valores JSON."""
+    node = Node(
+        Graph(), "4:abc:1", 1, ["Users"], {"name": "Ana", "born": Date(2000, 1, 2)}
+    )
+
+    assert serialize_value({"n": node, "tags": ("a", "b")}) == {
+        "n": {
+            "element_id": "4:abc:1",
+            "labels": ["Users"],
+            "properties": {"name": "Ana", "born": "2000-01-02"},
+        },
+        "tags": ["a", "b"],
+    }
+
+
+def test_async_execution_waits_concurrently():
+    """Cientos de consultas lentas esperan a la vez sin agotar el threadpool.
+
+    Con endpoints síncronos, como mucho 40 peticiones (el tamaño por defecto
+    del threadpool de Starlette) podrían estar esperando a Neo4j a la vez.
+    """
+    report = run_load(requests=100, latency=0.5)
+
+    assert report["errors"] == 0
+    assert report["peak_in_flight"] > THREADPOOL_TOKENS
+    assert report["async_seconds"] < report["threadpool_seconds"]
+
+
+def test_paginate_cypher_first_page_by_element_id():
+    """La primera página solo añade orden y límite."""
+    cypher, parameters = paginate_cypher(
+        "MATCH (n:Users)\nRETURN n", "elementId", None, 11
+    )
+
+    assert cypher == (
+        "MATCH (n:Users)\n"
+        "RETURN n, elementId(n) AS _cursor_id\n"
+        "ORDER BY elementId(n)\n"
+        "LIMIT $page_limit"
+    )
+    assert parameters == {"page_limit": 11}
+
+
+def test_paginate_cypher_next_page_by_property_keeps_where():
+    """Las páginas siguientes combinan el WHERE original con la clave."""
+    cypher, parameters = paginate_cypher(
+        "MATCH (n:Users)\nWHERE n.age > $p0\nRETURN n.name",
+        "name",
+        ("Ana", "4:x:7"),
+        5,
+    )
+
+    assert cypher == (
+        "MATCH (n:Users)\n"
+        "WHERE (n.age > $p0) AND (n.name > $cursor_value OR "
+        "(n.name = $cursor_value AND elementId(n) > $cursor_id) "
+        "OR n.name IS NULL)\n"
+        "RETURN n.name, n.name AS _cursor_value, elementId(n) AS _cursor_id\n"
+        "ORDER BY n.name, elementId(n)\n"
+        "LIMIT $page_limit"
+    )
+    assert parameters == {
+        "page_limit": 5,
+        "cursor_value": "Ana",
+        "cursor_id": "4:x:7",
+    }
+
+
+@pytest.mark.parametrize(
+    "order_key, cypher",
+    [
+        ("name) DETACH DELETE n //", "MATCH (n:Users)\nRETURN n"),
+        ("name", "MATCH (n:Users)\nRETURN n\nORDER BY n.name"),
+        ("name", "MATCH (n:Users)\nRETURN n\nLIMIT 5"),
+    ],
+)
+def test_paginate_cypher_rejects_invalid_input(order_key, cypher):
+    """Claves que no son identificadores o consultas ya limitadas se rechazan."""
+    with pytest.raises(ValidationError):
+        paginate_cypher(cypher, order_key, None, 10)
+
+
+def test_cursor_round_trip_and_validation():
+    """El cursor es opaco, reversible y ligado a la clave de ordenación."""
+    cursor = encode_cursor("name", "Ana", "4:x:7")
+
+    assert "Ana" not in cursor
+    assert decode_cursor(cursor, "name") == ("Ana", "4:x:7")
+    with pytest.raises(ValidationError):
+        decode_cursor(cursor, "elementId")
+    with pytest.raises(ValidationError):
+        decode_cursor("no-es-un-cursor", "name")
+
+
+def test_execute_page_returns_cursor_for_next_page(fake_session, auth_token, db):
+    """Cada página pide page_size + 1 filas y continúa tras la última."""
+    fake_session.result = FakeResult(
+        [{"n.name": f"user{i}", "_cursor_id": f"4:x:{i}"} for i in range(3)]
+    )
+    connection_id = _create_neo4j_connection(auth_token)
+    query_id = _translated_query(auth_token, connection_id, "SELECT name FROM Users")
+    headers = {"Authorization": f"Bearer {auth_token}"}
+
+    first = client.post(
+        "/api/v1/queries/execute/page",
+        json={"query_id": query_id, "page_size": 2},
+        headers=headers,
+    ).json()
+
+    assert first["rows"] == [{"n.name": "user0"}, {"n.name": "user1"}]
+    assert first["has_more"] is True
+    assert fake_session.runs[-1][1] == {"page_limit": 3}
+    assert fake_session.config["default_access_mode"] == neo4j.READ_ACCESS
+
+    fake_session.result = FakeResult([{"n.name": "user2", "_cursor_id": "4:x:2"}])
+    second = client.post(
+        "/api/v1/queries/execute/page",
+        json={"query_id": query_id, "page_size": 2, "cursor": first["next_cursor"]},
+        headers=headers,
+    ).json()
+
+    assert second == {
+        "rows": [{"n.name": "user2"}],
+        "next_cursor": None,
+        "has_more": False,
+        "page_size": 2,
+    }
+    assert fake_session.runs[-1][1] == {"page_limit": 3, "cursor_id": "4:x:1"}
+    assert "elementId(n) > $cursor_id" in fake_session.runs[-1][0]
+    assert _stored_query(db, query_id).nodes_affected == 1
+
+
+def test_execute_page_continues_into_rows_without_order_key(fake_session, auth_token):
+    """Las filas con la propiedad nula van al final y no se pierden entre páginas."""
+    connection_id = _create_neo4j_connection(auth_token)
+    query_id = _translated_query(auth_token, connection_id, "SELECT name FROM Users")
+    headers = {"Authorization": f"Bearer {auth_token}"}
+
+    def page(rows, cursor=None):
+        fake_session.result = FakeResult(
+            [
+                {"n.name": name, "_cursor_value": name, "_cursor_id": element_id}
+                for name, element_id in rows
+            ]
+        )
+        body = {"query_id": query_id, "page_size": 2, "order_key": "name"}
+        if cursor:
+            body["cursor"] = cursor
+        return client.post(
+            "/api/v1/queries/execute/page", json=body, headers=headers
+        ).json()
+
+    first = page([("Ana", "4:x:1"), ("Eva", "4:x:2"), (None, "4:x:3")])
+    second = page(
+        [(None, "4:x:3"), (None, "4:x:5"), (None, "4:x:8")], first["next_cursor"]
+    )
+
+    # Tras un valor no nulo la página siguiente incluye las filas sin valor
+    cypher, parameters = fake_session.runs[-1]
+    assert "OR n.name IS NULL)" in cypher
+    assert parameters == {"page_limit": 3, "cursor_value": "Eva", "cursor_id": "4:x:2"}
+    assert second["rows"] == [{"n.name": None}, {"n.name": None}]
+    assert decode_cursor(second["next_cursor"], "name") == (None, "4:x:5")
+
+    page([(None, "4:x:8")], second["next_cursor"])
+
+    # Tras un nulo solo siguen los nulos con elementId mayor
+    cypher, parameters = fake_session.runs[-1]
+    assert "WHERE (n.name IS NULL AND elementId(n) > $cursor_id)" in cypher
+    assert parameters == {"page_limit": 3, "cursor_id": "4:x:5"}
+
+
+def test_execute_page_rejects_foreign_cursor(fake_session, auth_token):
+    """Un cursor creado con otra clave de ordenación devuelve 400."""
+    connection_id = _create_neo4j_connection(auth_token)
+    query_id = _translated_query(auth_token, connection_id)
+
+    response = client.post(
+        "/api/v1/queries/execute/page",
+        json={
+            "query_id": query_id,
+            "cursor": encode_cursor("name", "Ana", "4:x:1"),
+        },
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+
+    assert response.status_code == 400
+
+
+@pytest.fixture
+def result_cache(monkeypatch):
+    """Activa la caché de resultados durante la prueba."""
+    monkeypatch.setattr(execution_cache, "max_entries", 100)
+    execution_cache.clear()
+    yield execution_cache
+    execution_cache.clear()
+
+
+def test_execute_serves_repeated_query_from_cache(
+    fake_session, result_cache, auth_token
+):
+    """La segunda ejecución idéntica no consulta Neo4j."""
+    fake_session.result = FakeResult([{"x": 1}, {"x": 2}])
+    connection_id = _create_neo4j_connection(auth_token)
+    query_id = _translated_query(auth_token, connection_id)
+
+    first = _execute(auth_token, query_id)
+    second = _execute(auth_token, query_id, format="json")
+
+    assert first.headers["x-cache"] == "MISS"
+    assert second.headers["x-cache"] == "HIT"
+    assert second.headers["age"] == "0"
+    assert second.json() == [{"x": 1}, {"x": 2}]
+    assert len(fake_session.runs) == 1
+
+
+def test_execute_cache_counts_utf8_bytes(fake_session, result_cache, auth_token):
+    """El tamaño de una entrada se mide en bytes UTF-8, no en caracteres."""
+    fake_session.result = FakeResult([{"x": "ñandú"}, {"x": "€"}])
+    connection_id = _create_neo4j_connection(auth_token)
+    query_id = _translated_query(auth_token, connection_id)
+
+    _execute(auth_token, query_id)
+
+    rows = ['{"x": "ñandú"}', '{"x": "€"}']
+    assert result_cache.stats()["bytes"] == sum(len(row.encode()) for row in rows)
+    assert result_cache.stats()["bytes"] > sum(len(row) for row in rows)
+
+
+def test_execute_cache_bypass_and_errors_not_cached(
+    fake_session, result_cache, auth_token
+):
+    """cache_ttl=0 no usa la caché y un resultado fallido no se guarda."""
+    fake_session.result = FakeResult([{"x": 1}, {"x": 2}], fail_after=1)
+    connection_id = _create_neo4j_connection(auth_token)
+    query_id = _translated_query(auth_token, connection_id)
+
+    assert _execute(auth_token, query_id).headers["x-cache"] == "MISS"
+    assert len(result_cache) == 0
+
+    fake_session.result = FakeResult([{"x": 1}])
+    response = _execute(auth_token, query_id, cache_ttl=0)
+    assert response.headers["x-cache"] == "BYPASS"
+    assert len(result_cache) == 0
+
+
+def test_execute_cache_isolated_per_user_and_invalidated(
+    fake_session, result_cache, auth_token
+):
+    """Otro usuario no recibe resultados ajenos y la invalidación los borra."""
+    fake_session.result = FakeResult([{"x": 1}])
+    connection_id = _create_neo4j_connection(auth_token)
+    query_id = _translated_query(auth_token, connection_id)
+    _execute(auth_token, query_id)
+
+    other = client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "cache.executor@example.com",
+            "password": "Test@2024!",
+            "name": "Otro",
+            "last_name": "User",
+        },
+    ).json()["access_token"]
+    other_connection = _create_neo4j_connection(other)
+    other_query = _translated_query(other, other_connection)
+    fake_session.result = FakeResult([{"x": 1}])
+    assert _execute(other, other_query).headers["x-cache"] == "MISS"
+
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    response = client.delete(
+        "/api/v1/queries/execute/cache",
+        params={"neo4j_connection_id": connection_id},
+        headers=headers,
+    )
+    assert response.json() == {"invalidated": 1}
+    assert len(result_cache) == 1
+
+    forbidden = client.delete(
+        "/api/v1/queries/execute/cache",
+        params={"neo4j_connection_id": other_connection},
+        headers=headers,
+    )
+    assert forbidden.status_code == 403
+
+
+def test_connection_update_invalidates_cached_results(
+    fake_session, result_cache, auth_token
+):
+    """Modificar la conexión descarta sus resultados cacheados."""
+    fake_session.result = FakeResult([{"x": 1}])
+    connection_id = _create_neo4j_connection(auth_token)
+    query_id = _translated_query(auth_token, connection_id)
+    _execute(auth_token, query_id)
+
+    client.put(
+        f"/api/v1/connections/{connection_id}",
+        json={"host": "otrohost"},
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+
+    assert len(result_cache) == 0
+
+
+def test_execute_page_uses_cache(fake_session, result_cache, auth_token):
+    """Las páginas repetidas se sirven desde la caché."""
+    fake_session.result = FakeResult([{"n": 1, "_cursor_id": "4:x:1"}])
+    connection_id = _create_neo4j_connection(auth_token)
+    query_id = _translated_query(auth_token, connection_id)
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    body = {"query_id": query_id, "page_size": 5}
+
+    first = client.post("/api/v1/queries/execute/page", json=body, headers=headers)
+    second = client.post("/api/v1/queries/execute/page", json=body, headers=headers)
+
+    assert first.headers["x-cache"] == "MISS"
+    assert second.headers["x-cache"] == "HIT"
+    assert second.json() == first.json()
+    assert len(fake_session.runs) == 1
+
+
+def test_effective_timeout_never_exceeds_connection_limit(monkeypatch):
+    """La petición puede acortar el límite de la conexión, pero no ampliarlo."""
+    monkeypatch.setattr(
+        "app.services.execution_service.settings.NEO4J_QUERY_TIMEOUT_SECONDS", 60.0
+    )
+    default = _connection()
+    default.query_timeout_seconds = None
+    limited = _connection()
+    limited.query_timeout_seconds = 5.0
+
+    assert ExecutionService.effective_timeout(default) == 60.0
+    assert ExecutionService.effective_timeout(default, 10.0) == 10.0
+    assert ExecutionService.effective_timeout(limited) == 5.0
+    assert ExecutionService.effective_timeout(limited, 30.0) == 5.0
+
+    monkeypatch.setattr(
+        "app.services.execution_service.settings.NEO4J_QUERY_TIMEOUT_SECONDS", 0.0
+    )
+    assert ExecutionService.effective_timeout(default) is None
+
+
+def test_execute_passes_timeout_to_transaction(fake_session, auth_token):
+    """El tiempo límite de la conexión y de la petición llega a la transacción."""
+    fake_session.result = FakeResult([{"x": 1}])
+    response = client.post(
+        "/api/v1/connections",
+        json={
+            "conn_name": "Grafo lento",
+            "db_type": "neo4j",
+            "host": "localhost",
+            "port": 7687,
+            "db_user": "neo4j",
+            "db_password": "Password123!",
+            "query_timeout_seconds": 20,
+        },
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+    assert response.json()["query_timeout_seconds"] == 20
+    query_id = _translated_query(auth_token, response.json()["connection_id"])
+
+    _execute(auth_token, query_id)
+    _execute(auth_token, query_id, timeout=2.5)
+
+    first, second = fake_session.transactions
+    assert (first.timeout, second.timeout) == (20, 2.5)
+    assert first.closed and not first.cancelled
+
+
+def test_execute_server_timeout_returns_504(fake_session, auth_token, db):
+    """Si Neo4j aborta la transacción por tiempo, se registra TIEMPO_AGOTADO."""
+    fake_session.error = Neo4jError._hydrate_neo4j(
+        code="Neo.ClientError.Transaction.TransactionTimedOutClientConfiguration",
+        message="The transaction has been terminated.",
+    )
+    connection_id = _create_neo4j_connection(auth_token)
+    query_id = _translated_query(auth_token, connection_id)
+
+    response = _execute(auth_token, query_id, timeout=1)
+
+    assert response.status_code == 504
+    assert fake_session.transactions[0].cancelled
+    query = _stored_query(db, query_id)
+    assert query.status == QueryStatus.TIEMPO_AGOTADO
+    assert query.execution_time is not None
+
+
+def test_execute_client_timeout_cancels_transaction(
+    fake_session, auth_token, db, monkeypatch
+):
+    """Si Neo4j no responde a tiempo, el cliente abandona y cancela."""
+    monkeypatch.setattr(
+        "app.services.execution_service._CLIENT_TIMEOUT_GRACE_SECONDS", 0
+    )
+    fake_session.delay = 5
+    connection_id = _create_neo4j_connection(auth_token)
+    query_id = _translated_query(auth_token, connection_id)
+
+    response = _execute(auth_token, query_id, timeout=0.05)
+
+    assert response.status_code == 504
+    assert fake_session.transactions[0].cancelled
+    assert fake_session.closed
+    assert _stored_query(db, query_id).status == QueryStatus.TIEMPO_AGOTADO
+
+
+def test_client_disconnect_cancels_transaction(fake_session, auth_token, db):
+    """Una desconexión a mitad del resultado cancela la transacción."""
+    fake_session.result = FakeResult([{"x": i} for i in range(1000)])
+    connection_id = _create_neo4j_connection(auth_token)
+    query_id = _translated_query(auth_token, connection_id)
+    query = _stored_query(db, query_id)
+    connection = (
+        db.query(Connection).filter(Connection.connection_id == connection_id).first()
+    )
+
+    async def consume():
+        disconnected = asyncio.Event()
+
+        async def receive():
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        stream = await ExecutionService.open_stream(db, query, connection, 10)
+        chunks = 0
+        async for _ in ExecutionService.stream_results(
+            db, query_id, stream, "ndjson", receive=receive
+        ):
+            chunks += 1
+            if chunks == 2:
+                disconnected.set()
+                await asyncio.sleep(0)
+        return chunks
+
+    chunks = asyncio.run(consume())
+
+    transaction = fake_session.transactions[0]
+    assert transaction.cancelled and not transaction.closed
+    assert chunks < 100
+    query = _stored_query(db, query_id)
+    assert query.status == QueryStatus.CANCELADO
+    assert query.execution_time is not None
+
+
+PLAN = {
+    "operatorType": "ProduceResults@neo4j",
+    "args": {"EstimatedRows": 10.0, "Details": "n"},
+    "identifiers": ["n"],
+    "children": [
+        {
+            "operatorType": "Filter@neo4j",
+            "args": {"EstimatedRows": 10.0, "Details": "n.age > $p0"},
+            "identifiers": ["n"],
+            "children": [
+                {
+                    "operatorType": "NodeByLabelScan@neo4j",
+                    "args": {"EstimatedRows": 1000.0, "Details": "n:Users"},
+                    "identifiers": ["n"],
+                    "children": [],
+                }
+            ],
+        }
+    ],
+}
+
+
+def test_explain_returns_plan_and_stores_summary(fake_session, auth_token, db):
+    """EXPLAIN devuelve el árbol y guarda el resumen junto a la consulta."""
+    fake_session.result = FakeResult([], plan=PLAN)
+    connection_id = _create_neo4j_connection(auth_token)
+    query_id = _translated_query(
+        auth_token, connection_id, "SELECT * FROM Users WHERE age > 18"
+    )
+
+    response = client.post(
+        "/api/v1/queries/explain",
+        json={"query_id": query_id},
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["mode"] == "EXPLAIN"
+    assert body["plan"]["children"][0]["children"][0]["operator"] == "NodeByLabelScan"
+    assert body["estimated_cost"] == 1020.0
+    assert body["admitted"] and body["max_estimated_cost"] is None
+    assert len(body["warnings"]) == 1
+    cypher, _ = fake_session.runs[0]
+    assert cypher.startswith("EXPLAIN MATCH")
+    assert fake_session.transactions[0].closed
+    assert fake_session.config["default_access_mode"] == neo4j.READ_ACCESS
+    stored = _stored_query(db, query_id)
+    assert stored.plan_summary["estimated_cost"] == 1020.0
+    assert "plan" not in stored.plan_summary
+    assert stored.status == QueryStatus.TRADUCIDO
+
+
+def test_explain_profile_mode(fake_session, auth_token):
+    """PROFILE devuelve db hits y filas reales."""
+    profiled = {**PLAN, "dbHits": 0, "rows": 7, "children": []}
+    fake_session.result = FakeResult([], profile=profiled)
+    connection_id = _create_neo4j_connection(auth_token)
+    query_id = _translated_query(auth_token, connection_id)
+
+    response = client.post(
+        "/api/v1/queries/explain",
+        json={"query_id": query_id, "profile": True},
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+
+    body = response.json()
+    assert body["mode"] == "PROFILE"
+    assert (body["db_hits"], body["rows"]) == (0, 7)
+    assert fake_session.runs[0][0].startswith("PROFILE ")
+
+
+def test_execute_rejected_by_admission_policy(
+    fake_session, auth_token, db, monkeypatch
+):
+    """Con umbral, las consultas con coste estimado excesivo no se ejecutan."""
+    monkeypatch.setattr(
+        "app.services.execution_service.settings.EXECUTION_MAX_ESTIMATED_COST", 500.0
+    )
+    fake_session.result = FakeResult([{"x": 1}], plan=PLAN)
+    connection_id = _create_neo4j_connection(auth_token)
+    query_id = _translated_query(auth_token, connection_id)
+
+    response = _execute(auth_token, query_id)
+
+    assert response.status_code == 400
+    assert "coste estimado" in response.json()["detail"]
+    assert len(fake_session.runs) == 1
+    assert fake_session.transactions[0].cancelled
+    stored = _stored_query(db, query_id)
+    assert stored.status == QueryStatus.FALLIDO
+    assert stored.plan_summary["estimated_cost"] == 1020.0
+
+
+def test_execute_admitted_by_admission_policy(
+    fake_session, auth_token, db, monkeypatch
+):
+    """Un plan bajo el umbral se ejecuta en la misma transacción."""
+    monkeypatch.setattr(
+        "app.services.execution_service.settings.EXECUTION_MAX_ESTIMATED_COST", 5000.0
+    )
+    fake_session.result = FakeResult([{"x": 1}], plan=PLAN)
+    connection_id = _create_neo4j_connection(auth_token)
+    query_id = _translated_query(auth_token, connection_id)
+
+    response = _execute(auth_token, query_id)
+
+    assert response.status_code == 200
+    explain, execute = fake_session.runs
+    assert explain[0].startswith("EXPLAIN ")
+    assert not execute[0].startswith("EXPLAIN ")
+    assert len(fake_session.transactions) == 1
+    stored = _stored_query(db, query_id)
+    assert stored.status == QueryStatus.EJECUTADO
+    assert stored.plan_summary["mode"] == "EXPLAIN"
+
+
+@pytest.mark.parametrize("output_format", ["arrow", "parquet"])
+def test_execute_exports_columnar_formats(
+    fake_session, result_cache, auth_token, db, output_format
+):
+    """Arrow IPC y Parquet se generan por lotes con el esquema del RETURN."""
+    fake_session.result = FakeResult(
+        [{"n.name": f"user{i}", "n.age": 20 + i} for i in range(5)]
+    )
+    connection_id = _create_neo4j_connection(auth_token)
+    query_id = _translated_query(
+        auth_token, connection_id, "SELECT name, age FROM Users"
+    )
+
+    response = _execute(auth_token, query_id, format=output_format, fetch_size=2)
+
+    assert response.status_code == 200
+    assert response.headers["x-cache"] == "BYPASS"
+    assert f"query_{query_id}." in response.headers["content-disposition"]
+    if output_format == "arrow":
+        assert response.headers["content-type"].startswith(
+            "application/vnd.apache.arrow.stream"
+        )
+        table = pa.ipc.open_stream(response.content).read_all()
+    else:
+        table = pq.read_table(pa.BufferReader(response.content))
+    assert table.schema.names == ["n.name", "n.age"]
+    assert table.schema.field("n.age").type == pa.int64()
+    assert table.column("n.age").to_pylist() == [20, 21, 22, 23, 24]
+    assert len(result_cache) == 0
+    query = _stored_query(db, query_id)
+    assert query.status == QueryStatus.EJECUTADO
+    assert query.nodes_affected == 5
+
+
+def test_execute_columnar_mid_stream_error_leaves_stream_unfinished(
+    fake_session, auth_token, db
+):
+    """Si Neo4j falla a mitad, el flujo Arrow queda sin su marca de fin."""
+    fake_session.result = FakeResult([{"x": i} for i in range(4)], fail_after=2)
+    connection_id = _create_neo4j_connection(auth_token)
+    query_id = _translated_query(auth_token, connection_id)
+
+    response = _execute(auth_token, query_id, format="arrow", fetch_size=1)
+
+    reader = pa.ipc.open_stream(response.content)
+    assert [batch.num_rows for batch in _read_batches(reader)] == [1, 1]
+    assert not response.content.endswith(b"\xff\xff\xff\xff\x00\x00\x00\x00")
+    assert _stored_query(db, query_id).status == QueryStatus.FALLIDO
+
+
+def _read_batches(reader):
+    batches = []
+    try:
+        for batch in reader:
+            batches.append(batch)
+    except pa.ArrowInvalid, OSError:
+        pass
+    return batches
+
+
+def test_execute_applies_default_row_limit(fake_session, auth_token, monkeypatch):
+    """Sin LIMIT ni TOP, /execute añade el límite por defecto al Cypher."""
+    monkeypatch.setattr(
+        "app.services.execution_service.settings.EXECUTION_DEFAULT_ROW_LIMIT", 100
+    )
+    fake_session.result = FakeResult([{"x": 1}])
+    connection_id = _create_neo4j_connection(auth_token)
+    unlimited = _translated_query(auth_token, connection_id)
+    limited = _translated_query(
+        auth_token, connection_id, "SELECT * FROM Users ORDER BY name LIMIT 5"
+    )
+
+    capped = _execute(auth_token, unlimited)
+    explicit = _execute(auth_token, limited)
+
+    assert capped.headers["x-row-limit"] == "100"
+    assert fake_session.runs[0][0] == "MATCH (n:Users)\nRETURN n\nLIMIT 100"
+    assert "x-row-limit" not in explicit.headers
+    assert fake_session.runs[1][0].endswith("ORDER BY n.name\nLIMIT 5")
+
+
+def test_unwind_cypher_runs_each_row_in_a_subquery():
+    """El Cypher se ejecuta por fila de $rows y ORDER BY/LIMIT siguen por consulta."""
+    cypher = (
+        "MATCH (n:Users)\n"
+        "WHERE n.age > $p0 AND n.city = $p1\n"
+        "RETURN n.name, n\n"
+        "ORDER BY n.age DESC\n"
+        "LIMIT 5"
+    )
+
+    assert unwind_cypher(cypher) == (
+        "UNWIND $rows AS _row\n"
+        "CALL {\n"
+        "  WITH _row\n"
+        "  MATCH (n:Users)\n"
+        "  WHERE n.age > _row.p0 AND n.city = _row.p1\n"
+        "  RETURN n.name AS `n.name`, n AS `n`\n"
+        "  ORDER BY n.age DESC\n"
+        "  LIMIT 5\n"
+        "}\n"
+        "RETURN _row._index AS _batch_index, `n.name`, `n`"
+    )
+    assert unwind_cypher("MATCH (n:Users)") is None
+
+
+def _execute_batch(auth_token, query_ids, **body):
+    return client.post(
+        "/api/v1/queries/execute/batch",
+        json={"query_ids": query_ids, **body},
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+
+
+def _batch_queries(auth_token, connection_id):
+    """Tres consultas con la misma forma (dos idénticas) y una distinta."""
+    return [
+        _translated_query(
+            auth_token, connection_id, "SELECT name FROM Users WHERE age > 18"
+        ),
+        _translated_query(
+            auth_token, connection_id, "SELECT name FROM Users WHERE age > 30"
+        ),
+        _translated_query(auth_token, connection_id, "SELECT * FROM Products"),
+        _translated_query(
+            auth_token, connection_id, "SELECT name FROM Users WHERE age > 30"
+        ),
+    ]
+
+
+def test_execute_batch_groups_same_shape_queries_with_unwind(
+    fake_session, auth_token, db
+):
+    """Las consultas con el mismo Cypher van en un UNWIND y el resto después."""
+    fake_session.results = [
+        FakeResult(
+            [
+                {"_batch_index": 0, "n.name": "ana"},
+                {"_batch_index": 1, "n.name": "bea"},
+                {"_batch_index": 0, "n.name": "bea"},
+            ]
+        ),
+        FakeResult([{"n": {"sku": 1}}]),
+    ]
+    connection_id = _create_neo4j_connection(auth_token)
+    query_ids = _batch_queries(auth_token, connection_id)
+
+    response = _execute_batch(auth_token, query_ids)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["statements"] == 2
+    assert (body["total"], body["successful"], body["failed"]) == (4, 4, 0)
+    assert [item["rows"] for item in body["results"]] == [
+        [{"n.name": "ana"}, {"n.name": "bea"}],
+        [{"n.name": "bea"}],
+        [{"n": {"sku": 1}}],
+        [{"n.name": "bea"}],
+    ]
+    unwound, parameters = fake_session.runs[0]
+    assert unwound.startswith("UNWIND $rows AS _row\nCALL {\n  WITH _row\n")
+    assert parameters == {"rows": [{"p0": 18, "_index": 0}, {"p0": 30, "_index": 1}]}
+    assert fake_session.runs[1] == ("MATCH (n:Products)\nRETURN n", {})
+    # Una sola transacción de lectura, sin commit
+    assert fake_session.config["default_access_mode"] == neo4j.READ_ACCESS
+    assert len(fake_session.transactions) == 1
+    assert fake_session.transactions[0].closed is True
+    assert fake_session.closed is True
+    stored = _stored_query(db, query_ids[0])
+    assert stored.status == QueryStatus.EJECUTADO
+    assert stored.nodes_affected == 2
+
+
+def test_execute_batch_without_unwind_sends_one_statement_per_query(
+    fake_session, auth_token
+):
+    """Sin unwind cada consulta distinta es una sentencia; las idénticas, una."""
+    connection_id = _create_neo4j_connection(auth_token)
+    query_ids = _batch_queries(auth_token, connection_id)
+
+    response = _execute_batch(auth_token, query_ids, unwind=False)
+
+    assert response.json()["statements"] == 3
+    assert [run[1] for run in fake_session.runs] == [{"p0": 18}, {"p0": 30}, {}]
+    assert len(fake_session.transactions) == 1
+
+
+def test_execute_batch_error_aborts_remaining_statements(fake_session, auth_token, db):
+    """Un error de Neo4j falla su sentencia y deja sin ejecutar las siguientes."""
+    fake_session.results = [
+        FakeResult([{"n.name": "ana"}]),
+        Neo4jError._hydrate_neo4j(
+            code="Neo.ClientError.Statement.SyntaxError", message="Invalid input"
+        ),
+    ]
+    connection_id = _create_neo4j_connection(auth_token)
+    query_ids = _batch_queries(auth_token, connection_id)[:3]
+
+    response = _execute_batch(auth_token, query_ids, unwind=False)
+
+    results = response.json()["results"]
+    assert [item["success"] for item in results] == [True, False, False]
+    assert "Invalid input" in results[1]["error"]
+    assert results[2]["error"].startswith("Consulta no ejecutada")
+    assert len(fake_session.runs) == 2
+    assert fake_session.transactions[0].cancelled is True
+    assert _stored_query(db, query_ids[1]).status == QueryStatus.FALLIDO
+    assert _stored_query(db, query_ids[2]).status == QueryStatus.TRADUCIDO
+
+
+def test_execute_batch_requires_a_shared_connection(fake_session, auth_token):
+    """Consultas asociadas a conexiones distintas necesitan neo4j_connection_id."""
+    first = _translated_query(auth_token, _create_neo4j_connection(auth_token))
+    second = _translated_query(
+        auth_token, _create_neo4j_connection(auth_token, "Grafo 2")
+    )
+
+    rejected = _execute_batch(auth_token, [first, second])
+    accepted = _execute_batch(
+        auth_token,
+        [first, second],
+        neo4j_connection_id=_create_neo4j_connection(auth_token, "Grafo 3"),
+    )
+
+    assert rejected.status_code == 400
+    assert "neo4j_connection_id" in rejected.json()["detail"]
+    assert accepted.status_code == 200
+    assert accepted.json()["statements"] == 1
+
+
+def test_execute_batch_rejects_unknown_queries(fake_session, auth_token):
+    """Una consulta inexistente rechaza el lote antes de abrir la sesión."""
+    query_id = _translated_query(auth_token, _create_neo4j_connection(auth_token))
+
+    response = _execute_batch(auth_token, [query_id, 99999])
+
+    assert response.status_code == 404
+    assert fake_session.runs == []
@@ -0,0 +1,205 @@
+"""
+Pruebas del ejecutor de traducciones en un pool de procesos.
+
+Los workers se crean con "spawn", por lo que el pool se comparte entre las
+pruebas del módulo para pagar su arranque una sola vez.
+"""
+
+import multiprocessing
+import time
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from app.core.parser import executor as executor_module
+from app.core.parser.executor import TranslationExecutor, TranslationTimeoutError
+from app.core.parser.visitor import translate_sql_to_cypher
+from app.services import translation_service
+from app.services.translation_service import TranslationService
+
+QUERIES = [
+    "SELECT * FROM Users",
+    "SELECT name FROM Users WHERE age > 18",
+    "SELECT * FROM Products WHERE price <= 100.50 AND stock > 0",
+    "SELECT * FROM",
+    "SELECT * FROM Users WHERE (age >= 18 AND age < 65) OR role = 'admin'",
+]
+
+
+def _stuck_chunk(sql_queries, parameterize, schema=None):
+    """Trozo que ocupa su worker mucho más que cualquier tiempo límite."""
+    time.sleep(60)
+    return []
+
+
+class _BrokenPool:
+    """Pool cuyos workers murieron: no acepta tareas."""
+
+    def submit(self, *args, **kwargs):
+        raise BrokenProcessPool("worker muerto")
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        pass
+
+
+@pytest.fixture(scope="module")
+def executor():
+    """Pool de dos workers compartido por el módulo."""
+    pool = TranslationExecutor(max_workers=2, timeout=30)
+    yield pool
+    pool.shutdown()
+
+
+def test_start_spawns_warm_workers(executor):
+    """start() arranca los workers y cada uno responde."""
+    assert 1 <= executor.start() <= 2
+
+
+def test_translate_many_matches_in_process_translation(executor):
+    """El pool devuelve los mismos resultados que el traductor, en orden."""
+    outcomes = executor.translate_many(QUERIES, parameterize=True)
+
+    assert [outcome for outcome, _ in outcomes] == [
+        translate_sql_to_cypher(sql, parameterize=True) for sql in QUERIES
+    ]
+    assert all(elapsed >= 0 for _, elapsed in outcomes)
+
+
+def test_translate_single_query(executor):
+    """translate() devuelve el resultado de una sola consulta."""
+    result = executor.translate("SELECT name FROM Users")
+
+    assert result["success"] is True
+    assert result["cypher"] == "MATCH (n:Users)\nRETURN n.name"
+
+
+def test_translate_many_empty(executor):
+    """Un lote vacío no envía tareas al pool."""
+    assert executor.translate_many([]) == []
+
+
+def test_timeout_reports_error_per_query():
+    """Las consultas que superan el tiempo límite reciben un error."""
+    executor = TranslationExecutor(max_workers=1, timeout=1e-6)
+    try:
+        outcomes = executor.translate_many(["SELECT * FROM Users"] * 3)
+    finally:
+        executor.shutdown()
+
+    assert len(outcomes) == 3
+    assert all(isinstance(outcome, TranslationTimeoutError) for outcome, _ in outcomes)
+    assert executor.timeouts == 3
+
+
+def test_timeout_of_running_chunk_recycles_pool(monkeypatch):
+    """Un trozo atascado no sigue ocupando su worker tras el tiempo límite."""
+    executor = TranslationExecutor(max_workers=1, timeout=0.5)
+    try:
+        executor.start()
+        stuck_pool = executor._pool
+        worker_pid = stuck_pool.submit(executor_module._ping).result()
+        processes = [
+            process
+            for process in multiprocessing.active_children()
+            if process.pid == worker_pid
+        ]
+        assert processes
+        monkeypatch.setattr(executor_module, "_translate_chunk", _stuck_chunk)
+
+        outcome, _ = executor.translate_many(["SELECT * FROM Users"])[0]
+
+        assert isinstance(outcome, TranslationTimeoutError)
+        assert executor.recycles == 1
+        assert executor._pool is not stuck_pool
+        for process in processes:
+            process.join(timeout=5)
+            assert not process.is_alive()
+
+        monkeypatch.undo()
+        executor.start()
+        assert executor.translate("SELECT * FROM Users")["success"] is True
+    finally:
+        executor.shutdown()
+
+
+def test_chunks_share_a_single_deadline(monkeypatch):
+    """Esperar los trozos uno tras otro no suma sus tiempos límite."""
+    executor = TranslationExecutor(max_workers=2, timeout=0.5)
+    try:
+        executor.start()
+        monkeypatch.setattr(executor_module, "_translate_chunk", _stuck_chunk)
+
+        start_time = time.monotonic()
+        outcomes = executor.translate_many(["SELECT * FROM Users"] * 2)
+        elapsed = time.monotonic() - start_time
+    finally:
+        executor.shutdown()
+
+    assert all(isinstance(outcome, TranslationTimeoutError) for outcome, _ in outcomes)
+    assert elapsed < 0.9
+
+
+def test_broken_pool_on_submit_retries_with_fresh_pool():
+    """Si el pool está roto al enviar, se reintenta una vez con uno nuevo."""
+    executor = TranslationExecutor(max_workers=1, timeout=30)
+    executor._pool = _BrokenPool()
+    try:
+        outcome, _ = executor.translate_many(["SELECT * FROM Users"])[0]
+    finally:
+        executor.shutdown()
+
+    assert outcome["success"] is True
+
+
+def test_pool_broken_twice_returns_errors_per_query(monkeypatch):
+    """Si tampoco el pool nuevo acepta tareas, cada consulta recibe el error."""
+    executor = TranslationExecutor(max_workers=1, timeout=30)
+    monkeypatch.setattr(executor, "_get_pool", _BrokenPool)
+
+    outcomes = executor.translate_many(["SELECT * FROM Users"] * 2)
+
+    assert len(outcomes) == 2
+    assert all(isinstance(outcome, BrokenProcessPool) for outcome, _ in outcomes)
+
+
+def test_service_dispatches_batch_to_pool(executor, monkeypatch):
+    """Con el pool activo el servicio le envía las consultas no cacheadas."""
+    dispatched = []
+    original = executor.translate_many
+
+    def recording_translate_many(sql_queries, parameterize=False, schema=None):
+        dispatched.append(list(sql_queries))
+        return original(sql_queries, parameterize, schema)
+
+    monkeypatch.setattr(executor, "translate_many", recording_translate_many)
+    monkeypatch.setattr(
+        translation_service, "get_translation_executor", lambda: executor
+    )
+    TranslationService.clear_cache()
+
+    results = TranslationService.translate_batch(
+        ["SELECT * FROM Users", "DROP TABLE Users", "SELECT name FROM Products"]
+    )
+
+    assert dispatched == [["SELECT * FROM Users", "SELECT name FROM Products"]]
+    assert [r["success"] for r in results] == [True, False, True]
+    assert results[2]["cypher"] == "MATCH (n:Products)\nRETURN n.name"
+    TranslationService.clear_cache()
+
+
+def test_service_reports_timeout(monkeypatch):
+    """Un timeout del pool se devuelve como error de la consulta."""
+
+    class TimingOutExecutor:
+        def translate_many(self, sql_queries, parameterize=False, schema=None):
+            return [(TranslationTimeoutError(0.5), 500.0) for _ in sql_queries]
+
+    monkeypatch.setattr(
+        translation_service, "get_translation_executor", TimingOutExecutor
+    )
+    TranslationService.clear_cache()
+
+    result = TranslationService.translate("SELECT * FROM Users")
+
+    assert result["success"] is False
+    assert result["errors"] == ["La traducción excedió el tiempo límite de 500 ms"]
@@ -0,0 +1,120 @@
+"""
+Pruebas unitarias de la exportación columnar (Arrow IPC y Parquet).
+
+Cubre:
+- Columnas del RETURN del Cypher traducido (alias y expresiones)
+- Esquema tipado deducido del primer lote
+- Codificación por lotes en Arrow IPC y Parquet
+- Valores que cambian de tipo a mitad del resultado
+"""
+
+from datetime import date
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from neo4j.time import Date
+
+from app.core.exceptions import ValidationError
+from app.services.execution_service import serialize_value
+from app.services.export_service import ColumnarWriter, infer_schema, return_columns
+
+
+def test_return_columns_from_translated_cypher():
+    """Los nombres de columna coinciden con las claves de Neo4j."""
+    assert return_columns("MATCH (n:Users)\nRETURN n") == [("n", "n")]
+    assert return_columns("MATCH (n:Users)\nRETURN n.name, n.age") == [
+        ("n.name", "n.name"),
+        ("n.age", "n.age"),
+    ]
+    assert return_columns(
+        "MATCH (n)\nRETURN DISTINCT coalesce(n.a, n.b) AS valor, n.c"
+    ) == [("valor", "coalesce(n.a, n.b)"), ("n.c", "n.c")]
+    assert return_columns("MATCH (n)\nDELETE n") is None
+
+
+def test_infer_schema_types_and_json_columns():
+    """Los escalares se tipan y los nodos o mapas se guardan como JSON."""
+    columns = [
+        ("n", "n"),
+        ("n.name", "n.name"),
+        ("n.age", "n.age"),
+        ("n.score", "n.score"),
+        ("n.active", "n.active"),
+        ("n.born", "n.born"),
+        ("n.tags", "n.tags"),
+        ("n.empty", "n.empty"),
+    ]
+    rows = [
+        {
+            "n": {"x": 1},
+            "n.name": "Ana",
+            "n.age": 30,
+            "n.score": 1,
+            "n.active": True,
+            "n.born": Date(1990, 5, 1),
+            "n.tags": ["a"],
+            "n.empty": None,
+        },
+        {"n.score": 2.5, "n.age": None},
+    ]
+
+    schema = infer_schema(columns, rows)
+
+    assert schema.field("n").type == pa.string()
+    assert schema.field("n").metadata[b"encoding"] == b"json"
+    assert schema.field("n.name").type == pa.string()
+    assert schema.field("n.age").type == pa.int64()
+    assert schema.field("n.score").type == pa.float64()
+    assert schema.field("n.active").type == pa.bool_()
+    assert schema.field("n.born").type == pa.date32()
+    assert schema.field("n.tags").metadata[b"encoding"] == b"json"
+    assert schema.field("n.empty").type == pa.string()
+
+
+@pytest.mark.parametrize("output_format", ["arrow", "parquet"])
+def test_columnar_writer_round_trip(output_format):
+    """Los lotes escritos por trozos forman un fichero legible y tipado."""
+    writer = ColumnarWriter(
+        output_format,
+        [("n.name", "n.name"), ("n.age", "n.age"), ("n.born", "n.born")],
+        serialize_value,
+    )
+    data = writer.write(
+        [
+            {"n.name": "Ana", "n.age": 30, "n.born": Date(1990, 5, 1)},
+            {"n.name": "Luis", "n.age": None, "n.born": None},
+        ]
+    )
+    data += writer.write([{"n.name": "Eva", "n.age": 41, "n.born": None}])
+    data += writer.close()
+
+    if output_format == "arrow":
+        table = pa.ipc.open_stream(data).read_all()
+    else:
+        table = pq.read_table(pa.BufferReader(data))
+    assert table.schema.field("n.age").type == pa.int64()
+    assert table.to_pydict() == {
+        "n.name": ["Ana", "Luis", "Eva"],
+        "n.age": [30, None, 41],
+        "n.born": [date(1990, 5, 1), None, None],
+    }
+
+
+def test_columnar_writer_empty_result_has_schema():
+    """Un resultado vacío produce un fichero válido con sus columnas."""
+    writer = ColumnarWriter("arrow", [("n.name", "n.name")], serialize_value)
+
+    table = pa.ipc.open_stream(writer.close()).read_all()
+
+    assert table.num_rows == 0
+    assert table.schema.names == ["n.name"]
+
+
+def test_columnar_writer_rejects_type_change():
+    """Un valor incompatible con el tipo fijado por el primer lote es un error."""
+    writer = ColumnarWriter("arrow", [("n.age", "n.age")], serialize_value)
+    writer.write([{"n.age": 30}])
+
+    with pytest.raises(ValidationError):
+        writer.write([{"n.age": "treinta"}])
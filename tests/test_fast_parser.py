@@ -0,0 +1,198 @@
+"""
+Pruebas diferenciales del parser rápido frente a ANTLR.
+
+Cada consulta del corpus se traduce con TRANSLATION_PARSER="antlr" y con
+TRANSLATION_PARSER="fast" y los resultados (Cypher, parámetros y errores)
+deben ser idénticos byte a byte.
+"""
+
+import random
+
+import pytest
+
+from app.core.config import settings
+from app.core.parser import fast_parser
+from app.core.parser.engine import get_parser_engine
+from app.core.parser.visitor import translate_sql_to_cypher
+
+VALID_CORPUS = [
+    "SELECT * FROM Users",
+    "select * from users",
+    "SeLeCt name FrOm people",
+    "SELECT name, email FROM Users",
+    "SELECT a,b,c FROM t",
+    "SELECT name FROM Users WHERE age > 18",
+    "SELECT * FROM Products WHERE price <= 100.50",
+    "SELECT * FROM Products WHERE price >= 0.5 AND stock < 10",
+    "SELECT * FROM Users WHERE status != 'inactive' AND role <> 'guest'",
+    "SELECT * FROM Users WHERE active = true OR verified = FALSE",
+    "SELECT * FROM Users WHERE last_login = NULL",
+    "SELECT * FROM Users WHERE (age >= 18 AND age < 65) OR role = 'admin'",
+    "SELECT * FROM Users WHERE a = 1 OR b = 2 AND c = 3",
+    "SELECT * FROM Users WHERE a = 1 AND b = 2 OR c = 3",
+    "SELECT * FROM Users WHERE a = 1 AND b = 2 AND c = 3",
+    "SELECT * FROM Users WHERE a = 1 OR b = 2 OR c = 3",
+    "SELECT * FROM Users WHERE (a = 1)",
+    "SELECT * FROM Users WHERE ((a = 1))",
+    "SELECT * FROM Users WHERE a = 1 AND (b = 2 OR (c = 3 AND d = 4))",
+    "SELECT * FROM Users WHERE name = 'O''Brien'",
+    "SELECT * FROM Users WHERE name = ''",
+    "SELECT * FROM Users WHERE name = 'línea\nnueva -- no es comentario'",
+    "SELECT * FROM Users WHERE name='x'AND age=1",
+    "SELECT id FROM orders where total > 10 -- comentario",
+    "SELECT /* bloque */ id FROM Orders /* otro\nbloque */ WHERE a = 1",
+    "\tSELECT\n*\r\nFROM\tUsers\n",
+    "SELECT _id, col_2 FROM _table9 WHERE _x = 007",
+    "SELECT selected FROM fromage WHERE wherever = 1 AND android = 2",
+    "SELECT dropped FROM updates WHERE executed = true",
+    "SELECT * FROM Users ORDER BY name",
+    "SELECT name FROM Users WHERE age > 18 ORDER BY age DESC, name ASC",
+    "select * from users order by a desc, b, c asc limit 10 offset 20",
+    "SELECT * FROM Users LIMIT 0",
+    "SELECT * FROM Users OFFSET 5",
+    "SELECT TOP 5 * FROM Users",
+    "SELECT TOP 3 name FROM Users WHERE a = 1 OR b = 2 ORDER BY name DESC",
+    "SELECT TOP 5 * FROM Users OFFSET 10",
+    "SELECT topic, ordering, bytes FROM limits WHERE offsets = 1",
+    "SELECT order, desc FROM top WHERE limit = 1 AND offset > 2",
+    "SELECT top FROM Users ORDER BY by DESC, asc",
+    "SELECT TOP 3 top FROM Orders ORDER BY desc desc LIMIT 2",
+    # Sintácticamente válidas; el visitor las rechaza igual en ambos motores
+    "SELECT * FROM Users LIMIT 2.5",
+    "SELECT TOP 5 * FROM Users LIMIT 3",
+]
+
+INVALID_CORPUS = [
+    "",
+    "SELECT",
+    "SELECT FROM WHERE",
+    "SELECT * FROM",
+    "SELECT name FROM Users WHERE",
+    "SELECT name FROM Users WHERE age >",
+    "SELECT name FROM Users WHERE > 18",
+    "SELECT name, FROM Users",
+    "SELECT * FROM Users WHERE a = 1 @",
+    "SELECT * FROM Users WHERE a = 1.",
+    "SELECT * FROM Users WHERE a = 'sin cerrar",
+    "SELECT * FROM Users WHERE a = b",
+    "SELECT * FROM Users WHERE (a = 1",
+    "SELECT * FROM Users WHERE a = 1)",
+    "SELECT * FROM Users WHERE a = 1 AND",
+    "SELECT * FROM Users WHERE a = 1 b = 2",
+    "SELECT * FROM Users Extra",
+    "SELECT * FROM Users; DROP TABLE Users",
+    "SELECT * FROM Users WHERE DROP = 1",
+    "SELECT * FROM Users WHERE a = -1",
+    "SELECT * FROM Users WHERE a == 1",
+    "SELECT * FROM Users WHERE ñandú = 1",
+    "SELECT * FROM Users /* sin cerrar",
+    "SELECT * FROM Users WHERE a = 1 - comentario mal formado",
+    "SELECT * FROM 1Users",
+    "DELETE FROM Users",
+    "SELECT * FROM Users WHERE a = 1\f",
+    "SELECT * FROM Users ORDER BY",
+    "SELECT * FROM Users ORDER name",
+    "SELECT * FROM Users ORDER BY name DESC ASC",
+    "SELECT * FROM Users ORDER BY name,",
+    "SELECT * FROM Users LIMIT",
+    "SELECT * FROM Users LIMIT 'diez'",
+    "SELECT * FROM Users OFFSET 5 LIMIT 10",
+    "SELECT * FROM Users LIMIT 10 ORDER BY name",
+    "SELECT TOP * FROM Users",
+    "SELECT TOP",
+    "SELECT * FROM Users ORDER BY limit LIMIT offset",
+    "SELECT * FROM Users WHERE a = 1 LIMIT -1",
+]
+
+
+def _random_condition(rng, depth):
+    """Genera una condición aleatoria de la gramática."""
+    roll = rng.random()
+    if depth <= 0 or roll < 0.4:
+        column = rng.choice(["a", "b", "edad", "Name", "x_1"])
+        operator = rng.choice(["=", "!=", "<>", "<", ">", "<=", ">="])
+        value = rng.choice(["1", "2.5", "'x'", "'it''s'", "TRUE", "false", "null"])
+        return f"{column} {operator} {value}"
+    if roll < 0.55:
+        return f"({_random_condition(rng, depth - 1)})"
+    keyword = rng.choice(["AND", "OR", "and", "Or"])
+    left = _random_condition(rng, depth - 1)
+    right = _random_condition(rng, depth - 1)
+    return f"{left} {keyword} {right}"
+
+
+def _random_corpus(size, seed=20261017):
+    """Corpus aleatorio reproducible de consultas válidas."""
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(size):
+        columns = rng.choice(["*", "name", "name, email", "a, b, c"])
+        table = rng.choice(["Users", "products", "T"])
+        query = f"SELECT {columns} FROM {table}"
+        if rng.random() < 0.9:
+            query += f" WHERE {_random_condition(rng, rng.randint(0, 6))}"
+        queries.append(query)
+    return queries
+
+
+RANDOM_CORPUS = _random_corpus(200)
+
+
+def _translate(monkeypatch, parser, sql_query, parameterize):
+    monkeypatch.setattr(settings, "TRANSLATION_PARSER", parser)
+    return translate_sql_to_cypher(sql_query, parameterize=parameterize)
+
+
+@pytest.mark.parametrize("parameterize", [False, True])
+@pytest.mark.parametrize("sql_query", VALID_CORPUS + INVALID_CORPUS)
+def test_fast_parser_matches_antlr(monkeypatch, sql_query, parameterize):
+    """Ambos motores producen exactamente el mismo resultado."""
+    expected = _translate(monkeypatch, "antlr", sql_query, parameterize)
+    actual = _translate(monkeypatch, "fast", sql_query, parameterize)
+
+    assert actual == expected
+
+
+@pytest.mark.parametrize("parameterize", [False, True])
+def test_fast_parser_matches_antlr_on_random_corpus(monkeypatch, parameterize):
+    """Consultas generadas al azar producen el mismo resultado en ambos motores."""
+    for sql_query in RANDOM_CORPUS:
+        expected = _translate(monkeypatch, "antlr", sql_query, parameterize)
+        actual = _translate(monkeypatch, "fast", sql_query, parameterize)
+        assert actual == expected, sql_query
+        assert expected["success"] is True
+
+
+@pytest.mark.parametrize("sql_query", VALID_CORPUS + RANDOM_CORPUS)
+def test_fast_parser_handles_valid_queries(sql_query):
+    """Las consultas válidas no recurren a ANTLR."""
+    assert fast_parser.parse_select(sql_query) is not None
+
+
+@pytest.mark.parametrize("sql_query", INVALID_CORPUS)
+def test_fast_parser_rejects_invalid_queries(sql_query):
+    """Las consultas inválidas se delegan en ANTLR."""
+    assert fast_parser.parse_select(sql_query) is None
+
+
+@pytest.mark.parametrize("sql_query", VALID_CORPUS + INVALID_CORPUS)
+def test_fast_lexer_matches_antlr_lexer(sql_query):
+    """El lexer escrito a mano produce los mismos tokens que el de ANTLR."""
+    tokens = fast_parser.tokenize(sql_query)
+    engine = get_parser_engine()
+    antlr_tokens = engine.tokenize(sql_query)
+
+    if engine.lexer_errors:
+        assert tokens is None
+    else:
+        assert tokens == [
+            (t.type, t.text if t.type != -1 else "<EOF>") for t in antlr_tokens
+        ]
+
+
+def test_fast_parser_falls_back_on_deep_nesting():
+    """Una anidación excesiva no rompe el camino rápido."""
+    depth = 5000
+    sql_query = "SELECT * FROM T WHERE " + "(" * depth + "a = 1" + ")" * depth
+
+    assert fast_parser.parse_select(sql_query) is None
@@ -0,0 +1,384 @@
+"""
+Pruebas del monitor en segundo plano del estado de las conexiones.
+
+Cubre:
+- Estado y percentiles de latencia de las conexiones probadas
+- Espera exponencial con las conexiones que fallan
+- Desfase aleatorio (jitter) de los intervalos
+- Reutilización de pools existentes y pruebas sin crear pools nuevos
+- Pruebas que no mantienen vivos los pools ni los drivers sin uso
+- Olvido de conexiones eliminadas o modificadas
+- Estado cacheado en el listado de conexiones
+
+Los drivers se sustituyen igual que en las pruebas de conexiones, así el
+monitor se prueba sin SQL Server ni Neo4j reales.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.connection import Connection
+from app.services import execution_service
+from app.services.connection_service import ConnectionService, sql_server_pools
+from app.services.execution_service import ExecutionService, neo4j_drivers
+from app.services.health_monitor import (
+    STATUS_DOWN,
+    STATUS_UP,
+    ConnectionHealthMonitor,
+    _percentile,
+    health_monitor,
+)
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def auth_token():
+    """Crea un usuario y retorna su token de autenticación."""
+    response = client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "monitor@example.com",
+            "password": "Test@2024!",
+            "name": "Monitor",
+            "last_name": "User",
+        },
+    )
+    return response.json()["access_token"]
+
+
+@pytest.fixture
+def sources():
+    """Sustituye los drivers de SQL Server y Neo4j.
+
+    Los hosts incluidos en el conjunto devuelto rechazan el login.
+    """
+    failing = set()
+    logins = []
+
+    def connect(connection_string, timeout=None):
+        logins.append(connection_string)
+        if any(f"SERVER={host}," in connection_string for host in failing):
+            import pyodbc
+
+            raise pyodbc.Error("Login failed for user 'sa'")
+        return MagicMock()
+
+    def open_driver(*args, **kwargs):
+        driver = MagicMock()
+        driver.verify_connectivity = AsyncMock()
+        driver.close = AsyncMock()
+        return driver
+
+    with (
+        patch("app.services.connection_service.pyodbc.connect", side_effect=connect),
+        patch(
+            "app.services.execution_service.AsyncGraphDatabase.driver",
+            side_effect=open_driver,
+        ),
+        patch("app.services.connection_service.GraphDatabase.driver"),
+    ):
+        yield SimpleNamespace(failing=failing, logins=logins)
+    sql_server_pools.close_all()
+    neo4j_drivers.close_all()
+    health_monitor.clear()
+
+
+def _monitor(**kwargs):
+    options = {"interval": 60, "jitter": 0, "max_backoff": 900, "history_size": 5}
+    options.update(kwargs)
+    return ConnectionHealthMonitor(**options)
+
+
+def _store_connection(auth_token, conn_name, host, db_type="sql_server"):
+    body = {
+        "conn_name": conn_name,
+        "db_type": db_type,
+        "host": host,
+        "port": 1433 if db_type == "sql_server" else 7687,
+        "db_user": "sa",
+        "db_password": "Password123!",
+    }
+    if db_type == "sql_server":
+        body["database_name"] = "TestDB"
+    response = client.post(
+        "/api/v1/connections",
+        json=body,
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+    return response.json()["connection_id"]
+
+
+def _expire_all(monitor):
+    """Hace que todas las conexiones deban probarse ya."""
+    for record in monitor._records.values():
+        record.next_check = 0.0
+
+
+def test_percentile_nearest_rank():
+    """Los percentiles usan el rango más cercano sobre las muestras ordenadas."""
+    samples = [float(value) for value in range(1, 101)]
+
+    assert _percentile(samples, 0.50) == 50.0
+    assert _percentile(samples, 0.95) == 95.0
+    assert _percentile(samples, 0.99) == 99.0
+    assert _percentile([7.0], 0.99) == 7.0
+
+
+def test_percentile_nearest_rank_odd_sample_counts():
+    """Con un número impar de muestras el rango se redondea hacia arriba."""
+    assert _percentile([1.0, 2.0, 3.0, 4.0, 5.0], 0.50) == 3.0
+    assert _percentile([float(value) for value in range(1, 10)], 0.50) == 5.0
+    assert _percentile([float(value) for value in range(1, 8)], 0.95) == 7.0
+
+
+def test_monitor_records_status_and_latency(sources, auth_token, db):
+    """Cada conexión probada guarda su estado, latencia y percentiles."""
+    up = _store_connection(auth_token, "Origen", "origen")
+    graph = _store_connection(auth_token, "Grafo", "grafo", db_type="neo4j")
+    sources.failing.add("denegado")
+    down = _store_connection(auth_token, "Denegado", "denegado")
+    monitor = _monitor()
+    connections = db.query(Connection).all()
+
+    assert asyncio.run(monitor.check_due(connections)) == 3
+
+    for connection_id in (up, graph):
+        health = monitor.snapshot(connection_id)
+        assert health["status"] == STATUS_UP
+        assert health["samples"] == 1
+        assert health["p50_ms"] == health["latency_ms"]
+        assert health["last_success_at"] == health["checked_at"]
+    failed = monitor.snapshot(down)
+    assert failed["status"] == STATUS_DOWN
+    assert failed["message"] == "Credenciales inválidas"
+    assert failed["consecutive_failures"] == 1
+    assert failed["samples"] == 0
+    assert failed["p95_ms"] is None
+    assert failed["last_success_at"] is None
+
+
+def test_monitor_only_probes_due_connections(sources, auth_token, db):
+    """Una conexión recién probada no se vuelve a probar hasta su intervalo."""
+    _store_connection(auth_token, "Origen", "origen")
+    monitor = _monitor()
+    connections = db.query(Connection).all()
+
+    assert asyncio.run(monitor.check_due(connections)) == 1
+    assert asyncio.run(monitor.check_due(connections)) == 0
+    _expire_all(monitor)
+    assert asyncio.run(monitor.check_due(connections)) == 1
+
+
+def test_monitor_keeps_bounded_latency_history(sources, auth_token, db):
+    """Solo se guardan las últimas history_size latencias."""
+    connection_id = _store_connection(auth_token, "Origen", "origen")
+    monitor = _monitor(history_size=3)
+    connections = db.query(Connection).all()
+
+    for _ in range(5):
+        _expire_all(monitor)
+        asyncio.run(monitor.check_due(connections))
+
+    assert monitor.snapshot(connection_id)["samples"] == 3
+    assert monitor.probes == 5
+
+
+def test_monitor_backs_off_failing_connections(sources, auth_token, db):
+    """El intervalo se duplica con cada fallo hasta el máximo."""
+    sources.failing.add("denegado")
+    connection_id = _store_connection(auth_token, "Denegado", "denegado")
+    monitor = _monitor(interval=10, max_backoff=50)
+    connections = db.query(Connection).all()
+
+    delays = []
+    for _ in range(4):
+        _expire_all(monitor)
+        asyncio.run(monitor.check_due(connections))
+        record = monitor._records[connection_id]
+        delays.append(record.next_check - time.monotonic())
+
+    assert [round(delay) for delay in delays] == [20, 40, 50, 50]
+    assert monitor.snapshot(connection_id)["consecutive_failures"] == 4
+
+    # Al recuperarse vuelve al intervalo normal
+    sources.failing.clear()
+    _expire_all(monitor)
+    asyncio.run(monitor.check_due(connections))
+    record = monitor._records[connection_id]
+    assert round(record.next_check - time.monotonic()) == 10
+    assert record.consecutive_failures == 0
+
+
+def test_monitor_jitter_spreads_intervals():
+    """El desfase aleatorio queda dentro de ±jitter del intervalo."""
+    monitor = _monitor(interval=100, jitter=0.2)
+
+    delays = [monitor._delay(0) for _ in range(200)]
+
+    assert all(80 <= delay <= 120 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_monitor_does_not_create_pools(sources, auth_token, db):
+    """Sin pool abierto la prueba usa una conexión propia y no crea ninguno."""
+    connection_id = _store_connection(auth_token, "Origen", "origen")
+    monitor = _monitor()
+    connections = db.query(Connection).all()
+
+    asyncio.run(monitor.check_due(connections))
+
+    assert connection_id not in sql_server_pools
+    assert len(sources.logins) == 1
+
+
+def test_monitor_reuses_existing_pool(sources, auth_token, db):
+    """Con un pool abierto la prueba usa una de sus conexiones."""
+    connection_id = _store_connection(auth_token, "Origen", "origen")
+    connection = db.query(Connection).first()
+    with ConnectionService.sql_server_connection(connection):
+        pass
+    logins = len(sources.logins)
+    monitor = _monitor()
+
+    asyncio.run(monitor.check_due([connection]))
+
+    assert monitor.snapshot(connection_id)["status"] == STATUS_UP
+    assert len(sources.logins) == logins
+
+
+def test_monitor_does_not_keep_neo4j_drivers_alive(
+    sources, auth_token, db, monkeypatch
+):
+    """Probar un driver compartido no cuenta como uso para el desalojo."""
+    connection_id = _store_connection(auth_token, "Grafo", "grafo", db_type="neo4j")
+    connection = db.query(Connection).first()
+    now = [100.0]
+    monkeypatch.setattr(execution_service.time, "monotonic", lambda: now[0])
+    monitor = _monitor()
+
+    async def tick_near_idle_timeout():
+        driver = ExecutionService.get_driver(connection)
+        now[0] = 100.0 + neo4j_drivers.idle_timeout - 1
+        await monitor.check_due([connection])
+        now[0] = 100.0 + neo4j_drivers.idle_timeout + 1
+        return driver, neo4j_drivers.evict_idle()
+
+    driver, evicted = asyncio.run(tick_near_idle_timeout())
+
+    assert monitor.snapshot(connection_id)["status"] == STATUS_UP
+    driver.verify_connectivity.assert_awaited_once()
+    assert evicted == 1
+    assert connection_id not in neo4j_drivers
+
+
+def test_monitor_ticks_let_idle_neo4j_drivers_be_evicted(
+    sources, auth_token, db, monkeypatch
+):
+    """Tras varias pasadas del monitor el driver sin uso se desaloja igual."""
+    connection_id = _store_connection(auth_token, "Grafo", "grafo", db_type="neo4j")
+    connection = db.query(Connection).first()
+    now = [100.0]
+    monkeypatch.setattr(execution_service.time, "monotonic", lambda: now[0])
+    monitor = _monitor()
+
+    async def ticks_across_idle_window():
+        driver = ExecutionService.get_driver(connection)
+        while now[0] + monitor.interval < 100.0 + neo4j_drivers.idle_timeout:
+            now[0] += monitor.interval
+            _expire_all(monitor)
+            await monitor.check_due([connection])
+        now[0] = 100.0 + neo4j_drivers.idle_timeout + 1
+        return driver, neo4j_drivers._evict_idle()
+
+    driver, evicted = asyncio.run(ticks_across_idle_window())
+
+    assert evicted == [driver]
+    assert driver.verify_connectivity.await_count > 1
+    assert connection_id not in neo4j_drivers
+    assert monitor.snapshot(connection_id)["status"] == STATUS_UP
+
+
+def test_monitor_forgets_deleted_and_changed_connections(sources, auth_token, db):
+    """Las conexiones eliminadas se olvidan y las modificadas se prueban de nuevo."""
+    kept = _store_connection(auth_token, "Origen", "origen")
+    deleted = _store_connection(auth_token, "Borrada", "borrada")
+    monitor = _monitor()
+    asyncio.run(monitor.check_due(db.query(Connection).all()))
+
+    client.delete(
+        f"/api/v1/connections/{deleted}",
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+    client.put(
+        f"/api/v1/connections/{kept}",
+        json={"host": "nuevo"},
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+    db.expire_all()
+
+    assert asyncio.run(monitor.check_due(db.query(Connection).all())) == 1
+    assert monitor.snapshot(deleted) is None
+    assert monitor.snapshot(kept)["samples"] == 1
+
+
+def test_monitor_loop_logs_failures_and_keeps_running(caplog):
+    """Un fallo en una pasada se registra y el bucle sigue con la siguiente."""
+    monitor = _monitor()
+    passes = []
+
+    async def failing_check_due():
+        passes.append(1)
+        if len(passes) == 1:
+            raise RuntimeError("fallo inesperado")
+        raise asyncio.CancelledError
+
+    monitor.check_due = failing_check_due
+    with (
+        patch("app.services.health_monitor.asyncio.sleep", AsyncMock()),
+        caplog.at_level("ERROR", logger="app.services.health_monitor"),
+    ):
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(monitor._run())
+
+    assert len(passes) == 2
+    assert "fallo inesperado" in caplog.text
+
+
+def test_list_connections_includes_cached_health(sources, auth_token, db):
+    """El listado devuelve el último estado conocido sin probar las conexiones."""
+    up = _store_connection(auth_token, "Origen", "origen")
+    sources.failing.add("denegado")
+    down = _store_connection(auth_token, "Denegado", "denegado")
+    unchecked = _store_connection(auth_token, "Nueva", "nueva")
+    connections = (
+        db.query(Connection).filter(Connection.connection_id.in_([up, down])).all()
+    )
+    asyncio.run(health_monitor.check_due(connections))
+    logins = len(sources.logins)
+
+    response = client.get(
+        "/api/v1/connections", headers={"Authorization": f"Bearer {auth_token}"}
+    )
+
+    assert response.status_code == 200
+    listed = {item["connection_id"]: item for item in response.json()}
+    assert listed[up]["is_active"] is True
+    assert listed[up]["health"]["status"] == "up"
+    assert listed[up]["health"]["p99_ms"] is not None
+    assert listed[down]["is_active"] is False
+    assert listed[down]["health"]["message"] == "Credenciales inválidas"
+    assert listed[unchecked]["health"] is None
+    assert len(sources.logins) == logins
+
+    detail = client.get(
+        f"/api/v1/connections/{up}",
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+    assert detail.json()["health"]["status"] == "up"
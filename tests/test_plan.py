@@ -0,0 +1,112 @@
+"""
+Pruebas unitarias del análisis de planes de ejecución de Neo4j.
+
+Cubre:
+- Conversión del plan crudo (EXPLAIN y PROFILE) en árbol serializable
+- Filas estimadas, coste estimado y db hits del resumen
+- Avisos de recorridos por etiqueta sin índice
+- Política de admisión por coste estimado
+"""
+
+from app.services.plan_service import (
+    build_plan_tree,
+    is_admitted,
+    plan_record,
+    plan_warnings,
+    summarize_plan,
+)
+
+
+def _operator(operator_type, estimated_rows, details=None, children=(), **profile):
+    args = {"EstimatedRows": estimated_rows}
+    if details:
+        args["Details"] = details
+    return {
+        "operatorType": f"{operator_type}@neo4j",
+        "args": args,
+        "identifiers": ["n"],
+        "children": list(children),
+        **profile,
+    }
+
+
+FILTERED_SCAN = _operator(
+    "ProduceResults",
+    10.0,
+    "n",
+    [
+        _operator(
+            "Filter",
+            10.0,
+            "n.age > $p0",
+            [_operator("NodeByLabelScan", 1000.0, "n:Users")],
+        )
+    ],
+)
+
+
+def test_build_plan_tree_strips_runtime_suffix():
+    """El árbol conserva operadores, detalles y estimaciones."""
+    tree = build_plan_tree(FILTERED_SCAN)
+
+    assert tree["operator"] == "ProduceResults"
+    scan = tree["children"][0]["children"][0]
+    assert scan["operator"] == "NodeByLabelScan"
+    assert scan["details"] == "n:Users"
+    assert scan["estimated_rows"] == 1000.0
+    assert scan["db_hits"] is None and scan["children"] == []
+
+
+def test_summarize_explain_plan():
+    """EXPLAIN da estimaciones pero no métricas reales."""
+    summary = summarize_plan(FILTERED_SCAN)
+
+    assert summary["mode"] == "EXPLAIN"
+    assert summary["estimated_rows"] == 10.0
+    assert summary["estimated_cost"] == 1020.0
+    assert summary["operators"] == 3
+    assert summary["db_hits"] is None and summary["rows"] is None
+    assert "plan" not in plan_record(summary)
+
+
+def test_summarize_profile_plan_sums_db_hits():
+    """PROFILE suma los db hits de todos los operadores."""
+    raw = _operator(
+        "ProduceResults",
+        5.0,
+        children=[_operator("NodeByLabelScan", 5.0, "n:Users", dbHits=6, rows=5)],
+        dbHits=0,
+        rows=5,
+    )
+
+    summary = summarize_plan(raw, profile=True)
+
+    assert summary["mode"] == "PROFILE"
+    assert summary["db_hits"] == 6
+    assert summary["rows"] == 5
+
+
+def test_warns_only_on_filtered_label_scans():
+    """Un recorrido por etiqueta solo es sospechoso si se filtra después."""
+    assert len(plan_warnings(build_plan_tree(FILTERED_SCAN))) == 1
+    assert "n:Users" in plan_warnings(build_plan_tree(FILTERED_SCAN))[0]
+
+    unfiltered = _operator(
+        "ProduceResults", 1000.0, children=[_operator("NodeByLabelScan", 1000.0)]
+    )
+    indexed = _operator(
+        "ProduceResults",
+        1.0,
+        children=[_operator("NodeIndexSeek", 1.0, "n:Users(email)")],
+    )
+    assert plan_warnings(build_plan_tree(unfiltered)) == []
+    assert plan_warnings(build_plan_tree(indexed)) == []
+
+
+def test_admission_policy():
+    """Se rechazan los planes cuyo coste estimado supera el umbral."""
+    summary = summarize_plan(FILTERED_SCAN)
+
+    assert is_admitted(summary, max_cost=0)
+    assert is_admitted(summary, max_cost=5000)
+    assert not is_admitted(summary, max_cost=500)
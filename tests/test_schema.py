@@ -0,0 +1,386 @@
+"""
+Pruebas del catálogo de esquema de SQL Server y su caché.
+
+Cubre:
+- Resolución de labels y propiedades con el nombre real de tablas y columnas
+- Errores por tablas o columnas que no existen en el esquema
+- Introspección de INFORMATION_SCHEMA (columnas, claves primarias y foráneas)
+- Caché en memoria y en disco, caducidad e invalidación al cambiar la conexión
+- Traducción con source_connection_id y claves de caché por versión del esquema
+
+INFORMATION_SCHEMA se simula con una base SQLite adjunta con ese nombre,
+abierta por un sustituto local de pyodbc.connect.
+"""
+
+import json
+import sqlite3
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.parser.schema import ColumnSchema, SchemaCatalog, TableSchema
+from app.core.parser.visitor import translate_sql_to_cypher
+from app.core.schema_cache import SchemaCache, schema_cache
+from app.core.security import encrypt_data
+from app.main import app
+from app.models.connection import Connection, DatabaseType
+from app.services import connection_service
+from app.services.connection_service import sql_server_pools
+from app.services.schema_service import SchemaService, introspect_sql_server
+from app.services.translation_service import TranslationService
+
+client = TestClient(app)
+
+_INFORMATION_SCHEMA = """
+CREATE TABLE INFORMATION_SCHEMA.TABLES (
+    TABLE_SCHEMA TEXT, TABLE_NAME TEXT, TABLE_TYPE TEXT
+);
+CREATE TABLE INFORMATION_SCHEMA.COLUMNS (
+    TABLE_SCHEMA TEXT, TABLE_NAME TEXT, COLUMN_NAME TEXT,
+    ORDINAL_POSITION INTEGER, DATA_TYPE TEXT, IS_NULLABLE TEXT
+);
+CREATE TABLE INFORMATION_SCHEMA.TABLE_CONSTRAINTS (
+    CONSTRAINT_SCHEMA TEXT, CONSTRAINT_NAME TEXT, CONSTRAINT_TYPE TEXT
+);
+CREATE TABLE INFORMATION_SCHEMA.KEY_COLUMN_USAGE (
+    CONSTRAINT_SCHEMA TEXT, CONSTRAINT_NAME TEXT, TABLE_SCHEMA TEXT,
+    TABLE_NAME TEXT, COLUMN_NAME TEXT, ORDINAL_POSITION INTEGER
+);
+CREATE TABLE INFORMATION_SCHEMA.REFERENTIAL_CONSTRAINTS (
+    CONSTRAINT_SCHEMA TEXT, CONSTRAINT_NAME TEXT,
+    UNIQUE_CONSTRAINT_SCHEMA TEXT, UNIQUE_CONSTRAINT_NAME TEXT
+);
+INSERT INTO INFORMATION_SCHEMA.TABLES VALUES
+    ('dbo', 'Customers', 'BASE TABLE'),
+    ('dbo', 'orderItems', 'BASE TABLE'),
+    ('sys', 'ignored', 'SYSTEM TABLE');
+INSERT INTO INFORMATION_SCHEMA.COLUMNS VALUES
+    ('dbo', 'Customers', 'CustomerID', 1, 'int', 'NO'),
+    ('dbo', 'Customers', 'FullName', 2, 'nvarchar', 'YES'),
+    ('dbo', 'orderItems', 'OrderItemID', 1, 'int', 'NO'),
+    ('dbo', 'orderItems', 'CustomerID', 2, 'int', 'NO'),
+    ('dbo', 'orderItems', 'Quantity', 3, 'int', 'YES');
+INSERT INTO INFORMATION_SCHEMA.TABLE_CONSTRAINTS VALUES
+    ('dbo', 'PK_Customers', 'PRIMARY KEY'),
+    ('dbo', 'PK_orderItems', 'PRIMARY KEY'),
+    ('dbo', 'FK_orderItems_Customers', 'FOREIGN KEY');
+INSERT INTO INFORMATION_SCHEMA.KEY_COLUMN_USAGE VALUES
+    ('dbo', 'PK_Customers', 'dbo', 'Customers', 'CustomerID', 1),
+    ('dbo', 'PK_orderItems', 'dbo', 'orderItems', 'OrderItemID', 1),
+    ('dbo', 'FK_orderItems_Customers', 'dbo', 'orderItems', 'CustomerID', 1);
+INSERT INTO INFORMATION_SCHEMA.REFERENTIAL_CONSTRAINTS VALUES
+    ('dbo', 'FK_orderItems_Customers', 'dbo', 'PK_Customers');
+"""
+
+
+class InformationSchemaODBC:
+    """Sustituto de pyodbc.connect con un INFORMATION_SCHEMA de ejemplo."""
+
+    def __init__(self):
+        self.connections = 0
+
+    def connect(self, connection_string, timeout=None):
+        self.connections += 1
+        connection = sqlite3.connect(":memory:", check_same_thread=False)
+        connection.execute("ATTACH DATABASE ':memory:' AS INFORMATION_SCHEMA")
+        connection.executescript(_INFORMATION_SCHEMA)
+        return connection
+
+
+@pytest.fixture
+def odbc(monkeypatch, tmp_path):
+    """Sustituye pyodbc.connect y lleva la caché de esquemas a tmp_path."""
+    stand_in = InformationSchemaODBC()
+    monkeypatch.setattr(connection_service.pyodbc, "connect", stand_in.connect)
+    monkeypatch.setattr(schema_cache, "directory", str(tmp_path))
+    schema_cache.clear()
+    yield stand_in
+    schema_cache.clear()
+    sql_server_pools.close_all()
+
+
+def _sql_server_connection(connection_id=1, host="localhost"):
+    """Crea un registro Connection de SQL Server sin guardarlo."""
+    return Connection(
+        connection_id=connection_id,
+        user_id=1,
+        conn_name=f"sql-{connection_id}",
+        db_type=DatabaseType.SQL_SERVER,
+        host=host,
+        port=1433,
+        db_user="sa",
+        db_password=encrypt_data("secret"),
+        database_name="ventas",
+    )
+
+
+def _catalog():
+    return SchemaCatalog(
+        [
+            TableSchema(
+                "dbo",
+                "orderItems",
+                [
+                    ColumnSchema("OrderItemID", "int", False),
+                    ColumnSchema("Quantity", "int", True),
+                ],
+                primary_key=("OrderItemID",),
+            )
+        ]
+    )
+
+
+def test_visitor_uses_real_table_and_column_names():
+    """Label y propiedades salen del esquema, no del texto de la consulta."""
+    result = translate_sql_to_cypher(
+        "SELECT orderitemid FROM ORDERITEMS WHERE quantity > 2 ORDER BY ORDERITEMID",
+        schema=_catalog(),
+    )
+
+    assert result["success"] is True
+    assert result["cypher"] == (
+        "MATCH (n:OrderItems)\n"
+        "WHERE n.Quantity > 2\n"
+        "RETURN n.OrderItemID\n"
+        "ORDER BY n.OrderItemID"
+    )
+
+
+def test_visitor_rejects_unknown_table_and_columns():
+    """Las tablas y columnas que no existen se informan como errores."""
+    unknown_table = translate_sql_to_cypher("SELECT * FROM Orders", schema=_catalog())
+    unknown_columns = translate_sql_to_cypher(
+        "SELECT price, total FROM orderItems", schema=_catalog()
+    )
+
+    assert unknown_table["success"] is False
+    assert "La tabla 'Orders' no existe" in unknown_table["errors"][0]
+    assert unknown_columns["success"] is False
+    assert "Columnas desconocidas en la tabla 'orderItems': price, total" in (
+        unknown_columns["errors"][0]
+    )
+
+
+def test_catalog_round_trip_keeps_version():
+    """to_dict/from_dict conserva el contenido y la versión del catálogo."""
+    catalog = _catalog()
+    restored = SchemaCatalog.from_dict(json.loads(json.dumps(catalog.to_dict())))
+
+    assert restored.version == catalog.version
+    assert restored.table("ORDERITEMS").column("quantity").name == "Quantity"
+
+
+def test_introspection_reads_columns_and_keys(odbc):
+    """Se leen tablas, columnas, claves primarias y claves foráneas."""
+    catalog = introspect_sql_server(_sql_server_connection())
+
+    assert [table.name for table in catalog.tables] == ["Customers", "orderItems"]
+    items = catalog.table("orderitems")
+    assert [column.name for column in items.columns] == [
+        "OrderItemID",
+        "CustomerID",
+        "Quantity",
+    ]
+    assert items.column("quantity").nullable is True
+    assert items.primary_key == ("OrderItemID",)
+    (foreign_key,) = items.foreign_keys
+    assert foreign_key.referenced_table == "Customers"
+    assert foreign_key.referenced_columns == ("CustomerID",)
+    assert catalog.referenced_by(catalog.table("customers")) == [(items, foreign_key)]
+
+
+def test_catalog_is_cached_in_memory_and_on_disk(odbc, tmp_path):
+    """La segunda lectura sale de memoria y, tras un reinicio, del disco."""
+    connection = _sql_server_connection()
+
+    first = SchemaService.get_catalog(connection)
+    assert SchemaService.get_catalog(connection) is first
+    assert (tmp_path / "1.json").exists()
+
+    schema_cache.clear()
+    from_disk = SchemaService.get_catalog(connection)
+
+    assert from_disk.version == first.version
+    assert odbc.connections == 1
+    assert schema_cache.stats()["disk_hits"] == 1
+    assert schema_cache.stats()["introspections"] == 0
+
+
+def test_changed_connection_or_refresh_reads_again(odbc):
+    """Cambiar el host o pedir refresh vuelve a leer el esquema."""
+    SchemaService.get_catalog(_sql_server_connection())
+    SchemaService.get_catalog(_sql_server_connection(host="otro-servidor"))
+    SchemaService.get_catalog(_sql_server_connection(host="otro-servidor"), True)
+
+    assert schema_cache.stats()["introspections"] == 3
+
+
+def test_expired_entries_are_read_again(tmp_path, monkeypatch):
+    """Una entrada caducada no se sirve ni de memoria ni del disco."""
+    cache = SchemaCache(directory=str(tmp_path), ttl=10)
+    connection = _sql_server_connection()
+    calls = []
+
+    def loader(conn):
+        calls.append(conn)
+        return _catalog()
+
+    monkeypatch.setattr("app.core.schema_cache.time.time", lambda: 100.0)
+    cache.get(connection, loader)
+    cache.get(connection, loader)
+    monkeypatch.setattr("app.core.schema_cache.time.time", lambda: 111.0)
+    cache.get(connection, loader)
+
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize("step", ["json.dump", "os.replace"])
+def test_failed_write_leaves_no_temporary_file(tmp_path, monkeypatch, step):
+    """Si la escritura en disco falla a medias, no quedan ficheros .tmp."""
+    cache = SchemaCache(directory=str(tmp_path), ttl=None)
+
+    def fail(*args):
+        raise OSError("disco lleno")
+
+    monkeypatch.setattr(f"app.core.schema_cache.{step}", fail)
+    catalog, _ = cache.get(_sql_server_connection(), lambda connection: _catalog())
+
+    # El catálogo sigue disponible en memoria
+    assert catalog.table("orderitems") is not None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_invalidate_removes_disk_entry(odbc, tmp_path):
+    """Invalidar una conexión borra su catálogo de memoria y de disco."""
+    SchemaService.get_catalog(_sql_server_connection())
+
+    assert schema_cache.invalidate(1) is True
+    assert not (tmp_path / "1.json").exists()
+    assert schema_cache.invalidate(1) is False
+
+
+def test_translation_cache_keys_on_schema_version():
+    """La misma consulta con esquemas distintos no comparte entrada de caché."""
+    TranslationService.clear_cache()
+    try:
+        plain = TranslationService.translate("SELECT quantity FROM orderitems")
+        with_schema = TranslationService.translate(
+            "SELECT quantity FROM orderitems", schema=_catalog()
+        )
+        cached = TranslationService.translate(
+            "SELECT quantity FROM orderitems", schema=_catalog()
+        )
+    finally:
+        TranslationService.clear_cache()
+
+    assert plain["cypher"] == "MATCH (n:Orderitems)\nRETURN n.quantity"
+    assert with_schema["cypher"] == "MATCH (n:OrderItems)\nRETURN n.Quantity"
+    assert with_schema["from_cache"] is False
+    assert cached["from_cache"] is True
+
+
+@pytest.fixture
+def auth_token():
+    """Crea un usuario y retorna su token de autenticación."""
+    response = client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "schema@example.com",
+            "password": "Test@2024!",
+            "name": "Schema",
+            "last_name": "User",
+        },
+    )
+    return response.json()["access_token"]
+
+
+def _store_connection(auth_token, db_type="sql_server", port=1433):
+    response = client.post(
+        "/api/v1/connections",
+        json={
+            "conn_name": f"Origen {db_type}",
+            "db_type": db_type,
+            "host": "localhost",
+            "port": port,
+            "db_user": "sa",
+            "db_password": "Password123!",
+            "database_name": "ventas" if db_type == "sql_server" else None,
+        },
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+    return response.json()["connection_id"]
+
+
+def test_schema_endpoint_returns_catalog(odbc, auth_token):
+    """El endpoint devuelve tablas, labels y claves de la conexión."""
+    connection_id = _store_connection(auth_token)
+
+    response = client.get(
+        f"/api/v1/connections/{connection_id}/schema",
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["connection_id"] == connection_id
+    items = data["tables"][1]
+    assert items["label"] == "OrderItems"
+    assert items["schema_name"] == "dbo"
+    assert items["foreign_keys"][0]["referenced_table"] == "Customers"
+
+
+def test_schema_endpoint_rejects_neo4j_connection(odbc, auth_token):
+    """Solo las conexiones SQL Server tienen esquema que leer."""
+    connection_id = _store_connection(auth_token, db_type="neo4j", port=7687)
+
+    response = client.get(
+        f"/api/v1/connections/{connection_id}/schema",
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+
+    assert response.status_code == 400
+
+
+def test_translate_endpoint_with_source_connection(odbc, auth_token):
+    """Con source_connection_id la traducción usa el esquema de origen."""
+    connection_id = _store_connection(auth_token)
+    headers = {"Authorization": f"Bearer {auth_token}"}
+
+    response = client.post(
+        "/api/v1/queries/translate",
+        json={
+            "sql_query": "SELECT fullname FROM customers",
+            "source_connection_id": connection_id,
+        },
+        headers=headers,
+    )
+    unknown = client.post(
+        "/api/v1/queries/translate",
+        json={
+            "sql_query": "SELECT email FROM customers",
+            "source_connection_id": connection_id,
+        },
+        headers=headers,
+    )
+
+    assert response.status_code == 200
+    assert response.json()["cypher"] == "MATCH (n:Customers)\nRETURN n.FullName"
+    assert unknown.status_code == 200
+    assert unknown.json()["success"] is False
+    assert "email" in unknown.json()["errors"][0]
+
+
+def test_updating_connection_invalidates_schema(odbc, auth_token, tmp_path):
+    """Modificar la conexión descarta su esquema guardado."""
+    connection_id = _store_connection(auth_token)
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    client.get(f"/api/v1/connections/{connection_id}/schema", headers=headers)
+    assert (tmp_path / f"{connection_id}.json").exists()
+
+    client.put(
+        f"/api/v1/connections/{connection_id}",
+        json={"database_name": "otra"},
+        headers=headers,
+    )
+
+    assert not (tmp_path / f"{connection_id}.json").exists()
@@ -0,0 +1,357 @@
+"""
+Pruebas del pool de conexiones pyodbc a SQL Server.
+
+Cubre:
+- Reutilización de conexiones y mínimo de conexiones abiertas
+- Comprobación de las conexiones libres antes de prestarlas
+- Máximo de conexiones y espera por una conexión libre
+- Desalojo de conexiones inactivas
+- Invalidación al cambiar los datos de la conexión
+- Máximo de pools (LRU) y cierre de pools enteros sin uso
+
+Las conexiones se abren con un sustituto local de pyodbc.connect respaldado
+por SQLite en memoria, así el pool se prueba sin un SQL Server real.
+"""
+
+import sqlite3
+import threading
+import time
+
+import pyodbc
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.exceptions import DatabaseConnectionError, ValidationError
+from app.core.security import encrypt_data
+from app.main import app
+from app.models.connection import Connection, DatabaseType
+from app.services import connection_service
+from app.services.connection_service import (
+    ConnectionService,
+    SQLServerConnectionPool,
+    SQLServerPoolRegistry,
+    sql_server_pools,
+)
+
+client = TestClient(app)
+
+
+class SQLiteODBC:
+    """Sustituto de pyodbc.connect que abre bases SQLite en memoria.
+
+    Las conexiones de sqlite3 tienen la misma interfaz DB-API que usa el pool
+    (cursor, execute, fetchone, rollback y close).
+    """
+
+    def __init__(self):
+        self.connection_strings = []
+        self.connections = []
+        self.error = None
+
+    def connect(self, connection_string, timeout=None):
+        self.connection_strings.append(connection_string)
+        if self.error is not None:
+            raise self.error
+        connection = sqlite3.connect(":memory:", check_same_thread=False)
+        self.connections.append(connection)
+        return connection
+
+
+@pytest.fixture
+def odbc(monkeypatch):
+    """Sustituye pyodbc.connect por el sustituto SQLite."""
+    stand_in = SQLiteODBC()
+    monkeypatch.setattr(connection_service.pyodbc, "connect", stand_in.connect)
+    yield stand_in
+    sql_server_pools.close_all()
+
+
+def _pool(odbc, min_size=0, max_size=2, idle_timeout=0, acquire_timeout=0.05):
+    return SQLServerConnectionPool(
+        lambda: odbc.connect("DRIVER=sqlite"),
+        min_size=min_size,
+        max_size=max_size,
+        idle_timeout=idle_timeout,
+        acquire_timeout=acquire_timeout,
+    )
+
+
+def _sql_server_connection(connection_id=1, password="secret", **kwargs):
+    """Crea un registro Connection de SQL Server sin guardarlo."""
+    return Connection(
+        connection_id=connection_id,
+        user_id=1,
+        conn_name=f"sql-{connection_id}",
+        db_type=kwargs.get("db_type", DatabaseType.SQL_SERVER),
+        host=kwargs.get("host", "localhost"),
+        port=1433,
+        db_user="sa",
+        db_password=encrypt_data(password),
+        database_name="ventas",
+    )
+
+
+def test_pool_reuses_released_connections(odbc):
+    """Una conexión devuelta se presta de nuevo sin abrir otra."""
+    pool = _pool(odbc)
+
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        pass
+
+    assert first is second
+    assert len(odbc.connections) == 1
+    assert pool.stats()["reused"] == 1
+    assert pool.stats()["idle"] == 1
+
+
+def test_pool_prefill_opens_min_size_connections(odbc):
+    """prefill() abre conexiones hasta el mínimo y no más."""
+    pool = _pool(odbc, min_size=2, max_size=4)
+
+    pool.prefill()
+    pool.prefill()
+
+    assert len(odbc.connections) == 2
+    assert pool.stats()["size"] == 2
+
+
+def test_pool_discards_dead_idle_connection(odbc, monkeypatch):
+    """Una conexión libre que no responde a SELECT 1 se descarta y se abre otra."""
+    monkeypatch.setattr(connection_service, "_ALIVE_BYPASS_SECONDS", 0)
+    pool = _pool(odbc)
+    with pool.connection() as dead:
+        pass
+    dead.close()
+
+    with pool.connection() as fresh:
+        fresh.execute("SELECT 1")
+
+    assert fresh is not dead
+    assert pool.stats()["discarded"] == 1
+    assert pool.stats()["size"] == 1
+
+
+def test_pool_skips_liveness_check_for_recently_used(odbc):
+    """Una conexión devuelta hace un instante se presta sin comprobarla."""
+    pool = _pool(odbc)
+    with pool.connection() as connection:
+        pass
+    connection.close()
+
+    # Dentro de la ventana de gracia no se comprueba (ni se detecta)
+    assert pool.acquire() is connection
+
+
+def test_pool_rolls_back_on_release(odbc):
+    """Al devolver una conexión se deshace su transacción pendiente."""
+    pool = _pool(odbc)
+    with pool.connection() as connection:
+        connection.execute("CREATE TABLE t (x INTEGER)")
+        connection.commit()
+        connection.execute("INSERT INTO t VALUES (1)")
+
+    with pool.connection() as connection:
+        rows = connection.execute("SELECT COUNT(*) FROM t").fetchone()
+
+    assert rows == (0,)
+
+
+def test_pool_waits_for_free_connection_up_to_timeout(odbc):
+    """Con el máximo prestado, acquire() espera y falla al agotar el tiempo."""
+    pool = _pool(odbc, max_size=1, acquire_timeout=0.05)
+    held = pool.acquire()
+
+    with pytest.raises(DatabaseConnectionError):
+        pool.acquire()
+
+    pool.acquire_timeout = 2
+    releaser = threading.Timer(0.05, pool.release, args=(held,))
+    releaser.start()
+    assert pool.acquire() is held
+    releaser.join()
+    assert pool.stats()["waits"] == 2
+    assert len(odbc.connections) == 1
+
+
+def test_pool_reaps_idle_connections_above_min_size(odbc):
+    """El desalojo cierra las conexiones inactivas pero conserva el mínimo."""
+    pool = _pool(odbc, min_size=1, max_size=3, idle_timeout=0.01)
+    held = [pool.acquire() for _ in range(3)]
+    for connection in held:
+        pool.release(connection)
+    time.sleep(0.02)
+
+    assert pool.reap_idle() == 2
+    assert pool.stats()["size"] == 1
+    # Se conserva la usada más recientemente
+    assert pool.acquire() is held[-1]
+
+
+def test_pool_close_discards_borrowed_connections_on_release(odbc):
+    """Tras close() las conexiones prestadas se cierran al devolverlas."""
+    pool = _pool(odbc)
+    borrowed = pool.acquire()
+
+    pool.close()
+    pool.release(borrowed)
+
+    assert pool.stats()["size"] == 0
+    with pytest.raises(DatabaseConnectionError):
+        pool.acquire()
+
+
+def test_registry_recreates_pool_when_credentials_change(odbc):
+    """Un cambio de contraseña crea un pool nuevo y cierra el anterior."""
+    registry = SQLServerPoolRegistry(
+        min_size=0, max_size=2, idle_timeout=0, acquire_timeout=1
+    )
+    connection = _sql_server_connection()
+    pool = registry.get_pool(connection)
+    with pool.connection():
+        pass
+
+    assert registry.get_pool(connection) is pool
+    connection.db_password = encrypt_data("otra")
+    replacement = registry.get_pool(connection)
+
+    assert replacement is not pool
+    assert pool.closed is True
+    with replacement.connection():
+        pass
+    assert "PWD=otra;" in odbc.connection_strings[-1]
+    assert registry.stats()["pools"] == 1
+
+
+def test_registry_evicts_least_recently_used_pool(odbc):
+    """Por encima de max_pools se cierra el pool usado hace más tiempo."""
+    registry = SQLServerPoolRegistry(
+        min_size=1, max_size=2, idle_timeout=0, acquire_timeout=1, max_pools=2
+    )
+    connections = [_sql_server_connection(i) for i in (1, 2, 3)]
+    first = registry.get_pool(connections[0])
+    second = registry.get_pool(connections[1])
+    first.prefill()
+    registry.get_pool(connections[0])
+
+    registry.get_pool(connections[2])
+
+    assert second.closed is True
+    assert first.closed is False
+    assert 2 not in registry
+    assert registry.stats()["pools"] == 2
+    assert registry.stats()["evictions"] == 1
+
+
+def test_registry_closes_idle_pools_including_min_size(odbc, monkeypatch):
+    """Un pool sin uso ni préstamos durante idle_timeout se cierra entero."""
+    registry = SQLServerPoolRegistry(
+        min_size=1, max_size=2, idle_timeout=10, acquire_timeout=1
+    )
+    now = [100.0]
+    monkeypatch.setattr(connection_service.time, "monotonic", lambda: now[0])
+    idle = registry.get_pool(_sql_server_connection(1))
+    idle.prefill()
+    busy = registry.get_pool(_sql_server_connection(2))
+    borrowed = busy.acquire()
+
+    now[0] = 111.0
+    assert registry.reap_idle() == 0
+
+    assert idle.closed is True
+    assert idle.stats()["size"] == 0
+    assert 1 not in registry
+    # Con una conexión prestada el pool sigue abierto
+    assert busy.closed is False
+    busy.release(borrowed)
+
+
+def test_health_probes_do_not_keep_pools_alive(odbc, monkeypatch):
+    """Las pruebas de estado reutilizan el pool sin contar como uso."""
+    connection = _sql_server_connection()
+    now = [100.0]
+    monkeypatch.setattr(connection_service.time, "monotonic", lambda: now[0])
+    with ConnectionService.sql_server_connection(connection):
+        pass
+
+    now[0] = 100.0 + sql_server_pools.idle_timeout - 1
+    ConnectionService._check_sql_server(connection)
+    now[0] = 100.0 + sql_server_pools.idle_timeout + 1
+
+    assert sql_server_pools.evict_idle() == 1
+    assert connection.connection_id not in sql_server_pools
+
+
+def test_registry_rejects_neo4j_connections(odbc):
+    """Solo las conexiones SQL Server tienen pool."""
+    registry = SQLServerPoolRegistry(
+        min_size=0, max_size=2, idle_timeout=0, acquire_timeout=1
+    )
+
+    with pytest.raises(ValidationError):
+        registry.get_pool(_sql_server_connection(db_type=DatabaseType.NEO4J))
+
+
+def test_service_connection_maps_login_errors(odbc):
+    """Un login fallido se informa sin exponer el mensaje del driver."""
+    odbc.error = pyodbc.Error("Login failed for user 'sa'")
+
+    with pytest.raises(DatabaseConnectionError) as error:
+        with ConnectionService.sql_server_connection(_sql_server_connection()):
+            pass
+
+    assert error.value.detail == "Credenciales inválidas"
+
+
+@pytest.fixture
+def auth_token():
+    """Crea un usuario y retorna su token de autenticación."""
+    response = client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "pooluser@example.com",
+            "password": "Test@2024!",
+            "name": "Pool",
+            "last_name": "User",
+        },
+    )
+    return response.json()["access_token"]
+
+
+@pytest.mark.parametrize("operation", ["update", "delete"])
+def test_connection_changes_invalidate_pool(odbc, auth_token, db, operation):
+    """Actualizar o eliminar una conexión cierra su pool."""
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    connection_id = client.post(
+        "/api/v1/connections",
+        json={
+            "conn_name": "Origen",
+            "db_type": "sql_server",
+            "host": "localhost",
+            "port": 1433,
+            "db_user": "sa",
+            "db_password": "Password123!",
+            "database_name": "ventas",
+        },
+        headers=headers,
+    ).json()["connection_id"]
+    connection = (
+        db.query(Connection).filter(Connection.connection_id == connection_id).first()
+    )
+    with ConnectionService.sql_server_connection(connection) as pooled:
+        pooled.execute("SELECT 1")
+    assert connection_id in sql_server_pools
+
+    if operation == "update":
+        client.put(
+            f"/api/v1/connections/{connection_id}",
+            json={"db_password": "Nueva123!"},
+            headers=headers,
+        )
+    else:
+        client.delete(f"/api/v1/connections/{connection_id}", headers=headers)
+
+    assert connection_id not in sql_server_pools
+    with pytest.raises(sqlite3.ProgrammingError):
+        odbc.connections[0].execute("SELECT 1")
@@ -11,9 +11,13 @@ Cubre:
 - Validaciones de seguridad
 """
 
+import threading
+
 import pytest
 
-from app.core.parser.visitor import translate_sql_to_cypher
+from app.core.parser.engine import WARMUP_QUERIES, get_parser_engine, warm_up
+from app.core.parser.normalizer import normalize_sql
+from app.core.parser.visitor import sql_literal_to_python, translate_sql_to_cypher
 from app.models.query import Query, QueryStatus
 from app.services.translation_service import TranslationService
 
@@ -154,6 +158,63 @@ def test_case_insensitive_keywords():
     assert result["cypher"] is not None
 
 
+def test_order_by_limit_and_offset():
+    """ORDER BY, LIMIT y OFFSET se traducen a ORDER BY, SKIP y LIMIT."""
+    sql = (
+        "SELECT name FROM Users WHERE age > 18 "
+        "ORDER BY age DESC, name LIMIT 10 OFFSET 20"
+    )
+    result = translate_sql_to_cypher(sql)
+
+    assert result["success"] is True
+    assert result["cypher"] == (
+        "MATCH (n:Users)\n"
+        "WHERE n.age > 18\n"
+        "RETURN n.name\n"
+        "ORDER BY n.age DESC, n.name\n"
+        "SKIP 20\n"
+        "LIMIT 10"
+    )
+
+
+def test_top_translates_to_limit():
+    """TOP n de SQL Server se traduce a LIMIT n."""
+    result = translate_sql_to_cypher("SELECT TOP 5 * FROM Users ORDER BY name ASC")
+
+    assert result["cypher"] == "MATCH (n:Users)\nRETURN n\nORDER BY n.name\nLIMIT 5"
+
+
+def test_row_count_keywords_are_valid_identifiers():
+    """TOP, ORDER, BY, ASC, DESC, LIMIT y OFFSET no están reservadas."""
+    result = translate_sql_to_cypher(
+        "SELECT TOP 2 order, desc FROM limit WHERE top = 1 ORDER BY offset DESC"
+    )
+
+    assert result["cypher"] == (
+        "MATCH (n:Limit)\n"
+        "WHERE n.top = 1\n"
+        "RETURN n.order, n.desc\n"
+        "ORDER BY n.offset DESC\n"
+        "LIMIT 2"
+    )
+
+
+@pytest.mark.parametrize(
+    "sql, error",
+    [
+        ("SELECT TOP 5 * FROM Users LIMIT 3", "TOP y LIMIT"),
+        ("SELECT * FROM Users LIMIT 2.5", "LIMIT requiere un número entero"),
+        ("SELECT * FROM Users OFFSET 0.5", "OFFSET requiere un número entero"),
+    ],
+)
+def test_invalid_row_counts(sql, error):
+    """Los recuentos de filas deben ser enteros y TOP excluye LIMIT."""
+    result = translate_sql_to_cypher(sql)
+
+    assert result["success"] is False
+    assert error in result["errors"][0]
+
+
 def test_invalid_syntax():
     """T32: Sintaxis SQL inválida."""
     sql = "SELECT FROM"
@@ -164,6 +225,154 @@ def test_invalid_syntax():
     assert len(result["errors"]) > 0
 
 
+# ============================================================================
+# Motor de parsing reutilizable
+# ============================================================================
+
+
+def test_parser_engine_is_reused_per_thread():
+    """El motor de parsing se reutiliza dentro del mismo hilo."""
+    assert get_parser_engine() is get_parser_engine()
+
+
+def test_parser_engine_is_not_shared_between_threads():
+    """Cada hilo obtiene su propio motor de parsing."""
+    engines = []
+    thread = threading.Thread(target=lambda: engines.append(get_parser_engine()))
+    thread.start()
+    thread.join()
+
+    assert engines[0] is not get_parser_engine()
+
+
+def test_parser_engine_errors_do_not_leak_between_queries():
+    """Los errores de una consulta no afectan a la siguiente."""
+    failed = translate_sql_to_cypher("SELECT FROM")
+    succeeded = translate_sql_to_cypher("SELECT name FROM Users WHERE age > 18")
+
+    assert failed["success"] is False
+    assert succeeded["success"] is True
+    assert succeeded["errors"] == []
+    assert succeeded["cypher"] == "MATCH (n:Users)\nWHERE n.age > 18\nRETURN n.name"
+
+
+def test_lexer_recognizes_dangerous_keywords():
+    """Las palabras clave DDL/DML son tokens propios del lexer."""
+    from app.core.parser.generated.SQLSimpleLexer import SQLSimpleLexer
+
+    tokens = get_parser_engine().tokenize("drop Delete EXEC execute execution")
+
+    assert [t.type for t in tokens[:-1]] == [
+        SQLSimpleLexer.DROP,
+        SQLSimpleLexer.DELETE,
+        SQLSimpleLexer.EXEC,
+        SQLSimpleLexer.EXECUTE,
+        SQLSimpleLexer.IDENTIFIER,
+    ]
+
+
+def test_service_tokenizes_query_once(monkeypatch):
+    """Validación, caché y parsing comparten una sola tokenización."""
+    engine = get_parser_engine()
+    fills = []
+    original_fill = engine.token_stream.fill
+
+    def counting_fill():
+        fills.append(1)
+        original_fill()
+
+    monkeypatch.setattr(engine.token_stream, "fill", counting_fill)
+
+    result = TranslationService.translate(
+        "SELECT name FROM Users WHERE age > 18 -- tokenizar una vez"
+    )
+
+    assert result["success"] is True
+    assert len(fills) == 1
+
+
+def test_parser_warm_up_parses_corpus():
+    """El precalentamiento parsea todo el corpus sin romper el motor."""
+    assert warm_up() == len(WARMUP_QUERIES)
+
+    result = translate_sql_to_cypher("SELECT * FROM Users")
+    assert result["cypher"] == "MATCH (n:Users)\nRETURN n"
+
+
+def _parse_with_full_ll(sql):
+    """
+    Parsea con un pipeline ANTLR nuevo en modo LL.
+
+    El lexer se ejecuta a medida que el parser pide tokens, así que los
+    errores léxicos y sintácticos quedan intercalados por posición.
+    """
+    from antlr4 import CommonTokenStream, InputStream
+
+    from app.core.parser.engine import SQLErrorListener
+    from app.core.parser.generated.SQLSimpleLexer import SQLSimpleLexer
+    from app.core.parser.generated.SQLSimpleParser import SQLSimpleParser
+
+    listener = SQLErrorListener()
+    lexer = SQLSimpleLexer(InputStream(sql))
+    lexer.removeErrorListeners()
+    lexer.addErrorListener(listener)
+    token_stream = CommonTokenStream(lexer)
+    parser = SQLSimpleParser(token_stream)
+    parser.removeErrorListeners()
+    parser.addErrorListener(listener)
+    parser.query()
+    return listener.errors
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "SELECT FROM",
+        "SELECT FROM WHERE",
+        "SELECT * FROM Users WHERE",
+        "SELECT * FROM Users WHERE age > 18 AND",
+        "SELECT * FROM Users WHERE (age > 18 OR role = 'x'",
+        "SELECT name FROM Users WHERE age = 1 @",
+        "SELECT name, FROM Users",
+        "SELECT FROM Users WHERE a = 1 @",
+        "SELECT FROM Users @ WHERE",
+        "SELECT * FROM Users WHERE DROP = 1",
+    ],
+)
+def test_two_stage_parse_reports_same_errors_as_full_ll(sql):
+    """SLL con fallback a LL reporta los mismos errores que LL directo."""
+    _, errors = get_parser_engine().parse(sql)
+
+    assert errors
+    assert errors == _parse_with_full_ll(sql)
+
+
+def test_parse_interleaves_lexer_and_parser_errors_by_position():
+    """Un error léxico entre dos sintácticos se informa en su posición."""
+    _, errors = get_parser_engine().parse("SELECT FROM Users @ WHERE")
+
+    assert [error.split(" - ")[0] for error in errors] == [
+        "Línea 1:7",
+        "Línea 1:18",
+        "Línea 1:20",
+    ]
+    assert "token recognition error at: '@'" in errors[1]
+
+
+def test_two_stage_parse_long_and_or_chain_uses_sll():
+    """Cadenas largas de AND/OR se resuelven sin recurrir a LL completo."""
+    terms = [f"(age > {i} AND status = 'active')" for i in range(50)]
+    sql = "SELECT * FROM Users WHERE " + " OR ".join(terms)
+
+    engine = get_parser_engine()
+    fallbacks = engine.ll_fallbacks
+    result = translate_sql_to_cypher(sql)
+
+    assert result["success"] is True
+    assert result["cypher"].count(" OR ") == 49
+    assert engine.ll_fallbacks == fallbacks
+
+
 # ============================================================================
 # T33: Tests de TranslationService (Validaciones de Seguridad)
 # ============================================================================
@@ -237,6 +446,51 @@ def test_service_detects_injection_pattern():
     assert "sospechoso" in error_msg or "drop" in error_msg
 
 
+def test_service_validates_lowercase_keyword():
+    """T33: Las palabras clave se detectan sin importar mayúsculas."""
+    result = TranslationService.validate_sql_query("SELECT * FROM Users; truncate x")
+
+    assert result["valid"] is False
+    assert "TRUNCATE" in result["error"]
+
+
+def test_service_reports_first_dangerous_keyword():
+    """T33: Se reporta la primera palabra clave peligrosa de la consulta."""
+    result = TranslationService.validate_sql_query(
+        "SELECT * FROM Users; GRANT x; DROP TABLE Users"
+    )
+
+    assert "GRANT" in result["error"]
+
+
+def test_service_ignores_keywords_in_string_literals():
+    """T33: Palabras clave dentro de cadenas no se consideran peligrosas."""
+    result = TranslationService.translate(
+        "SELECT * FROM Tasks WHERE note = 'please update and drop it'"
+    )
+
+    assert result["success"] is True
+    assert "n.note = 'please update and drop it'" in result["cypher"]
+
+
+def test_service_ignores_keywords_in_comments():
+    """T33: Palabras clave dentro de comentarios no se consideran peligrosas."""
+    result = TranslationService.translate(
+        "-- no delete\nSELECT * FROM Users /* insert later */ WHERE age > 18"
+    )
+
+    assert result["success"] is True
+
+
+def test_service_keyword_must_be_whole_word():
+    """T33: Identificadores que contienen una palabra clave son válidos."""
+    result = TranslationService.validate_sql_query(
+        "SELECT created_at, update_count FROM Users WHERE executed = true"
+    )
+
+    assert result["valid"] is True
+
+
 def test_service_successful_translation():
     """T33: Servicio realiza traducción exitosa."""
     result = TranslationService.translate("SELECT * FROM Users WHERE age > 18")
@@ -267,6 +521,224 @@ def test_service_get_examples():
     assert all("description" in ex for ex in examples)
 
 
+# ============================================================================
+# Caché de traducciones
+# ============================================================================
+
+
+@pytest.fixture
+def empty_translation_cache():
+    """Vacía la caché de traducciones antes y después del test."""
+    TranslationService.clear_cache()
+    yield
+    TranslationService.clear_cache()
+
+
+def test_normalize_sql_collapses_whitespace_and_comments():
+    """La normalización ignora espacios y comentarios."""
+    a = normalize_sql("SELECT  name\n FROM Users -- comentario\n WHERE age>18")
+    b = normalize_sql("SELECT /* x */ name FROM Users WHERE age > 18")
+
+    assert a == b == "SELECT name FROM Users WHERE age > 18"
+
+
+def test_normalize_sql_folds_keywords_and_preserves_identifiers():
+    """Las palabras clave se pasan a mayúsculas y los identificadores no."""
+    normalized = normalize_sql("select Name from users where Active = True")
+
+    assert normalized == "SELECT Name FROM users WHERE Active = TRUE"
+
+
+def test_normalize_sql_preserves_unreserved_keywords():
+    """Las palabras clave que pueden ser nombres conservan su texto."""
+    assert normalize_sql("select desc from Users order by desc") == (
+        "SELECT desc FROM Users order by desc"
+    )
+    assert normalize_sql("SELECT desc FROM Users") != normalize_sql(
+        "SELECT DESC FROM Users"
+    )
+
+
+def test_normalize_sql_preserves_literals_and_operators():
+    """Literales y operadores de dos caracteres se mantienen intactos."""
+    assert normalize_sql("SELECT * FROM U WHERE a = 'Select  -- x'") == (
+        "SELECT * FROM U WHERE a = 'Select  -- x'"
+    )
+    assert normalize_sql("SELECT * FROM U WHERE a>=1") != normalize_sql(
+        "SELECT * FROM U WHERE a> =1"
+    )
+
+
+def test_service_cache_hit_for_equivalent_query(empty_translation_cache):
+    """Consultas equivalentes tras normalizar se sirven desde la caché."""
+    first = TranslationService.translate("SELECT name FROM Users WHERE age > 18")
+    second = TranslationService.translate(
+        "select name\nfrom Users -- mayores\nwhere age>18"
+    )
+
+    assert first["from_cache"] is False
+    assert second["from_cache"] is True
+    assert second["cypher"] == first["cypher"]
+    assert second["sql_query"] == "select name\nfrom Users -- mayores\nwhere age>18"
+
+    stats = TranslationService.get_cache_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_service_cache_distinguishes_identifier_case(empty_translation_cache):
+    """Identificadores con distinto caso no comparten entrada de caché."""
+    TranslationService.translate("SELECT name FROM Users")
+    result = TranslationService.translate("SELECT Name FROM Users")
+
+    assert result["from_cache"] is False
+    assert result["cypher"] == "MATCH (n:Users)\nRETURN n.Name"
+
+
+def test_service_cache_does_not_store_failures(empty_translation_cache):
+    """Las traducciones fallidas no se almacenan en caché."""
+    TranslationService.translate("SELECT FROM Users")
+    result = TranslationService.translate("SELECT FROM Users")
+
+    assert result["success"] is False
+    assert result["from_cache"] is False
+    assert TranslationService.get_cache_stats()["entries"] == 0
+
+
+def test_service_cache_still_validates(empty_translation_cache):
+    """Una consulta cacheada sigue pasando por la validación de seguridad."""
+    TranslationService.translate("SELECT * FROM Users")
+    result = TranslationService.translate("SELECT * FROM Users; DROP TABLE Users")
+
+    assert result["success"] is False
+    assert result["from_cache"] is False
+
+
+def test_cache_hit_saves_to_database_with_flag(db, empty_translation_cache):
+    """Los aciertos de caché se guardan en el historial marcados como tales."""
+    from app.models.user import User
+
+    user = User(
+        name="Test",
+        last_name="User",
+        email="translator_cache@example.com",
+        password="hashed_password",
+    )
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+
+    for _ in range(2):
+        result = TranslationService.translate(
+            sql_query="SELECT * FROM Products",
+            db=db,
+            user_id=user.user_id,
+        )
+
+    saved = db.query(Query).filter(Query.user_id == user.user_id).all()
+    assert len(saved) == 2
+    assert [q.from_cache for q in saved] == [False, True]
+    assert saved[1].status == QueryStatus.TRADUCIDO
+    assert saved[1].cypher_query == saved[0].cypher_query
+    assert result["query_id"] == saved[1].query_id
+
+
+# ============================================================================
+# Modo parametrizado
+# ============================================================================
+
+
+def test_parameterized_translation_replaces_literals():
+    """Los literales se emiten como parámetros en orden de aparición."""
+    sql = "SELECT name FROM Users WHERE age > 18 AND (role = 'admin' OR active = true)"
+    result = translate_sql_to_cypher(sql, parameterize=True)
+
+    assert result["success"] is True
+    assert result["cypher"] == (
+        "MATCH (n:Users)\n"
+        "WHERE (n.age > $p0 AND ((n.role = $p1 OR n.active = $p2)))\n"
+        "RETURN n.name"
+    )
+    assert result["parameters"] == {"p0": 18, "p1": "admin", "p2": True}
+
+
+def test_non_parameterized_translation_has_no_parameters():
+    """Por defecto los literales se mantienen en la consulta."""
+    result = translate_sql_to_cypher("SELECT * FROM Users WHERE age > 18")
+
+    assert "n.age > 18" in result["cypher"]
+    assert result["parameters"] == {}
+
+
+@pytest.mark.parametrize(
+    "literal, expected",
+    [
+        ("'John'", "John"),
+        ("'it''s'", "it's"),
+        ("42", 42),
+        ("3.14", 3.14),
+        ("TRUE", True),
+        ("false", False),
+        ("NULL", None),
+    ],
+)
+def test_sql_literal_to_python(literal, expected):
+    """Conversión de literales SQL a valores de parámetros."""
+    assert sql_literal_to_python(literal) == expected
+
+
+def test_service_parameterized_cache_keys_on_shape(empty_translation_cache):
+    """En modo parametrizado la caché se comparte entre distintos valores."""
+    first = TranslationService.translate(
+        "SELECT name FROM Users WHERE age > 18 AND role = 'admin'",
+        parameterize=True,
+    )
+    second = TranslationService.translate(
+        "select name from Users where age > 65 and role = 'it''s'",
+        parameterize=True,
+    )
+
+    assert first["from_cache"] is False
+    assert second["from_cache"] is True
+    assert second["cypher"] == first["cypher"]
+    assert first["parameters"] == {"p0": 18, "p1": "admin"}
+    assert second["parameters"] == {"p0": 65, "p1": "it's"}
+
+
+def test_service_parameterized_cache_keeps_row_counts_in_shape(
+    empty_translation_cache,
+):
+    """LIMIT y TOP van en línea: consultas con distinto límite no comparten caché."""
+    first = TranslationService.translate(
+        "SELECT * FROM Users WHERE age > 18 LIMIT 10", parameterize=True
+    )
+    second = TranslationService.translate(
+        "SELECT * FROM Users WHERE age > 30 LIMIT 20", parameterize=True
+    )
+    third = TranslationService.translate(
+        "SELECT * FROM Users WHERE age > 40 LIMIT 20", parameterize=True
+    )
+
+    assert first["cypher"].endswith("LIMIT 10")
+    assert second["from_cache"] is False
+    assert second["cypher"].endswith("LIMIT 20")
+    assert third["from_cache"] is True
+    assert third["parameters"] == {"p0": 40}
+
+
+def test_service_parameterized_and_inline_caches_are_separate(
+    empty_translation_cache,
+):
+    """Las traducciones parametrizadas no se mezclan con las literales."""
+    TranslationService.translate("SELECT * FROM Users WHERE age > 18")
+    result = TranslationService.translate(
+        "SELECT * FROM Users WHERE age > 18", parameterize=True
+    )
+
+    assert result["from_cache"] is False
+    assert result["cypher"] == "MATCH (n:Users)\nWHERE n.age > $p0\nRETURN n"
+
+
 # ============================================================================
 # T34: Tests de Persistencia en BD
 # ============================================================================
@@ -370,6 +842,83 @@ def test_get_user_queries(db):
     assert "col2" in queries[0].sql_query
 
 
+def test_translate_batch_preserves_order_and_deduplicates(
+    db, monkeypatch, empty_translation_cache
+):
+    """El lote traduce una vez cada consulta distinta y mantiene el orden."""
+    from app.models.user import User
+    from app.services import translation_service
+
+    user = User(
+        name="Test",
+        last_name="User",
+        email="translator_batch@example.com",
+        password="hashed_password",
+    )
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+
+    parsed = []
+
+    def counting_translate(sql_query, parameterize=False, schema=None):
+        parsed.append(sql_query)
+        return translate_sql_to_cypher(
+            sql_query, parameterize=parameterize, schema=schema
+        )
+
+    monkeypatch.setattr(
+        translation_service, "translate_sql_to_cypher", counting_translate
+    )
+    commits = []
+    original_commit = db.commit
+    monkeypatch.setattr(db, "commit", lambda: commits.append(original_commit()))
+
+    results = TranslationService.translate_batch(
+        sql_queries=[
+            "SELECT * FROM Users",
+            "DROP TABLE Users",
+            "  SELECT * FROM Users  ",
+            "SELECT name FROM Products",
+        ],
+        db=db,
+        user_id=user.user_id,
+    )
+
+    assert [r["sql_query"] for r in results] == [
+        "SELECT * FROM Users",
+        "DROP TABLE Users",
+        "SELECT * FROM Users",
+        "SELECT name FROM Products",
+    ]
+    assert [r["success"] for r in results] == [True, False, True, True]
+    assert [r["from_cache"] for r in results] == [False, False, True, False]
+    assert results[2]["cypher"] == results[0]["cypher"]
+    assert "DROP" in results[1]["errors"][0]
+    assert parsed == ["SELECT * FROM Users", "SELECT name FROM Products"]
+
+    # Un registro por elemento, guardados con un único commit
+    assert len(commits) == 1
+    assert all(r["query_id"] is not None for r in results)
+    assert len({r["query_id"] for r in results}) == 4
+    saved = db.query(Query).filter(Query.user_id == user.user_id).all()
+    assert len(saved) == 4
+    failed = db.query(Query).filter(Query.query_id == results[1]["query_id"]).first()
+    assert failed.status == QueryStatus.FALLIDO
+
+
+def test_translate_batch_without_db_does_not_persist():
+    """Sin sesión de BD el lote se traduce sin guardar historial."""
+    results = TranslationService.translate_batch(
+        ["SELECT * FROM Users", "SELECT * FROM"], parameterize=True
+    )
+
+    assert results[0]["success"] is True
+    assert results[0]["query_id"] is None
+    assert results[1]["success"] is False
+    assert results[1]["errors"]
+
+
 # ============================================================================
 # T34: Tests de Endpoint de Traducción
 # ============================================================================
@@ -534,3 +1083,92 @@ def test_endpoint_history_returns_user_queries(client, auth_token):
     assert "cypher_query" in first_query
     assert "status" in first_query
     assert "created_at" in first_query
+
+
+def test_endpoint_cache_stats_requires_admin(client, auth_token):
+    """El endpoint de métricas de caché requiere rol ADMIN."""
+    response = client.get(
+        "/api/v1/queries/cache/stats",
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+
+    assert response.status_code == 403
+
+
+def test_endpoint_translate_parameterized(client, auth_token):
+    """El endpoint devuelve los parámetros en modo parametrizado."""
+    response = client.post(
+        "/api/v1/queries/translate",
+        json={
+            "sql_query": "SELECT name FROM Users WHERE age > 18",
+            "parameterize": True,
+        },
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["cypher"] == "MATCH (n:Users)\nWHERE n.age > $p0\nRETURN n.name"
+    assert data["parameters"] == {"p0": 18}
+
+    history = client.get(
+        "/api/v1/queries/history",
+        headers={"Authorization": f"Bearer {auth_token}"},
+    ).json()
+    assert history[0]["cypher_parameters"] == {"p0": 18}
+
+
+def test_endpoint_translate_batch(client, auth_token):
+    """El endpoint de lotes devuelve un resultado por consulta en orden."""
+    response = client.post(
+        "/api/v1/queries/translate/batch",
+        json={
+            "sql_queries": [
+                "SELECT name FROM Users WHERE age > 18",
+                "DELETE FROM Users",
+                "SELECT name FROM Users WHERE age > 18",
+                "",
+            ],
+            "parameterize": True,
+        },
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 4
+    assert data["successful"] == 2
+    assert data["failed"] == 2
+    assert data["unique"] == 3
+    assert [item["index"] for item in data["results"]] == [0, 1, 2, 3]
+    assert data["results"][0]["parameters"] == {"p0": 18}
+    assert data["results"][2]["cypher"] == data["results"][0]["cypher"]
+    assert "DELETE" in data["results"][1]["errors"][0]
+    assert "vacía" in data["results"][3]["errors"][0]
+
+    history = client.get(
+        "/api/v1/queries/history",
+        headers={"Authorization": f"Bearer {auth_token}"},
+    ).json()
+    assert len(history) == 4
+
+
+def test_endpoint_translate_batch_requires_auth(client):
+    """El endpoint de lotes requiere autenticación."""
+    response = client.post(
+        "/api/v1/queries/translate/batch",
+        json={"sql_queries": ["SELECT * FROM Users"]},
+    )
+
+    assert response.status_code == 401
+
+
+def test_endpoint_translate_batch_rejects_empty_list(client, auth_token):
+    """Un lote vacío es un error de validación."""
+    response = client.post(
+        "/api/v1/queries/translate/batch",
+        json={"sql_queries": []},
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+
+    assert response.status_code == 422